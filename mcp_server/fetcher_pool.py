@@ -0,0 +1,379 @@
+"""
+Server-lifetime WebFetcher pool for the MCP server.
+
+MCP tool calls are short and frequent. Building a FetchConfig and a fresh
+WebFetcher per call pays for a new connector, DNS lookups and TCP/TLS
+handshakes every time. The pool keeps one long-lived fetcher per
+(verify_ssl, timeout class, redirect policy) so tool calls reuse keep-alive
+connections, and can front all of them with a shared response cache and a
+shared per-domain rate limiter.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from web_fetch import (
+    BatchFetchResult,
+    FetchConfig,
+    FetchRequest,
+    FetchResult,
+    WebFetcher,
+)
+from web_fetch.utils import (
+    AdvancedRateLimiter,
+    EnhancedCache,
+    EnhancedCacheConfig,
+    RateLimitConfig,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TimeoutClass(NamedTuple):
+    """Session timeouts shared by all calls whose timeout falls in a class."""
+
+    name: str
+    total_timeout: float
+    connect_timeout: float
+    read_timeout: float
+
+
+# Ordered by total_timeout; a call uses the first class that can hold it
+TIMEOUT_CLASSES: Tuple[TimeoutClass, ...] = (
+    TimeoutClass("short", 15.0, 5.0, 10.0),
+    TimeoutClass("medium", 60.0, 10.0, 45.0),
+    TimeoutClass("long", 300.0, 15.0, 240.0),
+)
+
+PoolKey = Tuple[bool, str, bool]
+
+
+def timeout_class(timeout: float) -> TimeoutClass:
+    """Get the smallest timeout class that covers timeout seconds."""
+    for cls in TIMEOUT_CLASSES:
+        if timeout <= cls.total_timeout:
+            return cls
+    return TIMEOUT_CLASSES[-1]
+
+
+class FetcherPool:
+    """
+    Long-lived WebFetchers shared by MCP tool calls.
+
+    Fetchers are created on first use and kept open until close(). Per-call
+    timeouts and retry counts are applied on the request, so calls that only
+    differ in those still share a fetcher and its connections. Caching is off
+    unless a cache config is given; successful GET responses are then cached
+    for cache_config.default_ttl seconds. When a rate limit config is set
+    every request goes through one per-domain limiter regardless of the
+    fetcher serving it.
+
+    Example:
+        ```python
+        pool = FetcherPool()
+        result = await pool.fetch(
+            FetchRequest(url="https://example.com"), timeout=10.0
+        )
+        await pool.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        max_concurrent_requests: int = 50,
+        max_connections_per_host: int = 10,
+        cache_config: Optional[EnhancedCacheConfig] = None,
+        rate_limit_config: Optional[RateLimitConfig] = None,
+    ) -> None:
+        """
+        Initialize fetcher pool.
+
+        Args:
+            max_concurrent_requests: Concurrency limit of each pooled fetcher
+            max_connections_per_host: Keep-alive connections per host and fetcher
+            cache_config: Shared response cache configuration; None disables it
+            rate_limit_config: Shared rate limiter configuration; None disables it
+        """
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_connections_per_host = max_connections_per_host
+        self.cache_config = cache_config
+        self.rate_limiter = (
+            AdvancedRateLimiter(rate_limit_config) if rate_limit_config else None
+        )
+
+        self._fetchers: Dict[PoolKey, WebFetcher] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._cache: Optional[EnhancedCache] = None
+        self._stats = {
+            "requests": 0,
+            "cache_hits": 0,
+            "fetchers_created": 0,
+        }
+
+    async def get_fetcher(
+        self,
+        verify_ssl: bool = True,
+        timeout: float = 30.0,
+        follow_redirects: bool = True,
+    ) -> WebFetcher:
+        """
+        Borrow the pooled fetcher for a set of connection settings.
+
+        The fetcher stays owned by the pool; callers must not close it.
+
+        Args:
+            verify_ssl: Whether SSL certificates are verified
+            timeout: Request timeout in seconds, used to pick the timeout class
+            follow_redirects: Whether HTTP redirects are followed
+
+        Returns:
+            Open WebFetcher shared with other callers using the same settings
+        """
+        await self._check_loop()
+        cls = timeout_class(timeout)
+        key: PoolKey = (verify_ssl, cls.name, follow_redirects)
+
+        fetcher = self._fetchers.get(key)
+        if fetcher is None:
+            config = FetchConfig(
+                total_timeout=cls.total_timeout,
+                connect_timeout=cls.connect_timeout,
+                read_timeout=cls.read_timeout,
+                max_concurrent_requests=self.max_concurrent_requests,
+                max_connections_per_host=self.max_connections_per_host,
+                follow_redirects=follow_redirects,
+                verify_ssl=verify_ssl,
+            )
+            fetcher = self._fetchers[key] = WebFetcher(config)
+            self._stats["fetchers_created"] += 1
+            await fetcher.__aenter__()
+        return fetcher
+
+    async def fetch(
+        self,
+        request: FetchRequest,
+        timeout: float = 30.0,
+        max_retries: Optional[int] = None,
+        follow_redirects: bool = True,
+        verify_ssl: bool = True,
+        use_cache: bool = True,
+    ) -> FetchResult:
+        """
+        Fetch a request with a pooled fetcher.
+
+        Args:
+            request: Request to perform
+            timeout: Total timeout for this request in seconds
+            max_retries: Retry attempts for this request; fetcher default if None
+            follow_redirects: Whether HTTP redirects are followed
+            verify_ssl: Whether SSL certificates are verified
+            use_cache: Whether the shared response cache may serve GET requests
+
+        Returns:
+            FetchResult for the request
+        """
+        await self._check_loop()
+        self._stats["requests"] += 1
+        url = str(request.url)
+
+        cache = self._get_cache() if use_cache and request.method == "GET" else None
+        cache_key = self._cache_key(request, verify_ssl, follow_redirects)
+        if cache is not None:
+            cached = await cache.get(cache_key)
+            if cached is not None:
+                self._stats["cache_hits"] += 1
+                return cached
+
+        fetcher = await self.get_fetcher(verify_ssl, timeout, follow_redirects)
+        if request.timeout_override is None:
+            request = request.model_copy(update={"timeout_override": timeout})
+
+        if self.rate_limiter is not None:
+            delay = await self.rate_limiter.acquire(url)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        start_time = time.time()
+        result = await fetcher.fetch_single(request, max_retries=max_retries)
+
+        if self.rate_limiter is not None:
+            await self.rate_limiter.record_response(
+                url, result.status_code, result.headers, time.time() - start_time
+            )
+
+        if cache is not None and result.is_success:
+            await cache.set(cache_key, result, self._lower_keys(result.headers))
+        return result
+
+    async def fetch_batch(
+        self,
+        requests: List[FetchRequest],
+        max_concurrent: int = 10,
+        **kwargs: Any,
+    ) -> BatchFetchResult:
+        """
+        Fetch several requests through the pool, max_concurrent at a time.
+
+        Args:
+            requests: Requests to perform
+            max_concurrent: Maximum number of requests in flight for this batch
+            **kwargs: Per-request options passed to fetch()
+
+        Returns:
+            BatchFetchResult with results in request order
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def fetch_one(request: FetchRequest) -> FetchResult:
+            async with semaphore:
+                return await self.fetch(request, **kwargs)
+
+        start_time = time.time()
+        results = await asyncio.gather(*(fetch_one(r) for r in requests))
+        return BatchFetchResult.from_results(list(results), time.time() - start_time)
+
+    async def configure_cache(
+        self, cache_config: Optional[EnhancedCacheConfig]
+    ) -> None:
+        """
+        Replace the shared response cache, dropping everything cached so far.
+
+        Args:
+            cache_config: New cache configuration; None disables caching
+        """
+        if self._cache is not None:
+            await self._cache.close()
+            self._cache = None
+        self.cache_config = cache_config
+
+    def configure_rate_limit(
+        self, rate_limit_config: Optional[RateLimitConfig]
+    ) -> None:
+        """
+        Replace the shared rate limiter.
+
+        Args:
+            rate_limit_config: New rate limit configuration; None disables it
+        """
+        self.rate_limiter = (
+            AdvancedRateLimiter(rate_limit_config) if rate_limit_config else None
+        )
+
+    async def configure_connections(
+        self, max_concurrent_requests: int, max_connections_per_host: int
+    ) -> None:
+        """
+        Change connection limits; open fetchers are closed and rebuilt lazily.
+
+        Args:
+            max_concurrent_requests: Concurrency limit of each pooled fetcher
+            max_connections_per_host: Keep-alive connections per host and fetcher
+        """
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_connections_per_host = max_connections_per_host
+        await self._close_fetchers()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with request/cache counters and per-fetcher scheduler stats
+        """
+        requests = self._stats["requests"]
+        stats: Dict[str, Any] = {
+            **self._stats,
+            "cache_hit_rate": (
+                self._stats["cache_hits"] / requests * 100 if requests else 0.0
+            ),
+            "max_concurrent_requests": self.max_concurrent_requests,
+            "max_connections_per_host": self.max_connections_per_host,
+            "fetchers": {
+                f"ssl={key[0]},timeout={key[1]},redirects={key[2]}": (
+                    fetcher.get_scheduler_stats()
+                )
+                for key, fetcher in self._fetchers.items()
+            },
+            "cache_enabled": self.cache_config is not None,
+            "rate_limit_enabled": self.rate_limiter is not None,
+        }
+        if self._cache is not None:
+            stats["cache"] = self._cache.get_stats()
+        if self.rate_limiter is not None:
+            stats["rate_limits"] = self.rate_limiter.get_rate_limit_status()
+        return stats
+
+    async def close(self) -> None:
+        """Close all pooled fetchers and the shared cache."""
+        await self._close_fetchers()
+        if self._cache is not None:
+            await self._cache.close()
+            self._cache = None
+        self._loop = None
+
+    def _get_cache(self) -> Optional[EnhancedCache]:
+        """Get the shared cache, creating it on the running loop if needed."""
+        if self._cache is None and self.cache_config is not None:
+            self._cache = EnhancedCache(self.cache_config)
+        return self._cache
+
+    @staticmethod
+    def _cache_key(
+        request: FetchRequest, verify_ssl: bool, follow_redirects: bool
+    ) -> str:
+        """Build the cache key for everything that can change a GET response."""
+        params = sorted((request.params or {}).items())
+        headers = sorted(FetcherPool._lower_keys(request.headers).items())
+        return (
+            f"{request.content_type}|{verify_ssl}|{follow_redirects}|"
+            f"{request.url}|{params}|{headers}"
+        )
+
+    @staticmethod
+    def _lower_keys(headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+        """Lower-case header names, as EnhancedCache expects."""
+        return {k.lower(): v for k, v in (headers or {}).items()}
+
+    async def _check_loop(self) -> None:
+        """Close fetchers and cache bound to a previous event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        previous, self._loop = self._loop, loop
+        fetchers = list(self._fetchers.values())
+        self._fetchers.clear()
+        cache, self._cache = self._cache, None
+        if previous is None or not (fetchers or cache):
+            return
+
+        logger.debug("Event loop changed, closing pooled fetchers")
+        closing = self._close_all(fetchers, cache)
+        if previous.is_running():
+            # Their sessions belong to the other loop, so close them there
+            asyncio.run_coroutine_threadsafe(closing, previous)
+        else:
+            await closing
+
+    async def _close_fetchers(self) -> None:
+        """Close and forget every pooled fetcher."""
+        fetchers = list(self._fetchers.values())
+        self._fetchers.clear()
+        await self._close_all(fetchers, None)
+
+    @staticmethod
+    async def _close_all(
+        fetchers: List[WebFetcher], cache: Optional[EnhancedCache]
+    ) -> None:
+        """Close fetchers and a cache, logging rather than raising errors."""
+        for fetcher in fetchers:
+            try:
+                await fetcher.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled fetcher: {e}")
+        if cache is not None:
+            try:
+                await cache.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled cache: {e}")
@@ -56,8 +56,11 @@ from web_fetch.utils import (
     EnhancedCache,
     EnhancedCacheConfig,
     CacheBackend,
+    RateLimitConfig,
+    RateLimitStrategy,
     TransformationPipeline,
-    JSRenderConfig
+    JSRenderConfig,
+    shared_sessions
 )
 
 # Import WebSocket functionality
@@ -174,6 +177,8 @@ from web_fetch.crawlers import (
     get_crawler_status
 )
 
+from .fetcher_pool import FetcherPool
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -187,10 +192,17 @@ _graphql_clients: Dict[str, GraphQLClient] = {}
 # Global authentication manager
 _auth_manager: Optional[AuthManager] = None
 
-# Global performance optimization components
-_connection_pool: Optional[aiohttp.ClientSession] = None
-_cache_manager: Optional[EnhancedCache] = None
-_rate_limiter: Optional[Dict[str, float]] = None
+# Global fetcher pool shared by all HTTP tools for the server's lifetime
+_fetcher_pool: Optional[FetcherPool] = None
+
+
+def get_fetcher_pool() -> FetcherPool:
+    """Get the server-wide fetcher pool, creating it on first use."""
+    global _fetcher_pool
+    if _fetcher_pool is None:
+        # Response caching stays off until enabled with performance_optimize
+        _fetcher_pool = FetcherPool()
+    return _fetcher_pool
 
 
 def create_mcp_server() -> FastMCP:
@@ -276,21 +288,15 @@ def create_mcp_server() -> FastMCP:
             # Convert content_type string to enum
             content_type_enum = ContentType[content_type]
 
-            # Create fetch configuration
-            config = FetchConfig(
-                total_timeout=timeout,
+            # Perform the fetch with a pooled fetcher
+            result = await get_fetcher_pool().fetch(
+                FetchRequest(url=normalized_url, content_type=content_type_enum),
+                timeout=timeout,
                 max_retries=max_retries,
                 follow_redirects=follow_redirects,
                 verify_ssl=verify_ssl
             )
 
-            # Perform the fetch
-            result = await fetch_url(
-                url=normalized_url,
-                content_type=content_type_enum,
-                config=config
-            )
-
             # Log success
             if ctx:
                 await ctx.info(f"Successfully fetched {url} - Status: {result.status_code}")
@@ -410,22 +416,19 @@ def create_mcp_server() -> FastMCP:
             # Convert content_type string to enum
             content_type_enum = ContentType[content_type]
 
-            # Create fetch configuration
-            config = FetchConfig(
-                total_timeout=timeout,
+            # Perform batch fetch with pooled fetchers
+            batch_result = await get_fetcher_pool().fetch_batch(
+                [
+                    FetchRequest(url=valid_url, content_type=content_type_enum)
+                    for valid_url in valid_urls
+                ],
+                max_concurrent=max_concurrent,
+                timeout=timeout,
                 max_retries=max_retries,
-                max_concurrent_requests=max_concurrent,
                 follow_redirects=follow_redirects,
                 verify_ssl=verify_ssl
             )
 
-            # Perform batch fetch
-            batch_result = await fetch_urls(
-                urls=valid_urls,
-                content_type=content_type_enum,
-                config=config
-            )
-
             # Process results
             results = []
             successful_count = 0
@@ -1102,7 +1105,6 @@ def create_mcp_server() -> FastMCP:
                     ))
 
             # Perform download
-            import aiohttp
             async with aiohttp.ClientSession() as session:
                 result = await download_method(
                     session=session,
@@ -1178,7 +1180,6 @@ def create_mcp_server() -> FastMCP:
                 await ctx.info(f"Starting pagination for: {base_url}")
 
             from web_fetch.http.pagination import PaginationConfig, PaginationStrategy as PagStrategy
-            from web_fetch.src.core_fetcher import WebFetcher
 
             # Create pagination configuration
             config = PaginationConfig(
@@ -1204,9 +1205,9 @@ def create_mcp_server() -> FastMCP:
                 params=params
             )
 
-            # Fetch all pages
-            async with WebFetcher() as fetcher:
-                result = await handler.fetch_all_pages(fetcher, base_request)
+            # Fetch all pages with a pooled fetcher
+            fetcher = await get_fetcher_pool().get_fetcher()
+            result = await handler.fetch_all_pages(fetcher, base_request)
 
             return {
                 "success": True,
@@ -1415,7 +1416,6 @@ def create_mcp_server() -> FastMCP:
                     ))
 
             # Perform upload
-            import aiohttp
             async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout)) as session:
                 result = await upload_handler.upload_file(
                     session=session,
@@ -3427,10 +3427,10 @@ def create_mcp_server() -> FastMCP:
             if ctx:
                 await ctx.info(f"Applying performance optimization: {action}")
 
-            global _cache_manager, _connection_pool, _rate_limiter
+            pool = get_fetcher_pool()
 
             if action == "enable_cache":
-                # Configure enhanced caching
+                # Configure the pool's shared response cache
                 cache_config = EnhancedCacheConfig(
                     backend=CacheBackend.MEMORY,
                     max_size=config.get("max_size", 1000) if config else 1000,
@@ -3438,7 +3438,7 @@ def create_mcp_server() -> FastMCP:
                     enable_compression=config.get("enable_compression", True) if config else True
                 )
 
-                _cache_manager = EnhancedCache(cache_config)
+                await pool.configure_cache(cache_config)
 
                 return {
                     "success": True,
@@ -3452,39 +3452,22 @@ def create_mcp_server() -> FastMCP:
                 }
 
             elif action == "configure_pool":
-                # Configure connection pooling
+                # Configure connection limits of the pooled fetchers
                 pool_config = config or {}
+                max_connections = pool_config.get("max_connections", 100)
+                max_per_host = pool_config.get("max_per_host", 10)
 
-                connector = aiohttp.TCPConnector(
-                    limit=pool_config.get("max_connections", 100),
-                    limit_per_host=pool_config.get("max_per_host", 30),
-                    ttl_dns_cache=pool_config.get("dns_cache_ttl", 300),
-                    use_dns_cache=True,
-                    keepalive_timeout=pool_config.get("keepalive_timeout", 30),
-                    enable_cleanup_closed=True
-                )
-
-                timeout = aiohttp.ClientTimeout(
-                    total=pool_config.get("total_timeout", 60),
-                    connect=pool_config.get("connect_timeout", 10)
-                )
-
-                if _connection_pool:
-                    await _connection_pool.close()
-
-                _connection_pool = aiohttp.ClientSession(
-                    connector=connector,
-                    timeout=timeout
+                await pool.configure_connections(
+                    max_concurrent_requests=max_connections,
+                    max_connections_per_host=max_per_host
                 )
 
                 return {
                     "success": True,
                     "action": action,
                     "pool_config": {
-                        "max_connections": pool_config.get("max_connections", 100),
-                        "max_per_host": pool_config.get("max_per_host", 30),
-                        "dns_cache_ttl": pool_config.get("dns_cache_ttl", 300),
-                        "keepalive_timeout": pool_config.get("keepalive_timeout", 30)
+                        "max_connections": max_connections,
+                        "max_per_host": max_per_host
                     }
                 }
 
@@ -3526,12 +3509,23 @@ def create_mcp_server() -> FastMCP:
                 # Concurrency tuning
                 concurrency_config = config or {}
 
-                # Initialize rate limiter if not exists
-                if _rate_limiter is None:
-                    _rate_limiter = {}
-
                 max_concurrent = concurrency_config.get("max_concurrent", 50)
                 rate_limit = concurrency_config.get("rate_limit", 10.0)  # requests per second
+                adaptive = concurrency_config.get("adaptive", True)
+
+                await pool.configure_connections(
+                    max_concurrent_requests=max_concurrent,
+                    max_connections_per_host=pool.max_connections_per_host
+                )
+                pool.configure_rate_limit(
+                    RateLimitConfig(
+                        requests_per_second=rate_limit,
+                        burst_size=max(1, int(rate_limit * 2)),
+                        strategy=RateLimitStrategy.ADAPTIVE if adaptive else RateLimitStrategy.BALANCED
+                    )
+                    if rate_limit
+                    else None
+                )
 
                 return {
                     "success": True,
@@ -3539,7 +3533,7 @@ def create_mcp_server() -> FastMCP:
                     "concurrency_config": {
                         "max_concurrent": max_concurrent,
                         "rate_limit": rate_limit,
-                        "adaptive_enabled": concurrency_config.get("adaptive", True)
+                        "adaptive_enabled": adaptive
                     }
                 }
 
@@ -3608,11 +3602,11 @@ def create_mcp_server() -> FastMCP:
                     }
 
             elif metric_type == "cache":
-                # Cache performance metrics
-                global _cache_manager
+                # Shared response cache metrics of the fetcher pool
+                pool_stats = get_fetcher_pool().get_stats()
 
-                if _cache_manager:
-                    stats = _cache_manager.get_stats()
+                if "cache" in pool_stats:
+                    stats = pool_stats["cache"]
                     return {
                         "success": True,
                         "metric_type": metric_type,
@@ -3621,7 +3615,11 @@ def create_mcp_server() -> FastMCP:
                             "misses": stats.get("misses", 0),
                             "sets": stats.get("sets", 0),
                             "hit_rate": stats.get("hits", 0) / max(stats.get("hits", 0) + stats.get("misses", 0), 1) * 100,
-                            "size": stats.get("size", 0)
+                            "size": stats.get("size", 0),
+                            "bytes": stats.get("bytes", 0),
+                            "evictions": stats.get("evictions", 0),
+                            "pool_requests": pool_stats["requests"],
+                            "pool_cache_hits": pool_stats["cache_hits"]
                         }
                     }
                 else:
@@ -3629,37 +3627,21 @@ def create_mcp_server() -> FastMCP:
                         "success": True,
                         "metric_type": metric_type,
                         "cache_metrics": {
-                            "status": "not_configured",
-                            "message": "Cache manager not initialized"
+                            "status": "enabled" if pool_stats["cache_enabled"] else "not_configured",
+                            "message": "No requests cached yet" if pool_stats["cache_enabled"] else "Cache manager not initialized"
                         }
                     }
 
             elif metric_type == "connections":
-                # Connection pool metrics
-                global _connection_pool
-
-                if _connection_pool and hasattr(_connection_pool, '_connector'):
-                    connector = _connection_pool._connector
-                    return {
-                        "success": True,
-                        "metric_type": metric_type,
-                        "connection_metrics": {
-                            "total_connections": getattr(connector, '_total_connections', 0),
-                            "available_connections": getattr(connector, '_available_connections', 0),
-                            "acquired_connections": getattr(connector, '_acquired_connections', 0),
-                            "limit": getattr(connector, '_limit', 0),
-                            "limit_per_host": getattr(connector, '_limit_per_host', 0)
-                        }
-                    }
-                else:
-                    return {
-                        "success": True,
-                        "metric_type": metric_type,
-                        "connection_metrics": {
-                            "status": "not_configured",
-                            "message": "Connection pool not initialized"
-                        }
+                # Fetcher pool and shared session metrics
+                return {
+                    "success": True,
+                    "metric_type": metric_type,
+                    "connection_metrics": {
+                        "fetcher_pool": get_fetcher_pool().get_stats(),
+                        "shared_sessions": shared_sessions.get_stats()
                     }
+                }
 
             elif metric_type == "memory":
                 # Memory usage metrics
@@ -22,6 +22,12 @@ from web_fetch.exceptions import (
 )
 
 
+async def _aiter(chunks):
+    """Yield chunks the way aiohttp's StreamReader.iter_any does."""
+    for chunk in chunks:
+        yield chunk
+
+
 class TestNetworkErrorConditions:
     """Test various network error conditions."""
 
@@ -270,6 +276,10 @@ class TestRateLimitErrorConditions:
             mock_response.reason = "Too Many Requests"
             mock_response.headers = {'retry-after': '60'}
             mock_response.text.return_value = "Rate limit exceeded"
+            # The body is streamed from response.content, as with aiohttp
+            mock_response.content_length = None
+            mock_response.content = Mock()
+            mock_response.content.iter_any = lambda: _aiter([b"Rate limit exceeded"])
             mock_request.return_value.__aenter__.return_value = mock_response
             
             async with WebFetcher(fetcher_config) as fetcher:
@@ -0,0 +1,201 @@
+"""
+Tests for the MCP server's persistent fetcher pool.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from aioresponses import aioresponses
+
+from mcp_server.fetcher_pool import FetcherPool, timeout_class
+from web_fetch import ContentType, FetchRequest
+from web_fetch.utils import EnhancedCacheConfig, RateLimitConfig
+
+
+class TestFetcherPool:
+    """Test FetcherPool reuse, caching and statistics."""
+
+    def test_timeout_class(self):
+        """Test that timeouts map to the smallest covering class."""
+        assert timeout_class(5.0).name == "short"
+        assert timeout_class(30.0).name == "medium"
+        assert timeout_class(120.0).name == "long"
+        assert timeout_class(1000.0).name == "long"
+
+    @pytest.mark.asyncio
+    async def test_fetchers_are_reused_per_key(self):
+        """Test that calls with the same settings share one fetcher."""
+        pool = FetcherPool()
+        try:
+            first = await pool.get_fetcher(verify_ssl=True, timeout=20.0)
+            second = await pool.get_fetcher(verify_ssl=True, timeout=45.0)
+            insecure = await pool.get_fetcher(verify_ssl=False, timeout=20.0)
+            no_redirects = await pool.get_fetcher(timeout=20.0, follow_redirects=False)
+
+            assert first is second
+            assert insecure is not first
+            assert no_redirects is not first
+            assert not no_redirects.config.follow_redirects
+            assert pool.get_stats()["fetchers_created"] == 3
+        finally:
+            await pool.close()
+
+        assert first._session is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_applies_per_call_options(self):
+        """Test that per-call timeout and retries do not create new fetchers."""
+        pool = FetcherPool()
+        try:
+            with aioresponses() as m:
+                m.get("https://example.com/a", status=503)
+                m.get("https://example.com/a", status=503)
+                m.get("https://example.com/b", status=200, body="ok")
+
+                failed = await pool.fetch(
+                    FetchRequest(url="https://example.com/a"),
+                    timeout=20.0,
+                    max_retries=1,
+                )
+                result = await pool.fetch(
+                    FetchRequest(
+                        url="https://example.com/b", content_type=ContentType.TEXT
+                    ),
+                    timeout=50.0,
+                )
+
+            assert not failed.is_success
+            assert failed.retry_count == 1
+            assert result.is_success
+            assert result.content == "ok"
+            assert pool.get_stats()["fetchers_created"] == 1
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_shared_cache_serves_repeated_gets(self):
+        """Test that successful GET responses are served from the cache."""
+        pool = FetcherPool(
+            cache_config=EnhancedCacheConfig(max_size=500, default_ttl=300.0)
+        )
+        try:
+            with aioresponses() as m:
+                m.get("https://example.com/data", status=200, payload={"n": 1})
+
+                request = FetchRequest(
+                    url="https://example.com/data", content_type=ContentType.JSON
+                )
+                first = await pool.fetch(request)
+                second = await pool.fetch(request)
+                text = await pool.fetch(
+                    FetchRequest(
+                        url="https://example.com/data", content_type=ContentType.TEXT
+                    )
+                )
+
+            assert first.content == {"n": 1}
+            assert second is first
+            # Different content type is a different cache entry
+            assert not text.is_success
+
+            stats = pool.get_stats()
+            assert stats["requests"] == 3
+            assert stats["cache_hits"] == 1
+            assert stats["cache"]["hits"] == 1
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_batch_keeps_order(self):
+        """Test that fetch_batch returns results in request order."""
+        pool = FetcherPool(rate_limit_config=RateLimitConfig(requests_per_second=100))
+        try:
+            with aioresponses() as m:
+                for i in range(5):
+                    m.get(f"https://example.com/{i}", status=200, body=str(i))
+
+                batch = await pool.fetch_batch(
+                    [
+                        FetchRequest(
+                            url=f"https://example.com/{i}",
+                            content_type=ContentType.TEXT,
+                        )
+                        for i in range(5)
+                    ],
+                    max_concurrent=2,
+                )
+
+            assert [r.content for r in batch.results] == ["0", "1", "2", "3", "4"]
+            assert batch.successful_requests == 5
+            assert "example.com" in pool.get_stats()["rate_limits"]
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_configure_connections_rebuilds_fetchers(self):
+        """Test that changing connection limits replaces pooled fetchers."""
+        pool = FetcherPool()
+        try:
+            old = await pool.get_fetcher()
+            await pool.configure_connections(
+                max_concurrent_requests=5, max_connections_per_host=2
+            )
+            new = await pool.get_fetcher()
+
+            assert new is not old
+            assert new.config.max_concurrent_requests == 5
+            assert new.config.max_connections_per_host == 2
+        finally:
+            await pool.close()
+
+    def test_cache_is_off_by_default(self):
+        """Test that responses are only cached when a cache config is given."""
+        pool = FetcherPool()
+        assert pool.get_stats()["cache_enabled"] is False
+        assert pool._get_cache() is None
+
+    def test_loop_change_closes_fetchers(self):
+        """Test that fetchers from a finished loop are closed, not dropped."""
+        pool = FetcherPool()
+        old = asyncio.run(pool.get_fetcher())
+        session = old._session
+
+        async def on_new_loop():
+            try:
+                return await pool.get_fetcher()
+            finally:
+                await pool.close()
+
+        new = asyncio.run(on_new_loop())
+
+        assert new is not old
+        assert old._session is None
+        assert session.closed
+
+    def test_loop_change_closes_on_running_loop(self):
+        """Test that fetchers of a loop still running are closed on that loop."""
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            pool = FetcherPool()
+            old = asyncio.run_coroutine_threadsafe(pool.get_fetcher(), loop).result()
+            session = old._session
+
+            async def on_new_loop():
+                try:
+                    return await pool.get_fetcher()
+                finally:
+                    await pool.close()
+
+            asyncio.run(on_new_loop())
+            # The close was queued on the old loop before this sleep
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0.1), loop).result()
+
+            assert old._session is None
+            assert session.closed
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
@@ -64,7 +64,7 @@ class TestConvenienceFunctions:
             result = await fetch_url("https://example.com", config=config)
 
             assert result == mock_result
-            mock_fetcher_class.assert_called_with(config)
+            mock_fetcher_class.assert_called_with(config, shared_session=False)
 
     @pytest.mark.asyncio
     async def test_fetch_urls_batch(self):
@@ -243,7 +243,7 @@ class TestFetchUrlAdvanced:
             result = await fetch_url("https://api.example.com", ContentType.JSON, config)
 
             assert result == mock_result
-            mock_fetcher_class.assert_called_with(config)
+            mock_fetcher_class.assert_called_with(config, shared_session=False)
 
 
 class TestFetchUrlsAdvanced:
@@ -0,0 +1,155 @@
+"""
+Tests for streaming batch fetching with WebFetcher.fetch_iter.
+"""
+
+import asyncio
+import re
+
+import pytest
+from aioresponses import CallbackResult, aioresponses
+
+from web_fetch.core_fetcher import WebFetcher
+from web_fetch.models import (
+    BatchFetchResult,
+    BatchFetchStats,
+    FetchConfig,
+    FetchRequest,
+)
+from web_fetch.models.base import ContentType
+from web_fetch.models.http import FetchResult
+
+
+def _request(i: int) -> FetchRequest:
+    """Build a text request for item i."""
+    return FetchRequest(
+        url=f"https://example.com/item/{i}", content_type=ContentType.TEXT
+    )
+
+
+class TestFetchIter:
+    """Test fetch_iter streaming behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_yields_in_completion_order(self):
+        """Test that fast responses are yielded before slow ones."""
+
+        async def slow(url, **kwargs):
+            await asyncio.sleep(0.1)
+            return CallbackResult(status=200, body="slow")
+
+        with aioresponses() as m:
+            m.get("https://example.com/item/0", callback=slow)
+            m.get("https://example.com/item/1", status=200, body="fast")
+
+            async with WebFetcher(FetchConfig(max_retries=0)) as fetcher:
+                urls = [
+                    result.url
+                    async for result in fetcher.fetch_iter([_request(0), _request(1)])
+                ]
+
+        assert urls == ["https://example.com/item/1", "https://example.com/item/0"]
+
+    @pytest.mark.asyncio
+    async def test_window_bounds_in_flight_requests(self):
+        """Test that the source is only consumed as results are yielded."""
+        pulled = 0
+
+        async def source():
+            nonlocal pulled
+            for i in range(50):
+                pulled += 1
+                yield _request(i)
+
+        with aioresponses() as m:
+            m.get(re.compile(r"https://example\.com/item/\d+"), body="ok", repeat=True)
+
+            async with WebFetcher(FetchConfig(max_retries=0)) as fetcher:
+                yielded = 0
+                async for _ in fetcher.fetch_iter(source(), window=5):
+                    yielded += 1
+                    assert pulled - yielded < 5
+
+        assert yielded == 50
+
+    @pytest.mark.asyncio
+    async def test_no_request_cap_and_incremental_stats(self):
+        """Test more requests than BatchFetchRequest allows, with running stats."""
+        stats = BatchFetchStats()
+
+        with aioresponses() as m:
+            m.get(re.compile(r"https://example\.com/item/\d+"), body="ok", repeat=True)
+
+            async with WebFetcher(FetchConfig(max_retries=0)) as fetcher:
+                count = 0
+                async for result in fetcher.fetch_iter(
+                    (_request(i) for i in range(1500)), stats=stats
+                ):
+                    assert result.is_success
+                    count += 1
+
+        assert count == 1500
+        assert stats.total_requests == 1500
+        assert stats.successful_requests == 1500
+        assert stats.success_rate == 100.0
+        assert stats.status_codes == {200: 1500}
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_pending(self):
+        """Test that breaking out of the loop cancels in-flight requests."""
+
+        async def hang(url, **kwargs):
+            await asyncio.sleep(10)
+            return CallbackResult(status=200, body="late")
+
+        with aioresponses() as m:
+            m.get("https://example.com/item/0", status=200, body="first")
+            for i in range(1, 4):
+                m.get(f"https://example.com/item/{i}", callback=hang)
+
+            async with WebFetcher(FetchConfig(max_retries=0)) as fetcher:
+                results = fetcher.fetch_iter([_request(i) for i in range(4)])
+                async for result in results:
+                    break
+                await asyncio.wait_for(results.aclose(), timeout=1.0)
+
+                assert fetcher.get_scheduler_stats()["active"] == 0
+
+        assert result.url == "https://example.com/item/0"
+
+    @pytest.mark.asyncio
+    async def test_invalid_window(self):
+        """Test that a window below one is rejected."""
+        async with WebFetcher() as fetcher:
+            with pytest.raises(ValueError):
+                async for _ in fetcher.fetch_iter([], window=0):
+                    pass
+
+
+class TestBatchFetchStats:
+    """Test incremental batch statistics."""
+
+    def test_record(self):
+        """Test that stats track counts and response times."""
+        stats = BatchFetchStats()
+        stats.record(FetchResult(url="a", status_code=200, response_time=0.5))
+        stats.record(FetchResult(url="b", status_code=404, response_time=1.5))
+
+        assert stats.total_requests == 2
+        assert stats.successful_requests == 1
+        assert stats.failed_requests == 1
+        assert stats.average_response_time == 1.0
+        assert stats.min_response_time == 0.5
+        assert stats.max_response_time == 1.5
+        assert stats.status_codes == {200: 1, 404: 1}
+
+    def test_batch_result_uses_stats(self):
+        """Test that BatchFetchResult totals match the running stats."""
+        results = [
+            FetchResult(url="a", status_code=200),
+            FetchResult(url="b", status_code=500),
+        ]
+        batch = BatchFetchResult.from_results(results, total_time=1.0)
+
+        assert batch.total_requests == 2
+        assert batch.successful_requests == 1
+        assert batch.failed_requests == 1
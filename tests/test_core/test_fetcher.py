@@ -36,7 +36,7 @@ class TestWebFetcher:
         """Test WebFetcher as async context manager."""
         async with WebFetcher() as fetcher:
             assert fetcher._session is not None
-            assert fetcher._semaphore is not None
+            assert fetcher._scheduler is not None
         
         # Session should be closed after context exit
         assert fetcher._session is None
@@ -54,7 +54,7 @@ class TestWebFetcher:
         await fetcher._create_session()
         
         assert fetcher._session is not None
-        assert fetcher._semaphore._value == 5  # Semaphore limit
+        assert fetcher._scheduler.max_concurrent == 5  # Concurrency limit
         
         await fetcher.close()
     
@@ -49,13 +49,13 @@ class TestWebFetcherComprehensive:
         
         # Initially no session
         assert fetcher._session is None
-        assert fetcher._semaphore is None
+        assert fetcher._scheduler is None
         
         # Create session manually
         await fetcher._create_session()
         assert fetcher._session is not None
-        assert fetcher._semaphore is not None
-        assert fetcher._semaphore._value == 10
+        assert fetcher._scheduler is not None
+        assert fetcher._scheduler.max_concurrent == 10
         
         # Session should have correct configuration
         session = fetcher._session
@@ -67,7 +67,7 @@ class TestWebFetcherComprehensive:
         # Close session
         await fetcher.close()
         assert fetcher._session is None
-        assert fetcher._semaphore is None
+        assert fetcher._scheduler is None
         
         # Double close should be safe
         await fetcher.close()
@@ -0,0 +1,248 @@
+"""
+Tests for the per-host fair scheduler used by WebFetcher.
+
+Covers global and per-host caps, round-robin fairness across hosts, priority
+lanes, cancellation, and a crawl-style benchmark with one slow host.
+"""
+
+import asyncio
+import time
+
+import pytest
+from aioresponses import CallbackResult, aioresponses
+
+from web_fetch.core_fetcher import HostScheduler, RequestPriority, WebFetcher
+from web_fetch.models import ContentType, FetchConfig, FetchRequest
+
+
+def _request(host: str) -> FetchRequest:
+    """Build a request for host."""
+    return FetchRequest(url=f"https://{host}/")
+
+
+async def _queue(
+    scheduler: HostScheduler,
+    host: str,
+    order: list,
+    priority: int = RequestPriority.NORMAL,
+) -> asyncio.Task:
+    """Start a task that records host in order once it gets a slot."""
+
+    async def run() -> None:
+        await scheduler.acquire(host, _request(host), priority)
+        order.append(host)
+
+    task = asyncio.create_task(run())
+    await asyncio.sleep(0)
+    return task
+
+
+class TestHostScheduler:
+    """Test HostScheduler slot accounting and ordering."""
+
+    @pytest.mark.asyncio
+    async def test_global_and_per_host_caps(self):
+        """Test that neither cap is exceeded."""
+        scheduler = HostScheduler(max_concurrent=3, max_per_host=2)
+        order: list = []
+
+        tasks = [await _queue(scheduler, "a.com", order) for _ in range(3)]
+        tasks.append(await _queue(scheduler, "b.com", order))
+        tasks.append(await _queue(scheduler, "c.com", order))
+
+        # a.com is capped at 2, leaving the third slot for b.com
+        assert order == ["a.com", "a.com", "b.com"]
+        assert scheduler.active == 3
+        assert scheduler.waiting == 2
+
+        scheduler.release("a.com")
+        await asyncio.sleep(0)
+        # Round-robin hands the freed slot to a.com's queued request only
+        # after c.com, which has been waiting without a turn
+        assert order[-1] == "c.com"
+
+        for task in tasks:
+            task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_round_robin_across_hosts(self):
+        """Test that a deep queue for one host does not delay other hosts."""
+        scheduler = HostScheduler(max_concurrent=1, max_per_host=1)
+        order: list = []
+
+        await scheduler.acquire("busy.com", _request("busy.com"))
+        for _ in range(3):
+            await _queue(scheduler, "busy.com", order)
+        await _queue(scheduler, "x.com", order)
+        await _queue(scheduler, "y.com", order)
+
+        for host in ["busy.com", "x.com", "y.com", "busy.com", "busy.com"]:
+            scheduler.release(host)
+            await asyncio.sleep(0)
+
+        assert order == ["x.com", "y.com", "busy.com", "busy.com", "busy.com"]
+
+    @pytest.mark.asyncio
+    async def test_priority_lanes(self):
+        """Test that higher priority requests start first."""
+        scheduler = HostScheduler(max_concurrent=1, max_per_host=5)
+        order: list = []
+
+        await scheduler.acquire("hold.com", _request("hold.com"))
+        await _queue(scheduler, "low.com", order, RequestPriority.LOW)
+        await _queue(scheduler, "normal.com", order, RequestPriority.NORMAL)
+        await _queue(scheduler, "high.com", order, RequestPriority.HIGH)
+
+        for host in ["hold.com", "high.com", "normal.com"]:
+            scheduler.release(host)
+            await asyncio.sleep(0)
+
+        assert order == ["high.com", "normal.com", "low.com"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_is_removed(self):
+        """Test that cancelling a queued request frees its place."""
+        scheduler = HostScheduler(max_concurrent=1, max_per_host=1)
+        order: list = []
+
+        await scheduler.acquire("a.com", _request("a.com"))
+        task = await _queue(scheduler, "b.com", order)
+        task.cancel()
+        await asyncio.sleep(0)
+
+        assert scheduler.waiting == 0
+        scheduler.release("a.com")
+
+        assert scheduler.get_stats()["active"] == 0
+        assert scheduler.get_stats()["hosts"] == 0
+
+    @pytest.mark.asyncio
+    async def test_waiter_cancelled_in_same_tick_as_release(self):
+        """Test that a release racing a cancellation skips the cancelled waiter."""
+        scheduler = HostScheduler(max_concurrent=1, max_per_host=1)
+        order: list = []
+
+        await scheduler.acquire("a.com", _request("a.com"))
+        cancelled = await _queue(scheduler, "b.com", order)
+        waiting = await _queue(scheduler, "c.com", order)
+
+        # The waiter's future is cancelled but its task has not run yet
+        cancelled.cancel()
+        scheduler.release("a.com")
+        await asyncio.sleep(0)
+
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert order == ["c.com"]
+        assert scheduler.active == 1 and scheduler.waiting == 0
+        await waiting
+        scheduler.release("c.com")
+        assert scheduler.get_stats()["active"] == 0
+        assert scheduler.get_stats()["hosts"] == 0
+
+    @pytest.mark.asyncio
+    async def test_granted_waiter_cancelled_hands_slot_on(self):
+        """Test that a waiter cancelled after its grant passes the slot on."""
+        scheduler = HostScheduler(max_concurrent=1, max_per_host=1)
+        order: list = []
+
+        await scheduler.acquire("a.com", _request("a.com"))
+        granted = await _queue(scheduler, "b.com", order)
+        waiting = await _queue(scheduler, "c.com", order)
+
+        # Granted to b.com, then cancelled before the task resumes
+        scheduler.release("a.com")
+        granted.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await granted
+        await waiting
+
+        assert order == ["c.com"]
+        assert scheduler.active == 1 and scheduler.waiting == 0
+
+
+class TestFairFetch:
+    """Test fairness through WebFetcher.fetch_single."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.performance
+    async def test_slow_host_does_not_starve_fast_hosts(self):
+        """Test crawl-style throughput with one slow host."""
+        config = FetchConfig(
+            max_concurrent_requests=4, max_connections_per_host=2, max_retries=0
+        )
+        slow = [f"https://slow.example.com/{i}" for i in range(8)]
+        fast = [f"https://fast{i}.example.org/" for i in range(20)]
+
+        async def slow_response(url, **kwargs):
+            await asyncio.sleep(0.2)
+            return CallbackResult(status=200, body="slow")
+
+        with aioresponses() as m:
+            for url in slow:
+                m.get(url, callback=slow_response)
+            for url in fast:
+                m.get(url, status=200, body="fast")
+
+            async with WebFetcher(config) as fetcher:
+                start = time.perf_counter()
+                finished = {}
+
+                async def fetch(url: str) -> None:
+                    request = FetchRequest(url=url, content_type=ContentType.TEXT)
+                    result = await fetcher.fetch_single(request)
+                    assert result.status_code == 200
+                    finished[url] = time.perf_counter() - start
+
+                await asyncio.gather(*(fetch(url) for url in slow + fast))
+                assert fetcher.get_scheduler_stats()["hosts"] == 0
+
+        slowest_fast = max(finished[url] for url in fast)
+        slowest_slow = max(finished[url] for url in slow)
+
+        print(
+            f"\nFast hosts done in {slowest_fast * 1000:.0f}ms, "
+            f"slow host done in {slowest_slow * 1000:.0f}ms"
+        )
+
+        # Eight slow requests two at a time take about 0.8s
+        assert slowest_slow >= 0.7
+        assert slowest_fast < 0.15
+
+    @pytest.mark.asyncio
+    async def test_priority_ignored_unless_enabled(self):
+        """Test that priorities only apply with enable_request_prioritization."""
+        config = FetchConfig(max_concurrent_requests=1, max_retries=0)
+        urls = [f"https://p{i}.example.com/" for i in range(3)]
+
+        for enabled, expected in [(True, urls[::-1]), (False, urls)]:
+            order = []
+
+            with aioresponses() as m:
+                for url in urls:
+                    m.get(url, status=200, body="ok")
+
+                async with WebFetcher(
+                    config, enable_request_prioritization=enabled
+                ) as fetcher:
+                    await fetcher._scheduler.acquire("hold", _request("hold.com"))
+
+                    async def fetch(url: str, priority: int) -> None:
+                        await fetcher.fetch_single(
+                            FetchRequest(url=url, content_type=ContentType.TEXT),
+                            priority=priority,
+                        )
+                        order.append(url)
+
+                    tasks = []
+                    for url, priority in zip(
+                        urls,
+                        [RequestPriority.LOW, RequestPriority.NORMAL, RequestPriority.HIGH],
+                    ):
+                        tasks.append(asyncio.create_task(fetch(url, priority)))
+                        await asyncio.sleep(0)
+
+                    fetcher._scheduler.release("hold")
+                    await asyncio.gather(*tasks)
+
+            assert order == expected
@@ -0,0 +1,200 @@
+"""
+Tests for off-loop HTML parsing in WebFetcher.
+
+Covers the ParseExecutor modes, FetchConfig wiring, and a benchmark of
+event-loop lag under a mixed HTML load.
+"""
+
+import asyncio
+import time
+
+import pytest
+from aioresponses import aioresponses
+
+from web_fetch.core_fetcher import WebFetcher
+from web_fetch.models import ContentType, FetchConfig, FetchRequest, ParseExecutorMode
+from web_fetch.utils.parse_executor import ParseExecutor, parse_html_bytes
+
+SAMPLE_HTML = b"""
+<html>
+  <head><title>Test Page</title></head>
+  <body>
+    <p>Hello world</p>
+    <a href="/one">One</a>
+    <a href="https://example.com/two">Two</a>
+    <img src="/logo.png">
+  </body>
+</html>
+"""
+
+
+def _large_html(paragraphs: int) -> bytes:
+    """Build a large HTML document that is expensive to parse."""
+    body = "".join(
+        f'<div><p>Paragraph {i} text</p><a href="/link/{i}">link</a></div>'
+        for i in range(paragraphs)
+    )
+    return f"<html><head><title>Big</title></head><body>{body}</body></html>".encode()
+
+
+class TestParseHtmlBytes:
+    """Test the picklable HTML parse function."""
+
+    def test_extracts_structure(self):
+        """Test that title, text, links and images are returned."""
+        result = parse_html_bytes(SAMPLE_HTML)
+
+        assert result["title"] == "Test Page"
+        assert "Hello world" in result["text"]
+        assert result["links"] == ["/one", "https://example.com/two"]
+        assert result["images"] == ["/logo.png"]
+        assert "raw_html" not in result
+
+    def test_title_is_plain_str(self):
+        """Test that title is a plain str so results pickle across processes."""
+        result = parse_html_bytes(SAMPLE_HTML)
+        assert type(result["title"]) is str
+
+
+class TestParseExecutor:
+    """Test ParseExecutor dispatch modes."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "mode",
+        [ParseExecutorMode.INLINE, ParseExecutorMode.THREAD, ParseExecutorMode.PROCESS],
+    )
+    async def test_modes_return_same_shape(self, mode):
+        """Test that every mode returns identical results."""
+        executor = ParseExecutor(mode=mode, max_workers=2)
+        try:
+            result = await executor.run(parse_html_bytes, SAMPLE_HTML)
+        finally:
+            executor.shutdown(wait=True)
+
+        assert result == parse_html_bytes(SAMPLE_HTML)
+
+    @pytest.mark.asyncio
+    async def test_small_payloads_stay_inline(self):
+        """Test that payloads below the threshold are not offloaded."""
+        executor = ParseExecutor(
+            mode=ParseExecutorMode.THREAD, offload_threshold=len(SAMPLE_HTML) + 1
+        )
+
+        await executor.run(parse_html_bytes, SAMPLE_HTML)
+
+        stats = executor.get_stats()
+        assert stats["inline_count"] == 1
+        assert stats["offloaded_count"] == 0
+        assert stats["pool_active"] is False
+
+    @pytest.mark.asyncio
+    async def test_shutdown_releases_pool(self):
+        """Test that shutdown releases the lazily created pool."""
+        executor = ParseExecutor(mode=ParseExecutorMode.THREAD)
+        await executor.run(parse_html_bytes, SAMPLE_HTML)
+        assert executor.get_stats()["pool_active"] is True
+
+        executor.shutdown(wait=True)
+        assert executor.get_stats()["pool_active"] is False
+
+    def test_accepts_string_mode(self):
+        """Test that string values from FetchConfig are accepted."""
+        executor = ParseExecutor(mode="thread")
+        assert executor.mode == ParseExecutorMode.THREAD
+
+
+class TestWebFetcherParseExecutor:
+    """Test WebFetcher integration with the parse executor."""
+
+    def test_config_defaults(self):
+        """Test FetchConfig parse defaults."""
+        config = FetchConfig()
+        assert config.parse_executor == ParseExecutorMode.INLINE
+        assert config.parse_max_workers is None
+        assert config.parse_offload_threshold == 64 * 1024
+
+    @pytest.mark.asyncio
+    async def test_fetch_html_with_thread_executor(self):
+        """Test that HTML fetched through a thread executor keeps the dict shape."""
+        config = FetchConfig(
+            parse_executor=ParseExecutorMode.THREAD, parse_offload_threshold=0
+        )
+
+        with aioresponses() as m:
+            m.get("https://example.com/page", body=SAMPLE_HTML, status=200)
+
+            async with WebFetcher(config) as fetcher:
+                result = await fetcher.fetch_single(
+                    FetchRequest(url="https://example.com/page", content_type=ContentType.HTML)
+                )
+                stats = fetcher._parse_executor.get_stats()
+
+        assert result.is_success
+        assert result.content["title"] == "Test Page"
+        assert result.content["links"] == ["/one", "https://example.com/two"]
+        assert stats["offloaded_count"] == 1
+        assert fetcher._parse_executor.get_stats()["pool_active"] is False
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+class TestParseExecutorBenchmark:
+    """Benchmark event-loop lag while parsing a mixed HTML load."""
+
+    async def _measure_max_loop_lag(self, mode: ParseExecutorMode) -> float:
+        """Fetch a mix of large and small pages and return the worst loop lag."""
+        config = FetchConfig(
+            parse_executor=mode,
+            parse_max_workers=2,
+            parse_offload_threshold=0,
+            max_concurrent_requests=20,
+        )
+        large = _large_html(5000)
+        urls = [f"https://example.com/page/{i}" for i in range(12)]
+        max_lag = 0.0
+        done = asyncio.Event()
+
+        async def ticker() -> None:
+            nonlocal max_lag
+            interval = 0.005
+            while not done.is_set():
+                start = time.perf_counter()
+                await asyncio.sleep(interval)
+                max_lag = max(max_lag, time.perf_counter() - start - interval)
+
+        with aioresponses() as m:
+            for i, url in enumerate(urls):
+                m.get(url, body=large if i % 3 == 0 else SAMPLE_HTML, status=200)
+
+            async with WebFetcher(config) as fetcher:
+                tick_task = asyncio.create_task(ticker())
+                results = await asyncio.gather(
+                    *[
+                        fetcher.fetch_single(
+                            FetchRequest(url=url, content_type=ContentType.HTML)
+                        )
+                        for url in urls
+                    ]
+                )
+                done.set()
+                await tick_task
+
+        assert all(r.is_success for r in results)
+        return max_lag
+
+    @pytest.mark.asyncio
+    async def test_event_loop_lag_by_mode(self):
+        """Offloading parsing keeps the loop more responsive than inline parsing."""
+        inline_lag = await self._measure_max_loop_lag(ParseExecutorMode.INLINE)
+        thread_lag = await self._measure_max_loop_lag(ParseExecutorMode.THREAD)
+        process_lag = await self._measure_max_loop_lag(ParseExecutorMode.PROCESS)
+
+        # Absolute lag depends on the machine, so only compare the modes.
+        # Offloaded lag is usually a tenth of inline lag or less, even on one CPU
+        lags = (
+            f"inline={inline_lag * 1000:.1f}ms thread={thread_lag * 1000:.1f}ms "
+            f"process={process_lag * 1000:.1f}ms"
+        )
+        assert thread_lag < inline_lag / 2, lags
+        assert process_lag < inline_lag / 2, lags
@@ -0,0 +1,192 @@
+"""
+Tests for per-domain rate limiting in WebFetcher.
+
+Covers the AdvancedRateLimiter integration in fetch_single: throttled domains
+must wait outside the concurrency semaphore, and Retry-After/X-RateLimit-*
+headers must feed back into the limiter.
+"""
+
+import asyncio
+import time
+
+import pytest
+from aioresponses import aioresponses
+
+from web_fetch.core_fetcher import WebFetcher
+from web_fetch.models import ContentType, FetchConfig, FetchRequest
+from web_fetch.utils.advanced_rate_limiter import (
+    AdvancedRateLimiter,
+    RateLimitAlgorithm,
+    RateLimitConfig,
+)
+
+
+def _rate_limit_config(rps: float = 5.0, burst: int = 1) -> RateLimitConfig:
+    """Build a limiter config without circuit breaking for deterministic tests."""
+    return RateLimitConfig(
+        algorithm=RateLimitAlgorithm.TOKEN_BUCKET,
+        requests_per_second=rps,
+        burst_size=burst,
+        circuit_breaker_enabled=False,
+    )
+
+
+class TestTokenBucketReservation:
+    """Test that concurrent callers queue behind each other."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquires_are_spaced(self):
+        """Test that each waiter gets a distinct slot."""
+        limiter = AdvancedRateLimiter(_rate_limit_config(rps=10.0, burst=1))
+
+        delays = [await limiter.acquire("https://example.com/") for _ in range(4)]
+
+        assert delays[0] == 0.0
+        assert delays[1] == pytest.approx(0.1, abs=0.02)
+        assert delays[2] == pytest.approx(0.2, abs=0.02)
+        assert delays[3] == pytest.approx(0.3, abs=0.02)
+
+    @pytest.mark.asyncio
+    async def test_requests_per_second_is_honoured(self):
+        """Test that the configured rate is used for new domains."""
+        limiter = AdvancedRateLimiter(_rate_limit_config(rps=7.0))
+        await limiter.acquire("https://example.com/")
+
+        status = limiter.get_rate_limit_status("example.com")
+        assert status["current_rps"] == 7.0
+
+    @pytest.mark.asyncio
+    async def test_exhausted_window_waits_for_reset(self):
+        """Test that X-RateLimit-Remaining of 0 delays until the reset time."""
+        limiter = AdvancedRateLimiter(_rate_limit_config(rps=100.0, burst=10))
+        await limiter.acquire("https://example.com/")
+
+        await limiter.record_response(
+            "https://example.com/",
+            200,
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2"},
+        )
+
+        delay = await limiter.acquire("https://example.com/")
+        assert 1.5 < delay <= 2.0
+
+
+class TestWindowReservation:
+    """Test that the other algorithms also reserve slots for delayed callers."""
+
+    @staticmethod
+    async def _delays(algorithm: RateLimitAlgorithm, count: int) -> list:
+        limiter = AdvancedRateLimiter(
+            RateLimitConfig(
+                algorithm=algorithm,
+                requests_per_second=1.0,
+                burst_size=1,
+                window_size=2,
+                circuit_breaker_enabled=False,
+            )
+        )
+        return [await limiter.acquire("https://example.com/") for _ in range(count)]
+
+    @pytest.mark.asyncio
+    async def test_sliding_window(self):
+        """Test that waiters beyond the window limit get later windows."""
+        delays = await self._delays(RateLimitAlgorithm.SLIDING_WINDOW, 5)
+
+        assert delays[:2] == [0.0, 0.0]
+        assert delays[2] == pytest.approx(2.0, abs=0.05)
+        assert delays[3] == pytest.approx(2.0, abs=0.05)
+        assert delays[4] == pytest.approx(4.0, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_fixed_window(self):
+        """Test that a full window pushes waiters into the following ones."""
+        delays = await self._delays(RateLimitAlgorithm.FIXED_WINDOW, 5)
+
+        assert delays[:2] == [0.0, 0.0]
+        assert 0.0 < delays[2] <= 2.0
+        assert delays[3] == pytest.approx(delays[2], abs=0.05)
+        assert delays[4] == pytest.approx(delays[2] + 2.0, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_leaky_bucket(self):
+        """Test that each waiter drains one interval after the previous one."""
+        delays = await self._delays(RateLimitAlgorithm.LEAKY_BUCKET, 4)
+
+        assert delays[0] == 0.0
+        assert delays[1] == pytest.approx(1.0, abs=0.05)
+        assert delays[2] == pytest.approx(2.0, abs=0.05)
+        assert delays[3] == pytest.approx(3.0, abs=0.05)
+
+
+class TestRateLimitedFetch:
+    """Test rate limiting in the WebFetcher request path."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        """Test that no limiter is created without a config."""
+        fetcher = WebFetcher(FetchConfig())
+        assert fetcher.get_rate_limit_status() == {}
+
+    @pytest.mark.asyncio
+    async def test_retry_after_delays_next_request(self):
+        """Test that a 429 Retry-After header delays the next request."""
+        config = FetchConfig(max_retries=0)
+        url = "https://limited.example.com/api"
+
+        with aioresponses() as m:
+            m.get(url, status=429, headers={"Retry-After": "1"})
+            m.get(url, status=200, body="ok")
+
+            async with WebFetcher(
+                config, rate_limit_config=_rate_limit_config(rps=50.0, burst=5)
+            ) as fetcher:
+                request = FetchRequest(url=url, content_type=ContentType.TEXT)
+                first = await fetcher.fetch_single(request)
+
+                start = time.perf_counter()
+                second = await fetcher.fetch_single(request)
+                elapsed = time.perf_counter() - start
+
+        assert first.status_code == 429
+        assert second.status_code == 200
+        assert elapsed >= 0.9
+
+    @pytest.mark.asyncio
+    @pytest.mark.performance
+    async def test_throttled_domain_does_not_block_others(self):
+        """Test many-domain throughput with one heavily used domain."""
+        config = FetchConfig(max_concurrent_requests=2, max_retries=0)
+        throttled = [f"https://slow.example.com/item/{i}" for i in range(8)]
+        others = [f"https://site{i}.example.org/" for i in range(20)]
+
+        with aioresponses() as m:
+            for url in throttled + others:
+                m.get(url, status=200, body="ok")
+
+            async with WebFetcher(
+                config, rate_limit_config=_rate_limit_config(rps=5.0, burst=1)
+            ) as fetcher:
+                start = time.perf_counter()
+                finished = {}
+
+                async def fetch(url: str) -> None:
+                    request = FetchRequest(url=url, content_type=ContentType.TEXT)
+                    result = await fetcher.fetch_single(request)
+                    assert result.status_code == 200
+                    finished[url] = time.perf_counter() - start
+
+                # Queue the throttled domain first so it would hold every
+                # semaphore slot if it slept while holding one
+                await asyncio.gather(*(fetch(url) for url in throttled + others))
+
+        slowest_other = max(finished[url] for url in others)
+        slowest_throttled = max(finished[url] for url in throttled)
+
+        print(
+            f"\nOther domains done in {slowest_other * 1000:.0f}ms, "
+            f"throttled domain done in {slowest_throttled * 1000:.0f}ms"
+        )
+
+        # Seven reserved slots at 5 rps take about 1.4s
+        assert slowest_throttled >= 1.2
+        assert slowest_other < 0.5
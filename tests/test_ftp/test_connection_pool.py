@@ -0,0 +1,178 @@
+"""
+Tests for the per-host FTP connection pool.
+
+Covers connecting without blocking other hosts, the per-host connection
+limit, pre-warming, background health checks, wait-time metrics, and a
+benchmark of a fast host's checkout latency while another host is slow.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from web_fetch.ftp import FTPConfig
+from web_fetch.ftp.connection import FTPConnectionPool
+from web_fetch.ftp.metrics import FTPMetricsCollector
+
+SLOW = "ftp://slow.example.com/file"
+FAST = "ftp://fast.example.com/file"
+
+
+def make_pool(delays=None, **kwargs):
+    """Create a pool whose connections take delays[host] seconds to open."""
+    options = {"performance_monitoring": False, "adaptive_cleanup_interval": False}
+    options.update(kwargs)
+    pool = FTPConnectionPool(FTPConfig(**options))
+    opened = []
+
+    async def create(host, port, username, password):
+        await asyncio.sleep((delays or {}).get(host, 0))
+        client = MagicMock(name=host)
+        client.command = AsyncMock()
+        client.quit = AsyncMock()
+        opened.append(host)
+        return client
+
+    pool._create_connection = create
+    return pool, opened
+
+
+class TestFTPConnectionPool:
+    """Test FTPConnectionPool checkout, limits and maintenance."""
+
+    @pytest.mark.asyncio
+    async def test_slow_host_does_not_block_other_hosts(self):
+        """Test that connecting to one host does not delay another."""
+        pool, _ = make_pool({"slow.example.com": 0.5})
+
+        async def checkout(url):
+            started = time.perf_counter()
+            async with pool.get_connection(url):
+                return time.perf_counter() - started
+
+        slow = asyncio.create_task(checkout(SLOW))
+        await asyncio.sleep(0.01)
+        fast = await checkout(FAST)
+        assert fast < 0.1
+        assert await slow >= 0.5
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit_and_reuse(self):
+        """Test that waiters get a returned connection instead of a new one."""
+        pool, opened = make_pool({"fast.example.com": 0.01}, max_connections_per_host=2)
+        active = peak = 0
+
+        async def use():
+            nonlocal active, peak
+            async with pool.get_connection(FAST):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.02)
+                active -= 1
+
+        await asyncio.gather(*(use() for _ in range(8)))
+        assert peak == 2
+        assert len(opened) == 2
+
+        stats = pool.get_pool_stats()
+        info = stats["connection_info"]["fast.example.com:21:anonymous"]
+        assert info["connection_count"] == 8
+        assert stats["active_connections"] == 0 and stats["idle_connections"] == 2
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_failed_use_discards_connection(self):
+        """Test that a connection is closed when its use raised an error."""
+        pool, opened = make_pool()
+        with pytest.raises(ConnectionResetError):
+            async with pool.get_connection(FAST) as client:
+                raise ConnectionResetError()
+        client.quit.assert_awaited_once()
+
+        async with pool.get_connection(FAST):
+            pass
+        assert len(opened) == 2
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_prewarm(self):
+        """Test explicit pre-warming and pre-warming on first use."""
+        pool, opened = make_pool(prewarm_connections=3)
+        assert await pool.prewarm(SLOW) == 3
+        assert await pool.prewarm(SLOW) == 0
+
+        async with pool.get_connection(FAST):
+            pass
+        await asyncio.gather(*pool._prewarm_tasks)
+        assert sorted(opened) == ["fast.example.com"] * 3 + ["slow.example.com"] * 3
+        assert pool.get_pool_stats()["idle_connections"] == 6
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_background_health_check(self):
+        """Test that a dead idle connection is dropped without a checkout."""
+        pool, opened = make_pool(health_check_interval=0.02)
+        async with pool.get_connection(FAST) as dead:
+            pass
+        async with pool.get_connection(SLOW) as alive:
+            pass
+        dead.command.side_effect = ConnectionResetError()
+
+        # Wait until the dead connection is gone and no check is in progress
+        for _ in range(100):
+            if dead.quit.await_count and pool.get_pool_stats()["idle_connections"] == 1:
+                break
+            await asyncio.sleep(0.01)
+        assert dead.quit.await_count == 1
+        assert alive.command.await_count >= 1 and not alive.quit.await_count
+
+        async with pool.get_connection(SLOW) as reused:
+            assert reused is alive
+        assert len(opened) == 2
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_wait_metrics(self):
+        """Test that time waiting for a slot is reported to the metrics."""
+        pool, _ = make_pool(max_connections_per_host=1)
+        pool._metrics = metrics = FTPMetricsCollector()
+
+        async def use():
+            async with pool.get_connection(FAST):
+                await asyncio.sleep(0.05)
+
+        await asyncio.gather(use(), use())
+        pool_metrics = metrics._connection_metrics["fast.example.com:21"]
+        assert pool_metrics.wait_count == 2
+        assert pool_metrics.max_wait_time >= 0.04
+        assert pool_metrics.total_connections_created == 1
+        assert pool_metrics.total_connections_reused == 1
+
+        details = metrics.get_connection_statistics()["pool_details"]["fast.example.com:21"]
+        assert details["average_wait_time"] == pytest.approx(pool_metrics.average_wait_time)
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    @pytest.mark.performance
+    async def test_fast_host_latency_with_slow_host_connecting(self):
+        """Measure fast-host checkouts while a slow host is connecting."""
+        pool, _ = make_pool({"slow.example.com": 1.0, "fast.example.com": 0.01})
+        slow = [asyncio.create_task(self._checkout(pool, SLOW)) for _ in range(5)]
+        await asyncio.sleep(0.01)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(self._checkout(pool, FAST) for _ in range(200)))
+        fast_time = time.perf_counter() - started
+        await asyncio.gather(*slow)
+
+        print(f"\n200 fast-host checkouts during 1s slow connects: {fast_time:.3f}s")
+        assert fast_time < 0.5
+        await pool.close_all()
+
+    @staticmethod
+    async def _checkout(pool, url):
+        async with pool.get_connection(url):
+            await asyncio.sleep(0)
@@ -0,0 +1,161 @@
+"""
+Tests for checksums computed inline during FTP downloads.
+
+Covers every checksum method, hashing only the existing prefix on resume,
+verification from FTPResult.checksum without reading the file, and a
+benchmark of the inline digest against a post-download re-read.
+"""
+
+import hashlib
+import time
+import zlib
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from web_fetch.ftp import FTPConfig, FTPFileInfo, FTPVerificationMethod, verification
+from web_fetch.ftp.operations import FTPFileOperations
+from web_fetch.ftp.verification import FTPVerificationManager, new_checksum
+
+DATA = bytes(range(256)) * 4096  # 1MB
+DIGESTS = {
+    FTPVerificationMethod.MD5: hashlib.md5(DATA).hexdigest(),
+    FTPVerificationMethod.SHA256: hashlib.sha256(DATA).hexdigest(),
+    FTPVerificationMethod.CRC32: f"{zlib.crc32(DATA):08x}",
+}
+
+
+def make_operations(method, data=DATA, offset=0):
+    """Create FTPFileOperations serving data from offset over a fake client."""
+    operations = FTPFileOperations(
+        FTPConfig(
+            verification_method=method,
+            performance_monitoring=False,
+            adaptive_cleanup_interval=False,
+        )
+    )
+    info = FTPFileInfo("file.bin", "/file.bin", len(data), None, False)
+    operations.get_file_info = AsyncMock(return_value=info)
+
+    class Stream:
+        async def iter_by_block(self, size):
+            for start in range(offset, len(data), size):
+                yield data[start : start + size]
+
+    class Client:
+        command = AsyncMock()
+
+        @asynccontextmanager
+        async def download_stream(self, path):
+            yield Stream()
+
+    @asynccontextmanager
+    async def get_connection(url):
+        yield Client()
+
+    operations.connection_pool.get_connection = get_connection
+    return operations
+
+
+class TestInlineChecksum:
+    """Test hashing in the FTP download loop."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", list(DIGESTS))
+    async def test_digest_kept_on_result(self, method, tmp_path):
+        """Test that each method's digest is on FTPResult without a re-read."""
+        operations = make_operations(method)
+        with patch.object(
+            verification, "hash_file_prefix", wraps=verification.hash_file_prefix
+        ) as prefix:
+            result = await operations.download_file(
+                "ftp://example.com/file.bin", tmp_path / "file.bin"
+            )
+
+        assert result.is_success, result.error
+        assert result.checksum == DIGESTS[method]
+        assert result.checksum_algorithm == method.value
+        assert result.verification_result["actual"] == DIGESTS[method]
+        prefix.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_resume_hashes_existing_prefix_only(self, tmp_path):
+        """Test that a resumed download reads back only the bytes on disk."""
+        local = tmp_path / "file.bin"
+        local.write_bytes(DATA[:1000])
+        operations = make_operations(FTPVerificationMethod.SHA256, offset=1000)
+
+        calls = []
+        original = verification.hash_file_prefix
+
+        async def record(path, checksum, length, chunk_size=1024 * 1024):
+            calls.append(length)
+            await original(path, checksum, length, chunk_size)
+
+        with patch.object(verification, "hash_file_prefix", record):
+            result = await operations.download_file("ftp://example.com/file.bin", local)
+
+        assert result.is_success, result.error
+        assert calls == [1000]
+        assert local.read_bytes() == DATA
+        assert result.checksum == DIGESTS[FTPVerificationMethod.SHA256]
+
+    @pytest.mark.asyncio
+    async def test_manager_uses_result_checksum(self, tmp_path):
+        """Test verification against expected checksums from FTPResult.checksum."""
+        local = tmp_path / "file.bin"
+        local.write_bytes(DATA)
+        info = FTPFileInfo("file.bin", "/file.bin", len(DATA), None, False)
+        manager = FTPVerificationManager(
+            FTPConfig(verification_method=FTPVerificationMethod.CRC32)
+        )
+        expected = {"crc32": DIGESTS[FTPVerificationMethod.CRC32]}
+
+        with patch.object(verification, "hash_file_prefix") as prefix:
+            good = await manager.verify_file(
+                local, info, expected, checksum=DIGESTS[FTPVerificationMethod.CRC32]
+            )
+            bad = await manager.verify_file(local, info, expected, checksum="00000000")
+        prefix.assert_not_called()
+        assert good.is_valid and not bad.is_valid
+
+        # Without a precomputed checksum the file is read and hashed
+        read = await manager.verify_file(local, info, expected)
+        assert read.is_valid
+        assert FTPVerificationManager.validate_checksum_format(read.actual_value, "crc32")
+
+    @pytest.mark.asyncio
+    @pytest.mark.performance
+    async def test_inline_digest_against_reread(self, tmp_path):
+        """Compare the time of verifying by re-reading with the inline digest."""
+        local = tmp_path / "file.bin"
+        local.write_bytes(DATA * 64)
+        manager = FTPVerificationManager(
+            FTPConfig(verification_method=FTPVerificationMethod.SHA256)
+        )
+        info = FTPFileInfo("file.bin", "/file.bin", len(DATA) * 64, None, False)
+
+        inline = new_checksum("sha256")
+        started = time.perf_counter()
+        for _ in range(64):
+            inline.update(DATA)
+        digest = inline.hexdigest()
+        await manager.verify_file(local, info, checksum=digest)
+        inline_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        reread = await manager.verify_file(local, info)
+        reread_time = time.perf_counter() - started
+
+        for name in ("crc32", "md5", "sha256"):
+            checksum = new_checksum(name)
+            started = time.perf_counter()
+            for _ in range(64):
+                checksum.update(DATA)
+            print(f"\n{name}: {64 / (time.perf_counter() - started):.0f}MB/s", end="")
+        print(
+            f"\n64MB sha256: inline {inline_time:.3f}s, "
+            f"post-download re-read {reread_time:.3f}s"
+        )
+        assert reread.actual_value == digest
@@ -0,0 +1,209 @@
+"""
+Tests for Automatic Persisted Queries and interned query documents.
+
+Covers query normalization, the document intern table, hash-first requests
+with fallback to the full query against a local aiohttp server, servers
+without persisted query support, and a benchmark of request payload size
+and key generation for a large fragment-heavy query.
+"""
+
+import hashlib
+import json
+import time
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from web_fetch.graphql import (
+    GraphQLClient,
+    GraphQLConfig,
+    GraphQLQuery,
+    QueryDocument,
+    normalize_query,
+)
+from web_fetch.graphql.documents import QueryDocumentTable
+
+FRAGMENTS = "\n".join(
+    f"""
+    # Fields for section {i}
+    fragment Section{i} on Section {{
+        id
+        title
+        items(first: 10, orderBy: {{field: CREATED_AT, direction: DESC}}) {{
+            edges {{ node {{ id, name, description, createdAt, updatedAt }} }}
+        }}
+    }}"""
+    for i in range(30)
+)
+LARGE_QUERY = (
+    "query Dashboard($id: ID!) {\n    dashboard(id: $id) {\n"
+    + "\n".join(f"        section{i}: section(n: {i}) {{ ...Section{i} }}" for i in range(30))
+    + "\n    }\n}\n"
+    + FRAGMENTS
+)
+
+
+@pytest_asyncio.fixture
+async def apq_server():
+    """GraphQL endpoint that stores queries by hash, or rejects hashes."""
+    state = {"bodies": [], "supported": True, "store": {}}
+
+    async def handler(request: web.Request) -> web.Response:
+        body = await request.read()
+        state["bodies"].append(body)
+        payload = json.loads(body)
+        persisted = payload.get("extensions", {}).get("persistedQuery")
+        query = payload.get("query")
+
+        if persisted and not state["supported"]:
+            if query is None:
+                return web.json_response({"errors": [{
+                    "message": "PersistedQueryNotSupported",
+                    "extensions": {"code": "PERSISTED_QUERY_NOT_SUPPORTED"},
+                }]})
+        elif persisted:
+            digest = persisted["sha256Hash"]
+            if query is None:
+                query = state["store"].get(digest)
+                if query is None:
+                    return web.json_response({"errors": [{
+                        "message": "PersistedQueryNotFound",
+                        "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+                    }]})
+            elif hashlib.sha256(query.encode()).hexdigest() != digest:
+                return web.json_response(
+                    {"errors": [{"message": "provided sha does not match query"}]}
+                )
+            else:
+                state["store"][digest] = query
+
+        return web.json_response(
+            {"data": {"length": len(query), "variables": payload.get("variables")}}
+        )
+
+    app = web.Application()
+    app.router.add_post("/graphql", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}/graphql", state
+
+    await runner.cleanup()
+
+
+def make_client(url, **kwargs):
+    options = {
+        "endpoint": url,
+        "max_retries": 0,
+        "validate_queries": False,
+        "introspection_enabled": False,
+        "enable_persisted_queries": True,
+    }
+    options.update(kwargs)
+    return GraphQLClient(GraphQLConfig(**options))
+
+
+class TestQueryDocuments:
+    """Test normalization and the intern table."""
+
+    def test_normalize_keeps_strings(self):
+        """Test that layout and comments go but string contents stay."""
+        query = '''query Q($id: ID!, $n: Int = 5) {  # comment
+          user(id: $id) { name, friends(first: [1, 2]) { ...F } }
+          echo(s: "a,  b # c", t: """x  "y" """)
+        }'''
+        assert normalize_query(query) == (
+            'query Q($id:ID!$n:Int=5){user(id:$id){name friends(first:[1 2])'
+            '{...F}}echo(s:"a,  b # c" t:"""x  "y" """)}'
+        )
+        assert normalize_query(normalize_query(query)) == normalize_query(query)
+
+    def test_table_hashes_each_document_once(self):
+        """Test that repeat lookups reuse the document and the table is bounded."""
+        table = QueryDocumentTable(max_size=2)
+        first = table.intern("{ a }")
+        assert table.intern("{ a }") is first
+        assert first == QueryDocument.from_query("{a}")
+        table.intern("{ b }")
+        table.intern("{ c }")
+        assert table.statistics["size"] == 2
+        assert table.statistics["hits"] == 1 and table.statistics["misses"] == 3
+
+
+class TestPersistedQueries:
+    """Test GraphQLClient with enable_persisted_queries."""
+
+    @pytest.mark.asyncio
+    async def test_hash_first_then_full_query_on_miss(self, apq_server):
+        """Test that the query text is only sent when the server lacks it."""
+        url, state = apq_server
+        query = GraphQLQuery(query=LARGE_QUERY, variables={"id": "1"})
+        async with make_client(url) as client:
+            first = await client.execute(query, use_cache=False)
+            second = await client.execute(query, use_cache=False)
+            stats = client.get_persisted_query_stats()
+
+        assert first.success and second.success
+        assert first.data == second.data == {
+            "length": len(normalize_query(LARGE_QUERY)),
+            "variables": {"id": "1"},
+        }
+        sent = [json.loads(body) for body in state["bodies"]]
+        assert ["query" in body for body in sent] == [False, True, False]
+        assert stats["hits"] == 1 and stats["misses"] == 1 and stats["enabled"]
+
+    @pytest.mark.asyncio
+    async def test_unsupported_server_disables_persisted_queries(self, apq_server):
+        """Test that a server without support gets plain requests afterwards."""
+        url, state = apq_server
+        state["supported"] = False
+        query = GraphQLQuery(query="{ viewer { id } }")
+        async with make_client(url) as client:
+            results = [await client.execute(query, use_cache=False) for _ in range(2)]
+            assert not client.get_persisted_query_stats()["enabled"]
+
+        assert all(result.success for result in results)
+        sent = [json.loads(body) for body in state["bodies"]]
+        assert ["extensions" in body for body in sent] == [True, False, False]
+        assert sent[-1]["query"] == "{ viewer { id } }"
+
+    @pytest.mark.asyncio
+    @pytest.mark.performance
+    async def test_payload_and_key_cost_for_large_query(self, apq_server):
+        """Measure request bytes with and without persisted queries, and key cost."""
+        url, state = apq_server
+        query = GraphQLQuery(query=LARGE_QUERY, variables={"id": "1"})
+        sizes = {}
+        for persisted in (False, True):
+            state["bodies"].clear()
+            async with make_client(url, enable_persisted_queries=persisted) as client:
+                for _ in range(20):
+                    await client.execute(query, use_cache=False)
+            sizes[persisted] = sum(map(len, state["bodies"][-10:])) / 10
+
+        client = make_client(url)
+        started = time.perf_counter()
+        for _ in range(10_000):
+            client._generate_cache_key(query)
+        interned = time.perf_counter() - started
+        started = time.perf_counter()
+        for _ in range(10_000):
+            hashlib.sha256(
+                json.dumps(
+                    {"query": query.query, "variables": query.variables, "operationName": None},
+                    sort_keys=True,
+                ).encode()
+            ).hexdigest()
+        rehashed = time.perf_counter() - started
+
+        print(
+            f"\n{len(LARGE_QUERY)} byte query: request {sizes[False]:.0f} bytes plain, "
+            f"{sizes[True]:.0f} bytes persisted; 10k cache keys "
+            f"{rehashed * 1000:.1f}ms re-hashed, {interned * 1000:.1f}ms interned"
+        )
+        assert sizes[True] < sizes[False] * 0.1
+        assert interned < rehashed
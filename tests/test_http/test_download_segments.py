@@ -0,0 +1,234 @@
+"""
+Tests for segmented (multi-range) downloads.
+
+Covers concurrent ranges written in place, fallback to a single stream,
+per-segment retries, resuming an interrupted download, checksum
+verification, and a benchmark against a single connection on a server that
+throttles each connection.
+"""
+
+import asyncio
+import hashlib
+import time
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from web_fetch.http import DownloadHandler, download
+from web_fetch.http.download import SEGMENT_STATE_SUFFIX, DownloadConfig
+
+BLOCK = 64 * 1024
+DATA = bytes(range(256)) * (4 * 1024 * 4)  # 4MB
+ETAG = '"v1"'
+
+
+def parse_range(header: str, size: int):
+    start, _, end = header.removeprefix("bytes=").partition("-")
+    return int(start), min(int(end) if end else size - 1, size - 1)
+
+
+@pytest_asyncio.fixture
+async def range_server():
+    """Serve DATA with optional range support, throttling and failures."""
+    state = {"requests": [], "bytes_sent": 0, "fail_once": set(), "delay": 0.0}
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        ranges = request.path == "/ranged"
+        header = request.headers.get("Range")
+        state["requests"].append(header)
+        if ranges and header:
+            start, end = parse_range(header, len(DATA))
+            response = web.StreamResponse(
+                status=206,
+                headers={
+                    "Content-Range": f"bytes {start}-{end}/{len(DATA)}",
+                    "ETag": ETAG,
+                },
+            )
+            response.content_length = end - start + 1
+        else:
+            start, end = 0, len(DATA) - 1
+            response = web.StreamResponse(headers={"ETag": ETAG})
+            response.content_length = len(DATA)
+        await response.prepare(request)
+
+        for offset in range(start, end + 1, BLOCK):
+            if start in state["fail_once"] and offset > start:
+                # Drop the connection half way through this range once
+                state["fail_once"].discard(start)
+                request.transport.close()
+                return response
+            block = DATA[offset : min(offset + BLOCK, end + 1)]
+            await response.write(block)
+            state["bytes_sent"] += len(block)
+            if state["delay"]:
+                await asyncio.sleep(state["delay"])
+        return response
+
+    app = web.Application()
+    app.router.add_get("/ranged", handler)
+    app.router.add_get("/plain", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}", state
+
+    await runner.cleanup()
+
+
+def segmented_config(**kwargs) -> DownloadConfig:
+    options = {
+        "segments": 4,
+        "min_segment_size": 256 * 1024,
+        "segment_retry_delay": 0.01,
+        "verify_checksum": True,
+        "expected_checksum": hashlib.sha256(DATA).hexdigest(),
+    }
+    options.update(kwargs)
+    return DownloadConfig(**options)
+
+
+class TestSegmentedDownload:
+    """Test DownloadHandler with segments > 1."""
+
+    @pytest.mark.asyncio
+    async def test_ranges_fetched_concurrently(self, range_server, tmp_path):
+        """Test that the file is split into ranges and reassembled in place."""
+        base, state = range_server
+        progress = []
+        output = tmp_path / "data.bin"
+        async with aiohttp.ClientSession() as session:
+            handler = DownloadHandler(segmented_config())
+            result = await handler.download_file(
+                session, f"{base}/ranged", output,
+                progress_callback=lambda info: progress.append(info.bytes_downloaded),
+            )
+
+        assert result.success, result.error
+        assert output.read_bytes() == DATA
+        assert result.checksum == hashlib.sha256(DATA).hexdigest()
+        quarter = len(DATA) // 4
+        assert state["requests"][0] == "bytes=0-0"
+        assert sorted(state["requests"][1:]) == [
+            f"bytes={i * quarter}-{(i + 1) * quarter - 1}" for i in range(4)
+        ]
+        assert progress[-1] == len(DATA)
+        assert not list(tmp_path.glob("*.tmp*"))
+
+    @pytest.mark.asyncio
+    async def test_falls_back_without_range_support(self, range_server, tmp_path):
+        """Test single-stream download when the server ignores Range."""
+        base, state = range_server
+        output = tmp_path / "data.bin"
+        async with aiohttp.ClientSession() as session:
+            result = await DownloadHandler(segmented_config()).download_file(
+                session, f"{base}/plain", output
+            )
+        assert result.success, result.error
+        assert output.read_bytes() == DATA
+        assert len(state["requests"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_dropped_segment_is_retried(self, range_server, tmp_path):
+        """Test that a segment resumes from its last write after a drop."""
+        base, state = range_server
+        state["fail_once"].add(len(DATA) // 2)
+        output = tmp_path / "data.bin"
+        config = segmented_config(min_segment_size=len(DATA) // 4)
+        async with aiohttp.ClientSession() as session:
+            result = await DownloadHandler(config).download_file(
+                session, f"{base}/ranged", output
+            )
+        assert result.success, result.error
+        assert output.read_bytes() == DATA
+        assert len(state["requests"]) == 6
+
+    @pytest.mark.asyncio
+    async def test_resume_after_failed_download(self, range_server, tmp_path, monkeypatch):
+        """Test that a second call downloads only the missing part of a segment."""
+        monkeypatch.setattr(download, "SEGMENT_WRITE_SIZE", BLOCK)
+        base, state = range_server
+        state["fail_once"].add(0)
+        output = tmp_path / "data.bin"
+        temp = tmp_path / "data.bin.tmp"
+        async with aiohttp.ClientSession() as session:
+            failed = await DownloadHandler(segmented_config(segment_retries=0)).download_file(
+                session, f"{base}/ranged", output
+            )
+            assert not failed.success
+            assert temp.exists()
+            assert (tmp_path / f"data.bin.tmp{SEGMENT_STATE_SUFFIX}").exists()
+
+            state["bytes_sent"] = 0
+            result = await DownloadHandler(segmented_config()).download_file(
+                session, f"{base}/ranged", output
+            )
+
+        assert result.success, result.error
+        assert output.read_bytes() == DATA
+        # Only the rest of the first segment is fetched again
+        assert state["requests"][-1] == f"bytes={BLOCK}-{len(DATA) // 4 - 1}"
+        assert state["bytes_sent"] == len(DATA) // 4 - BLOCK + 1
+
+    @pytest.mark.asyncio
+    async def test_state_saves_are_throttled(self, range_server, tmp_path, monkeypatch):
+        """Test that the segment state is not rewritten after every flush."""
+        monkeypatch.setattr(download, "SEGMENT_WRITE_SIZE", BLOCK)
+        saves = []
+        save = download._SegmentState.save
+        monkeypatch.setattr(
+            download._SegmentState, "save", lambda state: saves.append(save(state))
+        )
+        base, _ = range_server
+        writes = []
+        async with aiohttp.ClientSession() as session:
+            result = await DownloadHandler(segmented_config()).download_file(
+                session, f"{base}/ranged", tmp_path / "data.bin",
+                progress_callback=writes.append,
+            )
+
+        assert result.success, result.error
+        assert len(writes) > 10
+        # The initial save, plus at most one per interval of a fast local download
+        assert len(saves) <= 3
+
+    @pytest.mark.asyncio
+    async def test_checksum_mismatch(self, range_server, tmp_path):
+        """Test that a bad whole-file checksum fails and removes the temp file."""
+        base, _ = range_server
+        output = tmp_path / "data.bin"
+        async with aiohttp.ClientSession() as session:
+            result = await DownloadHandler(
+                segmented_config(expected_checksum="0" * 64)
+            ).download_file(session, f"{base}/ranged", output)
+        assert not result.success
+        assert "Checksum mismatch" in result.error
+        assert not list(tmp_path.iterdir())
+
+    @pytest.mark.asyncio
+    @pytest.mark.performance
+    async def test_throughput_against_single_stream(self, range_server, tmp_path):
+        """Compare one throttled connection with four concurrent ranges."""
+        base, state = range_server
+        state["delay"] = 0.005  # roughly 12MB/s per connection
+        timings = {}
+        async with aiohttp.ClientSession() as session:
+            for segments in (1, 4):
+                output = tmp_path / f"data-{segments}.bin"
+                handler = DownloadHandler(segmented_config(segments=segments))
+                started = time.perf_counter()
+                result = await handler.download_file(session, f"{base}/ranged", output)
+                timings[segments] = time.perf_counter() - started
+                assert result.success, result.error
+                assert output.read_bytes() == DATA
+
+        print(
+            f"\n{len(DATA) // 2**20}MB over throttled connections: "
+            f"single {timings[1]:.2f}s, 4 segments {timings[4]:.2f}s"
+        )
+        assert timings[4] < timings[1] / 2
@@ -0,0 +1,236 @@
+"""
+Tests for streaming CSV ingestion.
+
+Covers chunk boundaries inside quoted fields, type inference and widening,
+nulls and ragged rows, dialect and encoding sniffing, file input, CSVParser
+and WebFetcher integration, and a peak-memory benchmark against the buffered
+ContentType.CSV path.
+"""
+
+import tracemalloc
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from web_fetch.core_fetcher import WebFetcher
+from web_fetch.models import ContentType, FetchConfig, FetchRequest
+from web_fetch.parsers import CSVBatchReader, CSVParser, read_csv_batches
+from web_fetch.parsers.csv_stream import HAS_NUMPY, HAS_PYARROW
+
+QUOTED = (
+    b'id,name,score,active\n'
+    b'1,"Smith, Jane",9.5,yes\n'
+    b'2,"multi\nline ""quoted""\nvalue",7,no\n'
+    b'3,plain,,true\n'
+    b'4,"",8.25,false\n'
+)
+
+
+def read_in_chunks(data: bytes, size: int, **kwargs):
+    reader = CSVBatchReader(**kwargs)
+    batches = []
+    for start in range(0, len(data), size):
+        batches.extend(reader.feed(memoryview(data)[start : start + size]))
+    batches.extend(reader.close())
+    return reader, batches
+
+
+async def achunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+class TestCSVBatchReader:
+    """Test the push parser."""
+
+    def test_chunk_boundaries_in_quoted_fields(self):
+        """Test that splitting the body anywhere gives the same rows."""
+        expected = [
+            {"id": 1, "name": "Smith, Jane", "score": 9.5, "active": True},
+            {"id": 2, "name": 'multi\nline "quoted"\nvalue', "score": 7.0, "active": False},
+            {"id": 3, "name": "plain", "score": None, "active": True},
+            {"id": 4, "name": None, "score": 8.25, "active": False},
+        ]
+        for size in (1, 2, 3, 7, 16, len(QUOTED)):
+            _, batches = read_in_chunks(QUOTED, size, batch_size=3)
+            assert [len(batch) for batch in batches] == [3, 1]
+            assert [row for batch in batches for row in batch.to_pylist()] == expected
+
+    def test_types_nulls_and_metadata(self):
+        """Test typed columns, validity masks and accumulated metadata."""
+        reader, (batch,) = read_in_chunks(QUOTED, 10)
+        assert batch.column_types == {
+            "id": "integer", "name": "string", "score": "float", "active": "boolean"
+        }
+        assert batch.null_count("score") == batch.null_count("name") == 1
+        assert "id" not in batch.validity
+        if HAS_NUMPY:
+            assert str(batch.columns["id"].dtype) == "int64"
+            assert str(batch.columns["active"].dtype) == "bool"
+            assert list(batch.validity["score"]) == [True, True, False, True]
+
+        metadata = reader.metadata
+        assert metadata.has_header and metadata.column_count == 4
+        assert metadata.row_count == 4 and metadata.file_size == len(QUOTED)
+        assert metadata.null_values == {"id": 0, "name": 1, "score": 1, "active": 0}
+
+    def test_types_widen_across_batches(self):
+        """Test that a later batch widens a column instead of failing."""
+        data = b"a,b,c\n1,yes,x\n2,no,y\n3.5,maybe,z\nn/a,no,w\n"
+        reader, batches = read_in_chunks(data, 4, batch_size=2)
+        assert batches[0].column_types == {"a": "integer", "b": "boolean", "c": "string"}
+        assert batches[1].column_types == {"a": "float", "b": "string", "c": "string"}
+        assert batches[1].to_pylist()[1] == {"a": None, "b": "no", "c": "w"}
+        assert reader.metadata.column_types["a"] == "float"
+
+    def test_pure_python_columns_match(self, monkeypatch):
+        """Test that the list-based path converts like the NumPy one."""
+        data = b"a,b,c,d\n1,yes,x,1.5\n,no,,n/a\n3,YES,z,-2\n"
+        _, (expected,) = read_in_chunks(data, 5)
+        monkeypatch.setattr("web_fetch.parsers.csv_stream.HAS_NUMPY", False)
+        _, (batch,) = read_in_chunks(data, 5)
+
+        assert batch.columns["a"] == [1, None, 3]
+        assert set(batch.validity) == {"a", "c", "d"}
+        assert batch.validity["a"] == [True, False, True]
+        assert batch.column_types == expected.column_types
+        assert batch.to_pylist() == expected.to_pylist()
+
+    def test_ragged_rows_and_no_header(self):
+        """Test padding of short rows, truncation of long ones and column names."""
+        data = b"1,2,3\n4,5\n6,7,8,9\n"
+        _, (batch,) = read_in_chunks(data, 5, has_header=False)
+        assert batch.column_names == ["Column_1", "Column_2", "Column_3"]
+        assert batch.to_pylist()[1:] == [
+            {"Column_1": 4, "Column_2": 5, "Column_3": None},
+            {"Column_1": 6, "Column_2": 7, "Column_3": 8},
+        ]
+
+    def test_dialect_and_encoding_sniffing(self):
+        """Test semicolon-delimited latin-1 data without hints."""
+        lines = ["ville;population"] + [f"Orléans-{i};{i * 1000}" for i in range(20)]
+        data = "\n".join(lines).encode("latin-1")
+        reader, batches = read_in_chunks(data, 8)
+        rows = [row for batch in batches for row in batch.to_pylist()]
+        assert reader.metadata.delimiter == ";"
+        assert rows[0] == {"ville": "Orléans-0", "population": 0}
+        assert len(rows) == 20
+
+    def test_read_csv_batches_from_file(self, tmp_path):
+        """Test reading a file path in small chunks."""
+        path = tmp_path / "data.csv"
+        path.write_bytes(b"\xef\xbb\xbfn,sq\n" + b"".join(b"%d,%d\n" % (i, i * i) for i in range(250)))
+        batches = list(read_csv_batches(str(path), batch_size=100, chunk_size=64))
+        assert [batch.row_offset for batch in batches] == [0, 100, 200]
+        assert batches[0].column_names == ["n", "sq"]
+        assert batches[-1].to_pylist()[-1] == {"n": 249, "sq": 249 * 249}
+
+    @pytest.mark.skipif(not HAS_PYARROW, reason="pyarrow not installed")
+    def test_to_arrow(self):
+        """Test conversion to a pyarrow RecordBatch with nulls."""
+        _, (batch,) = read_in_chunks(QUOTED, 16)
+        record_batch = batch.to_arrow()
+        assert record_batch.num_rows == 4
+        assert record_batch.column("score").null_count == 1
+        assert record_batch.to_pylist() == batch.to_pylist()
+
+
+class TestCSVParserBatches:
+    """Test CSVParser.iter_batches."""
+
+    @pytest.mark.asyncio
+    async def test_iter_batches(self):
+        """Test that iter_batches matches parse() on the same data."""
+        parser = CSVParser(use_pandas=False)
+        content = b"city,country\n" + b"".join(b"c%d,x%d\n" % (i, i % 3) for i in range(25))
+        batches = [
+            batch async for batch in parser.iter_batches(achunks(content, 5), batch_size=10)
+        ]
+        data, metadata = parser.parse(content)
+        assert [len(batch) for batch in batches] == [10, 10, 5]
+        assert [row for batch in batches for row in batch.to_pylist()] == data["data"]
+        assert batches[0].column_names == metadata.column_names
+
+
+ROWS = 100_000
+
+
+@pytest_asyncio.fixture
+async def export_server():
+    """Serve a large CSV export in chunks."""
+
+    async def export(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "text/csv"})
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        await response.write(b"id,amount,label,flag\n")
+        for start in range(0, ROWS, 10_000):
+            await response.write(
+                b"".join(
+                    b"%d,%d.5,item %d,%s\n" % (i, i % 97, i, b"yes" if i % 2 else b"no")
+                    for i in range(start, start + 10_000)
+                )
+            )
+        return response
+
+    app = web.Application()
+    app.router.add_get("/export.csv", export)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}/export.csv"
+
+    await runner.cleanup()
+
+
+class TestFetchCSVBatches:
+    """Test streaming CSV on the fetch path."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_csv_batches(self, export_server):
+        """Test fetch_csv_batches yields every row in order."""
+        async with WebFetcher() as fetcher:
+            offsets = []
+            async for batch in fetcher.fetch_csv_batches(
+                FetchRequest(url=export_server), batch_size=25_000
+            ):
+                offsets.append(batch.row_offset)
+                assert batch.column_types["id"] == "integer"
+                assert batch.column_types["flag"] == "boolean"
+            assert offsets == [0, 25_000, 50_000, 75_000]
+
+    @pytest.mark.asyncio
+    @pytest.mark.performance
+    async def test_peak_memory_against_buffered_csv(self, export_server):
+        """Compare peak memory of ContentType.CSV and fetch_csv_batches."""
+        config = FetchConfig(max_response_size=100 * 2**20)
+        async with WebFetcher(config) as fetcher:
+            tracemalloc.start()
+            result = await fetcher.fetch_single(
+                FetchRequest(url=export_server, content_type=ContentType.CSV)
+            )
+            buffered_rows = result.content["summary"]["total_rows"]
+            del result
+            _, buffered_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            tracemalloc.start()
+            streamed_rows = 0
+            async for batch in fetcher.fetch_csv_batches(
+                FetchRequest(url=export_server), batch_size=10_000
+            ):
+                streamed_rows += len(batch)
+            _, streamed_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        print(
+            f"\n{ROWS} rows: "
+            f"peak {buffered_peak / 2**20:.1f}MB buffered, "
+            f"{streamed_peak / 2**20:.1f}MB streamed"
+        )
+        assert streamed_rows == buffered_rows == ROWS
+        assert streamed_peak < buffered_peak / 4
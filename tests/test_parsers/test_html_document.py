@@ -0,0 +1,210 @@
+"""
+Tests for the shared parsed HTML document.
+"""
+
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from bs4 import BeautifulSoup
+
+from web_fetch.core_fetcher import WebFetcher
+from web_fetch.models import ContentType, FetchConfig, FetchRequest, ParseExecutorMode
+from web_fetch.parsers import (
+    EnhancedContentParser,
+    LinkExtractor,
+    ParsedHTMLDocument,
+    ensure_document,
+)
+from web_fetch.utils.transformers import HTMLExtractor, TransformationPipeline
+
+SAMPLE_HTML = """
+<html>
+  <head><title>Shared Page</title></head>
+  <body>
+    <h1>Heading</h1>
+    <p>This page is used to check that a single parsed tree can be shared by
+    every consumer of an HTML response without being rebuilt each time. It has
+    enough text to trigger content analysis in the enhanced parser.</p>
+    <a href="/about" title="About">About us</a>
+    <a href="https://other.example.org/page">External</a>
+    <img src="/logo.png">
+  </body>
+</html>
+"""
+
+
+class TestParsedHTMLDocument:
+    """Test ParsedHTMLDocument behaviour."""
+
+    def test_to_dict_shape(self):
+        """Test that to_dict matches the ContentType.HTML result shape."""
+        document = ParsedHTMLDocument.from_bytes(SAMPLE_HTML.encode())
+        result = document.to_dict()
+
+        assert set(result) == {"title", "text", "links", "images"}
+        assert result["title"] == "Shared Page"
+        assert "Heading" in result["text"]
+        assert result["links"] == ["/about", "https://other.example.org/page"]
+        assert result["images"] == ["/logo.png"]
+
+    def test_tree_is_lazy(self):
+        """Test that the tree is only built when needed."""
+        document = ParsedHTMLDocument(SAMPLE_HTML)
+        assert not document.is_parsed
+
+        _ = document.title
+        assert document.is_parsed
+
+        document.release()
+        document.ensure_parsed()
+        assert document.is_parsed
+
+    def test_release_keeps_cached_values(self):
+        """Test that releasing the tree keeps derived values."""
+        document = ParsedHTMLDocument(SAMPLE_HTML)
+        text = document.text
+
+        document.release()
+
+        assert not document.is_parsed
+        assert document.text == text
+
+    def test_ensure_document_reuses_instance(self):
+        """Test that ensure_document does not re-wrap documents."""
+        document = ParsedHTMLDocument(SAMPLE_HTML)
+        assert ensure_document(document) is document
+        assert ensure_document(SAMPLE_HTML.encode()).raw_html == SAMPLE_HTML
+
+
+class TestSingleParsePipeline:
+    """Test that consumers share one parsed tree."""
+
+    @pytest.mark.asyncio
+    async def test_enhanced_parser_builds_one_tree(self):
+        """Test that HTML parsing, analysis and link extraction build one tree."""
+        parser = EnhancedContentParser()
+
+        with patch(
+            "web_fetch.parsers.html_document.BeautifulSoup", wraps=BeautifulSoup
+        ) as shared_soup, patch(
+            "web_fetch.parsers.link_extractor.BeautifulSoup", wraps=BeautifulSoup
+        ) as link_soup:
+            content, result = await parser.parse_content(
+                SAMPLE_HTML.encode(),
+                ContentType.HTML,
+                url="https://example.com/index.html",
+            )
+
+        assert shared_soup.call_count == 1
+        assert link_soup.call_count == 0
+        assert content["title"] == "Shared Page"
+        assert result.content_summary is not None
+        assert any(
+            link.url == "https://example.com/about" for link in result.links
+        )
+
+    @pytest.mark.asyncio
+    async def test_link_extractor_accepts_document(self):
+        """Test that LinkExtractor reuses a parsed document."""
+        document = ParsedHTMLDocument(SAMPLE_HTML)
+        extractor = LinkExtractor()
+
+        links = await extractor.extract_links(
+            document, content_type="html", base_url="https://example.com/"
+        )
+
+        urls = {link.url for link in links}
+        assert "https://example.com/about" in urls
+        assert "https://other.example.org/page" in urls
+
+    @pytest.mark.asyncio
+    async def test_html_extractor_reuses_document(self):
+        """Test that HTMLExtractor reads from a shared document."""
+        document = ParsedHTMLDocument(SAMPLE_HTML)
+        extractor = HTMLExtractor({"heading": "h1"})
+
+        with patch("web_fetch.utils.transformers.BeautifulSoup") as mock_soup:
+            result = await extractor.transform(document, {})
+
+        mock_soup.assert_not_called()
+        assert result.data["heading"] == "Heading"
+
+    @pytest.mark.asyncio
+    async def test_html_extractor_accepts_structured_result(self):
+        """Test that HTMLExtractor reads the ContentType.HTML dict's document."""
+        document = ParsedHTMLDocument(SAMPLE_HTML)
+        data = document.to_dict()
+        extractor = HTMLExtractor({"heading": "h1"})
+
+        result = await extractor.transform(data, {"html_document": document})
+
+        assert result.data["heading"] == "Heading"
+
+
+@pytest_asyncio.fixture
+async def html_server():
+    """Serve SAMPLE_HTML."""
+
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(text=SAMPLE_HTML, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}/"
+
+    await runner.cleanup()
+
+
+class TestFetchPipeline:
+    """Test the shared document on the WebFetcher transformation path."""
+
+    @pytest.mark.asyncio
+    async def test_pipeline_context_carries_document(self, html_server):
+        """Test that transformers get the response document in their context."""
+        seen = []
+
+        class Recorder(HTMLExtractor):
+            async def transform(self, data, context):
+                seen.append(context.get("html_document"))
+                return await super().transform(data, context)
+
+        pipeline = TransformationPipeline([Recorder({"heading": "h1"})])
+        async with WebFetcher(transformation_pipeline=pipeline) as fetcher:
+            with patch("web_fetch.utils.transformers.BeautifulSoup") as mock_soup:
+                result = await fetcher.fetch_single(
+                    FetchRequest(url=html_server, content_type=ContentType.HTML)
+                )
+
+        mock_soup.assert_not_called()
+        assert result.content == {"heading": "Heading"}
+        assert isinstance(seen[0], ParsedHTMLDocument)
+        assert seen[0].raw_html == SAMPLE_HTML
+        # Released once the pipeline has run
+        assert not seen[0].is_parsed
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", list(ParseExecutorMode))
+    async def test_tree_built_once_per_response(self, html_server, mode):
+        """Test that the pipeline reuses the parse's tree unless it ran in a process."""
+        pipeline = TransformationPipeline([HTMLExtractor({"heading": "h1"})])
+        config = FetchConfig(parse_executor=mode, parse_offload_threshold=0)
+        async with WebFetcher(config, transformation_pipeline=pipeline) as fetcher:
+            with patch(
+                "web_fetch.parsers.html_document.BeautifulSoup", wraps=BeautifulSoup
+            ) as soup:
+                result = await fetcher.fetch_single(
+                    FetchRequest(url=html_server, content_type=ContentType.HTML)
+                )
+
+        assert result.content == {"heading": "Heading"}
+        # A process pool parse builds its tree in the worker, so the pipeline
+        # builds the only one in this process
+        assert soup.call_count == 1
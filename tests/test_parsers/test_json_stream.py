@@ -0,0 +1,265 @@
+"""
+Tests for incremental JSON parsing.
+
+Covers prefix handling, chunk boundaries at every byte, both decoder
+backends, malformed input, JSONParser and JSONPathExtractor integration,
+WebFetcher.fetch_json_items, and a peak-memory benchmark against the buffered
+ContentType.JSON path.
+"""
+
+import json
+import tracemalloc
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from web_fetch.core_fetcher import WebFetcher
+from web_fetch.exceptions import ContentError
+from web_fetch.models import ContentType, FetchConfig, FetchRequest, JSONBackend
+from web_fetch.parsers import JSONItemStream, JSONParser
+from web_fetch.parsers.json_stream import HAS_ORJSON, iter_json_items, parse_prefix
+from web_fetch.utils.transformers import JSONPathExtractor
+
+DOCUMENT = {
+    "meta": {"count": 3, "note": 'brackets ] } in "strings"'},
+    "skipped": [[1, 2], {"data": [0]}],
+    "data": [
+        {"id": 1, "name": "café", "tags": ["a", "b"]},
+        {"id": 2, "name": "x\\y", "tags": []},
+        {"id": 3, "name": None, "tags": ["c"]},
+    ],
+    "total": 3,
+}
+
+BACKENDS = [
+    "json",
+    pytest.param(
+        "orjson",
+        marks=pytest.mark.skipif(not HAS_ORJSON, reason="orjson not installed"),
+    ),
+]
+
+
+def parse_in_chunks(document: bytes, prefix: str, size: int, backend: str = "json"):
+    parser = JSONItemStream(prefix, backend)
+    items = []
+    for start in range(0, len(document), size):
+        items.extend(parser.feed(memoryview(document)[start : start + size]))
+    items.extend(parser.close())
+    return items
+
+
+async def achunks(document: bytes, size: int):
+    for start in range(0, len(document), size):
+        yield document[start : start + size]
+
+
+class TestJSONItemStream:
+    """Test the push parser."""
+
+    def test_parse_prefix(self):
+        """Test dotted and JSONPath-like prefixes."""
+        assert parse_prefix("data.item") == ("data", "item")
+        assert parse_prefix("$.data[*].tags[*]") == ("data", "item", "tags", "item")
+        assert parse_prefix("$[*]") == ("item",)
+        assert parse_prefix("$") == parse_prefix("") == ()
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_every_chunk_boundary(self, backend):
+        """Test that splitting the body anywhere gives the same items."""
+        document = json.dumps(DOCUMENT).encode()
+        for size in (1, 2, 3, 5, 8, 13, len(document)):
+            assert parse_in_chunks(document, "data.item", size, backend) == DOCUMENT["data"]
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    @pytest.mark.parametrize(
+        "prefix, wrap",
+        [
+            ("item", lambda values: values),
+            ("data.item", lambda values: {"data": values}),
+            ("$.data[*]", lambda values: {"meta": 1.5e3, "data": values}),
+            ("rows.item.list.item", lambda values: {"rows": [{"list": values}]}),
+            ("", lambda values: {"values": values, "last": -1.25}),
+        ],
+    )
+    def test_numbers_split_at_every_boundary(self, backend, prefix, wrap):
+        """Test that a chunk ending inside a number does not cut the number short."""
+        values = [-2500.0, 0, 1e-7, -3.25e10, 12, 6.02e23, 0.5, -0.0, 1e5, 7]
+        body = wrap(values)
+        expected = [body] if prefix == "" else values
+        document = json.dumps(body).encode().replace(b"e-07", b"E-7")
+        for size in range(1, len(document) + 1):
+            assert parse_in_chunks(document, prefix, size, backend) == expected, size
+
+    def test_prefixes(self):
+        """Test nested, root and scalar prefixes."""
+        document = json.dumps(DOCUMENT, indent=2).encode()
+        assert parse_in_chunks(document, "$.data[*].tags[*]", 7) == ["a", "b", "c"]
+        assert parse_in_chunks(document, "meta", 7) == [DOCUMENT["meta"]]
+        assert parse_in_chunks(document, "total", 7) == [3]
+        assert parse_in_chunks(document, "", 7) == [DOCUMENT]
+        assert parse_in_chunks(document, "missing.item", 7) == []
+        assert parse_in_chunks(b"[1, -2.5e3, true, null, \"s\"]", "item", 2) == [
+            1, -2500.0, True, None, "s"
+        ]
+        assert parse_in_chunks(b" 42 ", "", 1) == [42]
+
+    def test_items_arrive_incrementally(self):
+        """Test that items are returned as soon as they are complete."""
+        parser = JSONItemStream("item")
+        assert parser.feed(b'[{"a": 1}, {"b"') == [{"a": 1}]
+        assert parser.feed(b': 2}, 3') == [{"b": 2}]
+        assert parser.feed(b"]") == [3]
+        assert parser.close() == []
+
+    @pytest.mark.parametrize(
+        "document",
+        [b"[1, 2", b"[1 2]", b'{"a" 1}', b"[1]]", b"[1] x", b'{"a": 1]', b"[{]"],
+    )
+    def test_malformed(self, document):
+        """Test that malformed documents raise ContentError."""
+        with pytest.raises(ContentError, match="Invalid JSON"):
+            parse_in_chunks(document, "item", 1)
+
+
+class TestConsumers:
+    """Test JSONParser and JSONPathExtractor on streams."""
+
+    @pytest.mark.asyncio
+    async def test_json_parser_iter_items(self):
+        """Test JSONParser.iter_items over async chunks."""
+        document = json.dumps(DOCUMENT).encode()
+        items = [
+            item async for item in JSONParser().iter_items(
+                achunks(document, 10), "$.data[*]"
+            )
+        ]
+        assert items == DOCUMENT["data"]
+
+    @pytest.mark.asyncio
+    async def test_jsonpath_extractor_on_items(self):
+        """Test per-item JSONPath evaluation over a stream."""
+        document = json.dumps(DOCUMENT).encode()
+        extractor = JSONPathExtractor({"id": "$.id", "tags": "$.tags[*]"})
+        result = await extractor.transform(
+            iter_json_items(achunks(document, 16), "data.item"), {}
+        )
+
+        assert result.is_success
+        assert result.data["id"] == [1, 2, 3]
+        assert result.data["tags"] == [["a", "b"], None, "c"]
+        assert result.metadata["items_processed"] == 3
+
+        strict = JSONPathExtractor({"missing": "$.nope"}, strict=True)
+        result = await strict.transform(
+            iter_json_items(achunks(document, 16), "data.item"), {}
+        )
+        assert not result.is_success
+
+
+RECORDS = 30_000
+
+
+@pytest_asyncio.fixture
+async def export_server():
+    """Serve a large JSON export in chunks."""
+    record = {"id": 0, "name": "record", "values": list(range(10)), "active": True}
+
+    async def export(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "application/json"})
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        await response.write(b'{"count": %d, "results": [' % RECORDS)
+        batch = []
+        for number in range(RECORDS):
+            record["id"] = number
+            batch.append(json.dumps(record).encode())
+            if len(batch) == 1000:
+                separator = b"," if number >= 1000 else b""
+                await response.write(separator + b",".join(batch))
+                batch = []
+        await response.write(b"]}")
+        return response
+
+    app = web.Application()
+    app.router.add_get("/export", export)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}/export"
+
+    await runner.cleanup()
+
+
+class TestFetchJSONItems:
+    """Test streaming JSON on the fetch path."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_json_items_and_extractor(self, export_server):
+        """Test fetch_json_items and JSONPathExtractor on a ResponseStream."""
+        async with WebFetcher() as fetcher:
+            request = FetchRequest(url=export_server)
+            count = 0
+            async for item in fetcher.fetch_json_items(request, "results.item"):
+                assert item["id"] == count
+                count += 1
+            assert count == RECORDS
+
+            async with fetcher.fetch_stream(request) as stream:
+                extractor = JSONPathExtractor({"id": "$.id"}, stream_prefix="$.results[*]")
+                result = await extractor.transform(stream, {})
+            assert result.data["id"][-1] == RECORDS - 1
+
+    def test_json_backend_defaults_to_stdlib(self):
+        """Test that orjson is used only when configured, even if installed."""
+        assert WebFetcher()._json_loads is json.loads
+        if HAS_ORJSON:
+            config = FetchConfig(json_backend=JSONBackend.ORJSON)
+            assert WebFetcher(config)._json_loads is not json.loads
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("backend", BACKENDS)
+    async def test_json_content_with_backend(self, export_server, backend):
+        """Test ContentType.JSON decoding with each configured backend."""
+        config = FetchConfig(json_backend=backend, max_response_size=100 * 2**20)
+        async with WebFetcher(config) as fetcher:
+            result = await fetcher.fetch_single(
+                FetchRequest(url=export_server, content_type=ContentType.JSON)
+            )
+        assert result.content["count"] == len(result.content["results"]) == RECORDS
+
+    @pytest.mark.asyncio
+    @pytest.mark.performance
+    async def test_peak_memory_against_buffered_json(self, export_server):
+        """Compare peak memory of ContentType.JSON and fetch_json_items."""
+        config = FetchConfig(max_response_size=100 * 2**20)
+        async with WebFetcher(config) as fetcher:
+            tracemalloc.start()
+            result = await fetcher.fetch_single(
+                FetchRequest(url=export_server, content_type=ContentType.JSON)
+            )
+            buffered_total = sum(item["id"] for item in result.content["results"])
+            del result
+            _, buffered_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            tracemalloc.start()
+            streamed_total = 0
+            async for item in fetcher.fetch_json_items(
+                FetchRequest(url=export_server), "results.item"
+            ):
+                streamed_total += item["id"]
+            _, streamed_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        print(
+            f"\n{RECORDS} records: "
+            f"peak {buffered_peak / 2**20:.1f}MB buffered, "
+            f"{streamed_peak / 2**20:.1f}MB streamed"
+        )
+        assert streamed_total == buffered_total
+        assert streamed_peak < buffered_peak / 4
@@ -0,0 +1,230 @@
+"""
+Tests for the sliding-window circuit breaker and its WebFetcher integration.
+"""
+
+import asyncio
+import time
+
+import pytest
+from aioresponses import aioresponses
+
+from web_fetch import FetchRequest, WebFetcher
+from web_fetch.models import FetchConfig
+from web_fetch.utils.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerError,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_breaker(clock, **overrides):
+    options = dict(
+        failure_threshold=3,
+        failure_rate_threshold=0.5,
+        window_seconds=10.0,
+        window_buckets=10,
+        recovery_timeout=5.0,
+        success_threshold=2,
+        half_open_max_calls=1,
+        timeout=0,
+    )
+    options.update(overrides)
+    return CircuitBreaker("test", CircuitBreakerConfig(**options), clock=clock)
+
+
+class TestSlidingWindow:
+    """Test failure-rate tripping over the ring buffer window."""
+
+    def test_opens_on_failure_rate(self):
+        """Test that failures below the rate threshold keep the circuit closed."""
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+
+        for _ in range(10):
+            breaker.record_success(breaker.acquire())
+        for _ in range(5):
+            breaker.record_failure(breaker.acquire())
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.failure_rate() == pytest.approx(5 / 15)
+
+        for _ in range(5):
+            breaker.record_failure(breaker.acquire())
+        assert breaker.state is CircuitState.OPEN
+
+    def test_old_failures_leave_the_window(self):
+        """Test that failures older than the window no longer count."""
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+
+        breaker.record_failure(breaker.acquire())
+        breaker.record_failure(breaker.acquire())
+        assert breaker.failure_count == 2
+
+        clock.now += 11
+        assert breaker.failure_count == 0
+        breaker.record_failure(breaker.acquire())
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_open_blocks_then_half_open_limits_trials(self):
+        """Test blocking while open and the concurrent trial limit."""
+        clock = FakeClock()
+        breaker = make_breaker(clock, half_open_max_calls=2)
+        for _ in range(3):
+            breaker.record_failure(breaker.acquire())
+
+        with pytest.raises(CircuitBreakerError):
+            breaker.acquire()
+
+        clock.now += 5
+        first = breaker.acquire()
+        second = breaker.acquire()
+        assert breaker.state is CircuitState.HALF_OPEN
+        with pytest.raises(CircuitBreakerError):
+            breaker.acquire()
+
+        breaker.record_success(first)
+        third = breaker.acquire()
+        breaker.record_success(second)
+        assert breaker.state is CircuitState.CLOSED
+
+        # A trial permit from the finished half-open period is ignored
+        breaker.record_failure(third)
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.get_stats().blocked_requests == 2
+
+    def test_failed_trial_reopens(self):
+        """Test that a failed trial request reopens the circuit."""
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        for _ in range(3):
+            breaker.record_failure(breaker.acquire())
+
+        clock.now += 5
+        breaker.record_failure(breaker.acquire())
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitBreakerError):
+            breaker.acquire()
+
+    @pytest.mark.asyncio
+    async def test_call_releases_trial_on_cancel(self):
+        """Test that a cancelled trial frees its slot without an outcome."""
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        for _ in range(3):
+            breaker.record_failure(breaker.acquire())
+        clock.now += 5
+
+        task = asyncio.create_task(breaker.call(asyncio.sleep, 10))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert await breaker.call(asyncio.sleep, 0) is None
+
+    def test_registry_lookup_is_synchronous(self):
+        """Test that the registry keys breakers by scheme and host."""
+        registry = CircuitBreakerRegistry(CircuitBreakerConfig(failure_threshold=7))
+        first = registry.breaker_for("https://example.com/a")
+        assert registry.breaker_for("https://example.com/b") is first
+        assert registry.breaker_for("http://example.com/a") is not first
+        assert first.config.failure_threshold == 7
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_bookkeeping_overhead(self):
+        """Benchmark per-call bookkeeping against two asyncio.Lock sections."""
+        breaker = CircuitBreaker("bench", CircuitBreakerConfig())
+        lock = asyncio.Lock()
+        calls = 100000
+
+        start = time.perf_counter()
+        for _ in range(calls):
+            breaker.record_success(breaker.acquire())
+        breaker_time = time.perf_counter() - start
+
+        # Previous approach: lock to check state, then lock to record
+        counter = 0
+        start = time.perf_counter()
+        for _ in range(calls):
+            async with lock:
+                counter += 1
+            async with lock:
+                counter += 1
+        lock_time = time.perf_counter() - start
+
+        print(
+            f"\n{calls} calls: breaker {breaker_time * 1000:.0f}ms, "
+            f"locked {lock_time * 1000:.0f}ms"
+        )
+        assert breaker.get_stats().successful_requests == calls
+        assert breaker_time < lock_time
+
+
+class TestFetcherCircuitBreaker:
+    """Test circuit breaking inside WebFetcher.fetch_single."""
+
+    URL = "https://example.com/flaky"
+
+    @pytest.mark.asyncio
+    async def test_fetch_single_trips_per_host(self):
+        """Test that failing requests open the host's circuit."""
+        breaker_config = CircuitBreakerConfig(
+            failure_threshold=2, recovery_timeout=60.0
+        )
+        config = FetchConfig(max_retries=0)
+
+        async with WebFetcher(
+            config=config, circuit_breaker_config=breaker_config
+        ) as fetcher:
+            with aioresponses() as m:
+                m.get(self.URL, status=503, repeat=True)
+                m.get("https://other.example.com/", status=200, body="ok")
+
+                first = await fetcher.fetch_single(FetchRequest(url=self.URL))
+                second = await fetcher.fetch_single(FetchRequest(url=self.URL))
+                blocked = await fetcher.fetch_single(FetchRequest(url=self.URL))
+                other = await fetcher.fetch_single(
+                    FetchRequest(url="https://other.example.com/")
+                )
+
+                with pytest.raises(CircuitBreakerError):
+                    await fetcher.fetch_with_circuit_breaker(FetchRequest(url=self.URL))
+
+                sent = sum(
+                    len(calls) for key, calls in m.requests.items() if "flaky" in str(key[1])
+                )
+
+            assert "503" in first.error and "503" in second.error
+            assert "OPEN" in blocked.error
+            assert other.is_success
+            assert sent == 2
+
+            stats = fetcher.get_circuit_breaker_stats()
+            assert stats["https://example.com"].blocked_requests == 2
+            assert stats["https://other.example.com"].successful_requests == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_single_without_config_never_blocks(self):
+        """Test that breakers stay out of fetch_single unless configured."""
+        async with WebFetcher(config=FetchConfig(max_retries=0)) as fetcher:
+            with aioresponses() as m:
+                m.get(self.URL, status=503, repeat=True)
+                for _ in range(10):
+                    result = await fetcher.fetch_single(FetchRequest(url=self.URL))
+                    assert "503" in result.error
+
+            assert fetcher.get_circuit_breaker_stats() == {}
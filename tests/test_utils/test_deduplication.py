@@ -0,0 +1,260 @@
+"""
+Tests for single-flight request deduplication.
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from web_fetch.utils import deduplication
+from web_fetch.utils.deduplication import (
+    RequestDeduplicator,
+    RequestKey,
+    request_fingerprint,
+)
+
+
+class TestRequestFingerprint:
+    """Test deduplication keys."""
+
+    def test_plain_get_is_method_and_url(self):
+        """Test the cheap key for requests without headers, params or body."""
+        assert request_fingerprint("https://example.com", "get") == (
+            "GET",
+            "https://example.com",
+        )
+
+    def test_order_insensitive_and_distinct(self):
+        """Test that header order is ignored and bodies are distinguished."""
+        url = "https://example.com"
+        assert request_fingerprint(
+            url, headers={"A": "1", "B": "2"}
+        ) == request_fingerprint(url, headers={"B": "2", "A": "1"})
+        assert request_fingerprint(
+            url, "POST", data={"x": 1, "y": 2}
+        ) == request_fingerprint(url, "POST", data={"y": 2, "x": 1})
+        assert request_fingerprint(url, "POST", data=b"a") != request_fingerprint(
+            url, "POST", data=b"b"
+        )
+        assert request_fingerprint(url, headers={"A": "1"}) != request_fingerprint(url)
+
+    @pytest.mark.asyncio
+    async def test_tuple_keys_skip_hashing(self):
+        """Test that building and using tuple keys never hashes or serializes."""
+        url = "https://example.com/data"
+        with (
+            patch.object(deduplication.hashlib, "sha256") as sha256,
+            patch.object(deduplication.json, "dumps") as dumps,
+        ):
+            keys = [
+                request_fingerprint(url),
+                request_fingerprint(url, headers={"A": "1"}, params={"p": "1"}),
+                RequestKey(url=url, method="post", data=b"body").fingerprint(),
+            ]
+            dedup = RequestDeduplicator()
+            for key in keys:
+                assert await dedup.deduplicate(key, asyncio.sleep, 0, "ok") == "ok"
+            await dedup.clear()
+
+        sha256.assert_not_called()
+        dumps.assert_not_called()
+
+    def test_request_key_fingerprint(self):
+        """Test that RequestKey maps onto the same key."""
+        key = RequestKey(url="https://example.com", method="post", data="body")
+        assert key.fingerprint() == request_fingerprint(
+            "https://example.com", "POST", data="body"
+        )
+
+
+class TestRequestDeduplicator:
+    """Test coalescing, failure fan-out, cancellation and result sharing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_share_one_call(self):
+        """Test that identical in-flight requests run once."""
+        dedup = RequestDeduplicator()
+        calls = 0
+
+        async def fetch(value):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return value
+
+        results = await asyncio.gather(
+            *(dedup.deduplicate(("GET", "a"), fetch, "a") for _ in range(10)),
+            dedup.deduplicate(("GET", "b"), fetch, "b"),
+        )
+
+        assert results == ["a"] * 10 + ["b"]
+        assert calls == 2
+        assert dedup.get_stats()["coalesced"] == 9
+        assert dedup.get_stats()["pending_requests"] == 0
+        await dedup.clear()
+
+    @pytest.mark.asyncio
+    async def test_other_keys_not_blocked_by_waiters(self):
+        """Test that a slow coalesced key does not delay other keys."""
+        dedup = RequestDeduplicator()
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+            return "slow"
+
+        async def fast():
+            return "fast"
+
+        waiters = [
+            asyncio.create_task(dedup.deduplicate("slow", slow)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        assert await asyncio.wait_for(dedup.deduplicate("fast", fast), 1) == "fast"
+
+        release.set()
+        assert await asyncio.gather(*waiters) == ["slow"] * 3
+        await dedup.clear()
+
+    @pytest.mark.asyncio
+    async def test_exception_reaches_all_waiters(self):
+        """Test that a failure is raised to every coalesced caller."""
+        dedup = RequestDeduplicator()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            *(dedup.deduplicate("key", fail) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        await dedup.clear()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_hands_over(self):
+        """Test that waiters rerun the request when its owner is cancelled."""
+        dedup = RequestDeduplicator()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        leader = asyncio.create_task(dedup.deduplicate("key", fetch))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(dedup.deduplicate("key", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await waiter == 2
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        await dedup.clear()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_request(self):
+        """Test that cancelling one waiter leaves the shared request running."""
+        dedup = RequestDeduplicator()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return "done"
+
+        leader = asyncio.create_task(dedup.deduplicate("key", fetch))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(dedup.deduplicate("key", fetch))
+        await asyncio.sleep(0)
+        waiter.cancel()
+
+        assert await leader == "done"
+        await dedup.clear()
+
+    @pytest.mark.asyncio
+    async def test_result_sharing_window(self):
+        """Test that results are shared shortly after completion when enabled."""
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        plain = RequestDeduplicator()
+        assert await plain.deduplicate("key", fetch) == 1
+        assert await plain.deduplicate("key", fetch) == 2
+
+        sharing = RequestDeduplicator(result_ttl=0.05)
+        assert await sharing.deduplicate("key", fetch) == 3
+        assert await sharing.deduplicate("key", fetch) == 3
+        await asyncio.sleep(0.06)
+        assert await sharing.deduplicate("key", fetch) == 4
+        assert sharing.get_stats()["shared"] == 1
+
+        await plain.clear()
+        await sharing.clear()
+
+
+class TestDeduplicationBenchmark:
+    """Contention and key-cost benchmarks."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_contention(self):
+        """Benchmark 10k concurrent requests, half duplicates over 100 keys."""
+        headers = {"Accept": "application/json", "User-Agent": "bench"}
+        urls = [f"https://example.com/dup/{i % 100}" for i in range(5000)] + [
+            f"https://example.com/unique/{i}" for i in range(5000)
+        ]
+        calls = 0
+
+        async def fetch(url):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return url
+
+        dedup = RequestDeduplicator()
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                dedup.deduplicate(request_fingerprint(url, headers=headers), fetch, url)
+                for url in urls
+            )
+        )
+        elapsed = time.perf_counter() - start
+        await dedup.clear()
+
+        print(f"\n10k concurrent requests: {elapsed * 1000:.0f}ms, {calls} calls")
+        assert results == urls
+        assert calls == 5100
+        # Every request overlaps the same 50ms window instead of queueing
+        assert elapsed < 5.0
+
+    @pytest.mark.performance
+    @pytest.mark.benchmark
+    def test_key_cost(self):
+        """Report the cost of tuple keys against the sha256 hash of RequestKey."""
+        urls = [f"https://example.com/item/{i}" for i in range(10000)]
+
+        start = time.perf_counter()
+        for url in urls:
+            request_fingerprint(url)
+        tuple_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for url in urls:
+            RequestKey(url=url).to_hash()
+        hash_time = time.perf_counter() - start
+
+        # Timings are machine dependent; test_tuple_keys_skip_hashing covers
+        # the behaviour
+        print(
+            f"\nkeys: tuple {tuple_time * 1000:.1f}ms, sha256 {hash_time * 1000:.1f}ms"
+        )
@@ -0,0 +1,180 @@
+"""
+Tests for the sharded, index-backed disk cache.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from web_fetch.utils import DiskCache
+from web_fetch.utils.cache import (
+    CacheBackend,
+    EnhancedCache,
+    EnhancedCacheConfig,
+)
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    """Create a disk cache in a temporary directory."""
+    cache = DiskCache(str(tmp_path / "cache"))
+    yield cache
+    cache.close()
+
+
+class TestDiskCache:
+    """Test DiskCache storage, hits and eviction."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, disk_cache):
+        """Test storing raw bytes and pickled values."""
+        await disk_cache.set("raw", b"body bytes", etag='"v1"')
+        await disk_cache.set("obj", {"a": [1, 2, 3]}, ttl=60)
+
+        raw = await disk_cache.get("raw")
+        obj = await disk_cache.get("obj")
+
+        assert raw.value == b"body bytes"
+        assert raw.etag == '"v1"'
+        assert obj.value == {"a": [1, 2, 3]}
+        assert obj.expires_at == pytest.approx(obj.created_at + 60)
+        assert sorted(await disk_cache.keys()) == ["obj", "raw"]
+
+    @pytest.mark.asyncio
+    async def test_bodies_are_sharded_and_shared(self, disk_cache):
+        """Test that identical bodies share one content-addressed file."""
+        await disk_cache.set("a", b"same")
+        await disk_cache.set("b", b"same")
+
+        bodies = list(disk_cache.directory.glob("*/*/*"))
+        assert len(bodies) == 1
+        assert bodies[0].parent.name == bodies[0].name[2:4]
+        assert disk_cache.current_bytes == 4
+
+        await disk_cache.delete("a")
+        assert bodies[0].exists()
+        await disk_cache.delete("b")
+        assert not bodies[0].exists()
+        assert disk_cache.current_bytes == 0
+
+    @pytest.mark.asyncio
+    async def test_hit_does_not_rewrite_body(self, disk_cache):
+        """Test that a hit only updates the index."""
+        await disk_cache.set("key", {"value": 1})
+
+        with patch.object(disk_cache, "_write_body") as write_body:
+            first = await disk_cache.get("key")
+            second = await disk_cache.get("key")
+
+        write_body.assert_not_called()
+        assert first.hit_count == 1
+        assert second.hit_count == 2
+
+    @pytest.mark.asyncio
+    async def test_open_body_is_zero_copy(self, disk_cache):
+        """Test that open_body maps the stored bytes."""
+        await disk_cache.set("key", b"x" * 4096)
+
+        view = disk_cache.open_body("key")
+        assert isinstance(view, memoryview)
+        assert view.readonly
+        assert view[:3] == b"xxx"
+        assert len(view) == 4096
+        view.release()
+
+    @pytest.mark.asyncio
+    async def test_index_work_runs_off_loop(self, disk_cache):
+        """Test that index queries and body writes happen on the worker thread."""
+        threads = set()
+        connection = disk_cache._db
+
+        class RecordingConnection:
+            def execute(self, *args):
+                threads.add(threading.get_ident())
+                return connection.execute(*args)
+
+        disk_cache._db = RecordingConnection()
+        try:
+            await disk_cache.set("key", b"body")
+            assert (await disk_cache.get("key")).value == b"body"
+            assert await disk_cache.keys() == ["key"]
+            assert await disk_cache.purge() == 0
+        finally:
+            disk_cache._db = connection
+
+        assert threads and threading.get_ident() not in threads
+
+    @pytest.mark.asyncio
+    async def test_expiry(self, disk_cache):
+        """Test that expired entries are dropped with their bodies."""
+        await disk_cache.set("old", b"old", ttl=10, created_at=time.time() - 20)
+        await disk_cache.set("new", b"new", ttl=10)
+
+        assert await disk_cache.get("old") is None
+        assert await disk_cache.keys() == ["new"]
+        await disk_cache.set("stale", b"stale", ttl=10, created_at=time.time() - 20)
+        assert await disk_cache.purge() == 1
+        assert disk_cache.purge_expired() == 0
+        assert disk_cache.current_bytes == 3
+
+    @pytest.mark.asyncio
+    async def test_size_bounded_eviction(self, tmp_path):
+        """Test that least recently used entries are evicted over max_bytes."""
+        cache = DiskCache(str(tmp_path / "bounded"), max_bytes=10)
+        try:
+            await cache.set("a", b"aaaa")
+            await cache.set("b", b"bbbb")
+            await cache.get("a")
+            await cache.set("c", b"cccc")
+
+            assert sorted(await cache.keys()) == ["a", "c"]
+            assert cache.current_bytes == 8
+            assert cache.get_stats()["evictions"] == 1
+            assert await cache.set("huge", b"x" * 11) is False
+        finally:
+            cache.close()
+
+    @pytest.mark.asyncio
+    async def test_index_survives_reopen(self, tmp_path):
+        """Test that entries and byte accounting persist across instances."""
+        directory = str(tmp_path / "persist")
+        cache = DiskCache(directory)
+        await cache.set("key", b"persisted")
+        cache.close()
+
+        reopened = DiskCache(directory)
+        try:
+            record = await reopened.get("key")
+            assert record.value == b"persisted"
+            assert reopened.current_bytes == 9
+        finally:
+            reopened.close()
+
+
+class TestFileCacheBackend:
+    """Test EnhancedCache with the file backend."""
+
+    @pytest.mark.asyncio
+    async def test_enhanced_cache_file_backend(self, tmp_path):
+        """Test get/set through EnhancedCache and the stats it reports."""
+        cache = EnhancedCache(
+            EnhancedCacheConfig(
+                backend=CacheBackend.FILE,
+                file_cache_dir=str(tmp_path),
+                cleanup_interval=0,
+            )
+        )
+        try:
+            await cache.set("https://example.com", {"content": "hello"}, ttl=60)
+
+            assert await cache.get("https://example.com") == {"content": "hello"}
+            assert await cache.get("https://example.com/missing") is None
+
+            stats = cache.get_stats()
+            assert stats["hits"] == 1
+            assert stats["misses"] == 1
+            assert stats["size"] == 1
+        finally:
+            await cache.close()
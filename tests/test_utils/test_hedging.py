@@ -0,0 +1,274 @@
+"""
+Tests for hedged requests.
+
+Covers the per-host latency tracker, hedge timing, cancellation of the
+losing attempt, the hedge-rate cap, WebFetcher integration, and a benchmark
+of tail latency against a local server with occasional stuck responses.
+"""
+
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from web_fetch.core_fetcher import WebFetcher
+from web_fetch.models import ContentType, FetchConfig, FetchRequest
+from web_fetch.utils.hedging import HedgingConfig, RequestHedger
+from web_fetch.utils.metrics import HostLatencyTracker
+
+
+def warmed_hedger(**overrides) -> RequestHedger:
+    """Create a hedger whose host p95 is already 10ms."""
+    options = dict(min_samples=20, max_hedge_ratio=1.0)
+    options.update(overrides)
+    # Sort once so that later samples do not move the threshold
+    latencies = HostLatencyTracker(refresh_every=1000)
+    hedger = RequestHedger(HedgingConfig(**options), latencies)
+    for _ in range(20):
+        hedger.latencies.record("host", 0.01)
+    return hedger
+
+
+class TestHostLatencyTracker:
+    """Test rolling per-host percentiles."""
+
+    def test_percentiles_per_host(self):
+        """Test percentile lookup and host isolation."""
+        tracker = HostLatencyTracker(window=100, refresh_every=1)
+        for value in range(1, 101):
+            tracker.record("a", value / 1000)
+
+        assert tracker.percentile("a", 95) == pytest.approx(0.096)
+        assert tracker.percentile("a", 50) == pytest.approx(0.051)
+        assert tracker.percentile("b", 95) is None
+        assert tracker.sample_count("a") == 100
+
+    def test_window_and_refresh(self):
+        """Test that old samples roll off and sorting is batched."""
+        tracker = HostLatencyTracker(window=10, refresh_every=5)
+        for _ in range(10):
+            tracker.record("a", 1.0)
+        assert tracker.percentile("a", 50) == 1.0
+
+        for _ in range(4):
+            tracker.record("a", 0.1)
+        # Fewer than refresh_every new samples: cached order is reused
+        assert tracker.percentile("a", 50) == 1.0
+        tracker.record("a", 0.1)
+        assert tracker.percentile("a", 40) == 0.1
+
+
+class TestRequestHedger:
+    """Test hedging decisions."""
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self):
+        """Test that the hedge wins and the stuck primary is cancelled."""
+        hedger = warmed_hedger()
+        calls = 0
+        cancelled = []
+
+        async def attempt():
+            nonlocal calls
+            calls += 1
+            number = calls
+            try:
+                await asyncio.sleep(5 if number == 1 else 0.01)
+            except asyncio.CancelledError:
+                cancelled.append(number)
+                raise
+            return number
+
+        start = time.perf_counter()
+        assert await hedger.run("host", attempt) == 2
+        assert time.perf_counter() - start < 1
+        await asyncio.sleep(0)
+
+        assert cancelled == [1]
+        stats = hedger.get_stats()
+        assert stats["hedges_issued"] == 1 and stats["hedges_won"] == 1
+
+    @pytest.mark.asyncio
+    async def test_losing_primary_is_recorded_as_lower_bound(self):
+        """Test that a primary cancelled by its hedge still leaves a sample."""
+        hedger = warmed_hedger()
+        calls = 0
+
+        async def attempt():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(5 if calls == 1 else 0.01)
+            return calls
+
+        assert await hedger.run("host", attempt) == 2
+
+        samples = hedger.latencies._hosts.peek("host").samples
+        assert len(samples) == 22
+        # The hedge's own time, then the primary's time when it was cancelled
+        assert samples[-1] > samples[-2]
+        assert samples[-1] >= 0.02
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_samples_or_when_fast(self):
+        """Test that cold hosts and fast answers are never hedged."""
+        hedger = RequestHedger(HedgingConfig(max_hedge_ratio=1.0))
+
+        async def attempt():
+            await asyncio.sleep(0.02)
+            return "ok"
+
+        assert await hedger.run("cold", attempt) == "ok"
+
+        warm = warmed_hedger()
+
+        async def fast():
+            return "fast"
+
+        assert await warm.run("host", fast) == "fast"
+        assert hedger.get_stats()["hedges_issued"] == 0
+        assert warm.get_stats()["hedges_issued"] == 0
+
+    @pytest.mark.asyncio
+    async def test_hedge_rate_cap(self):
+        """Test that hedges stay within max_hedge_ratio of requests."""
+        hedger = warmed_hedger(max_hedge_ratio=0.1)
+
+        async def slow():
+            await asyncio.sleep(0.03)
+            return "slow"
+
+        for _ in range(30):
+            await hedger.run("host", slow)
+
+        stats = hedger.get_stats()
+        assert stats["hedges_issued"] == 3
+        assert stats["hedges_denied"] == 27
+
+    @pytest.mark.asyncio
+    async def test_failed_hedge_falls_back_to_primary(self):
+        """Test that a failing hedge does not beat a slower success."""
+        hedger = warmed_hedger()
+        calls = 0
+
+        async def attempt():
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                raise ConnectionError("reset")
+            await asyncio.sleep(0.05)
+            return "primary"
+
+        assert await hedger.run("host", attempt) == "primary"
+
+        calls = 0
+
+        async def always_fails():
+            nonlocal calls
+            calls += 1
+            number = calls
+            await asyncio.sleep(0.03 if number == 1 else 0)
+            raise ValueError(f"attempt {number}")
+
+        with pytest.raises(ValueError, match="attempt 1"):
+            await hedger.run("host", always_fails)
+
+
+@pytest_asyncio.fixture
+async def stalling_server():
+    """Serve quickly, except that every 25th request stalls for 500ms."""
+    counter = {"requests": 0}
+
+    async def handler(request: web.Request) -> web.Response:
+        counter["requests"] += 1
+        if counter["requests"] % 25 == 0:
+            await asyncio.sleep(0.5)
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}/", counter
+
+    await runner.cleanup()
+
+
+class TestFetcherHedging:
+    """Test hedging inside WebFetcher.fetch_single."""
+
+    @staticmethod
+    async def latencies(fetcher: WebFetcher, url: str, calls: int) -> list:
+        request = FetchRequest(url=url, content_type=ContentType.TEXT)
+        timings = []
+        for _ in range(calls):
+            start = time.perf_counter()
+            result = await fetcher.fetch_single(request)
+            timings.append(time.perf_counter() - start)
+            assert result.status_code == 200
+        return sorted(timings)
+
+    @pytest.mark.asyncio
+    async def test_post_is_never_hedged(self, stalling_server):
+        """Test that only configured idempotent methods are hedged."""
+        url, _ = stalling_server
+        async with WebFetcher(
+            FetchConfig(max_retries=0), hedging_config=HedgingConfig()
+        ) as fetcher:
+            request = FetchRequest(
+                url=url, method="POST", content_type=ContentType.TEXT
+            )
+            result = await fetcher.fetch_single(request)
+            assert result.status_code == 405
+            assert fetcher.get_hedging_stats()["requests"] == 0
+
+        async with WebFetcher() as fetcher:
+            assert fetcher.get_hedging_stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_hedge_bypasses_deduplication(self, stalling_server):
+        """Test that a hedge is sent even when deduplication is enabled."""
+        url, counter = stalling_server
+        async with WebFetcher(
+            FetchConfig(max_retries=0),
+            enable_deduplication=True,
+            hedging_config=HedgingConfig(max_hedge_ratio=1.0),
+        ) as fetcher:
+            # Requests 1-24 warm the host percentiles, request 25 stalls
+            await self.latencies(fetcher, url, 25)
+            stats = fetcher.get_hedging_stats()
+
+        assert stats["hedges_issued"] == 1
+        assert stats["hedges_won"] == 1
+        assert counter["requests"] == 26
+
+    @pytest.mark.asyncio
+    @pytest.mark.performance
+    async def test_tail_latency(self, stalling_server):
+        """Compare p99 latency of 200 sequential GETs with and without hedging."""
+        url, _ = stalling_server
+        config = FetchConfig(max_retries=0)
+        calls = 200
+
+        async with WebFetcher(config) as fetcher:
+            plain = await self.latencies(fetcher, url, calls)
+
+        hedging = HedgingConfig(max_hedge_ratio=0.1)
+        async with WebFetcher(config, hedging_config=hedging) as fetcher:
+            hedged = await self.latencies(fetcher, url, calls)
+            stats = fetcher.get_hedging_stats()
+
+        p99 = int(calls * 0.99)
+        print(
+            f"\n{calls} GETs, 4% stalled 500ms: p99 plain {plain[p99] * 1000:.0f}ms, "
+            f"hedged {hedged[p99] * 1000:.0f}ms "
+            f"({stats['hedges_issued']} hedges, {stats['hedges_won']} won)"
+        )
+        assert stats["hedges_won"] >= 1
+        assert stats["hedge_rate"] <= 0.1
+        assert hedged[p99] < plain[p99] / 2
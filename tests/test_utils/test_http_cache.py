@@ -0,0 +1,333 @@
+"""
+Tests for the HTTP-semantics response cache.
+"""
+
+import asyncio
+import time
+from email.utils import formatdate
+
+import pytest
+from aioresponses import aioresponses
+
+from web_fetch import ContentType, FetchRequest, WebFetcher
+from web_fetch.models import FetchResult
+from web_fetch.utils import CacheState, EnhancedCache, EnhancedCacheConfig, HTTPCache
+from web_fetch.utils.http_cache import CacheLookup, parse_cache_control
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self) -> None:
+        self.now = time.time()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_result(headers, content="body", status_code=200):
+    return FetchResult(
+        url="https://example.com/data",
+        status_code=status_code,
+        headers=headers,
+        content=content,
+        content_type=ContentType.TEXT,
+    )
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def http_cache(clock):
+    return HTTPCache(EnhancedCache(EnhancedCacheConfig(cleanup_interval=0)), clock=clock)
+
+
+class TestHTTPCache:
+    """Test freshness, Vary handling and revalidation."""
+
+    URL = "https://example.com/data"
+
+    def test_parse_cache_control(self):
+        """Test directive parsing with arguments and quoting."""
+        directives = parse_cache_control('Max-Age=60, no-cache="Set-Cookie", public')
+        assert directives == {"max-age": "60", "no-cache": "Set-Cookie", "public": None}
+
+    @pytest.mark.asyncio
+    async def test_max_age_and_stale_while_revalidate(self, http_cache, clock):
+        """Test the fresh, stale-while-revalidate and stale windows."""
+        result = make_result(
+            {"Cache-Control": "max-age=60, stale-while-revalidate=30", "ETag": '"v1"'}
+        )
+        assert await http_cache.store(self.URL, {}, result, clock.now, clock.now)
+
+        lookup = await http_cache.lookup(self.URL, {})
+        assert lookup.state is CacheState.FRESH
+        assert lookup.response().content == "body"
+
+        clock.now += 70
+        lookup = await http_cache.lookup(self.URL, {})
+        assert lookup.state is CacheState.STALE_WHILE_REVALIDATE
+        assert lookup.response().headers["Age"] == "70"
+
+        clock.now += 30
+        lookup = await http_cache.lookup(self.URL, {})
+        assert lookup.state is CacheState.STALE
+        assert lookup.conditional_headers() == {"If-None-Match": '"v1"'}
+
+    @pytest.mark.asyncio
+    async def test_malformed_max_age_is_stale(self, http_cache, clock):
+        """Test that a decimal or signed max-age is rejected, not rounded."""
+        for value in ("60.5", "+60", "-1"):
+            result = make_result(
+                {
+                    "Cache-Control": f"max-age={value}",
+                    "Expires": formatdate(clock.now + 120, usegmt=True),
+                    "ETag": '"v1"',
+                }
+            )
+            await http_cache.store(self.URL, {}, result, clock.now, clock.now)
+            lookup = await http_cache.lookup(self.URL, {})
+            assert lookup.state is CacheState.STALE
+            assert lookup.entry.freshness_lifetime == 0
+
+        request = {"Cache-Control": "max-age=0.5"}
+        result = make_result({"Cache-Control": "max-age=60"})
+        await http_cache.store(self.URL, request, result, clock.now, clock.now)
+        clock.now += 1
+        assert (await http_cache.lookup(self.URL, request)).state is CacheState.FRESH
+
+    @pytest.mark.asyncio
+    async def test_age_and_expires(self, http_cache, clock):
+        """Test that Age counts against max-age and Expires is relative to Date."""
+        aged = make_result({"Cache-Control": "max-age=60", "Age": "50"})
+        await http_cache.store(self.URL, {}, aged, clock.now, clock.now)
+        clock.now += 15
+        assert (await http_cache.lookup(self.URL, {})).state is CacheState.STALE
+
+        expires = make_result(
+            {
+                "Date": formatdate(clock.now, usegmt=True),
+                "Expires": formatdate(clock.now + 120, usegmt=True),
+            }
+        )
+        await http_cache.store(self.URL, {}, expires, clock.now, clock.now)
+        lookup = await http_cache.lookup(self.URL, {})
+        assert lookup.state is CacheState.FRESH
+        assert lookup.entry.freshness_lifetime == pytest.approx(120, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_no_store_and_vary_star(self, http_cache, clock):
+        """Test responses that must not be stored."""
+        for headers in (
+            {"Cache-Control": "no-store, max-age=60"},
+            {"Cache-Control": "max-age=60", "Vary": "*"},
+            {},
+        ):
+            assert not await http_cache.store(
+                self.URL, {}, make_result(headers), clock.now, clock.now
+            )
+        assert await http_cache.lookup(self.URL, {}) is None
+
+    @pytest.mark.asyncio
+    async def test_vary_selects_variant(self, http_cache, clock):
+        """Test that responses are keyed by the headers named in Vary."""
+        headers = {"Cache-Control": "max-age=60", "Vary": "Accept-Language"}
+        await http_cache.store(
+            self.URL,
+            {"accept-language": "en"},
+            make_result(headers, content="hello"),
+            clock.now,
+            clock.now,
+        )
+        await http_cache.store(
+            self.URL,
+            {"accept-language": "fr"},
+            make_result(headers, content="bonjour"),
+            clock.now,
+            clock.now,
+        )
+
+        english = await http_cache.lookup(self.URL, {"accept-language": "en"})
+        french = await http_cache.lookup(self.URL, {"accept-language": "fr"})
+        assert english.response().content == "hello"
+        assert french.response().content == "bonjour"
+        assert await http_cache.lookup(self.URL, {"accept-language": "de"}) is None
+
+    @pytest.mark.asyncio
+    async def test_request_no_cache_forces_revalidation(self, http_cache, clock):
+        """Test that request Cache-Control: no-cache skips fresh hits."""
+        result = make_result({"Cache-Control": "max-age=60", "ETag": '"v1"'})
+        await http_cache.store(self.URL, {}, result, clock.now, clock.now)
+
+        lookup = await http_cache.lookup(self.URL, {"cache-control": "no-cache"})
+        assert lookup.state is CacheState.STALE
+
+    @pytest.mark.asyncio
+    async def test_not_modified_refreshes_entry(self, http_cache, clock):
+        """Test that a 304 merges headers and restarts freshness."""
+        result = make_result(
+            {"Cache-Control": "max-age=10", "ETag": '"v1"', "X-Version": "1"}
+        )
+        await http_cache.store(self.URL, {}, result, clock.now, clock.now)
+        clock.now += 20
+        lookup = await http_cache.lookup(self.URL, {})
+
+        refreshed = await http_cache.process_response(
+            self.URL,
+            "GET",
+            {},
+            make_result(
+                {"Cache-Control": "max-age=30", "x-version": "2"},
+                content=None,
+                status_code=304,
+            ),
+            lookup,
+            clock.now,
+            clock.now,
+        )
+
+        assert refreshed.status_code == 200
+        assert refreshed.content == "body"
+        assert refreshed.headers["x-version"] == "2"
+        assert "X-Version" not in refreshed.headers
+        assert refreshed.headers["ETag"] == '"v1"'
+
+        clock.now += 20
+        assert (await http_cache.lookup(self.URL, {})).state is CacheState.FRESH
+        assert http_cache.get_stats()["not_modified"] == 1
+
+    @pytest.mark.asyncio
+    async def test_validators_extend_retention(self, http_cache, clock):
+        """Test that entries with validators outlive freshness by default_ttl."""
+        default_ttl = http_cache.cache.config.default_ttl
+        result = make_result(
+            {"Cache-Control": f"max-age={int(default_ttl)}", "ETag": '"v1"'}
+        )
+        await http_cache.store(self.URL, {}, result, clock.now, clock.now)
+
+        index = await http_cache.cache.backend.get(http_cache._index_key(self.URL))
+        variant = await http_cache.cache.backend.get(
+            http_cache._variant_key(self.URL, (), {})
+        )
+        assert variant.ttl == 2 * default_ttl
+        assert index.ttl == 2 * default_ttl
+
+    @pytest.mark.asyncio
+    async def test_not_modified_rewrites_index(self, http_cache, clock):
+        """Test that a 304 re-stores the URL index with the new retention."""
+        result = make_result({"Cache-Control": "max-age=10", "ETag": '"v1"'})
+        await http_cache.store(self.URL, {}, result, clock.now, clock.now)
+        index_key = http_cache._index_key(self.URL)
+        await http_cache.cache.backend.delete(index_key)
+        variant_key = http_cache._variant_key(self.URL, (), {})
+        stored = await http_cache.cache.backend.get(variant_key)
+        lookup = CacheLookup(
+            key=variant_key, entry=stored.data, state=CacheState.STALE, age=20
+        )
+
+        await http_cache.process_response(
+            self.URL,
+            "GET",
+            {},
+            make_result(
+                {"Cache-Control": "max-age=7200"}, content=None, status_code=304
+            ),
+            lookup,
+            clock.now,
+            clock.now,
+        )
+
+        index = await http_cache.cache.backend.get(index_key)
+        assert index.ttl == 7200 + http_cache.cache.config.default_ttl
+        assert (await http_cache.lookup(self.URL, {})).state is CacheState.FRESH
+
+    @pytest.mark.asyncio
+    async def test_unsafe_request_invalidates(self, http_cache, clock):
+        """Test that a successful POST drops the stored GET response."""
+        await http_cache.store(
+            self.URL, {}, make_result({"Cache-Control": "max-age=60"}), clock.now, clock.now
+        )
+        await http_cache.process_response(
+            self.URL, "POST", {}, make_result({}), None, clock.now, clock.now
+        )
+        assert await http_cache.lookup(self.URL, {}) is None
+
+
+class TestFetcherHTTPCache:
+    """Test WebFetcher in HTTP-semantics cache mode."""
+
+    URL = "https://example.com/poll"
+
+    @staticmethod
+    def sent_headers(mocked, index):
+        calls = [call for key, calls in mocked.requests.items() for call in calls]
+        return calls[index].kwargs["headers"]
+
+    @pytest.mark.asyncio
+    async def test_revalidation_with_304(self):
+        """Test that a stale entry is revalidated and the body is reused."""
+        config = EnhancedCacheConfig(http_semantics=True, cleanup_interval=0)
+        request = FetchRequest(url=self.URL, content_type=ContentType.TEXT)
+
+        async with WebFetcher(cache_config=config) as fetcher:
+            with aioresponses() as m:
+                m.get(
+                    self.URL,
+                    status=200,
+                    body="payload",
+                    headers={"Cache-Control": "max-age=0", "ETag": '"abc"'},
+                )
+                m.get(
+                    self.URL,
+                    status=304,
+                    headers={"Cache-Control": "max-age=60", "ETag": '"abc"'},
+                )
+
+                first = await fetcher.fetch_single(request)
+                second = await fetcher.fetch_single(request)
+                third = await fetcher.fetch_single(request)
+
+                assert self.sent_headers(m, 1)["If-None-Match"] == '"abc"'
+
+            assert first.content == second.content == third.content == "payload"
+            assert second.status_code == 200
+            stats = fetcher._http_cache.get_stats()
+            assert stats["not_modified"] == 1
+            assert stats["fresh_hits"] == 1
+            await fetcher._enhanced_cache.close()
+
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate_in_background(self):
+        """Test that a stale entry is served while it is refreshed."""
+        config = EnhancedCacheConfig(http_semantics=True, cleanup_interval=0)
+        request = FetchRequest(url=self.URL, content_type=ContentType.TEXT)
+
+        async with WebFetcher(cache_config=config) as fetcher:
+            with aioresponses() as m:
+                m.get(
+                    self.URL,
+                    status=200,
+                    body="v1",
+                    headers={
+                        "Cache-Control": "max-age=0, stale-while-revalidate=60",
+                        "ETag": '"v1"',
+                    },
+                )
+                m.get(
+                    self.URL,
+                    status=200,
+                    body="v2",
+                    headers={"Cache-Control": "max-age=60", "ETag": '"v2"'},
+                )
+
+                await fetcher.fetch_single(request)
+                stale = await fetcher.fetch_single(request)
+                await asyncio.gather(*fetcher._revalidations.values())
+                fresh = await fetcher.fetch_single(request)
+
+            assert stale.content == "v1"
+            assert fresh.content == "v2"
+            await fetcher._enhanced_cache.close()
@@ -0,0 +1,185 @@
+"""
+Tests for the LRU cache engine shared by the in-memory caches.
+"""
+
+import time
+
+import pytest
+
+from web_fetch.cache import CacheEntry
+from web_fetch.cache import MemoryCacheBackend as AdvancedMemoryBackend
+from web_fetch.models import CacheConfig
+from web_fetch.utils import LRUCache, SimpleCache
+from web_fetch.utils.cache import (
+    EnhancedCacheConfig,
+    EnhancedCacheEntry,
+    MemoryCacheBackend,
+)
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCache:
+    """Test LRUCache eviction, expiry and accounting."""
+
+    def test_lru_order(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = LRUCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+
+        cache.set("c", 3)
+
+        assert "b" not in cache
+        assert cache.keys() == ["a", "c"]
+        assert cache.evictions == 1
+
+    def test_byte_budget(self):
+        """Test that entries are evicted to stay within max_bytes."""
+        cache = LRUCache(max_bytes=10)
+        cache.set("a", b"xxxx")
+        cache.set("b", b"yyyy")
+        cache.set("c", b"zzzz")
+
+        assert cache.keys() == ["b", "c"]
+        assert cache.current_bytes == 8
+
+        # Replacing a value updates the accounting
+        cache.set("b", b"y")
+        assert cache.current_bytes == 5
+
+        # A value larger than the whole budget is rejected
+        assert cache.set("d", b"w" * 11) is False
+        assert "d" not in cache
+
+    def test_ttl_expiry(self):
+        """Test that expired entries are dropped without a lookup."""
+        clock = FakeClock()
+        cache = LRUCache(clock=clock)
+        cache.set("a", 1, ttl=10)
+        cache.set("b", 2, ttl=30)
+        cache.set("c", 3)
+
+        clock.now += 15
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        clock.now += 20
+        cache.purge_expired()
+        assert cache.keys() == ["c"]
+        assert cache.expirations == 2
+
+    def test_reset_ttl_ignores_stale_deadline(self):
+        """Test that overwriting an entry replaces its old deadline."""
+        clock = FakeClock()
+        cache = LRUCache(clock=clock)
+        cache.set("a", 1, ttl=5)
+        cache.set("a", 2, ttl=50)
+
+        clock.now += 10
+        cache.purge_expired()
+
+        assert cache.get("a") == 2
+
+    def test_stats(self):
+        """Test hit and miss counters."""
+        cache = LRUCache()
+        cache.set("a", "value")
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["bytes"] == 5
+
+    @pytest.mark.performance
+    def test_lookup_and_eviction_cost(self):
+        """Benchmark a get/set mix against a list-tracked access order."""
+        size = 5000
+        ops = [(i % (size * 2), i % 3 == 0) for i in range(50000)]
+
+        cache = LRUCache(max_entries=size)
+        start = time.perf_counter()
+        for key, is_set in ops:
+            if is_set or cache.get(key) is None:
+                cache.set(key, key)
+        lru_time = time.perf_counter() - start
+
+        # Previous approach: a dict plus a list holding the access order
+        table = {}
+        order = []
+        start = time.perf_counter()
+        for key, is_set in ops:
+            if not is_set and key in table:
+                order.remove(key)
+                order.append(key)
+                continue
+            while len(table) >= size and order:
+                del table[order.pop(0)]
+            if key in order:
+                order.remove(key)
+            table[key] = key
+            order.append(key)
+        list_time = time.perf_counter() - start
+
+        print(f"\nLRUCache: {lru_time * 1000:.1f}ms, list order: {list_time * 1000:.1f}ms")
+        assert len(cache) == size
+        assert lru_time < list_time
+
+
+class TestSharedEngine:
+    """Test that the cache front-ends share the engine semantics."""
+
+    def test_simple_cache_byte_budget(self):
+        """Test SimpleCache eviction by max_memory_bytes."""
+        config = CacheConfig(
+            max_size=100, max_memory_bytes=10, enable_compression=False
+        )
+        cache = SimpleCache(config)
+
+        cache.put("url1", b"12345", {}, 200)
+        cache.put("url2", b"12345", {}, 200)
+        cache.put("url3", b"12345", {}, 200)
+
+        assert cache.get("url1") is None
+        assert cache.size() == 2
+
+    @pytest.mark.asyncio
+    async def test_enhanced_memory_backend(self):
+        """Test EnhancedCache memory backend eviction and TTL."""
+        backend = MemoryCacheBackend(EnhancedCacheConfig(max_size=2))
+        for key in ("a", "b", "c"):
+            await backend.set(
+                EnhancedCacheEntry(key=key, data=key, timestamp=time.time(), ttl=60)
+            )
+        await backend.set(
+            EnhancedCacheEntry(key="old", data="x", timestamp=time.time() - 120, ttl=60)
+        )
+
+        assert await backend.keys() == ["b", "c"]
+        entry = await backend.get("c")
+        assert entry is not None and entry.hit_count == 1
+
+    @pytest.mark.asyncio
+    async def test_advanced_memory_backend(self):
+        """Test advanced cache memory backend memory accounting."""
+        backend = AdvancedMemoryBackend(max_size=10, max_memory=20)
+        now = time.time()
+        for key in ("a", "b", "c"):
+            await backend.set(
+                key, CacheEntry(key=key, value="x" * 5, created_at=now, last_accessed=now)
+            )
+
+        # Each value is 7 bytes as JSON ("xxxxx"), so only two fit
+        assert await backend.keys() == ["b", "c"]
+        assert backend.current_memory == 14
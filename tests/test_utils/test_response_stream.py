@@ -0,0 +1,217 @@
+"""
+Tests for streaming response bodies.
+
+Covers memoryview chunks and piping into consumers, early abort of oversized
+bodies, retries before the body is streamed, single consumption, and a
+benchmark of peak memory against the buffered fetch_single path.
+"""
+
+import hashlib
+import tracemalloc
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from web_fetch.core_fetcher import WebFetcher
+from web_fetch.exceptions import ContentError, ServerError, WebFetchError
+from web_fetch.models import ContentType, FetchConfig, FetchRequest
+from web_fetch.utils.circuit_breaker import CircuitBreakerConfig, CircuitBreakerError
+
+BLOCK = bytes(range(256)) * 256  # 64KB
+LARGE_BLOCKS = 320  # 20MB
+
+
+@pytest_asyncio.fixture
+async def body_server():
+    """Serve fixed, chunked and flaky bodies."""
+    counter = {"flaky": 0, "chunked_blocks": 0}
+
+    async def fixed(request: web.Request) -> web.Response:
+        return web.Response(body=BLOCK * 4)
+
+    async def chunked(request: web.Request) -> web.StreamResponse:
+        blocks = int(request.query.get("blocks", "16"))
+        response = web.StreamResponse()
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        try:
+            for _ in range(blocks):
+                await response.write(BLOCK)
+                counter["chunked_blocks"] += 1
+        except ConnectionError:
+            pass
+        return response
+
+    async def flaky(request: web.Request) -> web.Response:
+        counter["flaky"] += 1
+        if counter["flaky"] == 1:
+            return web.Response(status=503)
+        return web.Response(body=BLOCK)
+
+    app = web.Application()
+    app.router.add_get("/fixed", fixed)
+    app.router.add_get("/chunked", chunked)
+    app.router.add_get("/flaky", flaky)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}", counter
+
+    await runner.cleanup()
+
+
+class TestFetchStream:
+    """Test WebFetcher.fetch_stream."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_memoryviews(self, body_server):
+        """Test that the body arrives as memoryviews and pipes to consumers."""
+        base, _ = body_server
+        digest = hashlib.sha256()
+        sizes = []
+
+        async with WebFetcher() as fetcher:
+            async with fetcher.fetch_stream(FetchRequest(url=f"{base}/fixed")) as stream:
+                assert stream.status_code == 200
+                assert stream.content_length == len(BLOCK) * 4
+
+                async def count(chunk: memoryview) -> None:
+                    assert isinstance(chunk, memoryview)
+                    sizes.append(len(chunk))
+
+                total = await stream.pipe(digest.update, count)
+
+        assert total == sum(sizes) == len(BLOCK) * 4
+        assert digest.hexdigest() == hashlib.sha256(BLOCK * 4).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_fixed_chunk_size_and_read(self, body_server):
+        """Test fixed-size chunks and reading the rest of the body."""
+        base, _ = body_server
+        async with WebFetcher() as fetcher:
+            request = FetchRequest(url=f"{base}/chunked?blocks=2")
+            async with fetcher.fetch_stream(request, chunk_size=1000) as stream:
+                sizes = [len(chunk) async for chunk in stream]
+                assert max(sizes) == 1000 and sum(sizes) == len(BLOCK) * 2
+
+            async with fetcher.fetch_stream(request) as stream:
+                assert await stream.read() == BLOCK * 2
+                with pytest.raises(WebFetchError, match="already consumed"):
+                    await stream.read()
+
+    @pytest.mark.asyncio
+    async def test_oversized_body_is_aborted(self, body_server):
+        """Test that the limit applies to the running total and Content-Length."""
+        base, counter = body_server
+        limit = len(BLOCK) * 3
+        async with WebFetcher() as fetcher:
+            request = FetchRequest(url=f"{base}/chunked?blocks={LARGE_BLOCKS}")
+            sizes = []
+            async with fetcher.fetch_stream(request, max_size=limit) as stream:
+                with pytest.raises(ContentError):
+                    await stream.pipe(lambda chunk: sizes.append(len(chunk)))
+                # Nothing past the limit is handed out
+                assert sum(sizes) <= limit < stream.bytes_read
+            assert counter["chunked_blocks"] < LARGE_BLOCKS
+
+            with pytest.raises(ContentError, match="exceeds maximum"):
+                async with fetcher.fetch_stream(
+                    FetchRequest(url=f"{base}/fixed"), max_size=len(BLOCK)
+                ):
+                    pytest.fail("oversized Content-Length was not rejected")
+
+    @pytest.mark.asyncio
+    async def test_server_error_is_retried(self, body_server):
+        """Test that a 5xx before the body is retried like fetch_single."""
+        base, counter = body_server
+        config = FetchConfig(max_retries=1, retry_delay=0.1)
+        async with WebFetcher(config) as fetcher:
+            async with fetcher.fetch_stream(FetchRequest(url=f"{base}/flaky")) as stream:
+                assert stream.retry_count == 1
+                assert await stream.read() == BLOCK
+            assert counter["flaky"] == 2
+
+            counter["flaky"] = 0
+            with pytest.raises(ServerError):
+                async with fetcher.fetch_stream(
+                    FetchRequest(url=f"{base}/flaky"), max_retries=0
+                ):
+                    pass
+
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_counts_outcomes(self, body_server):
+        """Test that streams report to the host's breaker like fetch_single."""
+        base, counter = body_server
+        breaker_config = CircuitBreakerConfig(failure_threshold=2, recovery_timeout=60.0)
+        async with WebFetcher(
+            FetchConfig(max_retries=0), circuit_breaker_config=breaker_config
+        ) as fetcher:
+            async with fetcher.fetch_stream(FetchRequest(url=f"{base}/fixed")) as stream:
+                await stream.read()
+            for _ in range(2):
+                counter["flaky"] = 0
+                with pytest.raises(ServerError):
+                    async with fetcher.fetch_stream(FetchRequest(url=f"{base}/flaky")):
+                        pass
+            with pytest.raises(CircuitBreakerError):
+                async with fetcher.fetch_stream(FetchRequest(url=f"{base}/fixed")):
+                    pass
+
+            stats = fetcher.get_circuit_breaker_stats()[base]
+            assert stats.successful_requests == 1
+            assert stats.failed_requests == 2
+            assert counter["flaky"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_single_aborts_oversized_body(self, body_server):
+        """Test that fetch_single applies the size limit while reading."""
+        base, counter = body_server
+        config = FetchConfig(max_retries=0, max_response_size=len(BLOCK) * 3)
+        async with WebFetcher(config) as fetcher:
+            result = await fetcher.fetch_single(
+                FetchRequest(url=f"{base}/chunked?blocks={LARGE_BLOCKS}")
+            )
+            assert not result.is_success
+            assert "exceeds maximum" in result.error
+            assert counter["chunked_blocks"] < LARGE_BLOCKS
+
+            fixed = await fetcher.fetch_single(FetchRequest(url=f"{base}/fixed"))
+            assert not fixed.is_success
+            assert f"Response size {len(BLOCK) * 4}" in fixed.error
+
+    @pytest.mark.asyncio
+    @pytest.mark.performance
+    async def test_peak_memory_against_fetch_single(self, body_server):
+        """Compare peak memory of hashing a 20MB body buffered and streamed."""
+        base, _ = body_server
+        url = f"{base}/chunked?blocks={LARGE_BLOCKS}"
+        size = len(BLOCK) * LARGE_BLOCKS
+        config = FetchConfig(max_response_size=size * 2)
+
+        async with WebFetcher(config) as fetcher:
+            tracemalloc.start()
+            result = await fetcher.fetch_single(
+                FetchRequest(url=url, content_type=ContentType.RAW)
+            )
+            buffered_digest = hashlib.sha256(result.content).hexdigest()
+            del result
+            _, buffered_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            digest = hashlib.sha256()
+            tracemalloc.start()
+            async with fetcher.fetch_stream(FetchRequest(url=url)) as stream:
+                await stream.pipe(digest.update)
+            _, streamed_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        print(
+            f"\nsha256 of {size // 2**20}MB: peak {buffered_peak / 2**20:.1f}MB "
+            f"buffered, {streamed_peak / 2**20:.1f}MB streamed"
+        )
+        assert digest.hexdigest() == buffered_digest
+        assert streamed_peak < buffered_peak / 4
@@ -0,0 +1,230 @@
+"""
+Tests for the shared retry engine and retry budgets.
+"""
+
+import time
+from email.utils import formatdate
+
+import pytest
+from aioresponses import aioresponses
+
+from web_fetch import FetchRequest, WebFetcher
+from web_fetch.exceptions import ServerError
+from web_fetch.ftp.retry import FTPRetryManager, RetryConfig
+from web_fetch.models import FetchConfig
+from web_fetch.utils.retry import (
+    RetryBudget,
+    RetryEngine,
+    decorrelated_jitter,
+    parse_retry_after,
+    retry_after_from,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRetryAfter:
+    """Test Retry-After parsing."""
+
+    def test_seconds_and_http_date(self):
+        """Test both Retry-After forms and unusable values."""
+        now = time.time()
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after(formatdate(now + 30, usegmt=True), now=now) == (
+            pytest.approx(30, abs=1)
+        )
+        assert parse_retry_after(formatdate(now - 30, usegmt=True), now=now) == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_from_exception(self):
+        """Test reading retry_after attributes and Retry-After headers."""
+        error = ServerError("down", status_code=503, headers={"Retry-After": "7"})
+        assert retry_after_from(error) == 7.0
+        assert retry_after_from(ValueError("plain")) is None
+
+
+class TestBackoff:
+    """Test decorrelated jitter."""
+
+    def test_bounds(self):
+        """Test that delays stay between base and 3x the previous delay."""
+        previous = 0.0
+        for _ in range(100):
+            delay = decorrelated_jitter(0.5, previous, 10.0)
+            assert 0.5 <= delay <= max(0.5, previous * 3)
+            assert delay <= 10.0
+            previous = delay
+
+    def test_engine_without_jitter_is_exponential(self):
+        """Test the plain exponential fallback."""
+        engine = RetryEngine(base_delay=1.0, max_delay=5.0, jitter=False)
+        assert [engine.backoff(n) for n in range(4)] == [1.0, 2.0, 4.0, 5.0]
+
+
+class TestRetryBudget:
+    """Test ratio-limited retries over the sliding window."""
+
+    def test_ratio_of_recent_requests(self):
+        """Test that retries are capped at the configured share of requests."""
+        clock = FakeClock()
+        budget = RetryBudget(ratio=0.1, min_retries_per_second=0, clock=clock)
+
+        for _ in range(100):
+            budget.record_request("a")
+        allowed = sum(budget.try_acquire("a") for _ in range(20))
+
+        assert allowed == 10
+        assert budget.get_stats()["retries_denied"] == 10
+
+        clock.now += 11
+        assert not budget.try_acquire("a")
+        budget.record_request("a")
+        budget.record_request("a")
+        assert budget.get_stats("a")["requests"] == 2
+
+    def test_per_host_and_global(self):
+        """Test that one host's budget does not spend another's."""
+        clock = FakeClock()
+        budget = RetryBudget(ratio=0.5, min_retries_per_second=0, clock=clock)
+        for _ in range(4):
+            budget.record_request("a")
+            budget.record_request("b")
+
+        assert budget.try_acquire("a") and budget.try_acquire("a")
+        assert not budget.try_acquire("a")
+        assert budget.try_acquire("b")
+
+    def test_reserve_allows_low_traffic_retries(self):
+        """Test the per-second reserve without any recorded requests."""
+        budget = RetryBudget(
+            ratio=0.0, min_retries_per_second=0.2, window_seconds=10.0, clock=FakeClock()
+        )
+        assert budget.try_acquire("a") and budget.try_acquire("a")
+        assert not budget.try_acquire("a")
+
+    def test_default_reserve(self):
+        """Test that the default reserve allows ten retries per window."""
+        budget = RetryBudget(ratio=0.0, clock=FakeClock())
+        assert sum(budget.try_acquire("a") for _ in range(20)) == 10
+
+
+class TestRetryEngine:
+    """Test retry decisions."""
+
+    def test_retry_after_is_floor_and_cap(self):
+        """Test that Retry-After raises the delay or abandons the retry."""
+        engine = RetryEngine(base_delay=0.1, max_retry_after=30.0, budget=RetryBudget())
+        assert engine.next_delay("a", 0, retry_after=5.0) == 5.0
+        assert engine.next_delay("a", 0, retry_after=5.0, delay=8.0) == 8.0
+        assert engine.next_delay("a", 0, retry_after=60.0) is None
+
+    def test_budget_exhaustion_stops_retries(self):
+        """Test that next_delay returns None once the budget is spent."""
+        budget = RetryBudget(ratio=0.0, min_retries_per_second=0.1, clock=FakeClock())
+        engine = RetryEngine(base_delay=0.1, budget=budget)
+        assert engine.next_delay("a", 0) is not None
+        assert engine.next_delay("a", 1) is None
+
+    @pytest.mark.performance
+    def test_retry_amplification_under_outage(self):
+        """Compare attempts sent to a dead host with and without a budget."""
+        requests, max_retries = 1000, 3
+
+        def attempts(engine):
+            sent = 0
+            for _ in range(requests):
+                for attempt in range(max_retries + 1):
+                    engine.record_attempt("dead.example.com")
+                    sent += 1
+                    if attempt == max_retries:
+                        break
+                    if engine.next_delay("dead.example.com", attempt) is None:
+                        break
+            return sent
+
+        unbudgeted = attempts(
+            RetryEngine(budget=RetryBudget(ratio=max_retries, clock=FakeClock()))
+        )
+        budgeted = attempts(RetryEngine(budget=RetryBudget(clock=FakeClock())))
+
+        print(
+            f"\n{requests} failing requests: {unbudgeted} attempts unbudgeted, "
+            f"{budgeted} with a 10% retry budget"
+        )
+        assert unbudgeted == requests * (max_retries + 1)
+        assert budgeted <= requests * 1.25
+
+
+class TestSubsystemBudgetKeys:
+    """Test that FTP and auth retries are budgeted per host."""
+
+    @pytest.mark.asyncio
+    async def test_ftp_retries_share_the_host_budget(self):
+        """Test that different FTP operations on one host share its budget."""
+        budget = RetryBudget(ratio=0.0, min_retries_per_second=0.1, clock=FakeClock())
+        manager = FTPRetryManager(
+            RetryConfig(max_attempts=3, base_delay=0.0, jitter=False),
+            engine=RetryEngine(base_delay=0.0, budget=budget),
+        )
+
+        async def fail() -> None:
+            raise ConnectionError("connection reset")
+
+        for operation_key in ("list", "download"):
+            with pytest.raises(ConnectionError):
+                await manager.retry(
+                    fail, operation_key=operation_key, host="ftp.example.com"
+                )
+
+        stats = budget.get_stats("ftp.example.com")
+        assert stats["requests"] == 3
+        assert stats["retries"] == 1
+        assert stats["tracked_keys"] == 1
+
+
+class TestFetcherRetries:
+    """Test the engine inside WebFetcher.fetch_single."""
+
+    URL = "https://example.com/unavailable"
+
+    @pytest.mark.asyncio
+    async def test_budget_limits_fetch_retries(self):
+        """Test that WebFetcher stops retrying once the host budget is spent."""
+        async with WebFetcher(config=FetchConfig(max_retries=3)) as fetcher:
+            fetcher._retry_engine = RetryEngine(
+                base_delay=0.0,
+                budget=RetryBudget(ratio=0.0, min_retries_per_second=0.1),
+            )
+            with aioresponses() as m:
+                m.get(self.URL, status=503, repeat=True)
+                first = await fetcher.fetch_single(FetchRequest(url=self.URL))
+                second = await fetcher.fetch_single(FetchRequest(url=self.URL))
+                sent = sum(len(calls) for calls in m.requests.values())
+
+        assert first.retry_count == 1 and second.retry_count == 0
+        assert first.status_code == 503
+        assert sent == 3
+
+    @pytest.mark.asyncio
+    async def test_fetch_honours_retry_after(self):
+        """Test that a 503 Retry-After delays the retry."""
+        async with WebFetcher(config=FetchConfig(max_retries=1)) as fetcher:
+            fetcher._retry_engine = RetryEngine(base_delay=0.0, budget=RetryBudget())
+            with aioresponses() as m:
+                m.get(self.URL, status=503, headers={"Retry-After": "0.2"})
+                m.get(self.URL, status=200, body="ok")
+                start = time.perf_counter()
+                result = await fetcher.fetch_single(FetchRequest(url=self.URL))
+                elapsed = time.perf_counter() - start
+
+        assert result.is_success
+        assert elapsed >= 0.2
@@ -0,0 +1,253 @@
+"""
+Tests for the shared session registry.
+
+Covers reference counting, idle expiry, loop isolation, WebFetcher
+integration, opt-in sharing at the other call sites, and a benchmark of sequential fetch_url calls against a local
+server with and without session reuse.
+"""
+
+import asyncio
+import gc
+import inspect
+import time
+
+import pytest
+import pytest_asyncio
+from aiohttp import ClientSession, web
+
+from web_fetch.batch.models import BatchConfig
+from web_fetch.components.http_component import HTTPResourceComponent
+from web_fetch.components.rss_component import RSSComponent
+from web_fetch.convenience import fetch_url
+from web_fetch.core_fetcher import WebFetcher
+from web_fetch.models import ContentType, FetchConfig, FetchRequest
+from web_fetch.models.resource import ResourceKind, ResourceRequest
+from web_fetch.utils.session_registry import SessionRegistry, shared_sessions
+
+
+class TestSessionRegistry:
+    """Test SessionRegistry reference counting and lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_same_key_shares_session(self):
+        """Test that acquires with the same key return one session."""
+        registry = SessionRegistry()
+
+        first = await registry.acquire("key", ClientSession)
+        second = await registry.acquire("key", ClientSession)
+        other = await registry.acquire("other", ClientSession)
+
+        assert first is second
+        assert first is not other
+        assert registry.get_stats()["sessions_created"] == 2
+        assert registry.get_stats()["sessions_reused"] == 1
+
+        await registry.close_all()
+        assert first.closed and other.closed
+
+    @pytest.mark.asyncio
+    async def test_idle_session_expires(self):
+        """Test that an unreferenced session closes after the idle timeout."""
+        registry = SessionRegistry(idle_timeout=0.05)
+
+        session = await registry.acquire("key", ClientSession)
+        await registry.release(session)
+        assert not session.closed
+
+        await asyncio.sleep(0.1)
+
+        assert session.closed
+        assert registry.get_stats()["open_sessions"] == 0
+
+    @pytest.mark.asyncio
+    async def test_reacquire_cancels_expiry(self):
+        """Test that a session in use is never expired."""
+        registry = SessionRegistry(idle_timeout=0.05)
+
+        session = await registry.acquire("key", ClientSession)
+        await registry.release(session)
+        assert await registry.acquire("key", ClientSession) is session
+
+        await asyncio.sleep(0.1)
+
+        assert not session.closed
+        await registry.close_all()
+
+    def test_sessions_are_per_loop(self):
+        """Test that each event loop gets its own session and cleans it up."""
+        registry = SessionRegistry()
+        sessions = []
+
+        async def use() -> None:
+            session = await registry.acquire("key", ClientSession)
+            sessions.append(session)
+            await registry.release(session)
+
+        asyncio.run(use())
+        asyncio.run(use())
+
+        assert sessions[0] is not sessions[1]
+        # asyncio.run() cancels the keeper task, which closes the sessions
+        assert all(session.closed for session in sessions)
+
+    def test_closed_loops_are_released(self):
+        """Test that the registry does not keep finished event loops alive."""
+        registry = SessionRegistry()
+
+        async def use() -> None:
+            session = await registry.acquire("key", ClientSession)
+            await registry.release(session)
+
+        for _ in range(20):
+            asyncio.run(use())
+        gc.collect()
+
+        assert len(registry._loops) == 0
+
+
+class TestSharedWebFetcher:
+    """Test WebFetcher(shared_session=True)."""
+
+    @pytest.mark.asyncio
+    async def test_fetchers_share_and_release(self):
+        """Test that shared fetchers reuse and do not close the session."""
+        config = FetchConfig()
+
+        async with WebFetcher(config, shared_session=True) as first:
+            session = first._session
+        async with WebFetcher(config, shared_session=True) as second:
+            assert second._session is session
+
+        assert not session.closed
+
+        async with WebFetcher(FetchConfig(verify_ssl=False), shared_session=True) as third:
+            assert third._session is not session
+
+        await shared_sessions.close_all()
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_unshared_fetcher_owns_session(self):
+        """Test that the default fetcher still closes its own session."""
+        async with WebFetcher() as fetcher:
+            session = fetcher._session
+        assert session.closed
+
+
+@pytest_asyncio.fixture
+async def cookie_server():
+    """Set a cookie on a redirect and report whether it comes back."""
+
+    async def login(request: web.Request) -> web.Response:
+        response = web.HTTPFound("/check")
+        response.set_cookie("session", "1")
+        raise response
+
+    async def check(request: web.Request) -> web.Response:
+        return web.Response(text="kept" if "session" in request.cookies else "lost")
+
+    app = web.Application()
+    app.router.add_get("/login", login)
+    app.router.add_get("/check", check)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    # aiohttp's default cookie jar ignores cookies from IP address hosts
+    yield f"http://localhost:{port}/login"
+
+    await runner.cleanup()
+
+
+class TestSharedSessionOptIn:
+    """Test that components and batches only share sessions when asked."""
+
+    def test_defaults(self):
+        """Test that every WebFetcher call site defaults to its own session."""
+        assert HTTPResourceComponent().shared_session is False
+        signature = inspect.signature(RSSComponent)
+        assert signature.parameters["shared_session"].default is False
+        assert BatchConfig().shared_session is False
+
+    @pytest.mark.asyncio
+    async def test_component_keeps_redirect_cookies(self, cookie_server):
+        """Test that cookies set during a redirect are kept unless sharing."""
+        request = ResourceRequest(
+            uri=cookie_server,
+            kind=ResourceKind.HTTP,
+            options={"content_type": ContentType.TEXT},
+        )
+
+        own = await HTTPResourceComponent().fetch(request)
+        shared = await HTTPResourceComponent(shared_session=True).fetch(request)
+        await shared_sessions.close_all()
+
+        assert own.content == "kept"
+        assert shared.content == "lost"
+
+
+@pytest_asyncio.fixture
+async def local_server():
+    """Serve a small response locally and count TCP connections."""
+    peers = set()
+
+    async def handler(request: web.Request) -> web.Response:
+        peers.add(request.transport.get_extra_info("peername"))
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}/", peers
+
+    await runner.cleanup()
+
+
+class TestSharedSessionBenchmark:
+    """Benchmark sequential convenience calls."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.performance
+    async def test_sequential_fetch_url_reuses_connections(self, local_server):
+        """Compare 1000 sequential fetch_url calls with per-call sessions."""
+        url, peers = local_server
+        calls = 1000
+        config = FetchConfig(max_retries=0)
+
+        start = time.perf_counter()
+        for _ in range(calls):
+            async with WebFetcher(config) as fetcher:
+                result = await fetcher.fetch_single(
+                    FetchRequest(url=url, content_type=ContentType.TEXT)
+                )
+                assert result.status_code == 200
+        per_call_time = time.perf_counter() - start
+        per_call_connections = len(peers)
+
+        peers.clear()
+        start = time.perf_counter()
+        for _ in range(calls):
+            result = await fetch_url(url, config=config, shared_session=True)
+            assert result.status_code == 200
+        shared_time = time.perf_counter() - start
+        shared_connections = len(peers)
+
+        await shared_sessions.close_all()
+
+        print(
+            f"\n{calls} sequential fetches: per-call sessions "
+            f"{per_call_time * 1000:.0f}ms ({per_call_connections} connections), "
+            f"shared session {shared_time * 1000:.0f}ms "
+            f"({shared_connections} connections)"
+        )
+
+        assert per_call_connections == calls
+        assert shared_connections == 1
+        assert shared_time < per_call_time
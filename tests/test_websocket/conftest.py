@@ -0,0 +1,71 @@
+"""
+Shared fixtures for WebSocket tests against a local aiohttp server.
+"""
+
+from typing import Any, AsyncGenerator, Awaitable, Callable, List, Optional
+
+import pytest
+import pytest_asyncio
+from aiohttp import WSMessage, web
+
+from web_fetch.websocket import WebSocketConfig
+
+MessageHandler = Callable[[web.WebSocketResponse, WSMessage], Awaitable[None]]
+ConnectHandler = Callable[[web.Request, web.WebSocketResponse], None]
+
+
+@pytest_asyncio.fixture
+async def ws_server() -> AsyncGenerator[Callable[..., Awaitable[str]], None]:
+    """
+    Start local WebSocket servers for a test.
+
+    ``await ws_server(on_message, on_connect=None)`` returns the URL of a
+    server that calls ``on_connect(request, ws)`` for each new connection and
+    awaits ``on_message(ws, msg)`` for each message it receives.
+    """
+    runners: List[web.AppRunner] = []
+
+    async def start(
+        on_message: MessageHandler, on_connect: Optional[ConnectHandler] = None
+    ) -> str:
+        async def handler(request: web.Request) -> web.WebSocketResponse:
+            ws = web.WebSocketResponse()
+            await ws.prepare(request)
+            if on_connect is not None:
+                on_connect(request, ws)
+            async for msg in ws:
+                await on_message(ws, msg)
+            return ws
+
+        app = web.Application()
+        app.router.add_get("/ws", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        runners.append(runner)
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return f"ws://127.0.0.1:{port}/ws"
+
+    yield start
+
+    for runner in runners:
+        await runner.cleanup()
+
+
+@pytest.fixture
+def client_config() -> Callable[..., WebSocketConfig]:
+    """Build client configs without reconnects, pings or compression."""
+
+    def make(url: str, **kwargs: Any) -> WebSocketConfig:
+        options = {
+            "url": url,
+            "auto_reconnect": False,
+            "enable_ping": False,
+            "enable_compression": False,
+            "max_queue_size": 1000,
+        }
+        options.update(kwargs)
+        return WebSocketConfig(**options)
+
+    return make
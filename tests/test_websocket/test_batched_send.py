@@ -0,0 +1,149 @@
+"""
+Tests for the batched WebSocket send loop.
+
+Covers draining the queue in one wakeup, lingering for a fuller batch,
+broadcasts that build one message for all connections, and a throughput
+benchmark against the per-message send loop.
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+
+from web_fetch.websocket import WebSocketClient, WebSocketManager
+from web_fetch.websocket import manager as manager_module
+
+
+@pytest_asyncio.fixture
+async def sink_server(ws_server):
+    """Record every message each connection receives."""
+    state = {"received": [], "count": 0, "target": None, "done": None}
+    connections = {}
+
+    def on_connect(request, ws):
+        connections[id(ws)] = []
+        state["received"].append(connections[id(ws)])
+
+    async def on_message(ws, msg):
+        connections[id(ws)].append(msg.data)
+        state["count"] += 1
+        if state["count"] == state["target"]:
+            state["done"].set()
+
+    return await ws_server(on_message, on_connect), state
+
+
+async def wait_for_count(state, count):
+    state["target"] = count
+    state["done"] = asyncio.Event()
+    if state["count"] < count:
+        await asyncio.wait_for(state["done"].wait(), 10)
+
+
+class TestBatchedSend:
+    """Test WebSocketClient with enable_batching set."""
+
+    @pytest.mark.asyncio
+    async def test_queue_drained_in_batches(self, sink_server, client_config):
+        """Test that queued messages are written in full batches, in order."""
+        url, state = sink_server
+        config = client_config(
+            url,
+            enable_batching=True,
+            enable_adaptive_queues=False,
+            batch_size=20,
+            batch_timeout=0,
+        )
+        async with WebSocketClient(config) as client:
+            sizes = []
+            write_batch = client._write_batch
+
+            async def record(websocket, batch):
+                sizes.append(len(batch))
+                await write_batch(websocket, batch)
+
+            client._write_batch = record
+            for i in range(50):
+                await client.send_text(f"m{i}")
+            await client.send_binary(b"end")
+            await wait_for_count(state, 51)
+
+            assert state["received"][0] == [f"m{i}" for i in range(50)] + [b"end"]
+            assert sizes == [20, 20, 11]
+            assert client.statistics["messages_sent"] == 51
+
+    @pytest.mark.asyncio
+    async def test_linger_collects_stragglers(self, sink_server, client_config):
+        """Test that batch_timeout waits for messages queued just after the first."""
+        url, state = sink_server
+        config = client_config(
+            url,
+            enable_batching=True,
+            enable_adaptive_queues=False,
+            batch_size=100,
+            batch_timeout=0.05,
+        )
+        async with WebSocketClient(config) as client:
+            sizes = []
+            write_batch = client._write_batch
+
+            async def record(websocket, batch):
+                sizes.append(len(batch))
+                await write_batch(websocket, batch)
+
+            client._write_batch = record
+            for i in range(5):
+                await client.send_text(str(i))
+                await asyncio.sleep(0.005)
+            await wait_for_count(state, 5)
+            assert sizes == [5]
+
+    @pytest.mark.asyncio
+    async def test_broadcast_builds_one_message(self, sink_server, client_config):
+        """Test that broadcast_text creates a single message for all connections."""
+        url, state = sink_server
+        manager = WebSocketManager()
+        config = client_config(url, enable_batching=True, enable_adaptive_queues=False)
+        for name in ("a", "b", "c"):
+            await manager.add_connection(name, config)
+
+        with patch.object(
+            manager_module, "create_message", wraps=manager_module.create_message
+        ) as create:
+            results = await manager.broadcast_text("hello", exclude=["c"])
+        await wait_for_count(state, 2)
+
+        assert results == {"a": True, "b": True}
+        create.assert_called_once()
+        assert sorted(map(len, state["received"])) == [0, 1, 1]
+        await manager.disconnect_all()
+
+    @pytest.mark.asyncio
+    @pytest.mark.performance
+    async def test_throughput_against_per_message_sends(
+        self, sink_server, client_config
+    ):
+        """Compare time to deliver a burst with and without batching."""
+        url, state = sink_server
+        count = 20_000
+        timings = {}
+        for batching in (False, True):
+            config = client_config(
+                url, enable_batching=batching, batch_size=100, batch_timeout=0
+            )
+            async with WebSocketClient(config) as client:
+                state["count"] = 0
+                started = time.perf_counter()
+                for i in range(count):
+                    await client.send_text(f'{{"seq":{i}}}')
+                await wait_for_count(state, count)
+                timings[batching] = time.perf_counter() - started
+
+        print(
+            f"\n{count} sends: per-message {count / timings[False]:.0f} msgs/s, "
+            f"batched {count / timings[True]:.0f} msgs/s"
+        )
+        assert timings[True] < timings[False]
@@ -0,0 +1,242 @@
+"""
+Tests for WebSocket codecs and permessage-deflate.
+
+Covers codec round trips and decoding from bytes and memoryviews, the
+send_object/receive_object path against a local aiohttp server, deflate
+negotiation and window size, per-connection compression ratios, and a
+decode benchmark of the JSON codec against the standard library.
+"""
+
+import json
+import time
+
+import pytest
+import pytest_asyncio
+
+from web_fetch.websocket import (
+    JSONCodec,
+    MsgpackCodec,
+    RawCodec,
+    WebSocketClient,
+    WebSocketError,
+    WebSocketMessage,
+    WebSocketMessageType,
+    get_codec,
+)
+from web_fetch.websocket.codecs import HAS_MSGPACK, HAS_ORJSON
+
+QUOTE = {
+    "instrument": {"symbol": "ABC", "exchange": "NASDAQ", "currency": "USD"},
+    "bid": {"price": 101.25, "size": 300},
+    "ask": {"price": 101.27, "size": 200},
+    "status": "trading",
+}
+
+
+@pytest_asyncio.fixture
+async def feed_server(ws_server):
+    """Echo messages, or reply to "N" with N JSON quotes."""
+    state = {"extensions": None}
+
+    def on_connect(request, ws):
+        state["extensions"] = request.headers.get("Sec-WebSocket-Extensions")
+
+    async def on_message(ws, msg):
+        if isinstance(msg.data, str) and msg.data.isdigit():
+            for i in range(int(msg.data)):
+                await ws.send_str(json.dumps(dict(QUOTE, seq=i)))
+        elif isinstance(msg.data, bytes):
+            await ws.send_bytes(msg.data)
+        else:
+            await ws.send_str(msg.data)
+
+    return await ws_server(on_message, on_connect), state
+
+
+class TestCodecs:
+    """Test the codec implementations and registry."""
+
+    @pytest.mark.parametrize("backend", ["json", "auto"])
+    def test_json_decodes_any_buffer(self, backend):
+        """Test that JSON decodes str, bytes and memoryview payloads."""
+        codec = JSONCodec(backend)
+        encoded = codec.encode(QUOTE)
+        raw = encoded.encode() if isinstance(encoded, str) else encoded
+        for payload in (raw.decode(), raw, memoryview(bytearray(raw))):
+            assert codec.decode(payload) == QUOTE
+
+    def test_raw_frame_types(self):
+        """Test that raw sends bytes as binary frames and str as text."""
+        codec = get_codec("raw")
+        assert isinstance(codec, RawCodec)
+        assert codec.is_binary(codec.encode(bytearray(b"ab")))
+        assert not codec.is_binary(codec.encode("ab"))
+        with pytest.raises(TypeError):
+            codec.encode({"a": 1})
+
+    def test_unknown_codec(self, client_config):
+        """Test that a client cannot be created with an unregistered codec."""
+        with pytest.raises(ValueError, match="Unknown WebSocket codec"):
+            WebSocketClient(client_config("ws://localhost/ws", codec="cbor"))
+
+    @pytest.mark.skipif(not HAS_MSGPACK, reason="msgpack not installed")
+    def test_msgpack_round_trip(self):
+        """Test msgpack encoding and decoding from a memoryview."""
+        codec = get_codec("msgpack")
+        encoded = codec.encode(QUOTE)
+        assert codec.is_binary(encoded)
+        assert codec.decode(memoryview(encoded)) == QUOTE
+
+    @pytest.mark.skipif(HAS_MSGPACK, reason="msgpack installed")
+    def test_msgpack_requires_package(self):
+        """Test that msgpack is optional and reported clearly when missing."""
+        with pytest.raises(ImportError, match="msgpack"):
+            MsgpackCodec()
+
+
+class TestObjectMessages:
+    """Test send_object and receive_object."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fast_receive", [False, True])
+    async def test_json_round_trip(self, feed_server, fast_receive, client_config):
+        """Test sending and receiving objects with the JSON codec."""
+        url, _ = feed_server
+        config = client_config(url, fast_receive=fast_receive)
+        async with WebSocketClient(config) as client:
+            await client.send_object(QUOTE)
+            assert await client.receive_object(timeout=5) == QUOTE
+            await client.send_object([1, "two"])
+            assert await client.receive_object(timeout=5) == [1, "two"]
+
+    @pytest.mark.asyncio
+    async def test_raw_binary_round_trip(self, feed_server, client_config):
+        """Test that the raw codec returns binary frames as received."""
+        url, _ = feed_server
+        async with WebSocketClient(client_config(url, codec="raw")) as client:
+            await client.send_object(b"\x00\x01")
+            assert await client.receive_object(timeout=5) == b"\x00\x01"
+
+    @pytest.mark.asyncio
+    async def test_text_bytes_without_send_frame(self):
+        """Test that UTF-8 text payloads fall back to send_str on older aiohttp."""
+
+        class OldWebSocket:
+            def __init__(self):
+                self.sent = []
+
+            async def send_str(self, data):
+                self.sent.append(data)
+
+        websocket = OldWebSocket()
+        message = WebSocketMessage(type=WebSocketMessageType.TEXT, data=b'{"a":"\xc3\xa9"}')
+        await WebSocketClient._send_frame(websocket, message)
+        assert websocket.sent == ['{"a":"\u00e9"}']
+
+    @pytest.mark.asyncio
+    async def test_decode_error(self, feed_server, client_config):
+        """Test that an undecodable payload raises WebSocketError."""
+        url, _ = feed_server
+        async with WebSocketClient(client_config(url)) as client:
+            await client.send_text("not json")
+            with pytest.raises(WebSocketError, match="json codec"):
+                await client.receive_object(timeout=5)
+
+
+class TestCompression:
+    """Test permessage-deflate negotiation and ratios."""
+
+    @pytest.mark.asyncio
+    async def test_negotiated_with_window_bits(self, feed_server, client_config):
+        """Test that the configured window size is offered to the server."""
+        url, state = feed_server
+        config = client_config(
+            url, enable_compression=True, compression_window_bits=10
+        )
+        async with WebSocketClient(config) as client:
+            assert "permessage-deflate" in state["extensions"]
+            assert "server_max_window_bits=10" in state["extensions"]
+            stats = client.statistics["compression"]
+            assert stats["negotiated"] and stats["window_bits"]
+
+    @pytest.mark.asyncio
+    async def test_wire_counter_attaches(self, feed_server, client_config):
+        """Test that the aiohttp internals the wire counter wraps still exist."""
+        url, _ = feed_server
+        config = client_config(url, enable_compression=True)
+        async with WebSocketClient(config) as client:
+            websocket = client._websocket
+            assert hasattr(getattr(websocket, "_writer", None), "transport"), (
+                "aiohttp no longer exposes ClientWebSocketResponse._writer.transport"
+            )
+            protocol = getattr(getattr(websocket, "_conn", None), "protocol", None)
+            assert hasattr(protocol, "data_received"), (
+                "aiohttp no longer exposes ClientWebSocketResponse._conn.protocol"
+            )
+            assert client._wire_attached
+
+            await client.send_text("1")
+            await client.receive_object(timeout=5)
+            stats = client.compression_statistics
+            assert stats["wire_bytes_sent"] > 0
+            assert stats["wire_bytes_received"] > 0
+
+    @pytest.mark.asyncio
+    async def test_compression_ratios(self, feed_server, client_config):
+        """Test that repetitive JSON shows a high ratio only when compressed."""
+        url, _ = feed_server
+        ratios = {}
+        for enabled in (False, True):
+            config = client_config(url, enable_compression=enabled)
+            async with WebSocketClient(config) as client:
+                await client.send_text("200")
+                for _ in range(200):
+                    await client.receive_object(timeout=5)
+                stats = client.compression_statistics
+                assert stats["negotiated"] is enabled
+                assert stats["wire_bytes_received"] > 0
+                ratios[enabled] = stats["receive_ratio"]
+
+        assert 0.8 < ratios[False] <= 1.0
+        assert ratios[True] > 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.performance
+    async def test_wire_bytes_for_verbose_json(self, feed_server, client_config):
+        """Measure bytes on the wire for a stream of verbose JSON quotes."""
+        url, _ = feed_server
+        count = 5_000
+        config = client_config(url, enable_compression=True)
+        async with WebSocketClient(config) as client:
+            await client.send_text(str(count))
+            for _ in range(count):
+                await client.receive_object(timeout=5)
+            stats = client.compression_statistics
+
+        payload = client.statistics["bytes_received"]
+        print(
+            f"\n{count} quotes: {payload} payload bytes, "
+            f"{stats['wire_bytes_received']} on the wire, "
+            f"ratio {stats['receive_ratio']:.1f}"
+        )
+        assert stats["receive_ratio"] > 3
+
+
+@pytest.mark.performance
+@pytest.mark.skipif(not HAS_ORJSON, reason="orjson not installed")
+def test_json_codec_decode_against_stdlib():
+    """Compare decoding binary JSON payloads with orjson and json."""
+    payloads = [json.dumps(dict(QUOTE, seq=i)).encode() for i in range(50_000)]
+    timings = {}
+    for backend in ("json", "orjson"):
+        codec = JSONCodec(backend)
+        started = time.perf_counter()
+        for payload in payloads:
+            codec.decode(payload)
+        timings[backend] = time.perf_counter() - started
+
+    print(
+        f"\n{len(payloads)} decodes: json {len(payloads) / timings['json']:.0f}/s, "
+        f"orjson {len(payloads) / timings['orjson']:.0f}/s"
+    )
+    assert timings["orjson"] < timings["json"]
@@ -0,0 +1,189 @@
+"""
+Tests for multiplexed receive across WebSocketManager connections.
+
+Covers FanInQueue credits, delivery and per-connection ordering through
+receive_all_messages, per-connection backpressure, handing messages back
+when iteration stops, and a benchmark against one receive task per
+connection.
+"""
+
+import asyncio
+import time
+from contextlib import aclosing
+
+import pytest
+import pytest_asyncio
+
+from web_fetch.websocket import (
+    FanInQueue,
+    WebSocketError,
+    WebSocketManager,
+)
+
+
+@pytest_asyncio.fixture
+async def burst_server(ws_server):
+    """Reply to "N" with N numbered text messages."""
+
+    async def on_message(ws, msg):
+        for i in range(int(msg.data)):
+            await ws.send_str(str(i))
+
+    return await ws_server(on_message)
+
+
+async def connect_all(url, config, count, **kwargs):
+    manager = WebSocketManager(max_connections=count, **kwargs)
+    await asyncio.gather(
+        *(manager.add_connection(f"c{i}", config(url)) for i in range(count))
+    )
+    return manager
+
+
+class TestFanInQueue:
+    """Test FanInQueue credits and closing."""
+
+    @pytest.mark.asyncio
+    async def test_producer_waits_for_credit(self):
+        """Test that one producer over its limit does not block another."""
+        queue = FanInQueue(per_producer_limit=2)
+        await queue.put("a", 1)
+        await queue.put("a", 2)
+        blocked = asyncio.create_task(queue.put("a", 3))
+        assert await queue.put("b", 1)
+        await asyncio.sleep(0)
+        assert not blocked.done()
+
+        assert queue.get_nowait() == ("a", 1)
+        assert await blocked
+        assert [queue.get_nowait() for _ in range(3)] == [("a", 2), ("b", 1), ("a", 3)]
+        assert queue.statistics["blocked_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_close_wakes_producers(self):
+        """Test that close returns queued items and releases waiters."""
+        queue = FanInQueue(per_producer_limit=1)
+        await queue.put("a", 1)
+        blocked = asyncio.create_task(queue.put("a", 2))
+        await asyncio.sleep(0)
+        assert queue.close() == [("a", 1)]
+        assert await blocked is False
+
+
+class TestReceiveAllMessages:
+    """Test WebSocketManager.receive_all_messages."""
+
+    @pytest.mark.asyncio
+    async def test_messages_from_every_connection_in_order(self, burst_server, client_config):
+        """Test that each connection's messages arrive complete and in order."""
+        manager = await connect_all(burst_server, client_config, 20)
+        received = {f"c{i}": [] for i in range(20)}
+        async with aclosing(manager.receive_all_messages()) as messages:
+            for connection_id in received:
+                await manager.send_text(connection_id, "30")
+            async for connection_id, message in messages:
+                received[connection_id].append(message.data)
+                if sum(map(len, received.values())) == 600:
+                    break
+
+        assert all(data == [str(i) for i in range(30)] for data in received.values())
+        await manager.disconnect_all()
+
+    @pytest.mark.asyncio
+    async def test_backpressure_is_per_connection(self, burst_server, client_config):
+        """Test that a flooding connection does not delay a quiet one."""
+        manager = await connect_all(
+            burst_server, client_config, 2, receive_buffer_per_connection=5
+        )
+        order = []
+
+        async def consume():
+            async with aclosing(manager.receive_all_messages()) as messages:
+                async for connection_id, _ in messages:
+                    order.append(connection_id)
+                    await asyncio.sleep(0.001)
+                    if connection_id == "c1":
+                        return
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0.05)
+        await manager.send_text("c0", "500")
+        await asyncio.sleep(0.1)
+        sent_at = len(order)
+        await manager.send_text("c1", "1")
+        await asyncio.wait_for(consumer, 10)
+
+        # At most the flooding connection's buffer is ahead of the quiet one
+        assert order.index("c1") - sent_at <= 6
+        assert order.count("c0") < 500
+        await manager.disconnect_all()
+
+    @pytest.mark.asyncio
+    async def test_unread_messages_return_to_connection(self, burst_server, client_config):
+        """Test that stopping early leaves the rest on the client's queue."""
+        manager = await connect_all(burst_server, client_config, 1)
+        async with aclosing(manager.receive_all_messages()) as messages:
+            await manager.send_text("c0", "10")
+            await asyncio.sleep(0.1)
+            connection_id, first = await messages.__anext__()
+            with pytest.raises(WebSocketError):
+                await manager.receive_all_messages().__anext__()
+
+        client = manager.get_connection("c0")
+        rest = [(await client.receive_message(timeout=1)).data for _ in range(9)]
+        assert (connection_id, first.data) == ("c0", "0")
+        assert rest == [str(i) for i in range(1, 10)]
+        await manager.disconnect_all()
+
+    @pytest.mark.asyncio
+    @pytest.mark.performance
+    async def test_throughput_against_task_per_connection(self, burst_server, client_config):
+        """Compare fan-in with one receive_message task per connection."""
+        connections, per_connection = 100, 100
+        total = connections * per_connection
+        manager = await connect_all(burst_server, client_config, connections)
+
+        async def task_per_connection():
+            # The previous approach: a task per connection and a scan per message
+            tasks = {
+                cid: asyncio.create_task(client.receive_message(timeout=1.0))
+                for cid, client in manager._connections.items()
+            }
+            count = 0
+            while count < total:
+                done, _ = await asyncio.wait(
+                    tasks.values(), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    cid = next(c for c, t in tasks.items() if t is task)
+                    if task.result():
+                        count += 1
+                    tasks[cid] = asyncio.create_task(
+                        manager._connections[cid].receive_message(timeout=1.0)
+                    )
+            for task in tasks.values():
+                task.cancel()
+
+        async def fan_in():
+            count = 0
+            async with aclosing(manager.receive_all_messages()) as messages:
+                async for _ in messages:
+                    count += 1
+                    if count == total:
+                        break
+
+        timings = {}
+        for name, consume in (("tasks", task_per_connection), ("fan-in", fan_in)):
+            started = time.perf_counter()
+            consumer = asyncio.create_task(consume())
+            await manager.broadcast_text(str(per_connection))
+            await consumer
+            timings[name] = time.perf_counter() - started
+
+        print(
+            f"\n{total} messages over {connections} connections: "
+            f"task per connection {total / timings['tasks']:.0f} msgs/s, "
+            f"fan-in {total / timings['fan-in']:.0f} msgs/s"
+        )
+        assert timings["fan-in"] < timings["tasks"]
+        await manager.disconnect_all()
@@ -0,0 +1,128 @@
+"""
+Tests for the fast WebSocket receive path.
+
+Covers lazy message ids and sizes, explicit pool release, aggregated receive
+metrics, and a messages-per-second benchmark against the default receive
+path using a local aiohttp server.
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_asyncio
+
+from web_fetch.websocket import (
+    FastWebSocketMessage,
+    WebSocketClient,
+    WebSocketMessageType,
+)
+from web_fetch.websocket.optimization import FastMessagePool
+
+PAYLOAD = '{"symbol":"ABC","price":101.25,"size":300,"side":"buy","seq":%d}'
+
+
+@pytest_asyncio.fixture
+async def burst_server(ws_server):
+    """Reply to "N" with N text messages and echo anything else."""
+
+    async def on_message(ws, msg):
+        if msg.data.isdigit():
+            for i in range(int(msg.data)):
+                await ws.send_str(PAYLOAD % i)
+        else:
+            await ws.send_str(msg.data)
+
+    return await ws_server(on_message)
+
+
+class TestFastWebSocketMessage:
+    """Test FastWebSocketMessage and FastMessagePool."""
+
+    def test_lazy_id_and_size(self):
+        """Test that id and size are only computed when read."""
+        message = FastWebSocketMessage(WebSocketMessageType.TEXT, "héllo")
+        assert message._id is None and message._size == -1
+        assert message.size == 6
+        assert message.id == message.id and len(message.id) == 36
+        assert message.serialize() == "héllo"
+
+    def test_release_reuses_instances(self):
+        """Test that released messages are handed out again and cleared."""
+        pool = FastMessagePool(max_pool_size=1)
+        first = pool.acquire(WebSocketMessageType.TEXT, "a", 1)
+        first_id = first.id
+        first.release()
+        first.release()
+        assert first.data is None and pool.statistics["pool_size"] == 1
+
+        second = pool.acquire(WebSocketMessageType.BINARY, b"bc")
+        assert second is first
+        assert second.id != first_id and second.size == 2
+        assert pool.statistics["reused_count"] == 1
+
+
+class TestFastReceive:
+    """Test WebSocketClient with fast_receive enabled."""
+
+    @pytest.mark.asyncio
+    async def test_receives_pooled_messages(self, burst_server, client_config):
+        """Test receiving, releasing and reusing messages end to end."""
+        async with WebSocketClient(client_config(burst_server, fast_receive=True)) as client:
+            payloads = []
+            for _ in range(2):
+                # The second burst reuses the messages released after the first
+                await client.send_text("25")
+                for _ in range(25):
+                    message = await client.receive_message(timeout=5)
+                    assert isinstance(message, FastWebSocketMessage)
+                    payloads.append(message.data)
+                    message.release()
+
+            assert payloads == [PAYLOAD % i for i in range(25)] * 2
+            stats = client.statistics
+            assert stats["messages_received"] == 50
+            assert stats["bytes_received"] == sum(len(p) for p in payloads)
+            assert stats["fast_message_pool"]["reused_count"] == 25
+
+    @pytest.mark.asyncio
+    async def test_metrics_are_aggregated(self, burst_server, client_config):
+        """Test that receive metrics are flushed as counters, not per message."""
+        config = client_config(burst_server, fast_receive=True, metrics_flush_interval=60)
+        client = WebSocketClient(config)
+        client._metrics_collector = collector = MagicMock()
+        await client.connect()
+        await client.send_text("200")
+        for _ in range(200):
+            (await client.receive_message(timeout=5)).release()
+        await client.disconnect()
+
+        # Only the connection itself is recorded per event
+        collector.record_request.assert_called_once()
+        counters = {
+            call.args[0]: call.args[1] for call in collector.record_counter.call_args_list
+        }
+        assert counters["websocket.messages.received"] == 200
+        assert counters["websocket.bytes.received"] == client.statistics["bytes_received"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.performance
+    async def test_messages_per_second_against_default(self, burst_server, client_config):
+        """Compare receive throughput of the default and fast paths."""
+        count = 20_000
+        rates = {}
+        for fast in (False, True):
+            async with WebSocketClient(client_config(burst_server, fast_receive=fast)) as client:
+                await client.send_text(str(count))
+                started = time.perf_counter()
+                for _ in range(count):
+                    message = await client.receive_message(timeout=5)
+                    if fast:
+                        message.release()
+                rates[fast] = count / (time.perf_counter() - started)
+
+        print(
+            f"\n{count} messages: default {rates[False]:.0f} msgs/s, "
+            f"fast {rates[True]:.0f} msgs/s"
+        )
+        assert rates[True] > rates[False]
@@ -199,6 +199,7 @@ from .logging import (
 from .models import (  # Resource metadata classes
     BatchFetchRequest,
     BatchFetchResult,
+    BatchFetchStats,
     CacheConfig,
     ContentSummary,
     ContentType,
@@ -209,8 +210,10 @@ from .models import (  # Resource metadata classes
     FetchRequest,
     FetchResult,
     ImageMetadata,
+    JSONBackend,
     LinkInfo,
     PDFMetadata,
+    ParseExecutorMode,
     ProgressInfo,
     RateLimitConfig,
     RequestHeaders,
@@ -223,6 +226,7 @@ from .models import (  # Resource metadata classes
 from .utils import (  # Enhanced utilities
     CircuitBreaker,
     CircuitBreakerConfig,
+    HedgingConfig,
     HTMLExtractor,
     JSONPathExtractor,
     MetricsCollector,
@@ -314,6 +318,7 @@ __all__ = [
     "CircuitBreaker",
     "CircuitBreakerConfig",
     "with_circuit_breaker",
+    "HedgingConfig",
     "RequestDeduplicator",
     "deduplicate_request",
     "TransformationPipeline",
@@ -329,6 +334,7 @@ __all__ = [
     "FetchResult",
     "BatchFetchRequest",
     "BatchFetchResult",
+    "BatchFetchStats",
     "RequestHeaders",
     "StreamingConfig",
     "StreamRequest",
@@ -413,6 +419,8 @@ __all__ = [
     # Enums
     "ContentType",
     "RetryStrategy",
+    "ParseExecutorMode",
+    "JSONBackend",
     "FTPMode",
     "FTPAuthType",
     "FTPTransferMode",
@@ -13,6 +13,7 @@ import json
 import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
+from urllib.parse import urlparse
 
 from .api_key import APIKeyAuth, APIKeyConfig
 from .base import AuthMethod, AuthResult, AuthType, AuthenticationError
@@ -395,7 +396,7 @@ class AuthManager:
         # Use enhanced authentication if available
         if self._enhanced_features_enabled and method_name in self._retry_handlers:
             return await self._authenticate_with_enhanced_features(
-                method_name, force_refresh, **kwargs
+                method_name, force_refresh, url=url, **kwargs
             )
 
         # Fallback to basic authentication
@@ -406,6 +407,7 @@ class AuthManager:
         self,
         method_name: str,
         force_refresh: bool = False,
+        url: Optional[str] = None,
         **kwargs: Any
     ) -> AuthResult:
         """Perform authentication with enhanced features (retry, sessions, etc.)."""
@@ -445,7 +447,8 @@ class AuthManager:
         try:
             result = await retry_handler.execute_with_retry(
                 auth_operation,
-                operation_name=f"authentication:{method_name}"
+                operation_name=f"authentication:{method_name}",
+                host=self._retry_host(auth_method, url),
             )
 
             logger.info(f"Authentication successful for {method_name}")
@@ -457,6 +460,16 @@ class AuthManager:
             logger.error(f"Authentication failed for {method_name} after retries: {e}")
             raise
 
+    @staticmethod
+    def _retry_host(auth_method: AuthMethod, url: Optional[str]) -> Optional[str]:
+        """Host whose retry budget authentication retries are drawn from."""
+        # Token endpoints are what an OAuth retry hits; other methods are
+        # retried on behalf of the URL being authenticated for
+        target = getattr(auth_method.config, "token_url", None) or url
+        if not target:
+            return None
+        return urlparse(str(target)).netloc or None
+
     async def authenticate_for_url(self, url: str, **kwargs: Any) -> AuthResult:
         """
         Perform authentication for a specific URL.
@@ -469,7 +482,7 @@ class AuthManager:
             AuthResult containing authentication data
         """
         method_name = self.get_auth_method_for_url(url)
-        return await self.authenticate(method_name, **kwargs)
+        return await self.authenticate(method_name, url=url, **kwargs)
 
     async def refresh(self, method_name: Optional[str] = None) -> AuthResult:
         """
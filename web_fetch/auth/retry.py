@@ -8,7 +8,6 @@ and error handling for authentication operations.
 from __future__ import annotations
 
 import asyncio
-import random
 import time
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Type, Union
@@ -16,6 +15,7 @@ import logging
 
 from .config import RetryPolicy
 from ..exceptions import WebFetchError
+from ..utils.retry import GLOBAL_KEY, RetryEngine, decorrelated_jitter
 
 
 logger = logging.getLogger(__name__)
@@ -177,32 +177,43 @@ class CircuitBreaker:
 class RetryHandler:
     """Handles retry logic for authentication operations."""
     
-    def __init__(self, policy: RetryPolicy, circuit_breaker: Optional[CircuitBreaker] = None):
+    def __init__(
+        self,
+        policy: RetryPolicy,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        engine: Optional[RetryEngine] = None,
+    ):
         """
         Initialize retry handler.
         
         Args:
             policy: Retry policy configuration
             circuit_breaker: Optional circuit breaker for failure protection
+            engine: Retry engine whose budget gates retries; defaults to one
+                drawing from the process-wide budget
         """
         self.policy = policy
         self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._engine = engine or RetryEngine(
+            base_delay=policy.initial_delay,
+            max_delay=policy.max_delay,
+            jitter=policy.jitter,
+        )
     
-    def _calculate_delay(self, attempt: int) -> float:
+    def _calculate_delay(self, attempt: int, previous_delay: float = 0.0) -> float:
         """Calculate delay for retry attempt."""
         if attempt == 0:
             return 0
         
-        # Exponential backoff
-        delay = self.policy.initial_delay * (self.policy.exponential_base ** (attempt - 1))
-        delay = min(delay, self.policy.max_delay)
-        
-        # Add jitter if enabled
         if self.policy.jitter:
-            jitter = random.uniform(0, delay * 0.1)  # Up to 10% jitter
-            delay += jitter
+            # Decorrelated jitter between the initial delay and 3x the last one
+            return decorrelated_jitter(
+                self.policy.initial_delay, previous_delay, self.policy.max_delay
+            )
         
-        return delay
+        # Exponential backoff
+        delay = self.policy.initial_delay * (self.policy.exponential_base ** (attempt - 1))
+        return min(delay, self.policy.max_delay)
     
     def _should_retry(self, error: AuthenticationError, attempt: int) -> bool:
         """Determine if an error should be retried."""
@@ -231,6 +242,7 @@ class RetryHandler:
         func: Callable,
         *args,
         operation_name: str = "authentication",
+        host: Optional[str] = None,
         **kwargs
     ) -> Any:
         """
@@ -240,6 +252,8 @@ class RetryHandler:
             func: Function to execute
             *args: Function arguments
             operation_name: Name of the operation for logging
+            host: Host the operation talks to; retries are drawn from its
+                retry budget as well as the process-wide one
             **kwargs: Function keyword arguments
             
         Returns:
@@ -249,15 +263,12 @@ class RetryHandler:
             AuthenticationError: If all retry attempts fail
         """
         last_error: Optional[AuthenticationError] = None
+        delay = 0.0
+        budget_key = host or GLOBAL_KEY
         
         for attempt in range(self.policy.max_attempts):
+            self._engine.record_attempt(budget_key)
             try:
-                # Calculate and apply delay
-                if attempt > 0:
-                    delay = self._calculate_delay(attempt)
-                    logger.debug(f"Retrying {operation_name} in {delay:.2f}s (attempt {attempt + 1}/{self.policy.max_attempts})")
-                    await asyncio.sleep(delay)
-                
                 # Execute with circuit breaker protection
                 result = await self.circuit_breaker.call(func, *args, **kwargs)
                 
@@ -269,18 +280,28 @@ class RetryHandler:
             except AuthenticationError as e:
                 last_error = e
                 
-                # Use retry_after from error if provided
-                if e.retry_after and attempt < self.policy.max_attempts - 1:
-                    logger.debug(f"Server requested retry after {e.retry_after}s")
-                    await asyncio.sleep(e.retry_after)
-                    continue
-                
                 # Check if we should retry
                 if not self._should_retry(e, attempt + 1):
                     logger.error(f"{operation_name} failed with non-retryable error: {e}")
                     raise
                 
+                # Draw from the retry budget; retry_after from the server is
+                # a lower bound on the backoff
+                next_delay = self._engine.next_delay(
+                    budget_key,
+                    attempt,
+                    delay,
+                    e.retry_after,
+                    delay=self._calculate_delay(attempt + 1, delay),
+                )
+                if next_delay is None:
+                    logger.error(f"{operation_name} failed and the retry budget is exhausted: {e}")
+                    raise
+                delay = next_delay
+
                 logger.warning(f"{operation_name} failed on attempt {attempt + 1}: {e}")
+                logger.debug(f"Retrying {operation_name} in {delay:.2f}s (attempt {attempt + 2}/{self.policy.max_attempts})")
+                await asyncio.sleep(delay)
         
         # All retries exhausted
         if last_error:
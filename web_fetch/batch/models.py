@@ -182,6 +182,10 @@ class BatchConfig(BaseModel):
     # Resource management
     memory_limit_mb: int = Field(default=1024, description="Memory limit in MB")
     disk_cache_enabled: bool = Field(default=True, description="Enable disk caching")
+    shared_session: bool = Field(
+        default=False,
+        description="Borrow pooled HTTP sessions across batches; cookies are not kept",
+    )
 
     # Monitoring
     enable_metrics: bool = Field(default=True, description="Enable metrics collection")
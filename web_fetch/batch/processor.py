@@ -64,7 +64,9 @@ class BatchProcessor:
             )
 
             # Process requests with concurrency control
-            async with WebFetcher(fetch_config) as fetcher:
+            async with WebFetcher(
+                fetch_config, shared_session=self.config.shared_session
+            ) as fetcher:
                 semaphore = asyncio.Semaphore(batch_request.max_concurrent)
 
                 # Create tasks for all requests
@@ -226,7 +228,9 @@ class StreamingBatchProcessor(BatchProcessor):
                 max_concurrent_requests=batch_request.max_concurrent,
             )
 
-            async with WebFetcher(fetch_config) as fetcher:
+            async with WebFetcher(
+                fetch_config, shared_session=self.config.shared_session
+            ) as fetcher:
                 semaphore = asyncio.Semaphore(batch_request.max_concurrent)
 
                 # Process requests and stream results
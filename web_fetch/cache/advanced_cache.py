@@ -15,6 +15,8 @@ from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
+from ..utils.lru_cache import LRUCache
+
 try:
     import redis.asyncio as redis
     REDIS_AVAILABLE = True
@@ -111,7 +113,7 @@ class CacheBackendInterface(ABC):
 
 
 class MemoryCacheBackend(CacheBackendInterface):
-    """In-memory cache backend with LRU/LFU eviction."""
+    """In-memory cache backend with LRU eviction and a memory budget."""
 
     def __init__(self, max_size: int = 1000, max_memory: int = 100 * 1024 * 1024):
         """
@@ -123,26 +125,23 @@ class MemoryCacheBackend(CacheBackendInterface):
         """
         self.max_size = max_size
         self.max_memory = max_memory
-        self.cache: Dict[str, CacheEntry] = {}
-        self.access_order: List[str] = []
-        self.current_memory = 0
+        self.cache: LRUCache[str, CacheEntry] = LRUCache(
+            max_entries=max_size,
+            max_bytes=max_memory,
+            sizer=lambda entry: entry.size,
+            clock=time.time,
+        )
+
+    @property
+    def current_memory(self) -> int:
+        """Total size of cached values in bytes."""
+        return self.cache.current_bytes
 
     async def get(self, key: str) -> Optional[CacheEntry]:
         """Get cache entry by key."""
         entry = self.cache.get(key)
-        if entry is None:
-            return None
-
-        if entry.is_expired:
-            await self.delete(key)
-            return None
-
-        # Update access order for LRU
-        if key in self.access_order:
-            self.access_order.remove(key)
-        self.access_order.append(key)
-
-        entry.touch()
+        if entry is not None:
+            entry.touch()
         return entry
 
     async def set(self, key: str, entry: CacheEntry) -> bool:
@@ -150,43 +149,22 @@ class MemoryCacheBackend(CacheBackendInterface):
         # Calculate entry size
         entry.size = len(json.dumps(entry.value, default=str).encode())
 
-        # Remove existing entry if present
-        if key in self.cache:
-            await self.delete(key)
-
-        # Check if we need to evict entries
-        await self._evict_if_needed(entry.size)
-
-        # Add new entry
-        self.cache[key] = entry
-        self.access_order.append(key)
-        self.current_memory += entry.size
-
-        return True
+        ttl = entry.ttl - entry.age if entry.ttl is not None else None
+        return self.cache.set(key, entry, ttl=ttl)
 
     async def delete(self, key: str) -> bool:
         """Delete cache entry."""
-        entry = self.cache.pop(key, None)
-        if entry is None:
-            return False
-
-        if key in self.access_order:
-            self.access_order.remove(key)
-
-        self.current_memory -= entry.size
-        return True
+        return self.cache.delete(key)
 
     async def clear(self) -> bool:
         """Clear all cache entries."""
         self.cache.clear()
-        self.access_order.clear()
-        self.current_memory = 0
         return True
 
     async def keys(self, pattern: str = "*") -> List[str]:
         """Get keys matching pattern."""
         if pattern == "*":
-            return list(self.cache.keys())
+            return self.cache.keys()
 
         # Simple pattern matching (could be enhanced)
         import fnmatch
@@ -194,21 +172,9 @@ class MemoryCacheBackend(CacheBackendInterface):
 
     async def size(self) -> int:
         """Get cache size."""
+        self.cache.purge_expired()
         return len(self.cache)
 
-    async def _evict_if_needed(self, new_entry_size: int) -> None:
-        """Evict entries if needed to make space."""
-        # Check size limit
-        while len(self.cache) >= self.max_size and self.access_order:
-            oldest_key = self.access_order[0]
-            await self.delete(oldest_key)
-
-        # Check memory limit
-        while (self.current_memory + new_entry_size > self.max_memory and
-               self.access_order):
-            oldest_key = self.access_order[0]
-            await self.delete(oldest_key)
-
 
 class RedisCacheBackend(CacheBackendInterface):
     """Redis cache backend."""
@@ -17,9 +17,16 @@ from .base import ResourceComponent, component_registry
 class HTTPResourceComponent(ResourceComponent):
     kind = ResourceKind.HTTP
 
-    def __init__(self, config: Optional[ResourceConfig] = None, http_config: Optional[HTTPFetchConfig] = None):
+    def __init__(
+        self,
+        config: Optional[ResourceConfig] = None,
+        http_config: Optional[HTTPFetchConfig] = None,
+        shared_session: bool = False,
+    ):
         super().__init__(config)
         self.http_config = http_config or HTTPFetchConfig()
+        # Pooled sessions drop cookies, so sharing is opt-in
+        self.shared_session = shared_session
 
     def _to_http_url(self, uri: str) -> HttpUrl:
         adapter = TypeAdapter(HttpUrl)
@@ -43,7 +50,9 @@ class HTTPResourceComponent(ResourceComponent):
             timeout_override=request.timeout_seconds,
         )
 
-        async with WebFetcher(self.http_config) as fetcher:
+        async with WebFetcher(
+            self.http_config, shared_session=self.shared_session
+        ) as fetcher:
             http_result = await fetcher.fetch_single(http_request)
 
         # Map existing FetchResult -> unified ResourceResult
@@ -120,7 +120,8 @@ class RSSComponent(ResourceComponent):
         self,
         config: Optional[ResourceConfig] = None,
         rss_config: Optional[RSSConfig] = None,
-        http_config: Optional[HTTPFetchConfig] = None
+        http_config: Optional[HTTPFetchConfig] = None,
+        shared_session: bool = False,
     ) -> None:
         """
         Initialize RSS component.
@@ -132,6 +133,8 @@ class RSSComponent(ResourceComponent):
                        item limits, and content settings. If None, uses defaults.
             http_config: HTTP configuration for feed fetching including timeouts,
                         retries, and connection settings. If None, uses defaults.
+            shared_session: Whether to borrow pooled HTTP sessions. Pooled
+                           sessions do not keep cookies, so this is off by default.
 
         Example:
             ```python
@@ -149,6 +152,7 @@ class RSSComponent(ResourceComponent):
         super().__init__(config)
         self.rss_config = rss_config or RSSConfig()
         self.http_config = http_config or HTTPFetchConfig()
+        self.shared_session = shared_session
         self.feed_parser = FeedParser()
     
     def _to_http_url(self, uri: str) -> HttpUrl:
@@ -246,7 +250,9 @@ class RSSComponent(ResourceComponent):
             )
             
             # Fetch feed content using HTTP component
-            async with WebFetcher(self.http_config) as fetcher:
+            async with WebFetcher(
+                self.http_config, shared_session=self.shared_session
+            ) as fetcher:
                 http_result = await fetcher.fetch_single(http_request)
             
             if http_result.error:
@@ -38,6 +38,7 @@ async def fetch_url(
     url: str,
     content_type: ContentType = ContentType.TEXT,
     config: Optional[FetchConfig] = None,
+    shared_session: bool = False,
 ) -> FetchResult:
     """
     Convenience function to fetch a single URL.
@@ -52,6 +53,10 @@ async def fetch_url(
                      Options: RAW (bytes), TEXT (string), JSON (dict/list), HTML (BeautifulSoup)
         config: Optional FetchConfig object for customizing timeouts, retries,
                and other request parameters. Uses defaults if None.
+        shared_session: Reuse a pooled session across calls with the same
+                       connection settings, keeping keep-alive connections, DNS
+                       cache and TLS sessions. Shared sessions do not keep
+                       cookies, including ones set during a redirect chain.
 
     Returns:
         FetchResult object containing:
@@ -77,7 +82,7 @@ async def fetch_url(
     """
     request = FetchRequest(url=HttpUrl(url), content_type=content_type)
 
-    async with WebFetcher(config) as fetcher:
+    async with WebFetcher(config, shared_session=shared_session) as fetcher:
         return await fetcher.fetch_single(request)
 
 
@@ -85,6 +90,7 @@ async def fetch_urls(
     urls: List[str],
     content_type: ContentType = ContentType.TEXT,
     config: Optional[FetchConfig] = None,
+    shared_session: bool = False,
 ) -> BatchFetchResult:
     """
     Convenience function to fetch multiple URLs concurrently.
@@ -99,6 +105,9 @@ async def fetch_urls(
                      All URLs will be parsed using the same content type.
         config: Optional FetchConfig object for customizing timeouts, retries,
                concurrency limits, and other parameters. Uses defaults if None.
+        shared_session: Reuse a pooled session across calls with the same
+                       connection settings. Shared sessions do not keep
+                       cookies, including ones set during a redirect chain.
 
     Returns:
         BatchFetchResult object containing:
@@ -134,7 +143,7 @@ async def fetch_urls(
     ]
     batch_request = BatchFetchRequest(requests=requests, config=config)
 
-    async with WebFetcher(config) as fetcher:
+    async with WebFetcher(config, shared_session=shared_session) as fetcher:
         return await fetcher.fetch_batch(batch_request)
 
 
@@ -214,6 +223,7 @@ async def fetch_with_cache(
     content_type: ContentType = ContentType.TEXT,
     cache_config: Optional[Any] = None,  # CacheConfig from utils
     config: Optional[FetchConfig] = None,
+    shared_session: bool = False,
 ) -> FetchResult:
     """
     Convenience function to fetch a URL with caching.
@@ -230,6 +240,9 @@ async def fetch_with_cache(
                      Uses default cache configuration if None.
         config: Optional FetchConfig object for customizing HTTP request
                parameters. Only used if cache miss occurs.
+        shared_session: Reuse a pooled session across calls with the same
+                       connection settings. Shared sessions do not keep
+                       cookies, including ones set during a redirect chain.
 
     Returns:
         FetchResult object containing either cached or freshly fetched data:
@@ -305,7 +318,7 @@ async def fetch_with_cache(
     # Fetch from network
     request = FetchRequest(url=HttpUrl(url), content_type=content_type)
 
-    async with WebFetcher(config) as fetcher:
+    async with WebFetcher(config, shared_session=shared_session) as fetcher:
         result = await fetcher.fetch_single(request)
 
         # Cache successful responses
@@ -15,17 +15,29 @@ import logging
 import ssl
 import time
 import weakref
-from collections import defaultdict
-from contextlib import asynccontextmanager
+from collections import deque
+from contextlib import AsyncExitStack, asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from urllib.parse import urlparse
 
 import aiohttp
 from aiohttp import ClientSession, ClientTimeout, TCPConnector
 from aiohttp.resolver import AsyncResolver
-from bs4 import BeautifulSoup
 from pydantic import HttpUrl
 
 from web_fetch.exceptions import (
@@ -39,20 +51,41 @@ from web_fetch.exceptions import (
 from web_fetch.models import (
     BatchFetchRequest,
     BatchFetchResult,
+    BatchFetchStats,
     ContentType,
     FetchConfig,
     FetchRequest,
     FetchResult,
     RetryStrategy,
 )
+from web_fetch.parsers.csv_stream import CSVBatch
+from web_fetch.parsers.html_document import ParsedHTMLDocument
+from web_fetch.parsers.json_stream import get_json_loads
 from web_fetch.utils.advanced_rate_limiter import AdvancedRateLimiter, RateLimitConfig
 from web_fetch.utils.cache import EnhancedCache, EnhancedCacheConfig
-from web_fetch.utils.circuit_breaker import CircuitBreakerConfig, with_circuit_breaker
+from web_fetch.utils.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerError,
+    CircuitBreakerRegistry,
+    CircuitBreakerStats,
+    with_circuit_breaker,
+)
 from web_fetch.utils.content_detector import ContentTypeDetector
 from web_fetch.utils.deduplication import RequestKey, deduplicate_request
 from web_fetch.utils.error_handler import EnhancedErrorHandler, RetryConfig
+from web_fetch.utils.hedging import HedgingConfig, RequestHedger
+from web_fetch.utils.http_cache import CacheLookup, CacheState, HTTPCache
 from web_fetch.utils.js_renderer import JavaScriptRenderer, JSRenderConfig
 from web_fetch.utils.metrics import record_request_metrics
+from web_fetch.utils.parse_executor import (
+    ParseExecutor,
+    parse_html_bytes,
+    parse_html_document,
+)
+from web_fetch.utils.response_stream import ResponseStream
+from web_fetch.utils.retry import RetryEngine, retry_after_from
+from web_fetch.utils.session_registry import shared_sessions
 from web_fetch.utils.transformers import TransformationPipeline, Transformer
 
 logger = logging.getLogger(__name__)
@@ -96,6 +129,216 @@ class PriorityRequest:
         return self.timestamp < other.timestamp
 
 
+@dataclass
+class _HostQueue:
+    """Waiting requests and in-flight count for one host."""
+
+    active: int = 0
+    waiters: List[PriorityRequest] = field(default_factory=list)
+    lane: Optional[int] = None
+
+
+class HostScheduler:
+    """
+    Fair request scheduler with per-host queues and priority lanes.
+
+    Replaces a single global semaphore so one slow host cannot occupy every
+    concurrency slot. Each host gets its own priority queue of waiting
+    requests and a cap on in-flight requests. Hosts with runnable requests sit
+    in a lane keyed by the priority of their best waiting request; free slots
+    go to the highest-priority lane and rotate round-robin across the hosts in
+    it, so each host gets one grant per turn regardless of queue length.
+
+    Idle hosts are dropped as soon as their last request finishes, so memory
+    stays proportional to the hosts currently in use.
+    """
+
+    def __init__(self, max_concurrent: int, max_per_host: int) -> None:
+        """
+        Initialize scheduler.
+
+        Args:
+            max_concurrent: Maximum in-flight requests across all hosts
+            max_per_host: Maximum in-flight requests to a single host
+        """
+        self.max_concurrent = max_concurrent
+        self.max_per_host = max_per_host
+        self._active = 0
+        self._waiting = 0
+        self._hosts: Dict[str, _HostQueue] = {}
+        self._lanes: Dict[int, Deque[str]] = {}
+
+    @property
+    def active(self) -> int:
+        """Number of in-flight requests."""
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        """Number of queued requests."""
+        return self._waiting
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        host: str,
+        request: FetchRequest,
+        priority: int = RequestPriority.NORMAL,
+    ) -> AsyncGenerator[None, None]:
+        """
+        Hold a concurrency slot for host for the duration of the context.
+
+        Args:
+            host: Host the request is sent to
+            request: Request being scheduled
+            priority: RequestPriority value, lower runs first
+        """
+        await self.acquire(host, request, priority)
+        try:
+            yield
+        finally:
+            self.release(host)
+
+    async def acquire(
+        self,
+        host: str,
+        request: FetchRequest,
+        priority: int = RequestPriority.NORMAL,
+    ) -> None:
+        """
+        Wait for a concurrency slot for host.
+
+        Args:
+            host: Host the request is sent to
+            request: Request being scheduled
+            priority: RequestPriority value, lower runs first
+        """
+        queue = self._hosts.get(host)
+        if queue is None:
+            queue = self._hosts[host] = _HostQueue()
+
+        # Fast path: nothing queued anywhere and capacity is free
+        if (
+            self._waiting == 0
+            and self._active < self.max_concurrent
+            and queue.active < self.max_per_host
+        ):
+            self._grant(queue)
+            return
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        entry = PriorityRequest(request, priority, time.monotonic(), future)
+        heapq.heappush(queue.waiters, entry)
+        self._waiting += 1
+        self._schedule_host(host, queue)
+        self._dispatch()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.cancelled():
+                # Drop the entry unless _dispatch already skipped it
+                try:
+                    queue.waiters.remove(entry)
+                except ValueError:
+                    pass
+                else:
+                    heapq.heapify(queue.waiters)
+                    self._waiting -= 1
+                self._discard_if_idle(host, queue)
+            else:
+                # Granted but cancelled before resuming: hand the slot on
+                self.release(host)
+            raise
+
+    def release(self, host: str) -> None:
+        """
+        Release a slot acquired for host and wake the next waiter.
+
+        Args:
+            host: Host the finished request was sent to
+        """
+        queue = self._hosts[host]
+        queue.active -= 1
+        self._active -= 1
+        self._schedule_host(host, queue)
+        self._dispatch()
+        self._discard_if_idle(host, queue)
+
+    def _grant(self, queue: _HostQueue) -> None:
+        """Account for a slot handed to a request on queue's host."""
+        queue.active += 1
+        self._active += 1
+
+    def _schedule_host(self, host: str, queue: _HostQueue) -> None:
+        """Put host in the lane of its best waiting request if it can run."""
+        if not queue.waiters or queue.active >= self.max_per_host:
+            return
+
+        lane = queue.waiters[0].priority
+        if queue.lane is not None and queue.lane <= lane:
+            return
+
+        # Any entry in a previous lane is now stale and skipped on dispatch
+        queue.lane = lane
+        self._lanes.setdefault(lane, deque()).append(host)
+
+    def _next_host(self) -> Optional[str]:
+        """Pop the next runnable host from the highest-priority lane."""
+        for lane in sorted(self._lanes):
+            hosts = self._lanes[lane]
+            while hosts:
+                host = hosts.popleft()
+                queue = self._hosts.get(host)
+                if queue is None or queue.lane != lane:
+                    continue
+                queue.lane = None
+                if queue.waiters and queue.active < self.max_per_host:
+                    return host
+            del self._lanes[lane]
+        return None
+
+    def _dispatch(self) -> None:
+        """Hand free slots to waiting requests."""
+        while self._waiting and self._active < self.max_concurrent:
+            host = self._next_host()
+            if host is None:
+                return
+
+            queue = self._hosts[host]
+            entry = heapq.heappop(queue.waiters)
+            self._waiting -= 1
+            if entry.future.done():
+                # Cancelled in the same tick, before its task could dequeue it
+                self._schedule_host(host, queue)
+                continue
+            self._grant(queue)
+            entry.future.set_result(None)
+
+            # Rejoin at the back of the lane for round-robin fairness
+            self._schedule_host(host, queue)
+
+    def _discard_if_idle(self, host: str, queue: _HostQueue) -> None:
+        """Forget host once it has nothing in flight or queued."""
+        if queue.active == 0 and not queue.waiters and self._hosts.get(host) is queue:
+            del self._hosts[host]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Dictionary with slot usage and queue depth
+        """
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_per_host": self.max_per_host,
+            "active": self._active,
+            "waiting": self._waiting,
+            "hosts": len(self._hosts),
+        }
+
+
 class OptimizedTCPConnector(TCPConnector):
     """Enhanced TCP connector with advanced optimizations."""
 
@@ -145,87 +388,6 @@ class OptimizedTCPConnector(TCPConnector):
             self._last_dns_cleanup = current_time
 
 
-class AdaptiveRetryStrategy:
-    """Intelligent retry strategy that adapts based on error patterns."""
-
-    def __init__(self) -> None:
-        self._host_error_rates: Dict[str, Dict[str, Union[int, float]]] = defaultdict(
-            lambda: {"errors": 0, "requests": 0, "last_reset": time.time()}
-        )
-        self._global_backoff_multiplier = 1.0
-
-    def should_retry(
-        self, error: Exception, attempt: int, max_retries: int, url: str
-    ) -> bool:
-        """Determine if request should be retried based on adaptive logic."""
-        if attempt >= max_retries:
-            return False
-
-        # Extract host from URL
-        host = urlparse(url).netloc
-
-        # Update error statistics
-        stats = self._host_error_rates[host]
-        stats["requests"] += 1
-
-        # Reset stats if they're old (every 5 minutes)
-        if time.time() - stats["last_reset"] > 300:
-            stats["errors"] = 0
-            stats["requests"] = 0
-            stats["last_reset"] = time.time()
-
-        # Don't retry certain error types
-        if isinstance(error, (aiohttp.ClientResponseError,)):
-            if hasattr(error, "status") and error.status in (400, 401, 403, 404, 422):
-                return False
-
-        # Reduce retries for hosts with high error rates
-        if stats["requests"] > 10:
-            error_rate = stats["errors"] / stats["requests"]
-            if error_rate > 0.5:  # More than 50% error rate
-                return attempt < max(1, max_retries // 2)
-
-        return True
-
-    def calculate_delay(self, attempt: int, base_delay: float, url: str) -> float:
-        """Calculate adaptive delay with jitter."""
-        host = urlparse(url).netloc
-        stats = self._host_error_rates[host]
-
-        # Increase delay for problematic hosts
-        host_multiplier = 1.0
-        if stats["requests"] > 5:
-            error_rate = stats["errors"] / stats["requests"]
-            host_multiplier = 1.0 + (
-                error_rate * 2
-            )  # Up to 3x delay for 100% error rate
-
-        # Exponential backoff with jitter
-        delay = (
-            base_delay
-            * (2**attempt)
-            * host_multiplier
-            * self._global_backoff_multiplier
-        )
-
-        # Add jitter (±25%)
-        import random
-
-        jitter = random.uniform(0.75, 1.25)
-
-        return float(min(delay * jitter, 60.0))  # Cap at 60 seconds
-
-    def record_error(self, url: str) -> None:
-        """Record an error for adaptive learning."""
-        host = urlparse(url).netloc
-        self._host_error_rates[host]["errors"] += 1
-
-    def record_success(self, url: str) -> None:
-        """Record a success to help recovery detection."""
-        host = urlparse(url).netloc
-        # Don't increment requests here as it's already done in should_retry
-
-
 class WebFetcher:
     """
     Async web fetcher with modern Python features, AIOHTTP best practices, and advanced optimizations.
@@ -348,6 +510,9 @@ class WebFetcher:
         enable_adaptive_retry: bool = True,
         enable_http2: bool = True,
         dns_cache_ttl: int = 300,
+        rate_limit_config: Optional[RateLimitConfig] = None,
+        shared_session: bool = False,
+        hedging_config: Optional[HedgingConfig] = None,
     ):
         """
         Initialize the WebFetcher with comprehensive configuration options.
@@ -366,8 +531,12 @@ class WebFetcher:
 
             circuit_breaker_config: Configuration for circuit breaker pattern to handle
                                   failing services gracefully. Includes failure threshold,
-                                  recovery timeout, and expected exceptions. If None,
-                                  uses default settings (5 failures, 60s recovery).
+                                  failure rate window, recovery timeout, and expected
+                                  exceptions. When given, fetch_single runs every request
+                                  through a per-host breaker and returns an error result
+                                  while the host's circuit is open. If None, only
+                                  fetch_with_circuit_breaker uses a breaker, with default
+                                  settings (5 failures, 60s recovery).
 
             enable_deduplication: Whether to enable automatic request deduplication.
                                 When True, identical requests made concurrently will be
@@ -385,12 +554,43 @@ class WebFetcher:
 
             cache_config: Configuration for enhanced caching with support for multiple
                         backends (memory, Redis, file), compression, and TTL settings.
+                        With http_semantics set, GET responses are cached by their
+                        Cache-Control/Expires/Vary headers and stale entries are
+                        revalidated with If-None-Match/If-Modified-Since, so a 304
+                        refreshes the entry without downloading the body again.
                         If None, no caching is performed.
 
             js_config: Configuration for JavaScript rendering using Playwright. Enables
                      fetching of dynamically generated content from SPAs and other
                      JavaScript-heavy sites. If None, no JS rendering is performed.
 
+            enable_request_prioritization: Whether the priority passed to fetch_single
+                                         is honoured. When True, queued HIGH priority
+                                         requests are started before NORMAL and LOW
+                                         ones; otherwise all requests share one lane.
+
+            rate_limit_config: Configuration for per-domain rate limiting using the
+                             token bucket, sliding window, fixed window, leaky bucket
+                             or adaptive algorithms. Throttled requests wait outside
+                             the concurrency scheduler, and Retry-After/X-RateLimit-*
+                             response headers are fed back into the limiter. If None,
+                             no rate limiting is performed.
+
+            shared_session: Whether to borrow the HTTP session from the process-wide
+                          session registry instead of creating one. Fetchers with the
+                          same timeouts, connection limits, SSL and header settings
+                          on the same event loop then share keep-alive connections,
+                          DNS cache and TLS sessions, and close() only releases the
+                          reference. Shared sessions do not persist cookies.
+
+            hedging_config: Configuration for hedged requests. When given, a GET or
+                          HEAD attempt that has not answered within the host's
+                          recent p95 response time is raced against a second
+                          attempt on another pooled connection; the first response
+                          wins and the other is cancelled. Hedges are capped to a
+                          share of recent requests, see get_hedging_stats(). If
+                          None, requests are never hedged.
+
         Attributes:
             config (FetchConfig): The fetch configuration used by this instance
             circuit_breaker_config (CircuitBreakerConfig): Circuit breaker settings
@@ -427,19 +627,45 @@ class WebFetcher:
         """
         self.config = config or FetchConfig()
         self.circuit_breaker_config = circuit_breaker_config or CircuitBreakerConfig()
+        self._circuit_breakers = (
+            CircuitBreakerRegistry(circuit_breaker_config)
+            if circuit_breaker_config
+            else None
+        )
         self.enable_deduplication = enable_deduplication
         self.enable_metrics = enable_metrics
         self.transformation_pipeline = transformation_pipeline
+        self.enable_request_prioritization = enable_request_prioritization
+        self.shared_session = shared_session
 
         self._session: Optional[ClientSession] = None
-        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._scheduler: Optional[HostScheduler] = None
 
         # Enhanced components
         self._content_detector = ContentTypeDetector()
         self._error_handler = EnhancedErrorHandler()
-        self._advanced_rate_limiter = AdvancedRateLimiter()
+        self._retry_engine = RetryEngine(
+            base_delay=self.config.retry_delay,
+            jitter=self.config.retry_strategy == RetryStrategy.EXPONENTIAL,
+        )
+        self._advanced_rate_limiter = (
+            AdvancedRateLimiter(rate_limit_config) if rate_limit_config else None
+        )
+        self._hedger = RequestHedger(hedging_config) if hedging_config else None
         self._enhanced_cache = EnhancedCache(cache_config) if cache_config else None
+        self._http_cache = (
+            HTTPCache(self._enhanced_cache)
+            if self._enhanced_cache and self._enhanced_cache.config.http_semantics
+            else None
+        )
+        self._revalidations: Dict[str, asyncio.Task[None]] = {}
         self._js_renderer = JavaScriptRenderer(js_config) if js_config else None
+        self._parse_executor = ParseExecutor(
+            mode=self.config.parse_executor,
+            max_workers=self.config.parse_max_workers,
+            offload_threshold=self.config.parse_offload_threshold,
+        )
+        self._json_loads = get_json_loads(self.config.json_backend)
 
     async def __aenter__(self) -> WebFetcher:
         """
@@ -484,6 +710,32 @@ class WebFetcher:
         if self._session is not None:
             return
 
+        if self.shared_session:
+            self._session = await shared_sessions.acquire(
+                self._session_key(), self._build_session
+            )
+        else:
+            self._session = self._build_session()
+
+        # Create per-host fair scheduler for concurrency control
+        self._scheduler = HostScheduler(
+            max_concurrent=self.config.max_concurrent_requests,
+            max_per_host=self.config.max_connections_per_host,
+        )
+
+    def _session_key(self) -> Tuple[Any, ...]:
+        """Connection-relevant settings identifying a shareable session."""
+        return (
+            self.config.total_timeout,
+            self.config.connect_timeout,
+            self.config.read_timeout,
+            self.config.max_connections_per_host,
+            self.config.verify_ssl,
+            tuple(sorted(self.config.headers.to_dict().items())),
+        )
+
+    def _build_session(self) -> ClientSession:
+        """Build a ClientSession from self.config."""
         # Configure timeouts
         timeout = ClientTimeout(
             total=self.config.total_timeout,
@@ -500,24 +752,36 @@ class WebFetcher:
         )
 
         # Create session with configuration
-        self._session = ClientSession(
+        return ClientSession(
             timeout=timeout,
             connector=connector,
             headers=self.config.headers.to_dict(),
             raise_for_status=False,  # We'll handle status codes manually
+            cookie_jar=aiohttp.DummyCookieJar() if self.shared_session else None,
         )
 
-        # Create semaphore for concurrency control
-        self._semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
-
     async def close(self) -> None:
         """Close the session and cleanup resources."""
+        for task in list(self._revalidations.values()):
+            task.cancel()
+        if self._revalidations:
+            await asyncio.gather(*self._revalidations.values(), return_exceptions=True)
+            self._revalidations.clear()
         if self._session:
-            await self._session.close()
+            if self.shared_session:
+                await shared_sessions.release(self._session)
+            else:
+                await self._session.close()
             self._session = None
-        self._semaphore = None
+        self._scheduler = None
+        self._parse_executor.shutdown()
 
-    async def fetch_single(self, request: FetchRequest) -> FetchResult:
+    async def fetch_single(
+        self,
+        request: FetchRequest,
+        priority: int = RequestPriority.NORMAL,
+        max_retries: Optional[int] = None,
+    ) -> FetchResult:
         """
         Fetch a single URL with comprehensive retry logic and error handling.
 
@@ -538,6 +802,9 @@ class WebFetcher:
                     - params: Optional query parameters dictionary
                     - content_type: Expected content type for parsing response
                     - timeout_override: Optional timeout override for this request
+            priority: RequestPriority value (HIGH, NORMAL or LOW) used to order
+                     queued requests when enable_request_prioritization is set.
+            max_retries: Optional override of config.max_retries for this request.
 
         Returns:
             FetchResult object containing:
@@ -581,55 +848,454 @@ class WebFetcher:
             ```
 
         Note:
-            This method is safe to call concurrently. The internal semaphore ensures
-            that the number of concurrent requests doesn't exceed the configured limit.
+            This method is safe to call concurrently. The internal scheduler ensures
+            that the number of concurrent requests doesn't exceed the configured limit
+            overall or max_connections_per_host for any single host, and shares free
+            slots round-robin across hosts.
             Failed requests are automatically retried according to the retry strategy
             configured in FetchConfig.
         """
         if not self._session:
             await self._create_session()
 
+        if self._circuit_breakers is None:
+            return await self._fetch_with_retries(request, priority, max_retries)
+
+        breaker = self._circuit_breakers.breaker_for(str(request.url))
+        try:
+            return await self._fetch_through_breaker(
+                breaker, request, priority, max_retries
+            )
+        except CircuitBreakerError as e:
+            return FetchResult(
+                url=str(request.url),
+                status_code=0,
+                headers={},
+                content=None,
+                content_type=request.content_type,
+                response_time=0.0,
+                timestamp=datetime.now(),
+                error=str(e),
+            )
+
+    @asynccontextmanager
+    async def fetch_stream(
+        self,
+        request: FetchRequest,
+        priority: int = RequestPriority.NORMAL,
+        max_retries: Optional[int] = None,
+        max_size: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[ResponseStream]:
+        """
+        Open a request and stream its body without buffering it.
+
+        The request goes through the same scheduler, rate limiting, circuit
+        breaker and retry engine as fetch_single. Retries cover everything up
+        to the response headers: connection failures, 5xx responses and an
+        oversized Content-Length. Once body chunks are being handed out a
+        failure is raised to the caller, since consumed chunks cannot be
+        replayed. The scheduler slot is held until the block exits.
+
+        Args:
+            request: FetchRequest describing the request; content_type is ignored
+            priority: RequestPriority value used when prioritization is enabled
+            max_retries: Optional override of config.max_retries
+            max_size: Largest body in bytes; defaults to config.max_response_size.
+                     The stream is aborted as soon as the running total passes it.
+            chunk_size: Fixed chunk size; None hands out chunks as received
+
+        Yields:
+            ResponseStream iterating the body as memoryview chunks
+
+        Raises:
+            WebFetchError: If the request fails after retries or the body is too
+                          large (ContentError)
+            CircuitBreakerError: If circuit breaking is configured and the host's
+                                circuit is open
+
+        Example:
+            ```python
+            digest = hashlib.sha256()
+            async with fetcher.fetch_stream(FetchRequest(url=url)) as stream:
+                async with aiofiles.open("body.bin", "wb") as out:
+                    await stream.pipe(digest.update, out.write)
+            ```
+        """
+        if not self._session:
+            await self._create_session()
+        if self._session is None or self._scheduler is None:
+            raise WebFetchError("Session not properly initialized")
+
+        url = str(request.url)
+        host = urlparse(url).netloc.lower()
+        limit = self.config.max_response_size if max_size is None else max_size
+        priority, max_retries = self._attempt_settings(priority, max_retries)
+
         start_time = time.time()
-        last_error: Optional[str] = None
+        stack, response, attempt, attempt_start = (
+            await self._open_stream_through_breaker(
+                request, host, priority, max_retries, limit, start_time
+            )
+        )
+        await self._record_rate_limited_response(
+            url, response.status, dict(response.headers), attempt_start
+        )
+
+        stream = ResponseStream(response, url, limit, chunk_size, attempt)
+        error: Optional[str] = None
+        try:
+            async with stack:
+                yield stream
+        except BaseException as e:
+            error = str(e) or type(e).__name__
+            raise
+        finally:
+            if self.enable_metrics:
+                record_request_metrics(
+                    url,
+                    request.method,
+                    stream.status_code,
+                    time.time() - start_time,
+                    stream.bytes_read,
+                    error,
+                )
+
+    async def _open_stream_through_breaker(
+        self,
+        request: FetchRequest,
+        host: str,
+        priority: int,
+        max_retries: int,
+        limit: int,
+        start_time: float,
+    ) -> Tuple[AsyncExitStack, aiohttp.ClientResponse, int, float]:
+        """
+        Open a streamed response through the host's circuit breaker, if any.
+
+        A request that still fails after retries counts against the breaker
+        like in fetch_single and is recorded in the request metrics.
+
+        Returns:
+            See _open_stream
+
+        Raises:
+            WebFetchError: If the last attempt failed
+            CircuitBreakerError: If the host's circuit is open
+        """
+        url = str(request.url)
+        breaker = (
+            self._circuit_breakers.breaker_for(url) if self._circuit_breakers else None
+        )
+        permit = breaker.acquire() if breaker else None
+        try:
+            opened = await self._open_stream(
+                request, host, priority, max_retries, limit
+            )
+        except Exception as e:
+            status = getattr(e, "status_code", None) or 0
+            self._record_breaker_result(breaker, permit, status, str(e))
+            if self.enable_metrics:
+                record_request_metrics(
+                    url, request.method, status, time.time() - start_time, 0, str(e)
+                )
+            raise
+        except BaseException:
+            if breaker:
+                breaker.release(permit)
+            raise
+        self._record_breaker_result(breaker, permit, opened[1].status, None)
+        return opened
+
+    async def _open_stream(
+        self,
+        request: FetchRequest,
+        host: str,
+        priority: int,
+        max_retries: int,
+        limit: int,
+    ) -> Tuple[AsyncExitStack, aiohttp.ClientResponse, int, float]:
+        """
+        Send request until its response headers arrive, retrying failures.
+
+        Returns:
+            Exit stack holding the scheduler slot and the response, the
+            response, the attempt number and the time the attempt started
+
+        Raises:
+            WebFetchError: If the last attempt failed
+        """
+        url = str(request.url)
+        delay = 0.0
+        attempt = 0
+        while True:
+            self._retry_engine.record_attempt(host)
+            request_sent = False
+            attempt_start = time.time()
+            try:
+                if self._advanced_rate_limiter:
+                    await self._wait_for_rate_limit(url)
+                request_sent = True
+                stack, response = await self._open_response(
+                    request, host, priority, limit
+                )
+                return stack, response, attempt, attempt_start
+            except Exception as e:
+                web_error, next_delay = await self._attempt_failed(
+                    host,
+                    url,
+                    e,
+                    attempt,
+                    max_retries,
+                    delay,
+                    attempt_start if request_sent else None,
+                )
+                if next_delay is None:
+                    if web_error is e:
+                        raise
+                    raise web_error from e
+            delay = next_delay
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _open_response(
+        self, request: FetchRequest, host: str, priority: int, limit: int
+    ) -> Tuple[AsyncExitStack, aiohttp.ClientResponse]:
+        """
+        Take a scheduler slot and send request, keeping both open on a stack.
+
+        Raises:
+            ContentError: If the declared Content-Length is over limit
+            ServerError: If the response is a server error
+        """
+        if self._session is None or self._scheduler is None:
+            raise WebFetchError("Session not properly initialized")
+        url = str(request.url)
+        stack = AsyncExitStack()
+        try:
+            await stack.enter_async_context(
+                self._scheduler.slot(host, request, priority)
+            )
+            response = await stack.enter_async_context(
+                self._session.request(**self._request_kwargs(request))
+            )
+            self._check_server_error(response, url)
+            self._check_declared_size(response, url, limit)
+            return stack, response
+        except BaseException:
+            await stack.aclose()
+            raise
+
+    @staticmethod
+    def _check_declared_size(
+        response: aiohttp.ClientResponse, url: str, limit: int
+    ) -> None:
+        """Reject a response whose Content-Length is over limit before reading it."""
+        if response.content_length is not None and response.content_length > limit:
+            raise ContentError(
+                f"Response size {response.content_length} exceeds maximum {limit}",
+                url=url,
+                content_length=response.content_length,
+            )
+
+    async def fetch_json_items(
+        self,
+        request: FetchRequest,
+        prefix: str = "item",
+        backend: Optional[str] = None,
+        priority: int = RequestPriority.NORMAL,
+        max_retries: Optional[int] = None,
+        max_size: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Stream a JSON response and yield the values at prefix as they arrive.
+
+        Built on fetch_stream, so only the item being decoded is held in memory
+        rather than the whole body and its decoded text.
+
+        Args:
+            request: FetchRequest describing the request
+            prefix: Path of the values to yield, e.g. "item" for the elements of
+                   a top-level array or "data.item" / "$.data[*]" for a nested one
+            backend: Item decoder, "json", "orjson" or "auto" (orjson when
+                     installed); defaults to config.json_backend
+            priority: RequestPriority value used when prioritization is enabled
+            max_retries: Optional override of config.max_retries
+            max_size: Largest body in bytes; defaults to config.max_response_size
+
+        Yields:
+            Decoded items in document order
+
+        Raises:
+            WebFetchError: If the request fails after retries
+            ContentError: If the body is too large or is not valid JSON
+
+        Example:
+            ```python
+            request = FetchRequest(url="https://api.example.com/export")
+            async for record in fetcher.fetch_json_items(request, "$.results[*]"):
+                await store(record)
+            ```
+        """
+        async with self.fetch_stream(
+            request, priority, max_retries, max_size=max_size
+        ) as stream:
+            async for item in stream.iter_json(
+                prefix, backend or self.config.json_backend
+            ):
+                yield item
+
+    async def fetch_csv_batches(
+        self,
+        request: FetchRequest,
+        batch_size: int = 10_000,
+        encoding: Optional[str] = None,
+        has_header: Optional[bool] = None,
+        priority: int = RequestPriority.NORMAL,
+        max_retries: Optional[int] = None,
+        max_size: Optional[int] = None,
+    ) -> AsyncIterator[CSVBatch]:
+        """
+        Stream a CSV response and yield typed column batches as they fill.
+
+        Built on fetch_stream, so only the current batch of rows is held in
+        memory rather than the whole body, its decoded text and every row.
+
+        Args:
+            request: FetchRequest describing the request
+            batch_size: Rows per batch
+            encoding: Text encoding; detected from the first chunk when None
+            has_header: Whether the first row is a header; detected when None
+            priority: RequestPriority value used when prioritization is enabled
+            max_retries: Optional override of config.max_retries
+            max_size: Largest body in bytes; defaults to config.max_response_size
+
+        Yields:
+            CSVBatch objects in file order
 
-        for attempt in range(self.config.max_retries + 1):
+        Raises:
+            WebFetchError: If the request fails after retries
+            ContentError: If the body is too large or is not valid CSV
+
+        Example:
+            ```python
+            request = FetchRequest(url="https://data.example.com/export.csv")
+            async for batch in fetcher.fetch_csv_batches(request, batch_size=50_000):
+                totals += batch.columns["amount"].sum()
+            ```
+        """
+        async with self.fetch_stream(
+            request, priority, max_retries, max_size=max_size
+        ) as stream:
+            async for batch in stream.iter_csv(batch_size, encoding, has_header):
+                yield batch
+
+    async def _fetch_through_breaker(
+        self,
+        breaker: CircuitBreaker,
+        request: FetchRequest,
+        priority: int,
+        max_retries: Optional[int],
+    ) -> FetchResult:
+        """
+        Fetch a request through its host's circuit breaker.
+
+        Connection errors and failure_status_codes responses that remain after
+        retries count as failures; other results count as successes.
+
+        Raises:
+            CircuitBreakerError: If the host's circuit is open
+        """
+        permit = breaker.acquire()
+        try:
+            result = await self._fetch_with_retries(request, priority, max_retries)
+        except BaseException:
+            breaker.release(permit)
+            raise
+
+        self._record_breaker_result(breaker, permit, result.status_code, result.error)
+        return result
+
+    @staticmethod
+    def _record_breaker_result(
+        breaker: Optional[CircuitBreaker],
+        permit: Any,
+        status_code: int,
+        error: Optional[str],
+    ) -> None:
+        """
+        Report the outcome of a request to its circuit breaker.
+
+        Failed requests with no response or a failure_status_codes status
+        count as failures; everything else counts as a success.
+        """
+        if breaker is None:
+            return
+        if error is not None and (
+            status_code == 0 or status_code in breaker.config.failure_status_codes
+        ):
+            breaker.record_failure(permit)
+        else:
+            breaker.record_success(permit)
+
+    async def _fetch_with_retries(
+        self, request: FetchRequest, priority: int, max_retries: Optional[int]
+    ) -> FetchResult:
+        """Run the retry loop for fetch_single."""
+        start_time = time.time()
+        url = str(request.url)
+        host = urlparse(url).netloc.lower()
+        priority, max_retries = self._attempt_settings(priority, max_retries)
+
+        delay = 0.0
+        for attempt in range(max_retries + 1):
+            self._retry_engine.record_attempt(host)
+            request_sent = False
+            attempt_start = time.time()
             try:
-                if self._semaphore is None:
+                if self._scheduler is None:
                     raise WebFetchError("Session not properly initialized")
 
-                async with self._semaphore:  # Control concurrency
-                    result = await self._execute_request(request, attempt)
+                # Per-domain rate limiting waits before taking a scheduler slot so
+                # a throttled domain cannot starve requests to other domains
+                if self._advanced_rate_limiter:
+                    await self._wait_for_rate_limit(url)
+
+                request_sent = True
+                async with self._scheduler.slot(host, request, priority):
+                    result = await self._execute_attempt(host, request, attempt)
                     result.response_time = time.time() - start_time
-                    return result
+
+                await self._record_rate_limited_response(
+                    url, result.status_code, result.headers, attempt_start
+                )
+                return result
 
             except Exception as e:
-                # Convert to appropriate WebFetchError subclass
-                web_error = ErrorHandler.handle_aiohttp_error(e, str(request.url))
-                last_error = str(web_error)
-
-                # Check if error is retryable
-                if (
-                    attempt < self.config.max_retries
-                    and ErrorHandler.is_retryable_error(web_error)
-                ):
-                    delay = ErrorHandler.get_retry_delay(
-                        web_error, attempt, self.config.retry_delay
-                    )
-                    await asyncio.sleep(delay)
-                else:
+                web_error, next_delay = await self._attempt_failed(
+                    host,
+                    url,
+                    e,
+                    attempt,
+                    max_retries,
+                    delay,
+                    attempt_start if request_sent else None,
+                )
+                if next_delay is None:
                     # Final attempt failed or error is not retryable
-                    status_code = getattr(web_error, "status_code", 0)
                     return FetchResult(
                         url=str(request.url),
-                        status_code=status_code,
+                        status_code=getattr(web_error, "status_code", 0),
                         headers={},
                         content=None,
                         content_type=request.content_type,
                         response_time=time.time() - start_time,
                         timestamp=datetime.now(),
-                        error=last_error,
+                        error=str(web_error),
                         retry_count=attempt,
                     )
+                delay = next_delay
+                await asyncio.sleep(delay)
 
         # This should never be reached, but included for completeness
         return FetchResult(
@@ -641,11 +1307,196 @@ class WebFetcher:
             response_time=time.time() - start_time,
             timestamp=datetime.now(),
             error="Maximum retries exceeded",
-            retry_count=self.config.max_retries,
+            retry_count=max_retries,
+        )
+
+    def _attempt_settings(
+        self, priority: int, max_retries: Optional[int]
+    ) -> Tuple[int, int]:
+        """Resolve the scheduling priority and retry count for a request."""
+        if not self.enable_request_prioritization:
+            priority = RequestPriority.NORMAL
+        if max_retries is None:
+            max_retries = self.config.max_retries
+        return priority, max_retries
+
+    async def _execute_attempt(
+        self, host: str, request: FetchRequest, attempt: int
+    ) -> FetchResult:
+        """Execute one attempt, hedging it when its method is hedged."""
+        if self._hedger is None or request.method not in self._hedger.config.methods:
+            return await self._execute_request(request, attempt)
+        # The hedge must not join the primary's single-flight entry, or no
+        # second request would be sent
+        return await self._hedger.run(
+            host,
+            lambda: self._execute_request(request, attempt),
+            hedge=lambda: self._execute_request(request, attempt, deduplicate=False),
+        )
+
+    async def _record_rate_limited_response(
+        self,
+        url: str,
+        status_code: int,
+        headers: Optional[Dict[str, str]],
+        attempt_start: float,
+    ) -> None:
+        """Report a response to the per-domain rate limiter, if configured."""
+        if self._advanced_rate_limiter:
+            await self._advanced_rate_limiter.record_response(
+                url, status_code, headers, time.time() - attempt_start
+            )
+
+    async def _attempt_failed(
+        self,
+        host: str,
+        url: str,
+        error: Exception,
+        attempt: int,
+        max_retries: int,
+        previous_delay: float,
+        sent_at: Optional[float],
+    ) -> Tuple[WebFetchError, Optional[float]]:
+        """
+        Record a failed attempt and decide whether it is retried.
+
+        Args:
+            sent_at: Start of the attempt if the request was sent, so the
+                    rate limiter sees the failed response; None otherwise
+
+        Returns:
+            The error as a WebFetchError, and the delay before the next
+            attempt or None to give up
+        """
+        web_error = self._to_web_error(error, url)
+        if sent_at is not None:
+            await self._record_rate_limited_response(
+                url,
+                getattr(web_error, "status_code", None) or 0,
+                getattr(web_error, "headers", None),
+                sent_at,
+            )
+        next_delay = self._next_retry_delay(
+            host, web_error, attempt, max_retries, previous_delay
+        )
+        return web_error, next_delay
+
+    @staticmethod
+    def _to_web_error(error: Exception, url: str) -> WebFetchError:
+        """
+        Convert an exception to the appropriate WebFetchError subclass.
+
+        Errors already raised as WebFetchError for a response keep their
+        status and headers.
+        """
+        if isinstance(error, WebFetchError):
+            return error
+        return ErrorHandler.handle_aiohttp_error(error, url)
+
+    def _next_retry_delay(
+        self,
+        host: str,
+        web_error: WebFetchError,
+        attempt: int,
+        max_retries: int,
+        previous_delay: float,
+    ) -> Optional[float]:
+        """
+        Decide whether a failed attempt is retried and after how long.
+
+        Retries happen if the error is retryable and the host's retry budget
+        has room; the engine picks the backoff and honours Retry-After.
+
+        Returns:
+            Delay in seconds, or None to give up
+        """
+        if attempt >= max_retries or not ErrorHandler.is_retryable_error(web_error):
+            return None
+        return self._retry_engine.next_delay(
+            host,
+            attempt,
+            previous_delay,
+            retry_after_from(web_error),
+            delay=(
+                None
+                if self._retry_engine.jitter
+                else self._calculate_retry_delay(attempt)
+            ),
         )
 
+    async def _wait_for_rate_limit(self, url: str) -> None:
+        """
+        Wait until the per-domain rate limiter admits a request to url.
+
+        Every limiter algorithm reserves a slot and returns the delay until it
+        is due, so sleeping here keeps concurrent callers for the same domain
+        within the limit instead of waking together.
+
+        Args:
+            url: URL about to be requested
+
+        Raises:
+            RateLimitError: If the domain's circuit breaker is open
+        """
+        if self._advanced_rate_limiter is None:
+            return
+
+        delay = await self._advanced_rate_limiter.acquire(url)
+        if delay > 0:
+            logger.debug(f"Rate limiting {url}: waiting {delay:.3f}s")
+            await asyncio.sleep(delay)
+
+    def get_circuit_breaker_stats(self) -> Dict[str, CircuitBreakerStats]:
+        """
+        Get per-host circuit breaker statistics.
+
+        Returns:
+            Statistics keyed by scheme://host, empty if no circuit_breaker_config
+            was given
+        """
+        if self._circuit_breakers is None:
+            return {}
+        return self._circuit_breakers.get_all_stats()
+
+    def get_hedging_stats(self) -> Dict[str, Any]:
+        """
+        Get hedged request statistics.
+
+        Returns:
+            Counts of hedged requests, hedges issued, won and denied by the hedge
+            rate cap, empty if no hedging_config was given
+        """
+        if self._hedger is None:
+            return {}
+        return self._hedger.get_stats()
+
+    def get_scheduler_stats(self) -> Dict[str, Any]:
+        """
+        Get concurrency scheduler statistics.
+
+        Returns:
+            Scheduler statistics dictionary, empty if the session is not open
+        """
+        if self._scheduler is None:
+            return {}
+        return self._scheduler.get_stats()
+
+    def get_rate_limit_status(self, domain: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get per-domain rate limiter status.
+
+        Args:
+            domain: Optional domain to report on; all domains if None
+
+        Returns:
+            Rate limit status dictionary, empty if rate limiting is disabled
+        """
+        if self._advanced_rate_limiter is None:
+            return {}
+        return self._advanced_rate_limiter.get_rate_limit_status(domain)
+
     async def _execute_request(
-        self, request: FetchRequest, attempt: int
+        self, request: FetchRequest, attempt: int, deduplicate: bool = True
     ) -> FetchResult:
         """
         Execute a single HTTP request with enhanced features.
@@ -658,6 +1509,8 @@ class WebFetcher:
             request: FetchRequest object containing URL, method, headers, and other
                     request parameters
             attempt: Current attempt number (0-based) for retry tracking
+            deduplicate: Whether the request may share an identical in-flight
+                        request when deduplication is enabled
 
         Returns:
             FetchResult object containing response data, status code, headers,
@@ -676,6 +1529,12 @@ class WebFetcher:
         start_time = time.time()
         url = str(request.url)
 
+        # HTTP-semantics cache mode serves and revalidates by response headers
+        if self._http_cache:
+            return await self._execute_with_http_cache(
+                self._http_cache, request, attempt, start_time, deduplicate
+            )
+
         # Check enhanced cache first
         if self._enhanced_cache:
             cached_result: Optional[FetchResult] = await self._enhanced_cache.get(url, request.headers)
@@ -691,10 +1550,20 @@ class WebFetcher:
                     )
                 return cached_result
 
-        # Handle request deduplication
-        if self.enable_deduplication:
+        result = await self._send_request(request, attempt, deduplicate)
+        if self.enable_metrics:
+            record_request_metrics(
+                url, request.method, result.status_code, time.time() - start_time, 0
+            )
+        return result
+
+    async def _send_request(
+        self, request: FetchRequest, attempt: int, deduplicate: bool = True
+    ) -> FetchResult:
+        """Send a request over the network, deduplicating it if enabled."""
+        if self.enable_deduplication and deduplicate:
             result: FetchResult = await deduplicate_request(
-                url=url,
+                url=str(request.url),
                 method=request.method,
                 headers=request.headers,
                 data=request.data,
@@ -703,40 +1572,129 @@ class WebFetcher:
                 request=request,
                 attempt=attempt,
             )
+            return result
+        return await self._make_http_request(request, attempt)
 
-            if self.enable_metrics:
-                record_request_metrics(
-                    url, request.method, result.status_code, time.time() - start_time, 0
+    async def _execute_with_http_cache(
+        self,
+        http_cache: HTTPCache,
+        request: FetchRequest,
+        attempt: int,
+        start_time: float,
+        deduplicate: bool = True,
+    ) -> FetchResult:
+        """
+        Execute a request through the HTTP-semantics cache.
+
+        Fresh entries are returned directly. Entries inside their
+        stale-while-revalidate window are returned while a background
+        conditional request refreshes them. Other stale entries are
+        revalidated inline, and a 304 returns the stored body.
+
+        Args:
+            http_cache: HTTP cache to serve from and update
+            request: Request to execute
+            attempt: Current attempt number (0-based)
+            start_time: Time the attempt started, for metrics
+            deduplicate: Whether a network request may be deduplicated
+
+        Returns:
+            Cached or network FetchResult
+        """
+        url = str(request.url)
+        request_headers = {
+            name.lower(): value
+            for name, value in {
+                **self.config.headers.to_dict(),
+                **(request.headers or {}),
+            }.items()
+        }
+
+        lookup: Optional[CacheLookup] = None
+        if http_cache.is_cacheable(request.method, request_headers):
+            lookup = await http_cache.lookup(url, request_headers)
+
+        if lookup is not None and lookup.state is not CacheState.STALE:
+            logger.debug(f"HTTP cache {lookup.state.value} hit for {url}")
+            if lookup.state is CacheState.STALE_WHILE_REVALIDATE:
+                self._schedule_revalidation(
+                    http_cache, request, request_headers, lookup
                 )
-            return result
+            result = lookup.response()
         else:
-            result = await self._make_http_request(request, attempt)
+            result = await self._revalidate(
+                http_cache, request, request_headers, lookup, attempt, deduplicate
+            )
 
-            if self.enable_metrics:
-                record_request_metrics(
-                    url, request.method, result.status_code, time.time() - start_time, 0
-                )
-            return result
+        if self.enable_metrics:
+            record_request_metrics(
+                url, request.method, result.status_code, time.time() - start_time, 0
+            )
+        return result
 
-    async def _make_http_request(
-        self, request: FetchRequest, attempt: int
+    async def _revalidate(
+        self,
+        http_cache: HTTPCache,
+        request: FetchRequest,
+        request_headers: Dict[str, str],
+        lookup: Optional[CacheLookup],
+        attempt: int,
+        deduplicate: bool = True,
     ) -> FetchResult:
-        """Make the actual HTTP request without deduplication."""
-        if self._session is None:
-            raise WebFetchError("Session not properly initialized")
-
-        # Prepare request parameters
-        method = request.method
-        url = str(request.url)
-        headers = request.headers or {}
-        params = request.params
-        timeout = (
-            ClientTimeout(total=request.timeout_override)
-            if request.timeout_override
-            else None
+        """Send request, conditional on the stored validators, and update the cache."""
+        validators: Dict[str, str] = {}
+        if lookup is not None and http_cache.cache.config.enable_conditional_requests:
+            validators = lookup.conditional_headers()
+        if validators:
+            request = request.model_copy(
+                update={"headers": {**(request.headers or {}), **validators}}
+            )
+        else:
+            lookup = None
+
+        request_time = time.time()
+        result = await self._send_request(request, attempt, deduplicate)
+        return await http_cache.process_response(
+            str(request.url),
+            request.method,
+            request_headers,
+            result,
+            lookup,
+            request_time,
+            time.time(),
         )
 
-        # Prepare data/json parameters
+    def _schedule_revalidation(
+        self,
+        http_cache: HTTPCache,
+        request: FetchRequest,
+        request_headers: Dict[str, str],
+        lookup: CacheLookup,
+    ) -> None:
+        """Start one background revalidation per stale entry."""
+        if lookup.key in self._revalidations:
+            return
+
+        async def revalidate() -> None:
+            host = urlparse(str(request.url)).netloc.lower()
+            try:
+                if self._scheduler is None:
+                    return
+                async with self._scheduler.slot(host, request, RequestPriority.LOW):
+                    await self._revalidate(
+                        http_cache, request, request_headers, lookup, 0
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug(f"Background revalidation of {request.url} failed: {e}")
+            finally:
+                self._revalidations.pop(lookup.key, None)
+
+        self._revalidations[lookup.key] = asyncio.create_task(revalidate())
+
+    def _request_kwargs(self, request: FetchRequest) -> Dict[str, Any]:
+        """Build aiohttp session.request() arguments for request."""
         json_data = None
         data = None
         if request.data is not None:
@@ -745,43 +1703,68 @@ class WebFetcher:
             elif isinstance(request.data, (str, bytes)):
                 data = request.data
 
-        async with self._session.request(
-            method=method,
-            url=url,
-            headers=headers,
-            params=params,
-            json=json_data,
-            data=data,
-            timeout=timeout,
-        ) as response:
-            # Check for server errors that should be retried
-            if response.status >= 500:
-                from web_fetch.exceptions import ServerError
-
-                raise ServerError(
-                    f"Server error: {response.status} {response.reason}",
-                    status_code=response.status,
-                    url=str(request.url),
-                    headers=dict(response.headers),
-                )
-
-            # Read response content
-            content_bytes = await response.read()
+        return {
+            "method": request.method,
+            "url": str(request.url),
+            "headers": request.headers or {},
+            "params": request.params,
+            "json": json_data,
+            "data": data,
+            "timeout": (
+                ClientTimeout(total=request.timeout_override)
+                if request.timeout_override
+                else None
+            ),
+            "allow_redirects": self.config.follow_redirects,
+        }
+
+    @staticmethod
+    def _check_server_error(response: aiohttp.ClientResponse, url: str) -> None:
+        """Raise ServerError for 5xx responses so they are retried."""
+        if response.status >= 500:
+            from web_fetch.exceptions import ServerError
+
+            raise ServerError(
+                f"Server error: {response.status} {response.reason}",
+                status_code=response.status,
+                url=url,
+                headers=dict(response.headers),
+            )
 
-            # Check response size
-            if len(content_bytes) > self.config.max_response_size:
-                from web_fetch.exceptions import ContentError
+    async def _make_http_request(
+        self, request: FetchRequest, attempt: int
+    ) -> FetchResult:
+        """Make the actual HTTP request without deduplication."""
+        if self._session is None:
+            raise WebFetchError("Session not properly initialized")
 
-                raise ContentError(
-                    f"Response size {len(content_bytes)} exceeds maximum {self.config.max_response_size}",
-                    url=str(request.url),
-                    content_length=len(content_bytes),
+        url = str(request.url)
+        async with self._session.request(**self._request_kwargs(request)) as response:
+            # Check for server errors that should be retried
+            self._check_server_error(response, url)
+
+            # Enforce the size limit before and while reading, so an oversized
+            # chunked body is abandoned instead of buffered in full
+            limit = self.config.max_response_size
+            self._check_declared_size(response, url, limit)
+            content_bytes = await ResponseStream(response, url, limit).read()
+
+            # Parse content based on requested type; keep the HTML document for
+            # the pipeline so its tree is not built a second time
+            parsed_content: Union[str, bytes, Dict[str, Any], List[Any], None]
+            document: Optional[ParsedHTMLDocument] = None
+            if (
+                self.transformation_pipeline
+                and request.content_type == ContentType.HTML
+                and content_bytes
+            ):
+                parsed_content, document = await self._parse_html(
+                    content_bytes, keep_document=True
+                )
+            else:
+                parsed_content = await self._parse_content(
+                    content_bytes, request.content_type, url, dict(response.headers)
                 )
-
-            # Parse content based on requested type
-            parsed_content = await self._parse_content(
-                content_bytes, request.content_type, url, dict(response.headers)
-            )
 
             result = FetchResult(
                 url=str(request.url),
@@ -794,26 +1777,84 @@ class WebFetcher:
                 retry_count=attempt,
             )
 
-            # Apply transformation pipeline if configured
+            # Apply transformation pipeline if configured. After a process pool
+            # parse the document is rebuilt here, once, for every HTML transformer
             if self.transformation_pipeline:
-                try:
-                    transformation_result = (
-                        await self.transformation_pipeline.transform(
-                            parsed_content,
-                            {"url": url, "headers": dict(response.headers)},
-                        )
-                    )
-                    if transformation_result.is_success:
-                        result.content = transformation_result.data
-                except Exception as e:
-                    logger.warning(f"Transformation pipeline failed for {url}: {e}")
+                if document is None and request.content_type == ContentType.HTML:
+                    document = ParsedHTMLDocument.from_bytes(content_bytes)
+                await self._apply_transformations(
+                    self.transformation_pipeline,
+                    result,
+                    dict(response.headers),
+                    document,
+                )
 
-            # Store in enhanced cache if configured
-            if self._enhanced_cache:
+            # Store in enhanced cache if configured; the HTTP cache stores by itself
+            if self._enhanced_cache and not self._http_cache:
                 await self._enhanced_cache.set(url, result, dict(response.headers))
 
             return result
 
+    async def _apply_transformations(
+        self,
+        pipeline: TransformationPipeline,
+        result: FetchResult,
+        headers: Dict[str, str],
+        document: Optional[ParsedHTMLDocument] = None,
+    ) -> None:
+        """
+        Run the transformation pipeline over a result's parsed content.
+
+        document is the response's HTML document, which HTML transformers
+        read the markup and tree from.
+        """
+        context: Dict[str, Any] = {"url": result.url, "headers": headers}
+        if document is not None:
+            context["html_document"] = document
+        try:
+            transformation_result = await pipeline.transform(result.content, context)
+            if transformation_result.is_success:
+                result.content = transformation_result.data
+        except Exception as e:
+            logger.warning(f"Transformation pipeline failed for {result.url}: {e}")
+        finally:
+            if document is not None:
+                document.release()
+
+    async def _parse_html(
+        self, content_bytes: bytes, keep_document: bool = False
+    ) -> Tuple[Dict[str, Any], Optional[ParsedHTMLDocument]]:
+        """
+        Parse an HTML body in the parse executor.
+
+        Args:
+            content_bytes: Raw response content
+            keep_document: Also return the ParsedHTMLDocument, with its tree,
+                when the parse runs in this process
+
+        Returns:
+            Tuple of the structured HTML dict and the document, or None when
+            it was not kept
+
+        Raises:
+            WebFetchError: If the HTML cannot be parsed
+        """
+        try:
+            if keep_document and self._parse_executor.parses_locally(
+                len(content_bytes)
+            ):
+                document = await self._parse_executor.run(
+                    parse_html_document, content_bytes
+                )
+                return document.to_dict(), document
+            html_content: Dict[str, Any] = await self._parse_executor.run(
+                parse_html_bytes, content_bytes
+            )
+            return html_content, None
+        except Exception as e:
+            # Provide specific error context for HTML parsing failures
+            raise WebFetchError(f"Failed to parse HTML content: {e}")
+
     async def _parse_content(
         self,
         content_bytes: bytes,
@@ -875,10 +1916,11 @@ class WebFetcher:
             case ContentType.JSON:
                 # JSON parsing with comprehensive error handling
                 try:
-                    # First decode bytes to string, then parse JSON
-                    # This two-step process allows us to distinguish between encoding and JSON errors
-                    text_content = content_bytes.decode("utf-8")
-                    parsed_json: Union[Dict[str, Any], List[Any]] = json.loads(text_content)
+                    # Decode straight from bytes, skipping an intermediate str
+                    # copy of the body, with the configured json_backend
+                    parsed_json: Union[Dict[str, Any], List[Any]] = self._json_loads(
+                        content_bytes
+                    )
                     return parsed_json
                 except (UnicodeDecodeError, json.JSONDecodeError) as e:
                     # Provide specific error information for debugging
@@ -890,43 +1932,11 @@ class WebFetcher:
                     )
 
             case ContentType.HTML:
-                # HTML parsing with structured data extraction
-                try:
-                    # Decode HTML content to string for BeautifulSoup processing
-                    text_content = content_bytes.decode("utf-8")
-
-                    # Use lxml parser for better performance and HTML5 support
-                    # Falls back to html.parser if lxml is not available
-                    soup = BeautifulSoup(text_content, "lxml")
-
-                    # Extract structured data from HTML for common use cases
-                    return {
-                        # Page title from <title> tag, None if not found
-                        "title": soup.title.string if soup.title else None,
-                        # Clean text content with whitespace stripped
-                        # Useful for content analysis and search indexing
-                        "text": soup.get_text(strip=True),
-                        # All links with href attributes - useful for crawling and link analysis
-                        # Filter out None values and ensure href attribute exists
-                        "links": [
-                            a.get("href")
-                            for a in soup.find_all("a", href=True)
-                            if hasattr(a, "get")
-                        ],
-                        # All images with src attributes - useful for media extraction
-                        # Filter out None values and ensure src attribute exists
-                        "images": [
-                            img.get("src")
-                            for img in soup.find_all("img", src=True)
-                            if hasattr(img, "get")
-                        ],
-                        # Raw HTML content for cases where full HTML is needed
-                        # Useful for custom parsing or HTML transformation
-                        "raw_html": text_content,
-                    }
-                except Exception as e:
-                    # Provide specific error context for HTML parsing failures
-                    raise WebFetchError(f"Failed to parse HTML content: {e}")
+                # HTML parsing with structured data extraction. Tree building and
+                # text/link/image scans are CPU-bound, so they run wherever the
+                # configured parse executor puts them (inline, thread or process)
+                html_content, _ = await self._parse_html(content_bytes)
+                return html_content
 
             case (
                 ContentType.PDF
@@ -988,7 +1998,20 @@ class WebFetcher:
 
     # Enhanced convenience methods
     async def fetch_with_circuit_breaker(self, request: FetchRequest) -> FetchResult:
-        """Fetch a single URL with circuit breaker protection."""
+        """
+        Fetch a single URL with circuit breaker protection.
+
+        Raises:
+            CircuitBreakerError: If the circuit for the URL's host is open
+        """
+        if self._circuit_breakers is not None:
+            if not self._session:
+                await self._create_session()
+            breaker = self._circuit_breakers.breaker_for(str(request.url))
+            return await self._fetch_through_breaker(
+                breaker, request, RequestPriority.NORMAL, None
+            )
+
         result: FetchResult = await with_circuit_breaker(
             url=str(request.url),
             func=self.fetch_single,
@@ -1059,6 +2082,10 @@ class WebFetcher:
 
         Returns:
             BatchFetchResult with all individual results and summary statistics
+
+        Note:
+            All results are held in memory until the batch completes. Use
+            fetch_iter for large or unbounded request streams.
         """
         if not self._session:
             await self._create_session()
@@ -1075,6 +2102,100 @@ class WebFetcher:
 
         return BatchFetchResult.from_results(results, total_time)
 
+    async def fetch_iter(
+        self,
+        requests: Union[AsyncIterable[FetchRequest], Iterable[FetchRequest]],
+        window: Optional[int] = None,
+        stats: Optional[BatchFetchStats] = None,
+    ) -> AsyncIterator[FetchResult]:
+        """
+        Fetch a stream of requests, yielding results as they complete.
+
+        Unlike fetch_batch, requests are pulled from the source lazily and at
+        most window of them are in flight at once, so memory use is bounded by
+        the window rather than the number of requests. There is no limit on
+        the number of requests.
+
+        Args:
+            requests: Sync or async iterable of FetchRequest objects
+            window: Maximum number of requests started but not yet yielded.
+                   Defaults to twice max_concurrent_requests so the scheduler
+                   always has queued work.
+            stats: Optional BatchFetchStats updated with each result before it
+                  is yielded
+
+        Yields:
+            FetchResult objects in completion order
+
+        Example:
+            ```python
+            stats = BatchFetchStats()
+            async with WebFetcher() as fetcher:
+                async for result in fetcher.fetch_iter(read_requests(), stats=stats):
+                    store(result)
+            print(f"Success rate: {stats.success_rate:.1f}%")
+            ```
+        """
+        if not self._session:
+            await self._create_session()
+
+        if window is None:
+            window = self.config.max_concurrent_requests * 2
+        if window < 1:
+            raise ValueError("window must be at least 1")
+
+        if isinstance(requests, AsyncIterable):
+            source = requests.__aiter__()
+        else:
+            source = _aiter_sync(requests)
+
+        pending: set[asyncio.Task[FetchResult]] = set()
+        exhausted = False
+
+        try:
+            while True:
+                # Top up the window before waiting on completions
+                exhausted = exhausted or await self._fill_window(
+                    source, pending, window
+                )
+                if not pending:
+                    return
+
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    result = task.result()
+                    if stats is not None:
+                        stats.record(result)
+                    yield result
+        finally:
+            # Consumer stopped early or failed: cancel in-flight requests
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _fill_window(
+        self,
+        source: AsyncIterator[FetchRequest],
+        pending: set[asyncio.Task[FetchResult]],
+        window: int,
+    ) -> bool:
+        """
+        Start requests from source until window of them are pending.
+
+        Returns:
+            True if source is exhausted
+        """
+        while len(pending) < window:
+            try:
+                request = await source.__anext__()
+            except StopAsyncIteration:
+                return True
+            pending.add(asyncio.create_task(self.fetch_single(request)))
+        return False
+
     @asynccontextmanager
     async def session_context(self) -> AsyncGenerator[WebFetcher, None]:
         """
@@ -1102,3 +2223,9 @@ class WebFetcher:
             yield self
         finally:
             await self.close()
+
+
+async def _aiter_sync(items: Iterable[FetchRequest]) -> AsyncIterator[FetchRequest]:
+    """Adapt a synchronous iterable to an async iterator."""
+    for item in items:
+        yield item
@@ -8,9 +8,11 @@ connection pooling, and both active and passive modes.
 from __future__ import annotations
 
 import asyncio
+import time
+from collections import deque
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional, AsyncIterator
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 import aioftp
@@ -22,22 +24,49 @@ from .profiler import get_profiler
 from .circuit_breaker import get_circuit_breaker, CircuitBreakerError
 
 
+# Idle connections older than this are closed by the maintenance task
+IDLE_TIMEOUT = 300.0
+
+
+class _HostPool:
+    """Connections to one host:port:user with its own capacity limit."""
+
+    def __init__(self, limit: int, info: FTPConnectionInfo):
+        # Held for the life of every checked-out, connecting or checked
+        # connection, so at most `limit` exist per host
+        self.slots = asyncio.Semaphore(limit)
+        self.idle: Deque[Tuple[aioftp.Client, float]] = deque()
+        self.in_use = 0
+        self.connecting = 0
+        self.info = info
+
+    @property
+    def size(self) -> int:
+        """Connections that exist or are being opened."""
+        return len(self.idle) + self.in_use + self.connecting
+
+
 class FTPConnectionPool:
     """
     Connection pool for FTP connections with automatic cleanup and reuse.
+
+    Each host (host:port:user) has its own pool whose semaphore bounds the
+    number of connections to that host. No lock is shared between hosts and
+    none is held while connecting, so a slow server only delays its own
+    callers. Idle connections are health-checked in the background rather
+    than on checkout, and the first use of a host can pre-warm
+    ``config.prewarm_connections`` connections.
     """
 
     def __init__(self, config: FTPConfig):
         """Initialize the connection pool."""
         self.config = config
-        self._connections: Dict[str, List[aioftp.Client]] = {}
-        self._connection_info: Dict[str, FTPConnectionInfo] = {}
-        self._lock = asyncio.Lock()
+        self._pools: Dict[str, _HostPool] = {}
         self._cleanup_task: Optional[asyncio.Task[None]] = None
+        self._prewarm_tasks: Set[asyncio.Task[Any]] = set()
         self._metrics = get_metrics_collector() if config.performance_monitoring else None
         self._profiler = get_profiler() if config.performance_monitoring else None
         self._circuit_breaker = get_circuit_breaker() if config.performance_monitoring else None
-        self._last_activity: Dict[str, float] = {}  # Track last activity per connection key
         self._start_cleanup_task()
 
     def _start_cleanup_task(self) -> None:
@@ -53,39 +82,22 @@ class FTPConnectionPool:
 
     def _ensure_cleanup_task(self) -> None:
         """Ensure the cleanup task is running if there's an event loop."""
-        try:
-            asyncio.get_running_loop()
-            if self._cleanup_task is None or self._cleanup_task.done():
-                self._cleanup_task = asyncio.create_task(self._cleanup_connections())
-        except RuntimeError:
-            # No event loop running, skip task creation
-            pass
+        self._start_cleanup_task()
 
     async def _cleanup_connections(self) -> None:
-        """Background task to clean up idle connections with adaptive intervals."""
-        base_interval = 60  # Base cleanup interval in seconds
-        min_interval = 30   # Minimum cleanup interval
-        max_interval = 300  # Maximum cleanup interval
-
+        """Background task health-checking idle connections and closing stale ones."""
         while True:
             try:
-                # Calculate adaptive cleanup interval based on activity
-                if self.config.adaptive_cleanup_interval:
-                    total_connections = sum(len(conns) for conns in self._connections.values())
-                    activity_factor = min(total_connections / 10, 2.0)  # Scale based on connection count
-                    cleanup_interval = max(min_interval, min(base_interval / activity_factor, max_interval))
-                else:
-                    cleanup_interval = base_interval
+                interval = self.config.health_check_interval
+                if self.config.adaptive_cleanup_interval and not any(
+                    pool.idle for pool in self._pools.values()
+                ):
+                    # Nothing to check; wake up less often
+                    interval *= 4
 
-                await asyncio.sleep(cleanup_interval)
+                await asyncio.sleep(interval)
                 await self._cleanup_idle_connections()
 
-                # Record cleanup operation in metrics
-                if self._metrics:
-                    for key in self._connection_info:
-                        host, port = key.split(':')[:2]
-                        self._metrics.record_connection_created(host, int(port))
-
             except asyncio.CancelledError:
                 break
             except Exception:
@@ -93,44 +105,51 @@ class FTPConnectionPool:
                 pass
 
     async def _cleanup_idle_connections(self) -> None:
-        """Remove idle connections that have exceeded the timeout."""
-        async with self._lock:
-            current_time = datetime.now()
-            keys_to_remove: List[str] = []
-
-            for key, info in self._connection_info.items():
-                if (current_time - info.last_used).total_seconds() > 300:  # 5 minutes
-                    keys_to_remove.append(key)
-
-            for key in keys_to_remove:
-                if key in self._connections:
-                    connections = self._connections[key]
-                    for conn in connections:
-                        try:
-                            await conn.quit()
-                        except Exception:
-                            pass
-                    del self._connections[key]
-                if key in self._connection_info:
-                    del self._connection_info[key]
+        """Close idle connections past IDLE_TIMEOUT and NOOP-check the rest."""
+        now = time.monotonic()
+        for key, pool in list(self._pools.items()):
+            for _ in range(len(pool.idle)):
+                if pool.slots.locked() or not pool.idle:
+                    # Every slot is in use; check again next round
+                    break
+                async with pool.slots:
+                    # Oldest first; the connection is out of the idle list
+                    # while it is checked so it cannot be handed out
+                    client, last_used = pool.idle.popleft()
+                    keep = False
+                    try:
+                        keep = now - last_used <= IDLE_TIMEOUT and (
+                            not self.config.connection_health_check
+                            or await self._is_healthy(client)
+                        )
+                    finally:
+                        # Also reached on cancellation, so nothing leaks
+                        if keep:
+                            pool.idle.append((client, last_used))
+                        else:
+                            await self._close_client(client)
+            self._report_pool_state(pool)
+
+    async def _is_healthy(self, client: aioftp.Client) -> bool:
+        try:
+            await asyncio.wait_for(client.command("NOOP", "2xx"), self.config.connection_timeout)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    async def _close_client(client: aioftp.Client) -> None:
+        try:
+            await client.quit()
+        except Exception:
+            client.close()
 
     def _get_connection_key(self, host: str, port: int, username: Optional[str]) -> str:
         """Generate a unique key for connection pooling."""
         return f"{host}:{port}:{username or 'anonymous'}"
 
-    @asynccontextmanager
-    async def get_connection(self, url: str) -> AsyncIterator[aioftp.Client]:
-        """
-        Get an FTP connection from the pool or create a new one.
-
-        Args:
-            url: FTP URL to connect to
-
-        Yields:
-            aioftp.Client: FTP client connection
-        """
-        # Ensure cleanup task is running now that we have an event loop
-        self._ensure_cleanup_task()
+    def _resolve(self, url: str) -> Tuple[str, str, int, Optional[str], Optional[str], bool]:
+        """Get (key, host, port, username, password, secure) for a URL."""
         parsed = urlparse(url)
         host = parsed.hostname or "localhost"
         port = parsed.port or 21
@@ -142,84 +161,159 @@ class FTPConnectionPool:
             username = self.config.username
             password = self.config.password
 
-        connection_key = self._get_connection_key(host, port, username)
+        key = self._get_connection_key(host, port, username)
+        return key, host, port, username, password, parsed.scheme == "ftps"
+
+    def _get_pool(
+        self, key: str, host: str, port: int, username: Optional[str], secure: bool
+    ) -> Tuple[_HostPool, bool]:
+        """Get the pool for key, creating it on first use."""
+        pool = self._pools.get(key)
+        if pool is not None:
+            return pool, False
+        now = datetime.now()
+        pool = _HostPool(
+            self.config.max_connections_per_host,
+            FTPConnectionInfo(
+                host=host,
+                port=port,
+                username=username,
+                is_secure=secure,
+                created_at=now,
+                last_used=now,
+                connection_count=0,
+            ),
+        )
+        self._pools[key] = pool
+        return pool, True
+
+    def _report_pool_state(self, pool: _HostPool) -> None:
+        if self._metrics:
+            self._metrics.update_connection_pool_state(
+                pool.info.host, pool.info.port, pool.in_use, len(pool.idle)
+            )
+
+    async def _open(
+        self,
+        pool: _HostPool,
+        host: str,
+        port: int,
+        username: Optional[str],
+        password: Optional[str],
+    ) -> aioftp.Client:
+        """Open a connection for pool; the caller holds one of its slots."""
+        pool.connecting += 1
+        try:
+            client = await self._create_connection(host, port, username, password)
+        except Exception:
+            if self._metrics:
+                self._metrics.record_connection_failed(host, port)
+            raise
+        finally:
+            pool.connecting -= 1
+        if self._metrics:
+            self._metrics.record_connection_created(host, port)
+        return client
+
+    async def prewarm(self, url: str, count: Optional[int] = None) -> int:
+        """
+        Open idle connections to a host ahead of use.
 
-        async with self._lock:
-            # Try to get existing connection
-            if (
-                connection_key in self._connections
-                and self._connections[connection_key]
-            ):
-                client = self._connections[connection_key].pop()
+        Args:
+            url: FTP URL identifying the host and credentials
+            count: Connections the host should have, counting those in use;
+                defaults to config.prewarm_connections, capped at
+                max_connections_per_host
 
-                # Perform health check if enabled
-                if self.config.connection_health_check:
-                    try:
-                        # Simple health check - send NOOP command
-                        await client.command("NOOP")
-                        connection_healthy = True
-                    except Exception:
-                        connection_healthy = False
-                        try:
-                            await client.quit()
-                        except Exception:
-                            pass
-                else:
-                    connection_healthy = True
+        Returns:
+            Number of connections opened
+        """
+        key, host, port, username, password, secure = self._resolve(url)
+        pool, _ = self._get_pool(key, host, port, username, secure)
+        wanted = min(
+            self.config.prewarm_connections if count is None else count,
+            self.config.max_connections_per_host,
+        )
+
+        async def open_one() -> bool:
+            async with pool.slots:
+                if pool.size >= wanted:
+                    return False
+                client = await self._open(pool, host, port, username, password)
+                pool.idle.append((client, time.monotonic()))
+                return True
+
+        missing = max(0, wanted - pool.size)
+        outcomes = await asyncio.gather(
+            *(open_one() for _ in range(missing)), return_exceptions=True
+        )
+        self._report_pool_state(pool)
+        return sum(outcome is True for outcome in outcomes)
+
+    def _prewarm_in_background(self, url: str) -> None:
+        task = asyncio.create_task(self.prewarm(url))
+        self._prewarm_tasks.add(task)
+        task.add_done_callback(self._prewarm_tasks.discard)
+        # Failures surface on the next real checkout instead
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    @asynccontextmanager
+    async def get_connection(self, url: str) -> AsyncIterator[aioftp.Client]:
+        """
+        Get an FTP connection from the pool or create a new one.
 
-                if connection_healthy:
-                    self._connection_info[connection_key].last_used = datetime.now()
-                    self._connection_info[connection_key].connection_count += 1
-                    self._last_activity[connection_key] = time.time()
+        Waits only for a free slot on this URL's host; connecting happens
+        without holding any lock. A connection whose use raised an error
+        other than an FTP status reply is closed instead of being returned.
 
-                    # Record connection reuse in metrics
-                    if self._metrics:
-                        self._metrics.record_connection_reused(host, port)
-                else:
-                    # Health check failed, create new connection
-                    client = await self._create_connection(host, port, username, password)
-                    if self._metrics:
-                        self._metrics.record_connection_created(host, port)
-            else:
-                # Create new connection
-                client = await self._create_connection(host, port, username, password)
-                if self._metrics:
-                    self._metrics.record_connection_created(host, port)
-
-                # Update connection info
-                if connection_key not in self._connection_info:
-                    self._connection_info[connection_key] = FTPConnectionInfo(
-                        host=host,
-                        port=port,
-                        username=username,
-                        is_secure=parsed.scheme == "ftps",
-                        created_at=datetime.now(),
-                        last_used=datetime.now(),
-                        connection_count=1,
-                    )
-                else:
-                    self._connection_info[connection_key].last_used = datetime.now()
-                    self._connection_info[connection_key].connection_count += 1
+        Args:
+            url: FTP URL to connect to
 
+        Yields:
+            aioftp.Client: FTP client connection
+        """
+        # Ensure cleanup task is running now that we have an event loop
+        self._ensure_cleanup_task()
+        key, host, port, username, password, secure = self._resolve(url)
+        pool, created = self._get_pool(key, host, port, username, secure)
+        if created and self.config.prewarm_connections > 1:
+            self._prewarm_in_background(url)
+
+        started = time.perf_counter()
+        await pool.slots.acquire()
+        if self._metrics:
+            self._metrics.record_pool_wait(host, port, time.perf_counter() - started)
+
+        reusable = True
         try:
-            yield client
-        finally:
-            # Return connection to pool
-            async with self._lock:
-                if connection_key not in self._connections:
-                    self._connections[connection_key] = []
-
-                # Only keep up to max_connections_per_host connections
-                if (
-                    len(self._connections[connection_key])
-                    < self.config.max_connections_per_host
-                ):
-                    self._connections[connection_key].append(client)
+            if pool.idle:
+                client, _ = pool.idle.pop()
+                if self._metrics:
+                    self._metrics.record_connection_reused(host, port)
+            else:
+                client = await self._open(pool, host, port, username, password)
+
+            pool.in_use += 1
+            pool.info.last_used = datetime.now()
+            pool.info.connection_count += 1
+            self._report_pool_state(pool)
+            try:
+                yield client
+            except aioftp.StatusCodeError:
+                # The server answered; the control connection is still usable
+                raise
+            except BaseException:
+                reusable = False
+                raise
+            finally:
+                pool.in_use -= 1
+                if reusable:
+                    pool.idle.append((client, time.monotonic()))
                 else:
-                    try:
-                        await client.quit()
-                    except Exception:
-                        pass
+                    await self._close_client(client)
+                self._report_pool_state(pool)
+        finally:
+            pool.slots.release()
 
     async def _create_connection(
         self, host: str, port: int, username: Optional[str], password: Optional[str]
@@ -271,41 +365,38 @@ class FTPConnectionPool:
 
     async def close_all(self) -> None:
         """Close all connections in the pool."""
+        tasks = list(self._prewarm_tasks)
         if self._cleanup_task:
-            self._cleanup_task.cancel()
-            try:
-                await self._cleanup_task
-            except asyncio.CancelledError:
-                pass
+            tasks.append(self._cleanup_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
-        async with self._lock:
-            for connections in self._connections.values():
-                for conn in connections:
-                    try:
-                        await conn.quit()
-                    except Exception:
-                        pass
+        for pool in self._pools.values():
+            while pool.idle:
+                client, _ = pool.idle.pop()
+                await self._close_client(client)
 
-            self._connections.clear()
-            self._connection_info.clear()
+        self._pools.clear()
 
     def get_pool_stats(self) -> Dict[str, Any]:
         """Get statistics about the connection pool."""
         return {
-            "total_connection_keys": len(self._connection_info),
-            "active_connections": sum(
-                len(conns) for conns in self._connections.values()
-            ),
+            "total_connection_keys": len(self._pools),
+            "active_connections": sum(pool.in_use for pool in self._pools.values()),
+            "idle_connections": sum(len(pool.idle) for pool in self._pools.values()),
             "connection_info": {
                 key: {
-                    "host": info.host,
-                    "port": info.port,
-                    "username": info.username,
-                    "is_secure": info.is_secure,
-                    "created_at": info.created_at.isoformat(),
-                    "last_used": info.last_used.isoformat(),
-                    "connection_count": info.connection_count,
+                    "host": pool.info.host,
+                    "port": pool.info.port,
+                    "username": pool.info.username,
+                    "is_secure": pool.info.is_secure,
+                    "created_at": pool.info.created_at.isoformat(),
+                    "last_used": pool.info.last_used.isoformat(),
+                    "connection_count": pool.info.connection_count,
+                    "in_use": pool.in_use,
+                    "idle": len(pool.idle),
                 }
-                for key, info in self._connection_info.items()
+                for key, pool in self._pools.items()
             },
         }
@@ -354,6 +354,7 @@ class FTPFetcher:
         local_path: Path,
         file_info: FTPFileInfo,
         expected_checksums: Optional[Dict[str, str]] = None,
+        checksum: Optional[str] = None,
     ) -> bool:
         """
         Verify a downloaded file.
@@ -362,12 +363,14 @@ class FTPFetcher:
             local_path: Path to the downloaded file
             file_info: Information about the original file
             expected_checksums: Optional dictionary of expected checksums
+            checksum: FTPResult.checksum from the download, which spares
+                reading the file again
 
         Returns:
             True if verification passes, False otherwise
         """
         result = await self.verification_manager.verify_file(
-            local_path, file_info, expected_checksums
+            local_path, file_info, expected_checksums, checksum
         )
         return result.is_valid
 
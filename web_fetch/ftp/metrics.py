@@ -64,6 +64,16 @@ class ConnectionPoolMetrics:
     failed_connections: int = 0
     cleanup_operations: int = 0
     average_connection_lifetime: float = 0.0
+    wait_count: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+    @property
+    def average_wait_time(self) -> float:
+        """Get average time spent waiting for a pooled connection."""
+        if self.wait_count == 0:
+            return 0.0
+        return self.total_wait_time / self.wait_count
     
     @property
     def reuse_ratio(self) -> float:
@@ -171,6 +181,26 @@ class FTPMetricsCollector:
                 self._connection_metrics[key] = ConnectionPoolMetrics(host, port)
             self._connection_metrics[key].total_connections_reused += 1
     
+    def record_connection_failed(self, host: str, port: int) -> None:
+        """Record a failed connection attempt."""
+        with self._lock:
+            key = f"{host}:{port}"
+            if key not in self._connection_metrics:
+                self._connection_metrics[key] = ConnectionPoolMetrics(host, port)
+            self._connection_metrics[key].failed_connections += 1
+
+    def record_pool_wait(self, host: str, port: int, wait_seconds: float) -> None:
+        """Record time spent waiting for a free connection slot."""
+        with self._lock:
+            key = f"{host}:{port}"
+            if key not in self._connection_metrics:
+                self._connection_metrics[key] = ConnectionPoolMetrics(host, port)
+
+            metrics = self._connection_metrics[key]
+            metrics.wait_count += 1
+            metrics.total_wait_time += wait_seconds
+            metrics.max_wait_time = max(metrics.max_wait_time, wait_seconds)
+
     def update_connection_pool_state(self, host: str, port: int, 
                                    active: int, idle: int) -> None:
         """Update connection pool state."""
@@ -269,7 +299,9 @@ class FTPMetricsCollector:
                 "pool_details": {k: {
                     "reuse_ratio": v.reuse_ratio,
                     "total_connections": v.total_connections,
-                    "failed_connections": v.failed_connections
+                    "failed_connections": v.failed_connections,
+                    "average_wait_time": v.average_wait_time,
+                    "max_wait_time": v.max_wait_time
                 } for k, v in self._connection_metrics.items()}
             }
     
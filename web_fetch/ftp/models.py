@@ -45,6 +45,7 @@ class FTPVerificationMethod(str, Enum):
     SIZE = "size"
     MD5 = "md5"
     SHA256 = "sha256"
+    CRC32 = "crc32"  # Fast, non-cryptographic
     NONE = "none"
 
 
@@ -95,7 +96,13 @@ class FTPConfig(BaseModel):
         default=True, description="Enable adaptive chunk sizing based on transfer performance"
     )
     connection_health_check: bool = Field(
-        default=True, description="Enable connection health checks before reuse"
+        default=True, description="Enable background health checks of idle connections"
+    )
+    health_check_interval: float = Field(
+        default=30.0, gt=0, description="Seconds between idle connection health checks"
+    )
+    prewarm_connections: int = Field(
+        default=0, ge=0, le=15, description="Connections to open when a host is first used"
     )
     adaptive_cleanup_interval: bool = Field(
         default=True, description="Enable adaptive connection cleanup based on usage patterns"
@@ -210,6 +217,9 @@ class FTPResult:
     file_info: Optional[FTPFileInfo] = None
     files_list: Optional[List[FTPFileInfo]] = None
     verification_result: Optional[Dict[str, Any]] = None
+    # Digest computed while the file was transferred, for checksum methods
+    checksum: Optional[str] = None
+    checksum_algorithm: Optional[str] = None
 
     @property
     def is_success(self) -> bool:
@@ -8,7 +8,6 @@ and directory traversal with proper error handling.
 from __future__ import annotations
 
 import asyncio
-import hashlib
 import os
 import time
 from datetime import datetime
@@ -39,6 +38,12 @@ from .metrics import get_metrics_collector
 from .profiler import get_profiler
 from .circuit_breaker import get_circuit_breaker, CircuitBreakerError
 from .retry import get_retry_manager, RetryableError
+from .verification import (
+    CHECKSUM_METHODS,
+    checksum_fields,
+    hashing_writer,
+    start_checksum,
+)
 
 
 # Helper types matching aioftp list/stat structures
@@ -392,6 +397,13 @@ class FTPFileOperations:
                         file_info=file_info,
                     )
 
+            checksum = await start_checksum(
+                self.config.verification_method,
+                local_path,
+                resume_position,
+                self.config.max_chunk_size,
+            )
+
             async with self.connection_pool.get_connection(url) as client:
                 parsed = urlparse(url)
                 remote_path = parsed.path
@@ -405,6 +417,7 @@ class FTPFileOperations:
                 # Open local file for writing
                 mode = "ab" if resume_position > 0 else "wb"
                 async with aiofiles.open(local_path, mode) as local_file:
+                    write = hashing_writer(local_file.write, checksum)
                     # Start download with resume if needed
                     if resume_position > 0:
                         await client.command(f"REST {resume_position}")
@@ -416,7 +429,7 @@ class FTPFileOperations:
                         current_chunk_size = self._get_adaptive_chunk_size(host)
 
                         async for chunk in stream.iter_by_block(current_chunk_size):
-                            await local_file.write(chunk)
+                            await write(chunk)
                             bytes_transferred += len(chunk)
 
                             # Update metrics
@@ -460,10 +473,16 @@ class FTPFileOperations:
                                 if actual_time < expected_time:
                                     await asyncio.sleep(expected_time - actual_time)
 
+            digest, algorithm = checksum_fields(
+                self.config.verification_method, checksum
+            )
+
             # Verify download if configured
             verification_result = None
             if self.config.verification_method != FTPVerificationMethod.NONE:
-                verification_result = await self._verify_file(local_path, file_info)
+                verification_result = await self._verify_file(
+                    local_path, file_info, digest
+                )
                 if not verification_result.is_valid:
                     raise FTPVerificationError(
                         f"File verification failed: {verification_result.error}",
@@ -492,6 +511,8 @@ class FTPFileOperations:
                     if verification_result
                     else None
                 ),
+                checksum=digest,
+                checksum_algorithm=algorithm,
             )
 
         except Exception as e:
@@ -516,7 +537,10 @@ class FTPFileOperations:
             )
 
     async def _verify_file(
-        self, local_path: Path, file_info: FTPFileInfo
+        self,
+        local_path: Path,
+        file_info: FTPFileInfo,
+        checksum: Optional[str] = None,
     ) -> FTPVerificationResult:
         """
         Verify downloaded file integrity.
@@ -524,6 +548,8 @@ class FTPFileOperations:
         Args:
             local_path: Path to the downloaded file
             file_info: Information about the original file
+            checksum: Digest computed while downloading; the file is only
+                read back to hash it when this is None
 
         Returns:
             FTPVerificationResult with verification details
@@ -555,22 +581,17 @@ class FTPFileOperations:
                     ),
                 )
 
-            elif self.config.verification_method in [
-                FTPVerificationMethod.MD5,
-                FTPVerificationMethod.SHA256,
-            ]:
-                # Calculate file hash
-                hash_func = (
-                    hashlib.md5()
-                    if self.config.verification_method == FTPVerificationMethod.MD5
-                    else hashlib.sha256()
-                )
-
-                async with aiofiles.open(local_path, "rb") as f:
-                    while chunk := await f.read(self.config.chunk_size):
-                        hash_func.update(chunk)
-
-                actual_hash = hash_func.hexdigest()
+            elif self.config.verification_method in CHECKSUM_METHODS:
+                actual_hash = checksum
+                if actual_hash is None:
+                    hash_func = await start_checksum(
+                        self.config.verification_method,
+                        local_path,
+                        local_path.stat().st_size,
+                        self.config.chunk_size,
+                    )
+                    assert hash_func is not None
+                    actual_hash = hash_func.hexdigest()
 
                 # For now, we can't get the expected hash from FTP server
                 # This would need to be provided externally or calculated on server
@@ -15,6 +15,12 @@ from enum import Enum
 from typing import Any, Callable, Dict, Optional, TypeVar, Union
 import logging
 
+from ..utils.retry import (
+    GLOBAL_KEY,
+    RetryEngine,
+    decorrelated_jitter,
+    retry_after_from,
+)
 from .circuit_breaker import CircuitBreakerError, get_circuit_breaker
 from .metrics import get_metrics_collector
 
@@ -100,20 +106,40 @@ class FTPRetryManager:
     adaptive delays, and comprehensive error handling.
     """
     
-    def __init__(self, config: Optional[RetryConfig] = None):
+    def __init__(
+        self,
+        config: Optional[RetryConfig] = None,
+        engine: Optional[RetryEngine] = None,
+    ):
         """Initialize the retry manager."""
         self.config = config or RetryConfig()
+        # Retries are drawn from the shared budget, keyed by host
+        self._engine = engine or RetryEngine(
+            base_delay=self.config.base_delay,
+            max_delay=self.config.max_delay,
+            jitter=self.config.jitter,
+        )
         self._metrics = get_metrics_collector()
         self._circuit_breaker = get_circuit_breaker()
         self._attempt_history: dict[str, list[RetryAttempt]] = {}
         self._success_rates: dict[str, float] = {}
     
-    def _calculate_delay(self, attempt: int, operation_key: Optional[str] = None) -> float:
+    def _calculate_delay(
+        self,
+        attempt: int,
+        operation_key: Optional[str] = None,
+        previous_delay: float = 0.0,
+    ) -> float:
         """Calculate delay for the given attempt number."""
         if self.config.strategy == RetryStrategy.FIXED_DELAY:
             delay = self.config.base_delay
         
         elif self.config.strategy == RetryStrategy.EXPONENTIAL_BACKOFF:
+            if self.config.jitter:
+                # Decorrelated jitter is already randomised
+                return decorrelated_jitter(
+                    self.config.base_delay, previous_delay, self.config.max_delay
+                )
             delay = self.config.base_delay * (self.config.backoff_factor ** (attempt - 1))
         
         elif self.config.strategy == RetryStrategy.LINEAR_BACKOFF:
@@ -155,6 +181,31 @@ class FTPRetryManager:
         
         return base_delay * adjustment
     
+    def _next_delay(
+        self,
+        operation_key: str,
+        budget_key: str,
+        attempt: int,
+        previous_delay: float,
+        error: Exception,
+    ) -> Optional[float]:
+        """Delay before the attempt after a failed one, or None to stop retrying."""
+        # If this is the last attempt, don't continue
+        if attempt >= self.config.max_attempts:
+            return None
+
+        # Draw from the retry budget and honour any server-requested delay
+        next_delay = self._engine.next_delay(
+            budget_key,
+            attempt - 1,
+            previous_delay,
+            retry_after_from(error),
+            delay=self._calculate_delay(attempt + 1, operation_key, previous_delay),
+        )
+        if next_delay is None:
+            logger.debug(f"Retry budget exhausted for {operation_key}")
+        return next_delay
+
     def _calculate_timeout(self, attempt: int) -> float:
         """Calculate timeout for the given attempt number."""
         if not self.config.progressive_timeout:
@@ -223,6 +274,7 @@ class FTPRetryManager:
         func: Callable[..., T],
         *args: Any,
         operation_key: Optional[str] = None,
+        host: Optional[str] = None,
         **kwargs: Any
     ) -> T:
         """
@@ -232,6 +284,8 @@ class FTPRetryManager:
             func: Function to execute
             *args: Arguments to pass to the function
             operation_key: Key for tracking operation-specific metrics
+            host: FTP host the operation talks to; retries are drawn from its
+                retry budget as well as the process-wide one
             **kwargs: Keyword arguments to pass to the function
         
         Returns:
@@ -245,11 +299,13 @@ class FTPRetryManager:
         
         last_exception = None
         attempts = []
+        delay = 0.0
+        budget_key = host or GLOBAL_KEY
         
         for attempt in range(1, self.config.max_attempts + 1):
-            # Calculate delay and timeout for this attempt
-            delay = self._calculate_delay(attempt, operation_key) if attempt > 1 else 0.0
+            # Delay was decided when the previous attempt failed
             timeout = self._calculate_timeout(attempt)
+            self._engine.record_attempt(budget_key)
             
             retry_attempt = RetryAttempt(
                 attempt_number=attempt,
@@ -300,9 +356,10 @@ class FTPRetryManager:
                     logger.debug(f"Not retrying {operation_key} after attempt {attempt}: {type(e).__name__}")
                     break
                 
-                # If this is the last attempt, don't continue
-                if attempt >= self.config.max_attempts:
+                next_delay = self._next_delay(operation_key, budget_key, attempt, delay, e)
+                if next_delay is None:
                     break
+                delay = next_delay
         
         # All retries failed - update metrics and raise last exception
         self._update_success_rate(operation_key, False)
@@ -17,10 +17,17 @@ import aiofiles
 
 from ..exceptions import ErrorHandler, FTPError
 from .connection import FTPConnectionPool
-from .models import FTPConfig, FTPProgressInfo, FTPResult, FTPTransferMode
+from .models import (
+    FTPConfig,
+    FTPProgressInfo,
+    FTPResult,
+    FTPTransferMode,
+    FTPVerificationMethod,
+)
 from .operations import FTPFileOperations
 from .metrics import get_metrics_collector
 from .profiler import get_profiler
+from .verification import checksum_fields, hashing_writer, start_checksum
 
 
 class FTPStreamingDownloader:
@@ -214,21 +221,33 @@ class FTPStreamingDownloader:
                         file_info=file_info,
                     )
 
+            checksum = await start_checksum(
+                self.config.verification_method,
+                local_path,
+                resume_position,
+                self.config.max_chunk_size,
+            )
+
             # Open file for writing
             mode = "ab" if resume_position > 0 else "wb"
             async with aiofiles.open(local_path, mode) as local_file:
+                write = hashing_writer(local_file.write, checksum)
                 # Stream download and write to file
                 async for chunk in self.stream_download(
                     url, local_path, progress_callback
                 ):
-                    await local_file.write(chunk)
+                    await write(chunk)
                     bytes_transferred += len(chunk)
 
+            digest, algorithm = checksum_fields(
+                self.config.verification_method, checksum
+            )
+
             # Verify download if configured
             verification_result = None
             if self.config.verification_method.value != "none":
                 verification_result = await self.file_operations._verify_file(
-                    local_path, file_info
+                    local_path, file_info, digest
                 )
                 if not verification_result.is_valid:
                     from ..exceptions import FTPVerificationError
@@ -256,6 +275,8 @@ class FTPStreamingDownloader:
                     if verification_result
                     else None
                 ),
+                checksum=digest,
+                checksum_algorithm=algorithm,
             )
 
         except Exception as e:
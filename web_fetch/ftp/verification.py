@@ -8,8 +8,9 @@ and validation for FTP downloads with multiple verification methods.
 from __future__ import annotations
 
 import hashlib
+import zlib
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol, Tuple
 
 import aiofiles
 
@@ -20,6 +21,150 @@ from .models import (
     FTPVerificationResult,
 )
 
+# Verification methods whose digest is computed from the file contents
+CHECKSUM_METHODS = (
+    FTPVerificationMethod.MD5,
+    FTPVerificationMethod.SHA256,
+    FTPVerificationMethod.CRC32,
+)
+
+
+class Checksum(Protocol):
+    """Incremental hash with the hashlib update/hexdigest interface."""
+
+    def update(self, data: Any, /) -> None: ...
+
+    def hexdigest(self) -> str: ...
+
+
+class CRC32Checksum:
+    """CRC-32 with the hashlib interface; much faster than MD5 or SHA-256."""
+
+    def __init__(self) -> None:
+        self._value = 0
+
+    def update(self, data: Any, /) -> None:
+        self._value = zlib.crc32(data, self._value)
+
+    def hexdigest(self) -> str:
+        return f"{self._value:08x}"
+
+
+def new_checksum(method: FTPVerificationMethod | str) -> Optional[Checksum]:
+    """
+    Create an incremental checksum for a verification method.
+
+    Args:
+        method: Verification method or algorithm name (md5, sha256, crc32)
+
+    Returns:
+        Checksum object, or None if method is not a checksum method
+    """
+    try:
+        method = FTPVerificationMethod(method.lower())
+    except ValueError:
+        return None
+    if method == FTPVerificationMethod.MD5:
+        return hashlib.md5()
+    if method == FTPVerificationMethod.SHA256:
+        return hashlib.sha256()
+    if method == FTPVerificationMethod.CRC32:
+        return CRC32Checksum()
+    return None
+
+
+async def hash_file_prefix(
+    path: Path, checksum: Checksum, length: int, chunk_size: int = 1024 * 1024
+) -> None:
+    """
+    Feed the first length bytes of a file into checksum.
+
+    Used when resuming a download so that only the part already on disk is
+    read back, and the rest is hashed as it arrives.
+
+    Args:
+        path: File to read
+        checksum: Checksum to update
+        length: Number of bytes to hash
+        chunk_size: Bytes read at a time
+    """
+    async with aiofiles.open(path, "rb") as f:
+        while length > 0:
+            chunk = await f.read(min(chunk_size, length))
+            if not chunk:
+                break
+            checksum.update(chunk)
+            length -= len(chunk)
+
+
+async def start_checksum(
+    method: FTPVerificationMethod | str,
+    local_path: Path,
+    resume_position: int,
+    chunk_size: int = 1024 * 1024,
+) -> Optional[Checksum]:
+    """
+    Create the checksum for a download, seeded with any resumed prefix.
+
+    Hashing inline means verification never re-reads the file; on resume
+    only the part already on disk is read back.
+
+    Args:
+        method: Verification method
+        local_path: Download destination
+        resume_position: Bytes already on disk
+        chunk_size: Bytes read at a time when hashing the prefix
+
+    Returns:
+        Checksum to update with each downloaded chunk, or None if method
+        does not use one
+    """
+    checksum = new_checksum(method)
+    if checksum is not None and resume_position > 0:
+        await hash_file_prefix(local_path, checksum, resume_position, chunk_size)
+    return checksum
+
+
+def hashing_writer(
+    write: Callable[[bytes], Awaitable[Any]], checksum: Optional[Checksum]
+) -> Callable[[bytes], Awaitable[Any]]:
+    """
+    Wrap an async file write so each chunk also updates checksum.
+
+    Args:
+        write: Async write method of the destination file
+        checksum: Checksum from start_checksum(), or None
+
+    Returns:
+        write itself when checksum is None, otherwise a hashing wrapper
+    """
+    if checksum is None:
+        return write
+
+    async def write_and_hash(chunk: bytes) -> Any:
+        checksum.update(chunk)
+        return await write(chunk)
+
+    return write_and_hash
+
+
+def checksum_fields(
+    method: FTPVerificationMethod | str, checksum: Optional[Checksum]
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Get the checksum and checksum_algorithm fields of an FTPResult.
+
+    Args:
+        method: Verification method the checksum was created for
+        checksum: Checksum from start_checksum(), or None
+
+    Returns:
+        Tuple of (hex digest, algorithm name), both None without a checksum
+    """
+    if checksum is None:
+        return None, None
+    return checksum.hexdigest(), FTPVerificationMethod(method).value
+
 
 class FTPVerificationManager:
     """
@@ -35,6 +180,7 @@ class FTPVerificationManager:
         local_path: Path,
         file_info: FTPFileInfo,
         expected_checksums: Optional[Dict[str, str]] = None,
+        checksum: Optional[str] = None,
     ) -> FTPVerificationResult:
         """
         Verify a downloaded file using the configured verification method.
@@ -43,6 +189,8 @@ class FTPVerificationManager:
             local_path: Path to the downloaded file
             file_info: Information about the original file
             expected_checksums: Optional dictionary of expected checksums
+            checksum: Digest computed during the download (FTPResult.checksum);
+                when given, the file is not read again
 
         Returns:
             FTPVerificationResult with verification details
@@ -71,22 +219,17 @@ class FTPVerificationManager:
             if method == FTPVerificationMethod.SIZE:
                 return await self._verify_size(local_path, file_info)
 
-            if method == FTPVerificationMethod.MD5:
+            if method in CHECKSUM_METHODS:
+                algorithm = FTPVerificationMethod(method).value
                 return await self._verify_checksum(
                     local_path,
-                    "md5",
-                    expected_checksums.get("md5") if expected_checksums else None,
-                )
-
-            if method == FTPVerificationMethod.SHA256:
-                return await self._verify_checksum(
-                    local_path,
-                    "sha256",
-                    expected_checksums.get("sha256") if expected_checksums else None,
+                    algorithm,
+                    expected_checksums.get(algorithm) if expected_checksums else None,
+                    checksum,
                 )
 
             # Fallback for any future/unknown method values  # pragma: no cover
-            return FTPVerificationResult(  # type: ignore[unreachable]
+            return FTPVerificationResult(
                 method=method,
                 expected_value=None,
                 actual_value=None,
@@ -154,28 +297,28 @@ class FTPVerificationManager:
             )
 
     async def _verify_checksum(
-        self, local_path: Path, algorithm: str, expected_checksum: Optional[str] = None
+        self,
+        local_path: Path,
+        algorithm: str,
+        expected_checksum: Optional[str] = None,
+        actual_checksum: Optional[str] = None,
     ) -> FTPVerificationResult:
         """
         Verify file checksum using specified algorithm.
 
         Args:
             local_path: Path to the downloaded file
-            algorithm: Hash algorithm to use (md5, sha256)
+            algorithm: Hash algorithm to use (md5, sha256, crc32)
             expected_checksum: Expected checksum value
+            actual_checksum: Checksum already computed during the transfer;
+                the file is only read when this is None
 
         Returns:
             FTPVerificationResult with checksum verification details
         """
         try:
-            # Calculate file checksum
-            if algorithm.lower() == "md5":
-                hash_func = hashlib.md5()
-                method = FTPVerificationMethod.MD5
-            elif algorithm.lower() == "sha256":
-                hash_func = hashlib.sha256()
-                method = FTPVerificationMethod.SHA256
-            else:
+            hash_func = new_checksum(algorithm)
+            if hash_func is None:
                 return FTPVerificationResult(
                     method=self.config.verification_method,
                     expected_value=expected_checksum,
@@ -183,16 +326,18 @@ class FTPVerificationManager:
                     is_valid=False,
                     error=f"Unsupported hash algorithm: {algorithm}",
                 )
+            method = FTPVerificationMethod(algorithm.lower())
 
-            # Read file and calculate hash
-            async with aiofiles.open(local_path, "rb") as f:
-                while True:
-                    chunk = await f.read(self.config.chunk_size)
-                    if not chunk:
-                        break
-                    hash_func.update(chunk)
-
-            actual_checksum = hash_func.hexdigest().lower()
+            if actual_checksum is None:
+                # Read file and calculate hash
+                await hash_file_prefix(
+                    local_path,
+                    hash_func,
+                    local_path.stat().st_size,
+                    self.config.chunk_size,
+                )
+                actual_checksum = hash_func.hexdigest()
+            actual_checksum = actual_checksum.lower()
 
             if expected_checksum is None:
                 return FTPVerificationResult(
@@ -303,24 +448,16 @@ class FTPVerificationManager:
 
         Args:
             file_path: Path to the file
-            algorithm: Hash algorithm to use (md5, sha256)
+            algorithm: Hash algorithm to use (md5, sha256, crc32)
 
         Returns:
             Hexadecimal checksum string
         """
-        if algorithm.lower() == "md5":
-            hash_func = hashlib.md5()
-        elif algorithm.lower() == "sha256":
-            hash_func = hashlib.sha256()
-        else:
+        hash_func = new_checksum(algorithm)
+        if hash_func is None:
             raise ValueError(f"Unsupported hash algorithm: {algorithm}")
 
-        async with aiofiles.open(file_path, "rb") as f:
-            while True:
-                chunk = await f.read(8192)
-                if not chunk:
-                    break
-                hash_func.update(chunk)
+        await hash_file_prefix(file_path, hash_func, file_path.stat().st_size, 8192)
 
         return hash_func.hexdigest().lower()
 
@@ -352,5 +489,8 @@ class FTPVerificationManager:
             return len(checksum) == 64 and all(
                 c in "0123456789abcdef" for c in checksum
             )
+        elif algorithm.lower() == "crc32":
+            # CRC32 should be 8 hex characters
+            return len(checksum) == 8 and all(c in "0123456789abcdef" for c in checksum)
 
         return False
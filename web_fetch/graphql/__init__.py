@@ -7,6 +7,7 @@ response parsing, and advanced GraphQL features.
 
 from .builder import MutationBuilder, QueryBuilder, SubscriptionBuilder
 from .client import GraphQLClient, GraphQLConfig
+from .documents import QueryDocument, intern_query, normalize_query
 from .models import (
     GraphQLError,
     GraphQLExecutionError,
@@ -46,4 +47,8 @@ __all__ = [
     "SubscriptionBuilder",
     # Validator
     "GraphQLValidator",
+    # Query documents
+    "QueryDocument",
+    "intern_query",
+    "normalize_query",
 ]
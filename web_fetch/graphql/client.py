@@ -37,6 +37,7 @@ from .models import (
     GraphQLTimeoutError,
     GraphQLValidationError,
 )
+from .documents import QueryDocument, get_document_table_statistics, intern_query
 from .validator import GraphQLValidator
 from .managers import (
     ManagerFactory,
@@ -52,6 +53,31 @@ from .managers import (
 
 logger = logging.getLogger(__name__)
 
+# Automatic Persisted Queries error codes
+_PERSISTED_QUERY_NOT_FOUND = "PERSISTED_QUERY_NOT_FOUND"
+_PERSISTED_QUERY_NOT_SUPPORTED = "PERSISTED_QUERY_NOT_SUPPORTED"
+_PERSISTED_QUERY_MESSAGES = {
+    "PersistedQueryNotFound": _PERSISTED_QUERY_NOT_FOUND,
+    "PersistedQueryNotSupported": _PERSISTED_QUERY_NOT_SUPPORTED,
+}
+
+
+def _persisted_query_error(response_data: Dict[str, Any]) -> Optional[str]:
+    """Return the persisted query error code in a response, if any."""
+    errors = response_data.get("errors") if isinstance(response_data, dict) else None
+    if not isinstance(errors, list):
+        return None
+    for error in errors:
+        if not isinstance(error, dict):
+            continue
+        extensions = error.get("extensions")
+        code = extensions.get("code") if isinstance(extensions, dict) else None
+        if code in (_PERSISTED_QUERY_NOT_FOUND, _PERSISTED_QUERY_NOT_SUPPORTED):
+            return cast(str, code)
+        if error.get("message") in _PERSISTED_QUERY_MESSAGES:
+            return _PERSISTED_QUERY_MESSAGES[error["message"]]
+    return None
+
 
 class GraphQLClient:
     """
@@ -205,6 +231,10 @@ class GraphQLClient:
             "active_deduplication_keys": 0,
         }
 
+        # Automatic persisted queries; switched off if the server rejects them
+        self._persisted_queries_enabled = self.config.enable_persisted_queries
+        self._persisted_query_stats = {"hits": 0, "misses": 0}
+
         # Initialize managers
         self._initialize_managers()
 
@@ -274,6 +304,12 @@ class GraphQLClient:
         Returns:
             List of results
         """
+        if not self.config.enable_query_batching:
+            # execute_batch would send these back through execute() and the
+            # batch manager, where each waits on its own pending future
+            return [
+                await self._execute_query_with_circuit_breaker(query) for query in queries
+            ]
         return await self.execute_batch(queries)
 
     async def __aenter__(self) -> "GraphQLClient":
@@ -464,10 +500,13 @@ class GraphQLClient:
         use_cache: bool = True,
     ) -> GraphQLResult:
         """Execute GraphQL query with retry logic."""
+        endpoint = str(self.config.endpoint)
         last_error = None
         attempt = 0
+        delay = 0.0
 
         while attempt <= self._error_handler.default_retry_config.max_retries:
+            self._error_handler.record_attempt(endpoint)
             try:
                 return await self._execute_query_internal(query, use_cache)
             except Exception as e:
@@ -476,18 +515,20 @@ class GraphQLClient:
                 # Categorize the error
                 error_info = self._error_handler.categorize_error(
                     exception=e,
-                    url=str(self.config.endpoint)
+                    url=endpoint
                 )
 
-                # Check if we should retry
-                if not self._error_handler.should_retry(error_info, attempt):
+                # Check if we should retry and the endpoint's retry budget
+                # allows it, then get the backoff
+                next_delay = self._error_handler.next_retry_delay(
+                    error_info, attempt, endpoint, delay
+                )
+                if next_delay is None:
                     raise e
-
-                # Calculate delay
-                delay = self._error_handler.calculate_delay(error_info, attempt)
+                delay = next_delay
 
                 # Record error for adaptive strategies
-                self._error_handler.record_error(str(self.config.endpoint), error_info)
+                self._error_handler.record_error(endpoint, error_info)
 
                 # Wait before retry
                 if delay > 0:
@@ -512,7 +553,6 @@ class GraphQLClient:
         start_time = time.time()
 
         # Prepare request
-        request_data = query.to_dict()
         headers = self.config.headers.copy()
         headers["Content-Type"] = "application/json"
 
@@ -524,33 +564,33 @@ class GraphQLClient:
             if auth_result.success:
                 headers.update(auth_result.headers)
 
-        # Make request using session manager
-        if self._session_manager and self._session_manager.is_initialized:
-            # Use session manager for HTTP requests
-            async with self._session_manager.get_session() as session:
-                # Apply authentication through session manager
-                headers = await self._session_manager.apply_authentication(headers)
-                async with session.post(
-                    str(self.config.endpoint), json=request_data, headers=headers
-                ) as response:
-                    response_time = time.time() - start_time
-                    response_text = await response.text()
+        if self._persisted_queries_enabled:
+            # Send only the hash; the full text follows if the server lacks it
+            document = intern_query(query.query)
+            request_data = self._persisted_query_request(query, document, include_query=False)
+            response, response_time, response_text, response_data = await self._post_request(
+                request_data, headers, start_time
+            )
+            persisted_error = _persisted_query_error(response_data)
+            if persisted_error is None:
+                self._persisted_query_stats["hits"] += 1
+            else:
+                self._persisted_query_stats["misses"] += 1
+                if persisted_error == _PERSISTED_QUERY_NOT_SUPPORTED:
+                    logger.info("Server does not support persisted queries, disabling them")
+                    self._persisted_queries_enabled = False
+                    request_data = query.to_dict()
+                else:
+                    request_data = self._persisted_query_request(
+                        query, document, include_query=True
+                    )
+                response, response_time, response_text, response_data = await self._post_request(
+                    request_data, headers, start_time
+                )
         else:
-            # Fallback to legacy session for compatibility
-            if self._session is None:
-                raise GraphQLError("No session available - client not properly initialized")
-            session = self._session  # Now type checker knows it's not None
-            async with session.post(
-                str(self.config.endpoint), json=request_data, headers=headers
-            ) as response:
-                response_time = time.time() - start_time
-                response_text = await response.text()
-
-        # Parse response (common for both session manager and legacy paths)
-        try:
-            response_data = json.loads(response_text)
-        except json.JSONDecodeError:
-            raise GraphQLError(f"Invalid JSON response: {response_text}")
+            response, response_time, response_text, response_data = await self._post_request(
+                query.to_dict(), headers, start_time
+            )
 
         # Create result
         result = GraphQLResult(
@@ -631,6 +671,61 @@ class GraphQLClient:
 
         return result
 
+    async def _post_request(
+        self, request_data: Dict[str, Any], headers: Dict[str, str], start_time: float
+    ) -> Tuple[aiohttp.ClientResponse, float, str, Dict[str, Any]]:
+        """
+        POST a request body to the endpoint and parse the JSON response.
+
+        Returns:
+            Response, time since start_time, response text and parsed response
+        """
+        # Make request using session manager
+        if self._session_manager and self._session_manager.is_initialized:
+            # Use session manager for HTTP requests
+            async with self._session_manager.get_session() as session:
+                # Apply authentication through session manager
+                headers = await self._session_manager.apply_authentication(headers)
+                async with session.post(
+                    str(self.config.endpoint), json=request_data, headers=headers
+                ) as response:
+                    response_time = time.time() - start_time
+                    response_text = await response.text()
+        else:
+            # Fallback to legacy session for compatibility
+            if self._session is None:
+                raise GraphQLError("No session available - client not properly initialized")
+            session = self._session  # Now type checker knows it's not None
+            async with session.post(
+                str(self.config.endpoint), json=request_data, headers=headers
+            ) as response:
+                response_time = time.time() - start_time
+                response_text = await response.text()
+
+        # Parse response (common for both session manager and legacy paths)
+        try:
+            response_data = json.loads(response_text)
+        except json.JSONDecodeError:
+            raise GraphQLError(f"Invalid JSON response: {response_text}")
+
+        return response, response_time, response_text, response_data
+
+    @staticmethod
+    def _persisted_query_request(
+        query: GraphQLQuery, document: QueryDocument, include_query: bool
+    ) -> Dict[str, Any]:
+        """Build an Automatic Persisted Queries request body."""
+        request_data: Dict[str, Any] = {"variables": query.variables}
+        if include_query:
+            # The server checks the hash against this exact text
+            request_data["query"] = document.text
+        if query.operation_name:
+            request_data["operationName"] = query.operation_name
+        request_data["extensions"] = {
+            "persistedQuery": {"version": 1, "sha256Hash": document.sha256}
+        }
+        return request_data
+
     async def execute_batch(self, queries: List[GraphQLQuery]) -> List[GraphQLResult]:
         """
         Execute multiple queries in a batch.
@@ -889,7 +984,7 @@ class GraphQLClient:
         # Delegate to cache manager if available
         if self._cache_manager and self._cache_manager.is_initialized:
             cache_key = self._cache_manager.generate_cache_key(
-                query.query, query.variables, query.operation_name
+                intern_query(query.query).sha256, query.variables, query.operation_name
             )
             return await self._cache_manager.get(cache_key)
 
@@ -921,7 +1016,7 @@ class GraphQLClient:
         # Delegate to cache manager if available
         if self._cache_manager and self._cache_manager.is_initialized:
             cache_key = self._cache_manager.generate_cache_key(
-                query.query, query.variables, query.operation_name
+                intern_query(query.query).sha256, query.variables, query.operation_name
             )
             await self._cache_manager.set(cache_key, result, ttl=self.config.cache_ttl)
             return
@@ -943,7 +1038,7 @@ class GraphQLClient:
         """Generate cache key for query."""
         query_str = json.dumps(
             {
-                "query": query.query,
+                "query": intern_query(query.query).sha256,
                 "variables": query.variables,
                 "operationName": query.operation_name,
             },
@@ -958,7 +1053,7 @@ class GraphQLClient:
         query_str = json.dumps(
             {
                 "endpoint": str(self.config.endpoint),
-                "query": query.query,
+                "query": intern_query(query.query).sha256,
                 "variables": query.variables,
                 "operationName": query.operation_name,
             },
@@ -1112,6 +1207,27 @@ class GraphQLClient:
             "pending_queries": len(self._pending_queries),
         }
 
+    def get_persisted_query_stats(self) -> Dict[str, Any]:
+        """
+        Get Automatic Persisted Queries statistics.
+
+        Hits are requests answered from the hash alone; misses needed the
+        full query text to be sent as well.
+
+        Returns:
+            Dictionary with persisted query statistics
+        """
+        hits = self._persisted_query_stats["hits"]
+        misses = self._persisted_query_stats["misses"]
+        total = hits + misses
+        return {
+            "enabled": self._persisted_queries_enabled,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total > 0 else 0.0,
+            "document_table": get_document_table_statistics(),
+        }
+
     def get_circuit_breaker_stats(self) -> Dict[str, Any]:
         """Get circuit breaker statistics."""
         # Calculate next attempt time based on last failure time and recovery timeout
@@ -1121,7 +1237,7 @@ class GraphQLClient:
 
         return {
             "state": self._circuit_breaker.state.name,
-            "failure_count": self._circuit_breaker._failure_count,
+            "failure_count": self._circuit_breaker.failure_count,
             "success_count": self._circuit_breaker._success_count,
             "last_failure_time": self._circuit_breaker._last_failure_time,
             "next_attempt_time": next_attempt_time,
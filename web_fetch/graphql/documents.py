@@ -0,0 +1,147 @@
+"""
+Interned GraphQL query documents.
+
+Query text is normalized and hashed once per distinct document and the
+result reused for cache keys, deduplication keys and persisted query
+hashes, so large fragment-heavy queries are not re-hashed on every request.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+# Tokens that matter when normalizing: block strings, strings, comments,
+# ignored characters (whitespace and commas), everything else, and a stray
+# quote from an unterminated string so no character is dropped
+_TOKEN_RE = re.compile(
+    r'"""(?:\\"""|[^"]|"(?!""))*"""'
+    r'|"(?:\\.|[^"\\\n])*"'
+    r"|#[^\n\r]*"
+    r"|[\s,]+"
+    r'|[^\s,"#]+'
+    r'|"'
+)
+_PUNCTUATORS = frozenset("!$&().:=@[]{}|")
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a query document's layout.
+
+    Comments are removed and whitespace and commas collapse to the single
+    space needed between names, without changing string values.
+
+    Args:
+        query: GraphQL document text
+
+    Returns:
+        Normalized document text
+    """
+    parts: List[str] = []
+    pending_space = False
+    for token in _TOKEN_RE.findall(query):
+        first = token[0]
+        if first == "#" or first == "," or first.isspace():
+            pending_space = True
+            continue
+        if pending_space and parts:
+            previous = parts[-1][-1]
+            if previous not in _PUNCTUATORS and first not in _PUNCTUATORS:
+                parts.append(" ")
+        parts.append(token)
+        pending_space = False
+    return "".join(parts)
+
+
+@dataclass(frozen=True)
+class QueryDocument:
+    """A normalized query document and its hash."""
+
+    text: str
+    sha256: str
+
+    @classmethod
+    def from_query(cls, query: str) -> QueryDocument:
+        """Normalize and hash query text."""
+        text = normalize_query(query)
+        return cls(text, hashlib.sha256(text.encode()).hexdigest())
+
+
+class QueryDocumentTable:
+    """Bounded LRU table of documents keyed by the query text as written."""
+
+    def __init__(self, max_size: int = 1000):
+        """
+        Initialize document table.
+
+        Args:
+            max_size: Maximum number of documents kept
+        """
+        self.max_size = max_size
+        self._documents: OrderedDict[str, QueryDocument] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def intern(self, query: str) -> QueryDocument:
+        """
+        Get the document for query text, normalizing and hashing it on first use.
+
+        Args:
+            query: GraphQL document text
+
+        Returns:
+            The interned QueryDocument
+        """
+        document = self._documents.get(query)
+        if document is not None:
+            self._hits += 1
+            self._documents.move_to_end(query)
+            return document
+
+        self._misses += 1
+        document = QueryDocument.from_query(query)
+        self._documents[query] = document
+        if len(self._documents) > self.max_size:
+            self._documents.popitem(last=False)
+        return document
+
+    def clear(self) -> None:
+        """Remove all documents."""
+        self._documents.clear()
+
+    @property
+    def statistics(self) -> Dict[str, Any]:
+        """Get table statistics."""
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._documents),
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+        }
+
+
+_global_document_table = QueryDocumentTable()
+
+
+def intern_query(query: str) -> QueryDocument:
+    """
+    Get the interned document for query text from the global table.
+
+    Args:
+        query: GraphQL document text
+
+    Returns:
+        The interned QueryDocument
+    """
+    return _global_document_table.intern(query)
+
+
+def get_document_table_statistics() -> Dict[str, Any]:
+    """Get statistics for the global document table."""
+    return _global_document_table.statistics
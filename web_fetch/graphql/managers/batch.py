@@ -14,6 +14,7 @@ from typing import Any, Dict, List, Optional, Set
 
 from pydantic import Field
 
+from ..documents import intern_query
 from ..models import GraphQLQuery, GraphQLResult
 from .base import BaseGraphQLManager, GraphQLManagerConfig
 
@@ -401,9 +402,10 @@ class GraphQLBatchManager(BaseGraphQLManager):
         import hashlib
         import json
         
-        # Create deterministic key from query components
+        # Create deterministic key from query components, using the interned
+        # document hash rather than the full query text
         key_data = {
-            "query": query.query.strip(),
+            "query": intern_query(query.query).sha256,
             "variables": query.variables,
             "operation_name": query.operation_name,
         }
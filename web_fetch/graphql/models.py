@@ -348,4 +348,11 @@ class GraphQLConfig(BaseModel):
         default=300, ge=0, description="Response cache TTL in seconds"
     )
 
+    # Automatic persisted queries
+    enable_persisted_queries: bool = Field(
+        default=False,
+        description="Send the query's SHA-256 hash instead of its text, and the "
+        "text only when the server has not seen the hash (Automatic Persisted Queries)",
+    )
+
     model_config = ConfigDict(use_enum_values=True)
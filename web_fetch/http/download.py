@@ -5,18 +5,34 @@ This module provides comprehensive download capabilities including
 resumable downloads, progress tracking, and integrity verification.
 """
 
+import asyncio
 import hashlib
+import json
+import os
 import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlparse
 
 import aiofiles
 import aiohttp
 from pydantic import BaseModel, Field
 
 from ..models import ProgressInfo
+from ..utils.retry import RetryEngine, retry_after_from
 from .connection_pool import OptimizedConnectionPool, ConnectionPoolConfig
 
+# Segmented downloads write ranges in place with os.pwrite (POSIX only)
+HAS_PWRITE = hasattr(os, "pwrite")
+
+# Suffix of the file recording segment progress next to the temp file
+SEGMENT_STATE_SUFFIX = ".segments"
+# Bytes a segment buffers before each positional write
+SEGMENT_WRITE_SIZE = 1024 * 1024
+# Least seconds between rewrites of the segment state while downloading
+SEGMENT_STATE_INTERVAL = 1.0
+
 
 class DownloadConfig(BaseModel):
     """Download configuration."""
@@ -35,6 +51,20 @@ class DownloadConfig(BaseModel):
         default=True, description="Create parent directories"
     )
     temp_suffix: str = Field(default=".tmp", description="Temporary file suffix")
+    segments: int = Field(
+        default=1,
+        ge=1,
+        description="Concurrent range requests per download (1 = single stream)",
+    )
+    min_segment_size: int = Field(
+        default=4 * 1024 * 1024, ge=1, description="Smallest range worth its own request"
+    )
+    segment_retries: int = Field(
+        default=3, ge=0, description="Retries per segment before the download fails"
+    )
+    segment_retry_delay: float = Field(
+        default=0.5, ge=0, description="Base backoff between segment retries"
+    )
 
 
 class DownloadResult(BaseModel):
@@ -60,6 +90,116 @@ class DownloadResult(BaseModel):
             return f"{self.average_speed / (1024 * 1024):.1f} MB/s"
 
 
+@dataclass
+class _Segment:
+    """Byte range of a segmented download and how much of it is on disk."""
+
+    start: int
+    end: int  # inclusive
+    written: int = 0
+
+    @property
+    def offset(self) -> int:
+        return self.start + self.written
+
+    @property
+    def done(self) -> bool:
+        return self.offset > self.end
+
+
+@dataclass
+class _SegmentState:
+    """
+    Segment progress of a download, persisted next to its temp file.
+
+    Progress is saved at most every SEGMENT_STATE_INTERVAL seconds while
+    segments are written. A stale state under-reports what is on disk, so a
+    resumed download re-fetches a little but never skips bytes.
+    """
+
+    path: Path
+    url: str
+    total: int
+    validator: Optional[str]
+    segments: List[_Segment]
+    saved_at: float = 0.0
+
+    @property
+    def written(self) -> int:
+        """Bytes of the file already on disk."""
+        return sum(segment.written for segment in self.segments)
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        temp_path: Path,
+        url: str,
+        total: int,
+        validator: Optional[str],
+    ) -> Optional["_SegmentState"]:
+        """Load the progress of an interrupted download of the same file."""
+        try:
+            state = json.loads(path.read_text())
+            if (
+                state["url"] != url
+                or state["total"] != total
+                or state["validator"] != validator
+                or validator is None
+                or temp_path.stat().st_size != total
+            ):
+                return None
+            segments = [_Segment(*segment) for segment in state["segments"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return cls(path, url, total, validator, segments)
+
+    def save(self) -> None:
+        """Record segment progress atomically."""
+        state = {
+            "url": self.url,
+            "total": self.total,
+            "validator": self.validator,
+            "segments": [[s.start, s.end, s.written] for s in self.segments],
+        }
+        partial = self.path.with_name(self.path.name + ".part")
+        partial.write_text(json.dumps(state))
+        partial.replace(self.path)
+        self.saved_at = time.monotonic()
+
+    def save_periodically(self) -> None:
+        """Save if SEGMENT_STATE_INTERVAL has passed since the last save."""
+        if time.monotonic() - self.saved_at >= SEGMENT_STATE_INTERVAL:
+            self.save()
+
+
+def _split_segments(total: int, count: int) -> List[_Segment]:
+    """Split total bytes into count contiguous segments."""
+    size = -(-total // count)
+    return [
+        _Segment(start, min(start + size, total) - 1)
+        for start in range(0, total, size)
+    ]
+
+
+def _pwrite_all(fd: int, data: bytearray, offset: int) -> None:
+    """Write all of data at offset, looping over short writes."""
+    view = memoryview(data)
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+
+
+def _file_checksum(path: Path, algorithm: str) -> str:
+    """Hash a file in blocks."""
+    hasher = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        while block := f.read(SEGMENT_WRITE_SIZE):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
 class DownloadHandler:
     """Handler for file downloads with optimized connection pooling."""
 
@@ -78,6 +218,10 @@ class DownloadHandler:
         self.config = config or DownloadConfig()
         self._connection_pool = connection_pool
         self._owned_pool = connection_pool is None
+        # Segment retries are drawn from the shared retry budget, keyed by host
+        self._retry_engine = RetryEngine(
+            base_delay=self.config.segment_retry_delay, max_delay=10.0
+        )
 
     async def _get_connection_pool(self) -> OptimizedConnectionPool:
         """Get or create connection pool."""
@@ -102,6 +246,13 @@ class DownloadHandler:
         """
         Download a file from URL with optimized connection pooling.
 
+        With ``config.segments`` above 1 and a server that honours range
+        requests, the file is fetched as that many concurrent byte ranges
+        written in place into a preallocated temp file. An interrupted
+        segmented download leaves its temp file and segment state behind and
+        resumes from them on the next call. Otherwise the file is streamed
+        over a single connection.
+
         Args:
             session: Optional aiohttp session (will create optimized one if None)
             url: Download URL
@@ -125,16 +276,22 @@ class DownloadHandler:
                 error="File already exists and overwrite is disabled",
             )
 
+        download = (
+            self._download_segmented
+            if self.config.segments > 1 and HAS_PWRITE
+            else self._download_with_session
+        )
+
         # Use optimized connection pool if no session provided
         if session is None:
             pool = await self._get_connection_pool()
             async with pool.get_session() as optimized_session:
-                return await self._download_with_session(
+                return await download(
                     optimized_session, url, output_path, temp_path,
                     headers, progress_callback
                 )
         else:
-            return await self._download_with_session(
+            return await download(
                 session, url, output_path, temp_path,
                 headers, progress_callback
             )
@@ -276,6 +433,277 @@ class DownloadHandler:
                 error=str(e),
             )
 
+    async def _download_segmented(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        output_path: Path,
+        temp_path: Path,
+        headers: Optional[Dict[str, str]],
+        progress_callback: Optional[Callable[[ProgressInfo], None]],
+    ) -> DownloadResult:
+        """Download as concurrent byte ranges, falling back to a single stream."""
+        state_path = temp_path.with_name(temp_path.name + SEGMENT_STATE_SUFFIX)
+        start_time = time.time()
+        try:
+            probe = await self._probe_ranges(session, url, headers)
+        except Exception as e:
+            return DownloadResult(success=False, file_path=output_path, error=str(e))
+
+        count = self._segment_count(probe)
+        if probe is None or count < 2:
+            state_path.unlink(missing_ok=True)
+            return await self._download_with_session(
+                session, url, output_path, temp_path, headers, progress_callback
+            )
+
+        total_bytes, validator = probe
+        if self.config.max_file_size and total_bytes > self.config.max_file_size:
+            return DownloadResult(
+                success=False,
+                file_path=output_path,
+                error=f"File size {total_bytes} exceeds limit {self.config.max_file_size}",
+            )
+        if self.config.create_directories:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        state = _SegmentState.load(state_path, temp_path, url, total_bytes, validator)
+        resumed = state is not None
+        if state is None:
+            state = _SegmentState(
+                state_path, url, total_bytes, validator, _split_segments(total_bytes, count)
+            )
+        existing = state.written
+        try:
+            await self._fetch_segments(
+                session, headers, temp_path, state, resumed, progress_callback
+            )
+        except Exception as e:
+            # Keep the temp file and segment state so the next call resumes
+            return DownloadResult(
+                success=False,
+                file_path=output_path,
+                bytes_downloaded=state.written,
+                total_bytes=total_bytes,
+                error=str(e),
+            )
+
+        return await self._finish_segmented(
+            output_path, temp_path, state, existing, start_time
+        )
+
+    def _segment_count(self, probe: Optional[Tuple[int, Optional[str]]]) -> int:
+        """Number of segments to split the probed file into, 0 if unknown."""
+        if probe is None:
+            return 0
+        return min(self.config.segments, -(-probe[0] // self.config.min_segment_size))
+
+    async def _fetch_segments(
+        self,
+        session: aiohttp.ClientSession,
+        headers: Optional[Dict[str, str]],
+        temp_path: Path,
+        state: _SegmentState,
+        resumed: bool,
+        progress_callback: Optional[Callable[[ProgressInfo], None]],
+    ) -> None:
+        """
+        Fetch every unfinished segment into the temp file.
+
+        Raises:
+            Exception: The first segment failure, once all segments have stopped
+        """
+        progress = {"bytes": state.written}
+
+        def on_write(size: int) -> None:
+            progress["bytes"] += size
+            state.save_periodically()
+            if progress_callback:
+                progress_callback(
+                    ProgressInfo(
+                        bytes_downloaded=progress["bytes"],
+                        total_bytes=state.total,
+                        percentage=progress["bytes"] / state.total * 100,
+                    )
+                )
+
+        fd = os.open(temp_path, os.O_RDWR | os.O_CREAT)
+        try:
+            if not resumed:
+                # Preallocate so every segment can write at its own offset
+                os.ftruncate(fd, state.total)
+                state.save()
+            # A failed segment does not cancel the others, so everything
+            # that can be fetched is on disk for the next attempt
+            outcomes = await asyncio.gather(
+                *(
+                    self._fetch_segment(
+                        session, state.url, headers, state.validator, segment, fd, on_write
+                    )
+                    for segment in state.segments
+                    if not segment.done
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            os.close(fd)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                # Record exactly what reached the disk before giving up
+                state.save()
+                raise outcome
+
+    async def _finish_segmented(
+        self,
+        output_path: Path,
+        temp_path: Path,
+        state: _SegmentState,
+        existing: int,
+        start_time: float,
+    ) -> DownloadResult:
+        """Verify the completed temp file and move it into place."""
+        checksum = None
+        if self.config.verify_checksum:
+            checksum = await asyncio.get_running_loop().run_in_executor(
+                None, _file_checksum, temp_path, self.config.checksum_algorithm
+            )
+            if self.config.expected_checksum and checksum != self.config.expected_checksum:
+                temp_path.unlink(missing_ok=True)
+                state.path.unlink(missing_ok=True)
+                return DownloadResult(
+                    success=False,
+                    file_path=output_path,
+                    error=f"Checksum mismatch: expected {self.config.expected_checksum}, got {checksum}",
+                )
+
+        temp_path.replace(output_path)
+        state.path.unlink(missing_ok=True)
+
+        download_time = time.time() - start_time
+        new_bytes = state.total - existing
+        return DownloadResult(
+            success=True,
+            file_path=output_path,
+            bytes_downloaded=state.total,
+            total_bytes=state.total,
+            download_time=download_time,
+            average_speed=new_bytes / download_time if download_time > 0 else 0,
+            checksum=checksum,
+        )
+
+    async def _probe_ranges(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        headers: Optional[Dict[str, str]],
+    ) -> Optional[Tuple[int, Optional[str]]]:
+        """
+        Check whether the server serves byte ranges of url.
+
+        Uses a one-byte range request rather than HEAD, since Accept-Ranges
+        is often missing from servers that support ranges and present on
+        some that do not.
+
+        Returns:
+            (total size, ETag or Last-Modified validator), or None if ranges
+            are not supported or the size is unknown
+        """
+        request_headers = dict(headers or {})
+        request_headers["Range"] = "bytes=0-0"
+        async with session.get(url, headers=request_headers) as response:
+            response.raise_for_status()
+            if response.status != 206:
+                return None
+            # Format: bytes 0-0/total, where total may be "*"
+            total = response.headers.get("content-range", "").rpartition("/")[2]
+            if not total.isdigit():
+                return None
+            validator = response.headers.get("etag") or response.headers.get(
+                "last-modified"
+            )
+            return int(total), validator
+
+    async def _fetch_segment(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        validator: Optional[str],
+        segment: _Segment,
+        fd: int,
+        on_write: Callable[[int], None],
+    ) -> None:
+        """Fetch one segment, retrying from where it stopped on transient errors."""
+        host = urlparse(url).netloc
+        attempt = 0
+        delay = 0.0
+        while True:
+            self._retry_engine.record_attempt(host)
+            try:
+                await self._stream_segment(
+                    session, url, headers, validator, segment, fd, on_write
+                )
+                return
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if isinstance(e, aiohttp.ClientResponseError) and e.status < 500 and e.status != 429:
+                    raise
+                if attempt >= self.config.segment_retries:
+                    raise
+                next_delay = self._retry_engine.next_delay(
+                    host, attempt, delay, retry_after_from(e)
+                )
+                if next_delay is None:
+                    raise
+                delay = next_delay
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    async def _stream_segment(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        validator: Optional[str],
+        segment: _Segment,
+        fd: int,
+        on_write: Callable[[int], None],
+    ) -> None:
+        """Request the rest of a segment and write it in place."""
+        request_headers = dict(headers or {})
+        request_headers["Range"] = f"bytes={segment.offset}-{segment.end}"
+        if validator:
+            # A changed file is sent whole with 200 instead of mixing versions
+            request_headers["If-Range"] = validator
+        loop = asyncio.get_running_loop()
+        buffer = bytearray()
+
+        async def flush() -> None:
+            await loop.run_in_executor(None, _pwrite_all, fd, buffer, segment.offset)
+            segment.written += len(buffer)
+            on_write(len(buffer))
+            buffer.clear()
+
+        async with session.get(url, headers=request_headers) as response:
+            response.raise_for_status()
+            if response.status != 206:
+                raise ValueError(
+                    f"Server ignored range request for bytes {segment.offset}-{segment.end}; "
+                    "the file may have changed"
+                )
+            async for chunk in response.content.iter_any():
+                # Never write past the segment even if the server sends more
+                buffer += chunk[: segment.end + 1 - segment.offset - len(buffer)]
+                if len(buffer) >= SEGMENT_WRITE_SIZE:
+                    await flush()
+                if segment.offset + len(buffer) > segment.end:
+                    break
+            if buffer:
+                await flush()
+        if not segment.done:
+            raise aiohttp.ClientPayloadError(
+                f"Segment {segment.start}-{segment.end} ended at byte {segment.offset}"
+            )
+
     async def close(self) -> None:
         """Close connection pool if owned by this handler."""
         if self._owned_pool and self._connection_pool:
@@ -317,6 +745,28 @@ class ResumableDownloadHandler(DownloadHandler):
         """
         output_path = Path(output_path)
 
+        if self.config.segments > 1 and HAS_PWRITE and not output_path.exists():
+            # Segmented downloads resume from their temp file and segment state
+            temp_path = output_path.with_suffix(
+                output_path.suffix + self.config.temp_suffix
+            )
+            return await self._download_segmented(
+                session, url, output_path, temp_path, headers, progress_callback
+            )
+
+        return await self._download_appending(
+            session, url, output_path, headers, progress_callback
+        )
+
+    async def _download_appending(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        output_path: Path,
+        headers: Optional[Dict[str, str]] = None,
+        progress_callback: Optional[Callable[[ProgressInfo], None]] = None,
+    ) -> DownloadResult:
+        """Resume by requesting the bytes after a partial output file and appending them."""
         # Check if partial file exists
         existing_size = 0
         if output_path.exists():
@@ -15,6 +15,8 @@ __all__ = [
     # Base models and types
     "ContentType",
     "RetryStrategy",
+    "ParseExecutorMode",
+    "JSONBackend",
     "RequestHeaders",
     "ProgressInfo",
     # Resource metadata classes
@@ -31,6 +33,7 @@ __all__ = [
     "FetchResult",
     "BatchFetchRequest",
     "BatchFetchResult",
+    "BatchFetchStats",
     "StreamingConfig",
     "StreamRequest",
     "StreamResult",
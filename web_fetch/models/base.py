@@ -49,6 +49,30 @@ class RetryStrategy(str, Enum):
     EXPONENTIAL = "exponential"  # Exponential backoff: delay * (2 ** attempt)
 
 
+class ParseExecutorMode(str, Enum):
+    """
+    Enumeration of execution modes for CPU-bound content parsing.
+
+    Defines where HTML parsing runs relative to the asyncio event loop.
+    """
+
+    INLINE = "inline"  # Parse directly on the event loop
+    THREAD = "thread"  # Parse on a thread pool
+    PROCESS = "process"  # Parse on a process pool, sidestepping the GIL
+
+
+class JSONBackend(str, Enum):
+    """
+    Enumeration of decoders for JSON response bodies.
+
+    orjson is only used when selected explicitly, so results do not change
+    depending on which packages happen to be installed.
+    """
+
+    JSON = "json"  # Standard library json.loads
+    ORJSON = "orjson"  # orjson.loads, requires the orjson package
+
+
 @dataclass(frozen=True)
 class RequestHeaders:
     """
@@ -270,6 +294,8 @@ class BaseResult:
 __all__ = [
     "ContentType",
     "RetryStrategy",
+    "ParseExecutorMode",
+    "JSONBackend",
     "RequestHeaders",
     "ProgressInfo",
     "BaseConfig",
@@ -45,6 +45,7 @@ class FTPVerificationMethod(str, Enum):
     SIZE = "size"
     MD5 = "md5"
     SHA256 = "sha256"
+    CRC32 = "crc32"  # Fast, non-cryptographic
     NONE = "none"
 
 
@@ -262,7 +263,9 @@ class FTPConfig(BaseModel):
         default=FTPVerificationMethod.SIZE,
         description="Method for verifying downloaded files. SIZE checks file size only "
         "(fast), MD5/SHA256 compute cryptographic hashes (slower but more reliable), "
-        "NONE disables verification (fastest but risky).",
+        "CRC32 computes a fast non-cryptographic checksum, NONE disables "
+        "verification (fastest but risky). Checksums are computed while the file "
+        "is transferred and kept on FTPResult.checksum.",
     )
     enable_resume: bool = Field(
         default=True,
@@ -347,6 +350,9 @@ class FTPResult:
     file_info: Optional[FTPFileInfo] = None
     files_list: Optional[List[FTPFileInfo]] = None
     verification_result: Optional[Dict[str, Any]] = None
+    # Digest computed while the file was transferred, for checksum methods
+    checksum: Optional[str] = None
+    checksum_algorithm: Optional[str] = None
 
     @property
     def is_success(self) -> bool:
@@ -23,7 +23,9 @@ from .base import (
     FeedItem,
     FeedMetadata,
     ImageMetadata,
+    JSONBackend,
     LinkInfo,
+    ParseExecutorMode,
     PDFMetadata,
     RequestHeaders,
     RetryStrategy,
@@ -168,8 +170,9 @@ class FetchConfig(BaseConfig):
         ge=0.1,
         le=60.0,
         description="Base delay in seconds between retry attempts. Actual delay "
-        "depends on retry_strategy. For EXPONENTIAL: delay * (2^attempt), "
-        "for LINEAR: delay * attempt.",
+        "depends on retry_strategy. For EXPONENTIAL: a random delay between "
+        "this and 3x the previous delay (decorrelated jitter), for LINEAR: "
+        "delay * attempt. Retries are also limited by the shared retry budget.",
     )
 
     # Content settings - Control response handling and security
@@ -192,6 +195,33 @@ class FetchConfig(BaseConfig):
         "SECURITY WARNING: Disabling SSL verification is dangerous in production.",
     )
 
+    # Parse settings - Control where CPU-bound content parsing runs
+    parse_executor: ParseExecutorMode = Field(
+        default=ParseExecutorMode.INLINE,
+        description="Where HTML parsing runs. INLINE parses on the event loop, "
+        "THREAD uses a thread pool, PROCESS uses a process pool. Offloading keeps "
+        "large pages from stalling other in-flight requests.",
+    )
+    parse_max_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=64,
+        description="Worker count for the THREAD/PROCESS parse executor. "
+        "Defaults to the CPU count (capped at 8).",
+    )
+    parse_offload_threshold: int = Field(
+        default=64 * 1024,
+        ge=0,
+        description="Minimum response size in bytes before parsing is offloaded. "
+        "Smaller bodies are parsed inline because dispatch costs more than parsing.",
+    )
+    json_backend: JSONBackend = Field(
+        default=JSONBackend.JSON,
+        description="Decoder for JSON responses. JSON uses the standard library, "
+        "ORJSON uses orjson, which is faster on large bodies but must be installed "
+        "and differs in edge cases such as NaN and oversized integers.",
+    )
+
     # Headers - Default headers for all requests
     headers: RequestHeaders = Field(
         default_factory=RequestHeaders,
@@ -446,14 +476,15 @@ class BatchFetchResult:
         cls, results: List[FetchResult], total_time: float
     ) -> BatchFetchResult:
         """Create BatchFetchResult from a list of individual results."""
-        successful = sum(1 for r in results if r.is_success)
-        failed = len(results) - successful
+        stats = BatchFetchStats()
+        for result in results:
+            stats.record(result)
 
         return cls(
             results=results,
-            total_requests=len(results),
-            successful_requests=successful,
-            failed_requests=failed,
+            total_requests=stats.total_requests,
+            successful_requests=stats.successful_requests,
+            failed_requests=stats.failed_requests,
             total_time=total_time,
             timestamp=datetime.now(),
         )
@@ -466,6 +497,57 @@ class BatchFetchResult:
         return (self.successful_requests / self.total_requests) * 100
 
 
+@dataclass
+class BatchFetchStats:
+    """
+    Running statistics for a batch of fetches.
+
+    Updated one result at a time so streaming batches can report totals
+    without keeping every FetchResult in memory.
+    """
+
+    total_requests: int = 0
+    successful_requests: int = 0
+    failed_requests: int = 0
+    total_response_time: float = 0.0
+    min_response_time: Optional[float] = None
+    max_response_time: Optional[float] = None
+    status_codes: Dict[int, int] = field(default_factory=dict)
+
+    def record(self, result: FetchResult) -> None:
+        """Add a single result to the statistics."""
+        self.total_requests += 1
+        if result.is_success:
+            self.successful_requests += 1
+        else:
+            self.failed_requests += 1
+
+        response_time = result.response_time
+        self.total_response_time += response_time
+        if self.min_response_time is None or response_time < self.min_response_time:
+            self.min_response_time = response_time
+        if self.max_response_time is None or response_time > self.max_response_time:
+            self.max_response_time = response_time
+
+        self.status_codes[result.status_code] = (
+            self.status_codes.get(result.status_code, 0) + 1
+        )
+
+    @property
+    def success_rate(self) -> float:
+        """Calculate the success rate as a percentage."""
+        if self.total_requests == 0:
+            return 0.0
+        return (self.successful_requests / self.total_requests) * 100
+
+    @property
+    def average_response_time(self) -> float:
+        """Calculate the mean response time in seconds."""
+        if self.total_requests == 0:
+            return 0.0
+        return self.total_response_time / self.total_requests
+
+
 # Streaming models
 
 
@@ -550,6 +632,12 @@ class CacheConfig(BaseConfig):
         default=100, ge=1, le=10000, description="Maximum cache entries"
     )
     ttl_seconds: int = Field(default=300, ge=1, description="Time to live in seconds")
+    max_memory_bytes: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum total size of cached response data in bytes; "
+        "least recently used entries are evicted beyond it. Unbounded if None.",
+    )
     enable_compression: bool = Field(
         default=True, description="Enable response compression in cache"
     )
@@ -739,6 +827,7 @@ __all__ = [
     "FetchResult",
     "BatchFetchRequest",
     "BatchFetchResult",
+    "BatchFetchStats",
     "StreamingConfig",
     "StreamRequest",
     "StreamResult",
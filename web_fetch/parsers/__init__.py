@@ -8,9 +8,12 @@ from various resource types including PDFs, images, feeds, CSV files, and more.
 from .content_analyzer import ContentAnalyzer
 from .content_parser import EnhancedContentParser
 from .csv_parser import CSVParser
+from .csv_stream import CSVBatch, CSVBatchReader, iter_csv_batches, read_csv_batches
 from .feed_parser import FeedParser
+from .html_document import ParsedHTMLDocument, ensure_document
 from .image_parser import ImageParser
 from .json_parser import JSONParser
+from .json_stream import JSONItemStream, iter_json_items
 from .link_extractor import LinkExtractor
 from .markdown_converter import MarkdownConverter
 from .pdf_parser import PDFParser
@@ -20,9 +23,17 @@ __all__ = [
     "ImageParser",
     "FeedParser",
     "CSVParser",
+    "CSVBatch",
+    "CSVBatchReader",
+    "iter_csv_batches",
+    "read_csv_batches",
     "JSONParser",
+    "JSONItemStream",
+    "iter_json_items",
     "MarkdownConverter",
     "ContentAnalyzer",
     "LinkExtractor",
     "EnhancedContentParser",
+    "ParsedHTMLDocument",
+    "ensure_document",
 ]
@@ -10,7 +10,7 @@ from __future__ import annotations
 import logging
 import re
 from collections import Counter
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set
 
 try:
     import nltk
@@ -201,13 +201,18 @@ class ContentAnalyzer:
         # Generate summary
         summary_text = self._generate_summary(sentences, summary_length)
 
+        # Tokenize words once and share them between phrase and readability passes
+        words = self._tokenize_words(cleaned_text)
+
         # Extract key phrases
         key_phrases = []
         if extract_phrases:
-            key_phrases = self._extract_key_phrases(cleaned_text)
+            key_phrases = self._extract_key_phrases(cleaned_text, words=words)
 
         # Calculate readability score
-        readability_score = self._calculate_readability(cleaned_text, sentences)
+        readability_score = self._calculate_readability(
+            cleaned_text, sentences, words=words
+        )
 
         # Detect language (basic heuristic)
         language = self._detect_language(cleaned_text)
@@ -341,9 +346,12 @@ class ContentAnalyzer:
         summary_sentences = [sentences[i] for i in top_indices]
         return " ".join(summary_sentences)
 
-    def _extract_key_phrases(self, text: str, max_phrases: int = 10) -> List[str]:
-        """Extract key phrases from text."""
-        words = self._tokenize_words(text)
+    def _extract_key_phrases(
+        self, text: str, max_phrases: int = 10, words: Optional[List[str]] = None
+    ) -> List[str]:
+        """Extract key phrases from text, reusing pre-tokenized words if given."""
+        if words is None:
+            words = self._tokenize_words(text)
         stopwords_set = self._get_stopwords()
 
         # Filter out stopwords and short words
@@ -394,12 +402,15 @@ class ContentAnalyzer:
         all_candidates.sort(key=lambda x: x[1], reverse=True)
         return [phrase for phrase, _ in all_candidates[:max_phrases]]
 
-    def _calculate_readability(self, text: str, sentences: List[str]) -> float:
+    def _calculate_readability(
+        self, text: str, sentences: List[str], words: Optional[List[str]] = None
+    ) -> float:
         """Calculate readability score (Flesch Reading Ease approximation)."""
         if not sentences:
             return 0.0
 
-        words = self._tokenize_words(text)
+        if words is None:
+            words = self._tokenize_words(text)
 
         if not words:
             return 0.0
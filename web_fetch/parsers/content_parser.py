@@ -35,6 +35,7 @@ from bs4 import BeautifulSoup, Tag
 from ..exceptions import ContentError, WebFetchError
 from ..models.base import ContentType
 from ..models.http import FetchResult
+from .html_document import ParsedHTMLDocument
 
 logger = logging.getLogger(__name__)
 
@@ -186,25 +187,30 @@ class EnhancedContentParser:
                     return json_content, result
 
                 case ContentType.HTML:
-                    html_content = self._parse_html(content_bytes)
-                    # Add content analysis for HTML text content
-                    if "text" in html_content and isinstance(html_content["text"], str) and len(html_content["text"]) > 100:
-                        try:
-                            result.content_summary = (
-                                self.content_analyzer.analyze_content(html_content["text"])
-                            )
-                        except Exception:
-                            logger.warning("Content analysis failed")
-
-                    # Extract links from HTML content
-                    if "raw_html" in html_content and isinstance(html_content["raw_html"], str):
+                    # Parse once and share the document with every consumer
+                    document = self._parse_html_document(content_bytes)
+                    try:
+                        html_content = document.to_dict()
+
+                        # Add content analysis for HTML text content
+                        if len(document.text) > 100:
+                            try:
+                                result.content_summary = (
+                                    self.content_analyzer.analyze_content(document.text)
+                                )
+                            except Exception:
+                                logger.warning("Content analysis failed")
+
+                        # Extract links from the already parsed tree
                         try:
                             links = await self.link_extractor.extract_links(
-                                html_content["raw_html"], content_type="html", base_url=url
+                                document, content_type="html", base_url=url
                             )
                             result.links = links
                         except Exception:
                             logger.warning("Link extraction failed")
+                    finally:
+                        document.release()
 
                     return html_content, result
 
@@ -289,38 +295,24 @@ class EnhancedContentParser:
                     content_type="application/json",
                 )
 
-    def _parse_html(self, content_bytes: bytes) -> Dict[str, Any]:
-        """Parse content as HTML using BeautifulSoup."""
+    def _parse_html_document(self, content_bytes: bytes) -> ParsedHTMLDocument:
+        """Decode and parse HTML content into a shared document."""
         try:
-            text_content = content_bytes.decode("utf-8")
-            soup = BeautifulSoup(text_content, "lxml")
-
-            # Extract links with proper type checking
-            links = []
-            for a in soup.find_all("a", href=True):
-                if isinstance(a, Tag) and a.has_attr("href"):
-                    href = a.get("href")
-                    if href:
-                        links.append(href)
-
-            # Extract images with proper type checking
-            images = []
-            for img in soup.find_all("img", src=True):
-                if isinstance(img, Tag) and img.has_attr("src"):
-                    src = img.get("src")
-                    if src:
-                        images.append(src)
-
-            return {
-                "title": soup.title.string if soup.title else None,
-                "text": soup.get_text(strip=True),
-                "links": links,
-                "images": images,
-                "raw_html": text_content,
-            }
+            document = ParsedHTMLDocument.from_bytes(content_bytes)
+            # Build the tree eagerly so parse errors surface here
+            document.ensure_parsed()
+            return document
         except Exception as e:
             raise WebFetchError(f"Failed to parse HTML content: {e}")
 
+    def _parse_html(self, content_bytes: bytes) -> Dict[str, Any]:
+        """Parse content as HTML using BeautifulSoup."""
+        document = self._parse_html_document(content_bytes)
+        try:
+            return document.to_dict()
+        finally:
+            document.release()
+
     async def _parse_pdf(
         self, content_bytes: bytes, url: Optional[str], result: FetchResult
     ) -> Tuple[str, FetchResult]:
@@ -389,11 +381,9 @@ class EnhancedContentParser:
     ) -> Tuple[str, FetchResult]:
         """Convert HTML content to Markdown."""
         try:
-            # First parse as HTML to get structured content
-            html_content = self._parse_html(content_bytes)
-            # Convert to Markdown
+            # The converter builds its own tree, so only decode here
             markdown_content = self.markdown_converter.convert(
-                html_content["raw_html"], url
+                content_bytes.decode("utf-8"), url
             )
             return markdown_content, result
         except Exception as e:
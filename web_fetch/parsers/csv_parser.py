@@ -10,7 +10,7 @@ from __future__ import annotations
 import csv
 import io
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional, Tuple, Union
 
 import chardet
 
@@ -23,6 +23,7 @@ except ImportError:
 
 from ..exceptions import ContentError
 from ..models.base import CSVMetadata
+from .csv_stream import CSVBatch, iter_csv_batches
 
 logger = logging.getLogger(__name__)
 
@@ -83,6 +84,37 @@ class CSVParser:
             logger.error(f"Failed to parse CSV from {url}: {e}")
             raise ContentError(f"CSV parsing error: {e}")
 
+    async def iter_batches(
+        self,
+        chunks: AsyncIterable[Union[bytes, bytearray, memoryview]],
+        batch_size: int = 10_000,
+        encoding: Optional[str] = None,
+        has_header: Optional[bool] = None,
+    ) -> AsyncIterator[CSVBatch]:
+        """
+        Parse CSV incrementally, yielding typed column batches.
+
+        Unlike parse(), the body is never held in memory as a whole; only the
+        current batch of rows is. Encoding, dialect and header are detected
+        from the start of the data with the same heuristics as parse().
+
+        Args:
+            chunks: Body chunks, e.g. a ResponseStream from WebFetcher.fetch_stream
+            batch_size: Rows per batch
+            encoding: Text encoding; detected from the first chunk when None
+            has_header: Whether the first row is a header; detected when None
+
+        Yields:
+            CSVBatch objects in file order
+
+        Raises:
+            ContentError: If CSV parsing fails
+        """
+        async for batch in iter_csv_batches(
+            chunks, batch_size, encoding, has_header, parser=self
+        ):
+            yield batch
+
     def _detect_encoding(self, content: bytes) -> str:
         """Detect the encoding of CSV content."""
         try:
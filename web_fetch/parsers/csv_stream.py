@@ -0,0 +1,487 @@
+"""
+Streaming CSV ingestion in typed, columnar batches.
+
+CSVBatchReader is fed the body chunk by chunk, sniffs the encoding and
+dialect from the start of the data, and returns CSVBatch objects holding up
+to ``batch_size`` rows as one typed array per column. Only the pending
+partial record and the current batch are held in memory, so files of any
+size can be ingested.
+
+Column types are inferred from the first batch in the same order as
+CSVParser (integer, float, boolean, string) and widen in later batches if a
+value no longer fits (integer to float to string, boolean to string). Each
+batch records the types it was built with. With NumPy installed, integer,
+float and boolean columns are NumPy arrays and string columns are object
+arrays; nulls are marked in a validity mask, which is the layout Arrow
+expects, so ``CSVBatch.to_arrow()`` hands the buffers to pyarrow when it is
+installed. Without NumPy, columns are plain lists with None for nulls.
+"""
+
+from __future__ import annotations
+
+import codecs
+import csv
+import io
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from ..exceptions import ContentError
+from ..models.base import CSVMetadata
+
+if TYPE_CHECKING:
+    from .csv_parser import CSVParser
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import pyarrow as pa
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+BytesLike = Union[bytes, bytearray, memoryview]
+# Raw field strings of one column: an object array with NumPy, else a tuple
+RawColumn = Union[Sequence[str], "np.ndarray"]
+
+# Same tokens CSVParser passes to pandas as na_values
+NULL_VALUES = frozenset(["", "NULL", "null", "None", "N/A", "n/a"])
+TRUE_VALUES = frozenset(["true", "yes"])
+FALSE_VALUES = frozenset(["false", "no"])
+
+_INFERENCE_ORDER = ("integer", "float", "boolean", "string")
+# Types a column can widen to when a value does not fit its current type
+_WIDER_TYPES = {
+    "integer": ("integer", "float", "string"),
+    "float": ("float", "string"),
+    "boolean": ("boolean", "string"),
+    "string": ("string",),
+}
+
+# Bytes used for encoding and dialect detection
+SNIFF_BYTES = 64 * 1024
+SNIFF_LINES = 10
+
+
+@dataclass
+class CSVBatch:
+    """A block of consecutive rows stored column by column."""
+
+    columns: Dict[str, Any]
+    column_types: Dict[str, str]
+    # Per-column validity (True = value present), only for columns with nulls
+    validity: Dict[str, Any] = field(default_factory=dict)
+    row_offset: int = 0
+    num_rows: int = 0
+
+    @property
+    def column_names(self) -> List[str]:
+        """Column names in file order."""
+        return list(self.columns)
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def null_count(self, name: str) -> int:
+        """Number of null values in a column."""
+        valid = self.validity.get(name)
+        if valid is None:
+            return 0
+        return self.num_rows - int(sum(valid))
+
+    def to_arrow(self) -> Any:
+        """
+        Convert the batch to a pyarrow RecordBatch.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if not HAS_PYARROW:
+            raise ImportError("pyarrow is required for CSVBatch.to_arrow()")
+        arrays = []
+        for name, values in self.columns.items():
+            valid = self.validity.get(name)
+            if valid is not None and HAS_NUMPY:
+                arrays.append(pa.array(values, mask=~valid))
+            else:
+                arrays.append(pa.array(values))
+        return pa.RecordBatch.from_arrays(arrays, names=self.column_names)
+
+    def to_pylist(self) -> List[Dict[str, Any]]:
+        """Convert the batch to one dict per row, with None for nulls."""
+        columns = {}
+        for name, values in self.columns.items():
+            items = values.tolist() if HAS_NUMPY else list(values)
+            valid = self.validity.get(name)
+            if valid is not None:
+                items = [v if ok else None for v, ok in zip(items, valid)]
+            columns[name] = items
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+
+def _parse_boolean(value: str) -> bool:
+    lowered = value.lower()
+    if lowered not in TRUE_VALUES and lowered not in FALSE_VALUES:
+        raise ValueError(f"not a boolean: {value!r}")
+    return lowered in TRUE_VALUES
+
+
+_PYTHON_CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    "integer": int,
+    "float": float,
+    "boolean": _parse_boolean,
+    "string": str,
+}
+
+
+def _convert_python(
+    values: Collection[str], kind: str
+) -> Tuple[List[Any], Optional[List[bool]]]:
+    """Convert a column to a list with None for nulls."""
+    convert = _PYTHON_CONVERTERS[kind]
+    validity = [value not in NULL_VALUES for value in values]
+    converted = [
+        convert(value) if valid else None for value, valid in zip(values, validity)
+    ]
+    return converted, None if all(validity) else validity
+
+
+def _convert_numpy(
+    raw: np.ndarray, kind: str
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Convert an object array of strings to a typed array and validity mask."""
+    size = len(raw)
+    nulls = np.fromiter(map(NULL_VALUES.__contains__, raw), bool, size)
+    has_nulls = bool(nulls.any())
+    validity = ~nulls if has_nulls else None
+
+    if kind == "string":
+        column = raw.copy()
+        column[nulls] = None
+        return column, validity
+    if kind == "boolean":
+        present = ~nulls
+        column = np.zeros(size, dtype=bool)
+        column[present] = list(map(_parse_boolean, raw[present]))
+        return column, validity
+
+    if has_nulls:
+        raw = raw.copy()
+        raw[nulls] = "0"
+    # int() and float() raise ValueError on values that do not parse
+    if kind == "integer":
+        return np.fromiter(map(int, raw), np.int64, size), validity
+    return np.fromiter(map(float, raw), np.float64, size), validity
+
+
+def _convert_column(values: RawColumn, kind: str) -> Tuple[Any, Any]:
+    """
+    Convert raw strings to a typed column.
+
+    Returns:
+        (values, validity) where validity is None when there are no nulls
+
+    Raises:
+        ValueError: If a value does not fit kind
+    """
+    if HAS_NUMPY:
+        return _convert_numpy(np.asarray(values, dtype=object), kind)
+    return _convert_python(values, kind)
+
+
+def _infer_type(values: RawColumn, candidates: Sequence[str]) -> Tuple[str, Any, Any]:
+    """Convert a column to the first candidate type that fits every value."""
+    for kind in candidates:
+        try:
+            column, validity = _convert_column(values, kind)
+        except (ValueError, OverflowError):
+            continue
+        return kind, column, validity
+    raise ContentError("CSV column could not be converted")  # string always fits
+
+
+class CSVBatchReader:
+    """Push parser turning CSV bytes into typed columnar batches."""
+
+    def __init__(
+        self,
+        batch_size: int = 10_000,
+        encoding: Optional[str] = None,
+        has_header: Optional[bool] = None,
+        parser: Optional[CSVParser] = None,
+    ):
+        """
+        Initialize CSV batch reader.
+
+        Args:
+            batch_size: Rows per batch
+            encoding: Text encoding; detected from the first chunk when None
+            has_header: Whether the first row is a header; detected when None
+            parser: CSVParser whose encoding, dialect and header detection is used
+        """
+        if parser is None:
+            from .csv_parser import CSVParser
+
+            parser = CSVParser(use_pandas=False)
+        self.batch_size = max(1, batch_size)
+        self.metadata = CSVMetadata()
+        self._parser = parser
+        self._encoding = encoding
+        self._has_header = has_header
+        self._decoder: Optional[codecs.IncrementalDecoder] = None
+        self._dialect: Optional[csv.Dialect] = None
+        self._sniff = bytearray()
+        self._text = ""
+        self._rows: List[List[str]] = []
+        self._types: Dict[str, str] = {}
+        self._bytes = 0
+
+    def feed(self, chunk: BytesLike) -> List[CSVBatch]:
+        """
+        Add body bytes and collect the batches they complete.
+
+        Args:
+            chunk: Next piece of the body
+
+        Returns:
+            Completed batches, possibly empty
+
+        Raises:
+            ContentError: If the data cannot be parsed as CSV
+        """
+        self._bytes += len(chunk)
+        decoder = self._decoder
+        if decoder is None:
+            # Hold back data until there is enough to detect the encoding
+            self._sniff += chunk
+            if len(self._sniff) < SNIFF_BYTES:
+                return []
+            chunk, self._sniff = bytes(self._sniff), bytearray()
+            decoder = self._start_decoding(chunk)
+        self._text += decoder.decode(chunk)
+        return self._consume(final=False)
+
+    def close(self) -> List[CSVBatch]:
+        """
+        Signal the end of the body and flush the remaining rows.
+
+        Returns:
+            Remaining batches
+
+        Raises:
+            ContentError: If the data cannot be parsed as CSV
+        """
+        decoder = self._decoder
+        if decoder is None:
+            sample, self._sniff = bytes(self._sniff), bytearray()
+            decoder = self._start_decoding(sample)
+            self._text += decoder.decode(sample)
+        self._text += decoder.decode(b"", final=True)
+        batches = self._consume(final=True)
+        if self._rows:
+            batches.append(self._build_batch(self._rows))
+            self._rows = []
+        self.metadata.file_size = self._bytes
+        return batches
+
+    def _start_decoding(self, sample: bytes) -> codecs.IncrementalDecoder:
+        encoding = self._encoding or self._parser._detect_encoding(sample[:SNIFF_BYTES])
+        if codecs.lookup(encoding).name == "ascii":
+            # ASCII is only what the sample happened to contain
+            encoding = "utf-8"
+        if sample.startswith(codecs.BOM_UTF8):
+            encoding = "utf-8-sig"
+        self.metadata.encoding = encoding
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        return self._decoder
+
+    def _complete_records(self, final: bool) -> str:
+        """Split off the text up to the last record boundary."""
+        if final:
+            complete, self._text = self._text, ""
+            return complete
+        text = self._text
+        cut = text.rfind("\n") + 1
+        quote = self._dialect.quotechar if self._dialect else '"'
+        if quote:
+            # A newline ends a record only outside quotes, where the number of
+            # quote characters before it is even (doubled quotes keep parity)
+            odd = text.count(quote, 0, cut) % 2
+            while cut and odd:
+                previous = text.rfind("\n", 0, cut - 1) + 1
+                odd ^= text.count(quote, previous, cut) % 2
+                cut = previous
+        complete, self._text = text[:cut], text[cut:]
+        return complete
+
+    def _detect_dialect(self) -> csv.Dialect:
+        dialect = self._parser._detect_dialect(self._text)
+        if not dialect.doublequote and not dialect.escapechar:
+            # The sniffer only reports doubled quotes it happens to see in
+            # the sample; without them or an escape character a quoted
+            # field could never contain the quote character
+            dialect.doublequote = True
+        self.metadata.delimiter = dialect.delimiter
+        self.metadata.quotechar = dialect.quotechar or '"'
+        return dialect
+
+    def _read_header(self, rows: List[List[str]]) -> None:
+        """Set the column names, taking the header row off rows if there is one."""
+        if self._has_header is None:
+            self._has_header = self._parser._detect_header(rows[:2])
+        self.metadata.has_header = self._has_header
+        if self._has_header:
+            self.metadata.column_names = rows.pop(0)
+        else:
+            self.metadata.column_names = [
+                f"Column_{i + 1}" for i in range(len(rows[0]))
+            ]
+        self.metadata.column_count = len(self.metadata.column_names)
+
+    def _consume(self, final: bool) -> List[CSVBatch]:
+        if self._dialect is None:
+            if not final and self._text.count("\n") < SNIFF_LINES:
+                return []
+            self._dialect = self._detect_dialect()
+
+        complete = self._complete_records(final)
+        if not complete:
+            return []
+        try:
+            rows = list(filter(None, csv.reader(io.StringIO(complete), self._dialect)))
+        except csv.Error as e:
+            raise ContentError(f"CSV parsing error: {e}")
+
+        if not self.metadata.column_names and rows:
+            self._read_header(rows)
+
+        self._rows.extend(rows)
+        batches = []
+        while len(self._rows) >= self.batch_size:
+            batch_rows = self._rows[: self.batch_size]
+            del self._rows[: self.batch_size]
+            batches.append(self._build_batch(batch_rows))
+        return batches
+
+    def _build_batch(self, rows: List[List[str]]) -> CSVBatch:
+        names = self.metadata.column_names
+        width = len(names)
+        if set(map(len, rows)) != {width}:
+            # Short rows are padded with nulls; extra fields are dropped
+            rows = [(row + [""] * width)[:width] for row in rows]
+        raw_columns: Sequence[RawColumn]
+        if HAS_NUMPY:
+            table = np.array(rows, dtype=object).reshape(len(rows), width)
+            raw_columns = [table[:, i] for i in range(width)]
+        else:
+            raw_columns = list(zip(*rows))
+
+        batch = CSVBatch(
+            columns={},
+            column_types={},
+            row_offset=self.metadata.row_count,
+            num_rows=len(rows),
+        )
+        for name, values in zip(names, raw_columns):
+            current = self._types.get(name)
+            candidates = _WIDER_TYPES[current] if current else _INFERENCE_ORDER
+            kind, column, validity = _infer_type(values, candidates)
+            self._types[name] = kind
+            batch.columns[name] = column
+            batch.column_types[name] = kind
+            if validity is not None:
+                batch.validity[name] = validity
+            self.metadata.null_values[name] = self.metadata.null_values.get(
+                name, 0
+            ) + batch.null_count(name)
+
+        self.metadata.column_types = dict(self._types)
+        self.metadata.row_count += len(rows)
+        return batch
+
+
+async def iter_csv_batches(
+    chunks: AsyncIterable[BytesLike],
+    batch_size: int = 10_000,
+    encoding: Optional[str] = None,
+    has_header: Optional[bool] = None,
+    parser: Optional[CSVParser] = None,
+) -> AsyncIterator[CSVBatch]:
+    """
+    Yield typed column batches from an asynchronous stream of body chunks.
+
+    Args:
+        chunks: Body chunks, e.g. a ResponseStream from WebFetcher.fetch_stream
+        batch_size: Rows per batch
+        encoding: Text encoding; detected from the first chunk when None
+        has_header: Whether the first row is a header; detected when None
+        parser: CSVParser whose detection helpers are used
+
+    Yields:
+        CSVBatch objects in file order
+
+    Raises:
+        ContentError: If the data cannot be parsed as CSV
+    """
+    reader = CSVBatchReader(batch_size, encoding, has_header, parser)
+    async for chunk in chunks:
+        for batch in reader.feed(chunk):
+            yield batch
+    for batch in reader.close():
+        yield batch
+
+
+def read_csv_batches(
+    source: Union[str, BinaryIO],
+    batch_size: int = 10_000,
+    chunk_size: int = 1024 * 1024,
+    encoding: Optional[str] = None,
+    has_header: Optional[bool] = None,
+    parser: Optional[CSVParser] = None,
+) -> Iterator[CSVBatch]:
+    """
+    Yield typed column batches from a CSV file.
+
+    Args:
+        source: Path or binary file object
+        batch_size: Rows per batch
+        chunk_size: Bytes read from the file at a time
+        encoding: Text encoding; detected from the first chunk when None
+        has_header: Whether the first row is a header; detected when None
+        parser: CSVParser whose detection helpers are used
+
+    Yields:
+        CSVBatch objects in file order
+
+    Raises:
+        ContentError: If the data cannot be parsed as CSV
+    """
+    reader = CSVBatchReader(batch_size, encoding, has_header, parser)
+    handle = open(source, "rb") if isinstance(source, str) else source
+    try:
+        while chunk := handle.read(chunk_size):
+            yield from reader.feed(chunk)
+        yield from reader.close()
+    finally:
+        if isinstance(source, str):
+            handle.close()
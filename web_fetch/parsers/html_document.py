@@ -0,0 +1,154 @@
+"""
+Shared parsed HTML document.
+
+This module provides a single parsed representation of an HTML response that
+can be handed to every consumer (content parser, link extractor, content
+analyzer, transformers) so the body is decoded and tree-built only once.
+"""
+
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Union
+
+from bs4 import BeautifulSoup, Tag
+
+
+class ParsedHTMLDocument:
+    """
+    Lazily parsed HTML document shared across consumers.
+
+    The decoded HTML string is the only copy of the body kept by the document,
+    and it is not copied into :meth:`to_dict`, so a fetch result does not hold
+    the markup once the document is gone. The BeautifulSoup tree is built on
+    first access and derived values (title, text, links, images) are computed
+    once and cached. Call :meth:`release` after the last consumer has run to
+    drop the tree, which is by far the largest per-page allocation.
+    """
+
+    def __init__(self, raw_html: str, parser: str = "lxml") -> None:
+        """
+        Initialize document.
+
+        Args:
+            raw_html: Decoded HTML content
+            parser: BeautifulSoup tree builder to use
+        """
+        self.raw_html = raw_html
+        self.parser = parser
+        self._soup: Optional[BeautifulSoup] = None
+
+    @classmethod
+    def from_bytes(
+        cls, content_bytes: bytes, encoding: str = "utf-8", parser: str = "lxml"
+    ) -> ParsedHTMLDocument:
+        """
+        Create a document from a raw response body.
+
+        Args:
+            content_bytes: Raw response content
+            encoding: Text encoding of the body
+            parser: BeautifulSoup tree builder to use
+
+        Returns:
+            ParsedHTMLDocument wrapping the decoded body
+
+        Raises:
+            UnicodeDecodeError: If the body cannot be decoded
+        """
+        return cls(content_bytes.decode(encoding), parser=parser)
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        """Parsed tree, built on first access."""
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.raw_html, self.parser)
+        return self._soup
+
+    def ensure_parsed(self) -> None:
+        """
+        Build the tree now rather than on first access.
+
+        Raises:
+            Exception: Whatever the tree builder raises for unparseable content
+        """
+        _ = self.soup
+
+    @property
+    def is_parsed(self) -> bool:
+        """Check whether the tree is currently held in memory."""
+        return self._soup is not None
+
+    @cached_property
+    def title(self) -> Optional[str]:
+        """Page title from the <title> tag."""
+        soup = self.soup
+        if soup.title is None or soup.title.string is None:
+            return None
+        return str(soup.title.string)
+
+    @cached_property
+    def text(self) -> str:
+        """Text content with whitespace stripped."""
+        return self.soup.get_text(strip=True)
+
+    @cached_property
+    def links(self) -> List[str]:
+        """href values of all anchors."""
+        return self._attribute_values("a", "href")
+
+    @cached_property
+    def images(self) -> List[str]:
+        """src values of all images."""
+        return self._attribute_values("img", "src")
+
+    def _attribute_values(self, tag_name: str, attr_name: str) -> List[str]:
+        """Collect non-empty attribute values for a tag type."""
+        values = []
+        for element in self.soup.find_all(tag_name, attrs={attr_name: True}):
+            if isinstance(element, Tag):
+                value = element.get(attr_name)
+                if value:
+                    values.append(str(value))
+        return values
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to the structured dict returned for ContentType.HTML.
+
+        Returns:
+            Dictionary with title, text, links and images keys; the markup
+            itself stays on the document as raw_html
+        """
+        return {
+            "title": self.title,
+            "text": self.text,
+            "links": self.links,
+            "images": self.images,
+        }
+
+    def release(self) -> None:
+        """Drop the parsed tree. Cached derived values remain available."""
+        if self._soup is not None:
+            self._soup.decompose()
+            self._soup = None
+
+
+def ensure_document(
+    content: Union[str, bytes, ParsedHTMLDocument], parser: str = "lxml"
+) -> ParsedHTMLDocument:
+    """
+    Return a ParsedHTMLDocument for content, reusing it if already parsed.
+
+    Args:
+        content: HTML string, raw bytes, or an existing document
+        parser: BeautifulSoup tree builder for newly created documents
+
+    Returns:
+        ParsedHTMLDocument for the content
+    """
+    if isinstance(content, ParsedHTMLDocument):
+        return content
+    if isinstance(content, bytes):
+        return ParsedHTMLDocument.from_bytes(content, parser=parser)
+    return ParsedHTMLDocument(content, parser=parser)
@@ -9,10 +9,11 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional, Tuple, Union
 from urllib.parse import urljoin, urlparse
 
 from ..exceptions import ContentError
+from .json_stream import iter_json_items
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +89,33 @@ class JSONParser:
             logger.error(f"Unexpected error parsing JSON from {url}: {e}")
             raise ContentError(f"JSON processing error: {e}")
 
+    async def iter_items(
+        self,
+        chunks: AsyncIterable[Union[bytes, bytearray, memoryview]],
+        prefix: str = "item",
+        backend: str = "auto",
+    ) -> AsyncIterator[Any]:
+        """
+        Parse JSON incrementally, yielding the values at prefix as they complete.
+
+        Unlike parse(), the body is never held in memory as a whole, which
+        suits large array exports. API standard detection is not applied.
+
+        Args:
+            chunks: Body chunks, e.g. a ResponseStream from WebFetcher.fetch_stream
+            prefix: Path of the values to yield, e.g. "item", "data.item" or
+                   "$.value[*]"
+            backend: Item decoder, "auto" (orjson when installed), "orjson" or "json"
+
+        Yields:
+            Decoded items in document order
+
+        Raises:
+            ContentError: If JSON parsing fails
+        """
+        async for item in iter_json_items(chunks, prefix, backend):
+            yield item
+
     def _detect_api_standard(
         self, data: Dict[str, Any], headers: Optional[Dict[str, str]]
     ) -> Optional[str]:
@@ -0,0 +1,432 @@
+"""
+Incremental JSON parsing for large responses.
+
+JSONItemStream is fed the body chunk by chunk and returns the values found
+at a configured prefix (by default the elements of a top-level array) as
+soon as each one is complete, so peak memory is bounded by the largest
+single item rather than by the whole body.
+
+Only the structure leading to the prefix is tracked. Items that arrive
+whole are decoded in place by the standard library's C scanner. An item
+that spans chunks is located with a resumable bracket scan, so it is never
+re-parsed from its start, and is then decoded with the configured backend:
+orjson when it is installed, the standard library otherwise. Values off the
+prefix are skipped with the same bracket scan without being decoded.
+
+Prefixes use ijson-style dotted paths where ``item`` stands for any array
+element, e.g. ``"item"``, ``"data.item"`` or ``"results.item.tags.item"``.
+The equivalent JSONPath forms ``$[*]``, ``$.data[*]`` and
+``$.results[*].tags[*]`` are accepted too. The empty prefix (or ``$``)
+yields the whole document.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
+
+from ..exceptions import ContentError
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Rest of a string after its opening quote, up to and including the closing one
+_STRING_REST = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_SCALAR_END = re.compile(r"[ \t\n\r,\]}]")
+# Everything up to the next bracket that is not inside a string
+_TO_BRACKET = re.compile(r'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+
+# Parser states
+_VALUE, _FIRST_ITEM, _FIRST_KEY, _KEY, _COLON, _AFTER_VALUE, _DONE = range(7)
+
+
+def _match_end(pattern: Pattern[str], text: str, position: int) -> int:
+    """End of a match of a pattern that always matches, possibly empty."""
+    match = pattern.match(text, position)
+    assert match is not None
+    return match.end()
+
+
+def _skip_whitespace(text: str, position: int) -> int:
+    return _match_end(_WHITESPACE, text, position)
+
+
+def parse_prefix(prefix: str) -> Tuple[str, ...]:
+    """
+    Convert a dotted or JSONPath-like prefix to path segments.
+
+    Args:
+        prefix: Prefix such as ``"data.item"`` or ``"$.data[*]"``
+
+    Returns:
+        Tuple of object keys and ``"item"`` markers
+    """
+    prefix = prefix.strip()
+    if prefix.startswith("$"):
+        prefix = prefix[1:].replace("[*]", ".item")
+    return tuple(segment for segment in prefix.split(".") if segment)
+
+
+def get_json_loads(backend: str = "auto") -> Callable[[Union[str, bytes]], Any]:
+    """
+    Get the function used to decode complete JSON documents.
+
+    Args:
+        backend: ``"orjson"``, ``"json"``, or ``"auto"`` for orjson when installed
+
+    Returns:
+        Callable decoding a str or bytes JSON document
+
+    Raises:
+        ImportError: If orjson is requested but not installed
+        ValueError: If the backend is unknown
+    """
+    if backend == "auto":
+        backend = "orjson" if HAS_ORJSON else "json"
+    if backend == "orjson":
+        if not HAS_ORJSON:
+            raise ImportError("orjson is required for the orjson JSON backend")
+        return orjson.loads
+    if backend == "json":
+        return json.loads
+    raise ValueError(f"Unknown JSON backend: {backend}")
+
+
+class JSONItemStream:
+    """Push parser yielding the values at a prefix as they complete."""
+
+    def __init__(self, prefix: str = "item", backend: str = "auto"):
+        """
+        Initialize JSON item stream.
+
+        Args:
+            prefix: Path of the values to yield, see module docstring
+            backend: Decoder for items spanning chunks, ``"auto"``,
+                ``"orjson"`` or ``"json"``
+        """
+        self.prefix = parse_prefix(prefix)
+        self.backend = backend
+        self._loads = get_json_loads(backend)
+        # scan_once is set by JSONDecoder.__init__ but not declared in its stubs
+        self._scan_once: Callable[[str, int], Tuple[Any, int]] = getattr(
+            json.JSONDecoder(), "scan_once"
+        )
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._discarded = 0
+        self._state = _VALUE
+        # Path to the current value; None is an object key not yet read
+        self._path: List[Optional[str]] = []
+        self._containers: List[str] = []
+        # Resumable scan of a partially received value: (start, position, depth)
+        self._scan: Optional[Tuple[int, int, int]] = None
+        self.items_yielded = 0
+        self._handlers: Dict[int, Callable[[str, List[Any], bool], bool]] = {
+            _VALUE: self._parse_value,
+            _FIRST_ITEM: self._parse_first_item,
+            _FIRST_KEY: self._parse_key,
+            _KEY: self._parse_key,
+            _COLON: self._parse_colon,
+            _AFTER_VALUE: self._parse_after_value,
+        }
+
+    def feed(self, chunk: BytesLike) -> List[Any]:
+        """
+        Add body bytes and collect the items they complete.
+
+        Args:
+            chunk: Next piece of the body
+
+        Returns:
+            Items completed by this chunk, in document order
+
+        Raises:
+            ContentError: If the document is not valid JSON
+        """
+        try:
+            text = self._text.decode(chunk)
+        except UnicodeDecodeError as e:
+            raise self._error(str(e)) from e
+        self._compact()
+        self._buffer += text
+        items: List[Any] = []
+        self._parse(items, final=False)
+        return items
+
+    def close(self) -> List[Any]:
+        """
+        Signal the end of the body.
+
+        Returns:
+            Items completed by the end of input (a trailing top-level scalar)
+
+        Raises:
+            ContentError: If the document is truncated or has trailing data
+        """
+        try:
+            self._buffer += self._text.decode(b"", final=True)
+        except UnicodeDecodeError as e:
+            raise self._error(str(e)) from e
+        items: List[Any] = []
+        self._parse(items, final=True)
+        if self._state != _DONE:
+            raise self._error("unexpected end of document")
+        return items
+
+    def _error(self, message: str) -> ContentError:
+        return ContentError(
+            f"Invalid JSON content: {message} at character {self._discarded + self._pos}",
+            content_type="application/json",
+        )
+
+    def _compact(self) -> None:
+        """Drop text that no pending value still needs."""
+        keep = self._scan[0] if self._scan else self._pos
+        if keep:
+            self._buffer = self._buffer[keep:]
+            self._discarded += keep
+            self._pos -= keep
+            if self._scan:
+                start, position, depth = self._scan
+                self._scan = (0, position - keep, depth)
+
+    def _parse(self, items: List[Any], final: bool) -> None:
+        buffer = self._buffer
+        size = len(buffer)
+        handlers = self._handlers
+        while True:
+            if self._scan is None:
+                self._pos = _skip_whitespace(buffer, self._pos)
+                if self._pos >= size:
+                    return
+            if self._state == _DONE:
+                raise self._error("trailing data after document")
+            if not handlers[self._state](buffer, items, final):
+                return
+
+    # State handlers: each consumes input at self._pos and returns False if
+    # more input is needed
+
+    def _parse_value(self, buffer: str, items: List[Any], final: bool) -> bool:
+        path = tuple(self._path)
+        if path == self.prefix:
+            return self._take_prefix_values(buffer, items, final)
+        if path == self.prefix[: len(path)] and buffer[self._pos] in "[{":
+            # On the way to the prefix: descend into the container
+            opener = buffer[self._pos]
+            self._pos += 1
+            self._containers.append(opener)
+            if opener == "[":
+                self._path.append("item")
+                self._state = _FIRST_ITEM
+            else:
+                self._path.append(None)
+                self._state = _FIRST_KEY
+            return True
+        end = self._scan_value(final)
+        if end is None:
+            return False
+        self._pos = end
+        self._end_value()
+        return True
+
+    def _take_prefix_values(self, buffer: str, items: List[Any], final: bool) -> bool:
+        """Take the value at the prefix and, in a target array, the items after it."""
+        if not self._take_value(items, final):
+            return False
+        self._end_value()
+        if self.prefix and self.prefix[-1] == "item":
+            # Fast path through the rest of the target array
+            while self._next_item(buffer, len(buffer)):
+                if not self._take_value(items, final):
+                    return False
+                self._state = _AFTER_VALUE
+        return True
+
+    def _parse_key(self, buffer: str, items: List[Any], final: bool) -> bool:
+        char = buffer[self._pos]
+        if char == "}" and self._state == _FIRST_KEY:
+            self._pos += 1
+            self._close_container("{")
+            return True
+        if char != '"':
+            raise self._error("expected object key")
+        match = _STRING_REST.match(buffer, self._pos + 1)
+        if match is None:
+            return False
+        try:
+            self._path[-1] = json.loads(buffer[self._pos : match.end()])
+        except ValueError as e:
+            raise self._error(str(e)) from e
+        self._pos = match.end()
+        self._state = _COLON
+        return True
+
+    def _parse_colon(self, buffer: str, items: List[Any], final: bool) -> bool:
+        if buffer[self._pos] != ":":
+            raise self._error("expected ':'")
+        self._pos += 1
+        self._state = _VALUE
+        return True
+
+    def _parse_first_item(self, buffer: str, items: List[Any], final: bool) -> bool:
+        if buffer[self._pos] == "]":
+            self._pos += 1
+            self._close_container("[")
+        else:
+            self._state = _VALUE
+        return True
+
+    def _parse_after_value(self, buffer: str, items: List[Any], final: bool) -> bool:
+        char = buffer[self._pos]
+        if char == ",":
+            self._pos += 1
+            self._state = _VALUE if self._containers[-1] == "[" else _KEY
+        elif char == "]" or char == "}":
+            self._pos += 1
+            self._close_container("[" if char == "]" else "{")
+        else:
+            raise self._error("expected ',' or closing bracket")
+        return True
+
+    def _next_item(self, buffer: str, size: int) -> bool:
+        """Step over the comma before the next array item, if there is one."""
+        position = _skip_whitespace(buffer, self._pos)
+        if position >= size or buffer[position] != ",":
+            return False
+        self._state = _VALUE
+        self._pos = _skip_whitespace(buffer, position + 1)
+        return self._pos < size
+
+    def _take_value(self, items: List[Any], final: bool) -> bool:
+        """
+        Decode the value at the current position into items.
+
+        Returns:
+            False if more input is needed
+        """
+        buffer = self._buffer
+        if self._scan is None:
+            try:
+                value, end = self._scan_once(buffer, self._pos)
+            except (StopIteration, ValueError):
+                pass
+            else:
+                # A number or literal is only complete once a delimiter follows:
+                # "-2500." may still be "-2500.0" when the next chunk arrives
+                if final or buffer[end - 1] in '"]}' or _SCALAR_END.match(buffer, end):
+                    items.append(value)
+                    self.items_yielded += 1
+                    self._pos = end
+                    return True
+
+        start = self._scan[0] if self._scan else self._pos
+        value_end = self._scan_value(final)
+        if value_end is None:
+            return False
+        try:
+            items.append(self._loads(buffer[start:value_end]))
+        except ValueError as e:
+            raise self._error(str(e)) from e
+        self.items_yielded += 1
+        self._pos = value_end
+        return True
+
+    def _end_value(self) -> None:
+        self._state = _AFTER_VALUE if self._containers else _DONE
+
+    def _close_container(self, opener: str) -> None:
+        if not self._containers or self._containers[-1] != opener:
+            self._pos -= 1
+            raise self._error("mismatched closing bracket")
+        self._containers.pop()
+        self._path.pop()
+        self._end_value()
+
+    def _scan_value(self, final: bool) -> Optional[int]:
+        """
+        Find the end of the value starting at the current position.
+
+        Returns:
+            Offset just past the value, or None if more input is needed
+        """
+        buffer = self._buffer
+        if self._scan is not None:
+            start, position, depth = self._scan
+            self._scan = None
+        else:
+            start = self._pos
+            char = buffer[start]
+            if char == '"':
+                match = _STRING_REST.match(buffer, start + 1)
+                return match.end() if match else None
+            if char not in "[{":
+                match = _SCALAR_END.search(buffer, start)
+                if match:
+                    return match.start()
+                return len(buffer) if final else None
+            position, depth = start, 0
+
+        size = len(buffer)
+        while True:
+            # Jump to the next bracket outside a string; the match stops at an
+            # opening quote only when that string is still incomplete
+            position = _match_end(_TO_BRACKET, buffer, position)
+            if position == size or buffer[position] == '"':
+                self._scan = (start, position, depth)
+                return None
+            char = buffer[position]
+            position += 1
+            if char == "[" or char == "{":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return position
+
+
+async def iter_json_items(
+    chunks: AsyncIterable[BytesLike], prefix: str = "item", backend: str = "auto"
+) -> AsyncIterator[Any]:
+    """
+    Yield the values at prefix from an asynchronous stream of body chunks.
+
+    Args:
+        chunks: Body chunks, e.g. a ResponseStream from WebFetcher.fetch_stream
+        prefix: Path of the values to yield
+        backend: Decoder for items spanning chunks, ``"auto"``, ``"orjson"``
+            or ``"json"``
+
+    Yields:
+        Decoded items in document order
+
+    Raises:
+        ContentError: If the body is not valid JSON
+    """
+    parser = JSONItemStream(prefix, backend)
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
@@ -11,7 +11,7 @@ import asyncio
 import logging
 import mimetypes
 import re
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from urllib.parse import parse_qs, urljoin, urlparse
 
 try:
@@ -25,6 +25,7 @@ from bs4 import BeautifulSoup
 
 from ..exceptions import ContentError
 from ..models.base import LinkInfo
+from .html_document import ParsedHTMLDocument
 
 logger = logging.getLogger(__name__)
 
@@ -105,13 +106,17 @@ class LinkExtractor:
         }
 
     async def extract_links(
-        self, content: str, content_type: str = "html", base_url: Optional[str] = None
+        self,
+        content: Union[str, ParsedHTMLDocument],
+        content_type: str = "html",
+        base_url: Optional[str] = None,
     ) -> List[LinkInfo]:
         """
         Extract links from content based on content type.
 
         Args:
-            content: Content to extract links from
+            content: Content to extract links from. An already parsed
+                ParsedHTMLDocument is reused instead of being parsed again.
             content_type: Type of content ('html', 'text', 'css', 'javascript')
             base_url: Base URL for resolving relative links
 
@@ -123,6 +128,8 @@ class LinkExtractor:
         try:
             if content_type.lower() == "html":
                 links = await self._extract_html_links(content, base_url)
+            elif isinstance(content, ParsedHTMLDocument):
+                links = await self._extract_text_links(content.raw_html, base_url)
             elif content_type.lower() == "css":
                 links = await self._extract_css_links(content, base_url)
             elif content_type.lower() == "javascript":
@@ -141,10 +148,13 @@ class LinkExtractor:
             raise ContentError(f"Failed to extract links: {e}")
 
     async def _extract_html_links(
-        self, html_content: str, base_url: Optional[str]
+        self, html_content: Union[str, ParsedHTMLDocument], base_url: Optional[str]
     ) -> List[LinkInfo]:
         """Extract links from HTML content."""
-        soup = BeautifulSoup(html_content, "html.parser")
+        if isinstance(html_content, ParsedHTMLDocument):
+            soup = html_content.soup
+        else:
+            soup = BeautifulSoup(html_content, "html.parser")
         links = []
 
         # Extract links from various HTML elements
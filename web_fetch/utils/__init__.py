@@ -24,24 +24,34 @@ from .circuit_breaker import (
 from .content_detector import ContentTypeDetector
 from .deduplication import (
     RequestDeduplicator,
+    configure_deduplication,
     deduplicate_request,
     get_deduplication_stats,
 )
+from .disk_cache import DiskCache
 from .error_handler import (
     EnhancedErrorHandler,
     ErrorCategory,
     RetryConfig,
     RetryStrategy,
 )
+from .hedging import HedgingConfig, RequestHedger
+from .http_cache import CacheState, HTTPCache
 from .js_renderer import BrowserType, JavaScriptRenderer, JSRenderConfig, WaitStrategy
+from .lru_cache import LRUCache
 from .metrics import (
+    HostLatencyTracker,
     MetricsCollector,
     get_metrics_summary,
     get_recent_performance,
     record_request_metrics,
 )
+from .parse_executor import ParseExecutor, parse_html_bytes
 from .rate_limit import RateLimiter
 from .response import ResponseAnalyzer
+from .response_stream import ResponseStream
+from .retry import RetryBudget, RetryEngine, parse_retry_after, retry_budget
+from .session_registry import SessionRegistry, close_shared_sessions, shared_sessions
 from .transformers import (
     DataValidator,
     HTMLExtractor,
@@ -80,6 +90,10 @@ __all__ = [
     "RateLimitAlgorithm",
     "RateLimitStrategy",
     "EnhancedCache",
+    "LRUCache",
+    "DiskCache",
+    "HTTPCache",
+    "CacheState",
     "CacheConfig",
     "CacheBackend",
     "JavaScriptRenderer",
@@ -92,15 +106,29 @@ __all__ = [
     "CircuitBreakerError",
     "with_circuit_breaker",
     "RequestDeduplicator",
+    "configure_deduplication",
     "deduplicate_request",
     "get_deduplication_stats",
+    "HedgingConfig",
+    "RequestHedger",
+    "RetryEngine",
+    "RetryBudget",
+    "retry_budget",
+    "parse_retry_after",
+    "ResponseStream",
     "TransformationPipeline",
     "JSONPathExtractor",
     "HTMLExtractor",
     "RegexExtractor",
     "DataValidator",
     "MetricsCollector",
+    "HostLatencyTracker",
     "record_request_metrics",
     "get_metrics_summary",
     "get_recent_performance",
+    "ParseExecutor",
+    "parse_html_bytes",
+    "SessionRegistry",
+    "shared_sessions",
+    "close_shared_sessions",
 ]
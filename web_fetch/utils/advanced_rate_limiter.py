@@ -68,6 +68,7 @@ class DomainLimitInfo:
     tokens: float
     last_refill: float
     request_times: Deque[float] = field(default_factory=deque)
+    bucket_level: float = 0.0
     server_limit_rps: Optional[float] = None
     server_limit_reset: Optional[float] = None
     circuit_breaker: Optional[CircuitBreaker] = None
@@ -109,22 +110,22 @@ class AdvancedRateLimiter:
         # Strategy configurations
         self.strategy_configs = {
             RateLimitStrategy.CONSERVATIVE: {
-                "base_rps": 5.0,
+                "rps_multiplier": 0.5,
                 "burst_multiplier": 1.5,
                 "backoff_factor": 2.0,
             },
             RateLimitStrategy.BALANCED: {
-                "base_rps": 10.0,
+                "rps_multiplier": 1.0,
                 "burst_multiplier": 2.0,
                 "backoff_factor": 1.5,
             },
             RateLimitStrategy.AGGRESSIVE: {
-                "base_rps": 20.0,
+                "rps_multiplier": 2.0,
                 "burst_multiplier": 3.0,
                 "backoff_factor": 1.2,
             },
             RateLimitStrategy.ADAPTIVE: {
-                "base_rps": 10.0,
+                "rps_multiplier": 1.0,
                 "burst_multiplier": 2.0,
                 "backoff_factor": 1.5,
             },
@@ -165,9 +166,16 @@ class AdvancedRateLimiter:
         # Calculate delay based on algorithm
         delay = await self._calculate_delay(domain_info, url)
 
-        # Record request attempt
+        # Honour Retry-After / exhausted X-RateLimit windows for every algorithm
+        if self.config.respect_server_limits and domain_info.server_limit_reset:
+            server_delay = domain_info.server_limit_reset - time.time()
+            if server_delay > 0:
+                delay = max(delay, server_delay)
+
+        # Record the time the request is due, so the window algorithms count
+        # delayed callers in the slot they reserved
         current_time = time.time()
-        domain_info.request_times.append(current_time)
+        domain_info.request_times.append(current_time + delay)
 
         # Clean old request times
         self._clean_old_requests(domain_info, current_time)
@@ -205,15 +213,11 @@ class AdvancedRateLimiter:
         # Record success/failure for circuit breaker
         if domain_info.circuit_breaker:
             if 200 <= status_code < 300:
-                await domain_info.circuit_breaker._on_success()
+                domain_info.circuit_breaker.record_success()
                 domain_info.consecutive_failures = 0
                 domain_info.last_success = current_time
             elif status_code == 429 or status_code >= 500:
-                # Create a dummy exception for circuit breaker
-                from ..exceptions import HTTPError
-
-                error = HTTPError(f"HTTP {status_code}", status_code)
-                await domain_info.circuit_breaker._on_failure(error)
+                domain_info.circuit_breaker.record_failure()
                 domain_info.consecutive_failures += 1
 
         # Adaptive rate limiting
@@ -232,9 +236,15 @@ class AdvancedRateLimiter:
         """Create rate limit info for a domain."""
         current_time = time.time()
 
-        # Get strategy-specific configuration
+        # Scale the configured rate by the strategy multiplier
         strategy_config = self.strategy_configs[self.config.strategy]
-        base_rps = strategy_config["base_rps"]
+        base_rps = max(
+            self.config.min_requests_per_second,
+            min(
+                self.config.max_requests_per_second,
+                self.config.requests_per_second * strategy_config["rps_multiplier"],
+            ),
+        )
 
         domain_info = DomainLimitInfo(
             domain=domain,
@@ -314,10 +324,28 @@ class AdvancedRateLimiter:
             if server_rps > 0:
                 domain_info.current_rps = min(domain_info.current_rps, server_rps * 0.8)
 
+        self._hold_until_reset(domain_info, remaining, reset_time, current_time)
+
         if retry_after:
             # Server explicitly told us to wait
             domain_info.server_limit_reset = current_time + retry_after
 
+    @staticmethod
+    def _hold_until_reset(
+        domain_info: DomainLimitInfo,
+        remaining: Optional[int],
+        reset_value: Optional[float],
+        now: float,
+    ) -> None:
+        """Hold requests until an exhausted server window resets."""
+        if remaining != 0 or not reset_value:
+            return
+        # The reset header is either an epoch time or seconds from now
+        reset_at = reset_value if reset_value > now else now + reset_value
+        domain_info.server_limit_reset = max(
+            domain_info.server_limit_reset or 0.0, reset_at
+        )
+
     async def _calculate_delay(self, domain_info: DomainLimitInfo, url: str) -> float:
         """Calculate delay based on selected algorithm."""
         if self.config.algorithm == RateLimitAlgorithm.TOKEN_BUCKET:
@@ -348,8 +376,10 @@ class AdvancedRateLimiter:
             domain_info.tokens -= 1.0
             return 0.0
         else:
-            # Calculate delay until next token
+            # Calculate delay until next token and reserve it, so concurrent
+            # callers queue up behind each other instead of sharing one token
             delay = (1.0 - domain_info.tokens) / domain_info.current_rps
+            domain_info.tokens -= 1.0
             return delay
 
     async def _sliding_window_delay(self, domain_info: DomainLimitInfo) -> float:
@@ -357,17 +387,20 @@ class AdvancedRateLimiter:
         current_time = time.time()
         window_start = current_time - self.config.window_size
 
-        # Count requests in current window
-        recent_requests = [t for t in domain_info.request_times if t > window_start]
+        # Count requests in current window, including reserved future slots
+        recent_requests = sorted(
+            t for t in domain_info.request_times if t > window_start
+        )
 
-        max_requests = int(domain_info.current_rps * self.config.window_size)
+        max_requests = max(1, int(domain_info.current_rps * self.config.window_size))
 
         if len(recent_requests) < max_requests:
             return 0.0
         else:
-            # Calculate delay until oldest request falls out of window
-            oldest_request = min(recent_requests)
-            delay = (oldest_request + self.config.window_size) - current_time
+            # Wait until the request max_requests back falls out of the window,
+            # which puts this caller after every slot already reserved
+            blocking_request = recent_requests[-max_requests]
+            delay = (blocking_request + self.config.window_size) - current_time
             return max(0.0, delay)
 
     async def _fixed_window_delay(self, domain_info: DomainLimitInfo) -> float:
@@ -377,39 +410,38 @@ class AdvancedRateLimiter:
             int(current_time / self.config.window_size) * self.config.window_size
         )
 
-        # Count requests in current window
-        window_requests = [t for t in domain_info.request_times if t >= window_start]
+        max_requests = max(1, int(domain_info.current_rps * self.config.window_size))
 
-        max_requests = int(domain_info.current_rps * self.config.window_size)
+        # Find the first window, starting with the current one, that still has
+        # room once the slots reserved by delayed callers are counted
+        while (
+            sum(
+                1
+                for t in domain_info.request_times
+                if window_start <= t < window_start + self.config.window_size
+            )
+            >= max_requests
+        ):
+            window_start += self.config.window_size
 
-        if len(window_requests) < max_requests:
-            return 0.0
-        else:
-            # Wait until next window
-            next_window = window_start + self.config.window_size
-            delay = next_window - current_time
-            return max(0.0, delay)
+        return max(0.0, window_start - current_time)
 
     async def _leaky_bucket_delay(self, domain_info: DomainLimitInfo) -> float:
         """Calculate delay using leaky bucket algorithm."""
         current_time = time.time()
 
-        # Calculate leak rate
+        # Drain the bucket at the current rate
         time_passed = current_time - domain_info.last_refill
         leaked_requests = time_passed * domain_info.current_rps
+        domain_info.bucket_level = max(0.0, domain_info.bucket_level - leaked_requests)
+        domain_info.last_refill = current_time
 
-        # Update bucket level
-        current_level = max(0, len(domain_info.request_times) - leaked_requests)
-
-        if current_level < self.config.burst_size:
-            domain_info.last_refill = current_time
-            return 0.0
-        else:
-            # Calculate delay
-            delay = (
-                current_level - self.config.burst_size + 1
-            ) / domain_info.current_rps
-            return delay
+        # Wait until the bucket has room for one more request, and add this
+        # request to it now so the next caller's delay accounts for it
+        overflow = domain_info.bucket_level + 1.0 - self.config.burst_size
+        delay = max(0.0, overflow) / domain_info.current_rps
+        domain_info.bucket_level += 1.0
+        return delay
 
     async def _adaptive_delay(self, domain_info: DomainLimitInfo) -> float:
         """Calculate delay using adaptive algorithm."""
@@ -23,6 +23,8 @@ from typing import Any, Dict, List, Optional, Union
 from pydantic import BaseModel, Field
 
 from ..models import CacheConfig
+from .disk_cache import DiskCache
+from .lru_cache import LRUCache, estimate_size
 
 logger = logging.getLogger(__name__)
 
@@ -74,50 +76,26 @@ class SimpleCache:
 
         Args:
             config: CacheConfig object specifying cache behavior including
-                   max_size, TTL, compression settings, and header caching.
+                   max_size, max_memory_bytes, TTL, compression settings,
+                   and header caching.
 
         Attributes:
             config: The cache configuration
-            _cache: Internal storage for cache entries
-            _access_order: List tracking access order for LRU eviction
+            _cache: LRU engine holding cache entries in recency order
         """
         self.config = config
-        self._cache: Dict[str, CacheEntry] = {}
-        self._access_order: List[str] = []
-
-    def _cleanup_expired(self) -> None:
-        """
-        Remove expired entries from cache.
-
-        Scans all cache entries and removes those that have exceeded
-        their TTL. Called automatically during get operations.
-        """
-        expired_keys = [key for key, entry in self._cache.items() if entry.is_expired]
-        for key in expired_keys:
-            self._remove_entry(key)
-
-    def _remove_entry(self, key: str) -> None:
-        """
-        Remove entry from cache and access order.
-
-        Args:
-            key: Cache key to remove
-        """
-        if key in self._cache:
-            del self._cache[key]
-        if key in self._access_order:
-            self._access_order.remove(key)
-
-    def _evict_lru(self) -> None:
-        """
-        Evict least recently used entries if cache is full.
+        self._cache: LRUCache[str, CacheEntry] = LRUCache(
+            max_entries=config.max_size,
+            max_bytes=config.max_memory_bytes,
+            default_ttl=config.ttl_seconds,
+            sizer=lambda entry: estimate_size(entry.response_data),
+            clock=self._now,
+        )
 
-        Removes the oldest accessed entries until cache size is
-        below the configured maximum. Uses LRU eviction policy.
-        """
-        while len(self._cache) >= self.config.max_size and self._access_order:
-            lru_key = self._access_order.pop(0)
-            self._remove_entry(lru_key)
+    @staticmethod
+    def _now() -> float:
+        """Current time on the clock used by CacheEntry.is_expired."""
+        return datetime.now().timestamp()
 
     def get(self, url: str) -> Optional[CacheEntry]:
         """
@@ -129,22 +107,7 @@ class SimpleCache:
         Returns:
             CacheEntry if found and not expired, None otherwise
         """
-        self._cleanup_expired()
-
-        if url not in self._cache:
-            return None
-
-        entry = self._cache[url]
-        if entry.is_expired:
-            self._remove_entry(url)
-            return None
-
-        # Update access order
-        if url in self._access_order:
-            self._access_order.remove(url)
-        self._access_order.append(url)
-
-        return entry
+        return self._cache.get(url)
 
     def put(
         self, url: str, response_data: Any, headers: Dict[str, str], status_code: int
@@ -158,9 +121,6 @@ class SimpleCache:
             headers: Response headers
             status_code: HTTP status code
         """
-        self._cleanup_expired()
-        self._evict_lru()
-
         # Compress data if enabled
         compressed = False
         if self.config.enable_compression and isinstance(response_data, (str, bytes)):
@@ -182,20 +142,21 @@ class SimpleCache:
             compressed=compressed,
         )
 
-        self._cache[url] = entry
-        if url in self._access_order:
-            self._access_order.remove(url)
-        self._access_order.append(url)
+        self._cache.set(url, entry)
 
     def clear(self) -> None:
         """Clear all cache entries."""
         self._cache.clear()
-        self._access_order.clear()
 
     def size(self) -> int:
         """Get current cache size."""
+        self._cache.purge_expired()
         return len(self._cache)
 
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return self._cache.get_stats()
+
 
 # Enhanced Cache Implementation
 
@@ -246,8 +207,10 @@ class EnhancedCacheConfig:
     max_memory_mb: int = 100  # Maximum memory usage in MB
     enable_etag: bool = True
     enable_conditional_requests: bool = True
+    http_semantics: bool = False  # Follow server Cache-Control/Vary (RFC 9111)
     enable_compression: bool = True
     file_cache_dir: Optional[str] = None
+    max_disk_mb: int = 1024  # Maximum size of file cache bodies in MB
     redis_url: Optional[str] = None
     redis_prefix: str = "web_fetch:"
     cleanup_interval: float = 300.0  # 5 minutes
@@ -288,182 +251,115 @@ class CacheBackendInterface(ABC):
 
 
 class MemoryCacheBackend(CacheBackendInterface):
-    """In-memory cache backend with LRU eviction."""
+    """In-memory cache backend with LRU eviction and a memory budget."""
 
     def __init__(self, config: EnhancedCacheConfig):
         self.config = config
-        self.cache: Dict[str, EnhancedCacheEntry] = {}
-        self._lock = asyncio.Lock()
+        self.cache: LRUCache[str, EnhancedCacheEntry] = LRUCache(
+            max_entries=config.max_size,
+            max_bytes=config.max_memory_mb * 1024 * 1024,
+            sizer=lambda entry: entry.size,
+            clock=time.time,
+        )
 
     async def get(self, key: str) -> Optional[EnhancedCacheEntry]:
         """Get cache entry by key."""
-        async with self._lock:
-            entry = self.cache.get(key)
-            if entry and not entry.is_expired:
-                entry.hit_count += 1
-                entry.last_accessed = time.time()
-                return entry
-            elif entry:
-                # Remove expired entry
-                del self.cache[key]
-            return None
+        entry = self.cache.get(key)
+        if entry is not None:
+            entry.hit_count += 1
+            entry.last_accessed = time.time()
+        return entry
 
     async def set(self, entry: EnhancedCacheEntry) -> bool:
         """Set cache entry."""
-        async with self._lock:
-            # Check size limits
-            if len(self.cache) >= self.config.max_size:
-                await self._evict_entries()
-
-            self.cache[entry.key] = entry
-            return True
+        ttl = entry.ttl - entry.age if entry.ttl is not None else None
+        return self.cache.set(entry.key, entry, ttl=ttl)
 
     async def delete(self, key: str) -> bool:
         """Delete cache entry by key."""
-        async with self._lock:
-            if key in self.cache:
-                del self.cache[key]
-                return True
-            return False
+        return self.cache.delete(key)
 
     async def clear(self) -> bool:
         """Clear all cache entries."""
-        async with self._lock:
-            self.cache.clear()
-            return True
+        self.cache.clear()
+        return True
 
     async def keys(self) -> List[str]:
         """Get all cache keys."""
-        async with self._lock:
-            return list(self.cache.keys())
+        return self.cache.keys()
 
     async def size(self) -> int:
         """Get number of cache entries."""
-        async with self._lock:
-            return len(self.cache)
-
-    async def _evict_entries(self) -> None:
-        """Evict least recently used entries."""
-        if not self.cache:
-            return
-
-        # Sort by last accessed time and remove oldest entries
-        sorted_entries = sorted(self.cache.items(), key=lambda x: x[1].last_accessed)
-
-        # Remove 20% of entries
-        num_to_remove = max(1, len(sorted_entries) // 5)
-        for key, _ in sorted_entries[:num_to_remove]:
-            del self.cache[key]
+        self.cache.purge_expired()
+        return len(self.cache)
 
 
 class FileCacheBackend(CacheBackendInterface):
-    """File-based cache backend with persistent storage."""
+    """File-based cache backend with a SQLite index and sharded body files."""
 
     def __init__(self, config: EnhancedCacheConfig):
         self.config = config
         self.cache_dir = Path(config.file_cache_dir or "/tmp/web_fetch_cache")
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self._lock = asyncio.Lock()
+        self.disk = DiskCache(
+            str(self.cache_dir),
+            max_bytes=config.max_disk_mb * 1024 * 1024,
+            max_entries=config.max_size,
+        )
 
     async def get(self, key: str) -> Optional[EnhancedCacheEntry]:
-        """Get cache entry by key from file."""
-        cache_file = (
-            self.cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.cache"
+        """Get cache entry by key; a hit only updates the index."""
+        record = await self.disk.get(key)
+        if record is None:
+            return None
+        return EnhancedCacheEntry(
+            key=key,
+            data=record.value,
+            timestamp=record.created_at,
+            ttl=(
+                record.expires_at - record.created_at
+                if record.expires_at is not None
+                else None
+            ),
+            etag=record.etag,
+            last_modified=record.last_modified,
+            content_type=record.content_type,
+            size=record.size,
+            hit_count=record.hit_count,
+            last_accessed=record.last_accessed,
         )
 
-        async with self._lock:
-            try:
-                if not cache_file.exists():
-                    return None
-
-                import aiofiles
-
-                async with aiofiles.open(cache_file, "rb") as f:
-                    import pickle
-
-                    entry = pickle.loads(await f.read())
-
-                if not entry.is_expired:
-                    entry.hit_count += 1
-                    entry.last_accessed = time.time()
-                    # Write back updated entry
-                    async with aiofiles.open(cache_file, "wb") as f:
-                        await f.write(pickle.dumps(entry))
-                    return entry  # type: ignore[no-any-return]
-                else:
-                    # Remove expired entry
-                    cache_file.unlink(missing_ok=True)
-                    return None
-
-            except Exception:
-                return None
-
     async def set(self, entry: EnhancedCacheEntry) -> bool:
-        """Set cache entry to file."""
-        cache_file = (
-            self.cache_dir / f"{hashlib.sha256(entry.key.encode()).hexdigest()}.cache"
+        """Set cache entry."""
+        return await self.disk.set(
+            entry.key,
+            entry.data,
+            ttl=entry.ttl,
+            etag=entry.etag,
+            last_modified=entry.last_modified,
+            content_type=entry.content_type,
+            created_at=entry.timestamp,
         )
 
-        async with self._lock:
-            try:
-                import pickle
-
-                import aiofiles
-
-                async with aiofiles.open(cache_file, "wb") as f:
-                    await f.write(pickle.dumps(entry))
-                return True
-            except Exception:
-                return False
-
     async def delete(self, key: str) -> bool:
-        """Delete cache entry file."""
-        cache_file = (
-            self.cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.cache"
-        )
-
-        async with self._lock:
-            try:
-                cache_file.unlink(missing_ok=True)
-                return True
-            except Exception:
-                return False
+        """Delete cache entry."""
+        return await self.disk.delete(key)
 
     async def clear(self) -> bool:
-        """Clear all cache files."""
-        async with self._lock:
-            try:
-                for cache_file in self.cache_dir.glob("*.cache"):
-                    cache_file.unlink(missing_ok=True)
-                return True
-            except Exception:
-                return False
+        """Clear all cache entries."""
+        return await self.disk.clear()
 
     async def keys(self) -> List[str]:
-        """Get all cache keys from files."""
-        async with self._lock:
-            keys = []
-            try:
-                import pickle
-
-                import aiofiles
-
-                for cache_file in self.cache_dir.glob("*.cache"):
-                    try:
-                        async with aiofiles.open(cache_file, "rb") as f:
-                            entry = pickle.loads(await f.read())
-                            if not entry.is_expired:
-                                keys.append(entry.key)
-                    except Exception:
-                        continue
-            except Exception:
-                pass
-            return keys
+        """Get all cache keys from the index."""
+        return await self.disk.keys()
 
     async def size(self) -> int:
-        """Get number of cache files."""
-        async with self._lock:
-            return len(list(self.cache_dir.glob("*.cache")))
+        """Get number of cache entries."""
+        return await self.disk.size()
+
+    async def close(self) -> None:
+        """Close the index once the worker thread has finished."""
+        # Shutting down the executor waits for queued disk work
+        await asyncio.to_thread(self.disk.close)
 
 
 class RedisCacheBackend(CacheBackendInterface):
@@ -671,6 +567,19 @@ class EnhancedCache:
             self.stats["sets"] += 1
         return success
 
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics, including storage usage of memory/file backends."""
+        stats: Dict[str, Any] = dict(self.stats)
+        backend_stats: Optional[Dict[str, Any]] = None
+        if isinstance(self.backend, MemoryCacheBackend):
+            backend_stats = self.backend.cache.get_stats()
+        elif isinstance(self.backend, FileCacheBackend):
+            backend_stats = self.backend.disk.get_stats()
+        if backend_stats is not None:
+            for name in ("evictions", "size", "bytes"):
+                stats[name] = backend_stats[name]
+        return stats
+
     def _generate_key(self, url: str, headers: Optional[Dict[str, str]] = None) -> str:
         """Generate cache key for URL and headers."""
         key_parts = [url]
@@ -690,7 +599,10 @@ class EnhancedCache:
         while True:
             try:
                 await asyncio.sleep(self.config.cleanup_interval)
-                # Cleanup logic would go here
+                if isinstance(self.backend, MemoryCacheBackend):
+                    self.backend.cache.purge_expired()
+                elif isinstance(self.backend, FileCacheBackend):
+                    await self.backend.disk.purge()
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -28,11 +28,17 @@ class CircuitState(str, Enum):
 class CircuitBreakerConfig:
     """Configuration for circuit breaker behavior."""
 
-    failure_threshold: int = 5  # Number of failures before opening
+    failure_threshold: int = 5  # Minimum failures in the window before opening
     recovery_timeout: float = 60.0  # Seconds before trying half-open
     success_threshold: int = 3  # Successes needed to close from half-open
     timeout: float = 30.0  # Request timeout in seconds
 
+    # Sliding window the failure rate is measured over
+    failure_rate_threshold: float = 0.5  # Failure rate (0-1) that opens the circuit
+    window_seconds: float = 60.0
+    window_buckets: int = 10  # Ring buffer slots the window is split into
+    half_open_max_calls: int = 1  # Concurrent trial requests while half-open
+
     # What constitutes a failure
     failure_exceptions: tuple[type[Exception], ...] = (Exception,)
     failure_status_codes: set[int] = field(default_factory=lambda: {500, 502, 503, 504})
@@ -65,10 +71,24 @@ class CircuitBreaker:
 
     Prevents cascading failures by temporarily blocking requests to failing services
     and allowing them to recover.
+
+    Outcomes are counted in a ring buffer of time buckets covering the last
+    window_seconds. The circuit opens once the window holds at least
+    failure_threshold failures and the failure rate reaches
+    failure_rate_threshold. After recovery_timeout it turns half-open and
+    admits at most half_open_max_calls concurrent trial requests.
+
+    Admitting a call and recording its outcome contain no await, so
+    concurrent calls cannot interleave inside either step and the breaker
+    holds no lock (see :mod:`web_fetch.utils.lru_cache`). In the CLOSED
+    state a success is a single bucket increment.
     """
 
     def __init__(
-        self, name: str, config: Optional[CircuitBreakerConfig] = None
+        self,
+        name: str,
+        config: Optional[CircuitBreakerConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         """
         Initialize circuit breaker.
@@ -76,16 +96,121 @@ class CircuitBreaker:
         Args:
             name: Unique name for this circuit breaker
             config: Configuration options
+            clock: Monotonic time source for the window and recovery timeout
         """
         self.name = name
         self.config = config or CircuitBreakerConfig()
         self.state = CircuitState.CLOSED
         self.stats = CircuitBreakerStats()
+        self._clock = clock
+
+        buckets = max(1, self.config.window_buckets)
+        self._bucket_width = self.config.window_seconds / buckets
+        self._bucket_epochs = [-1] * buckets
+        self._bucket_successes = [0] * buckets
+        self._bucket_failures = [0] * buckets
+
+        self._success_count = 0  # Trial successes while half-open
+        self._last_failure_time = 0.0  # Wall-clock time of the last failure
+        self._last_success_time = 0.0  # Wall-clock time of the last success
+        self._opened_at = 0.0
+        self._trials_in_flight = 0
+        self._generation = 0  # Bumped on every state change
+
+    @property
+    def failure_count(self) -> int:
+        """Failures recorded in the current window."""
+        return self._window_counts()[1]
+
+    def failure_rate(self) -> float:
+        """Failure rate over the current window, 0.0 when it is empty."""
+        successes, failures = self._window_counts()
+        total = successes + failures
+        return failures / total if total else 0.0
+
+    def acquire(self) -> Optional[int]:
+        """
+        Admit a call or reject it.
 
-        self._failure_count = 0
-        self._success_count = 0
-        self._last_failure_time = 0.0
-        self._lock = asyncio.Lock()
+        Every admitted call must be followed by exactly one of
+        record_success(), record_failure() or release() with the returned
+        permit.
+
+        Returns:
+            Half-open generation for trial calls, None for regular calls
+
+        Raises:
+            CircuitBreakerError: If the circuit is open or all trial slots are taken
+        """
+        self.stats.total_requests += 1
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return None
+
+        if state is CircuitState.OPEN:
+            if self._clock() - self._opened_at < self.config.recovery_timeout:
+                self.stats.blocked_requests += 1
+                raise CircuitBreakerError(
+                    f"Circuit breaker '{self.name}' is OPEN. Service appears to be failing.",
+                    self.stats,
+                )
+            self._transition(CircuitState.HALF_OPEN)
+
+        if self._trials_in_flight >= self.config.half_open_max_calls:
+            self.stats.blocked_requests += 1
+            raise CircuitBreakerError(
+                f"Circuit breaker '{self.name}' is HALF_OPEN and its trial requests are in flight.",
+                self.stats,
+            )
+        self._trials_in_flight += 1
+        return self._generation
+
+    def record_success(self, permit: Optional[int] = None) -> None:
+        """
+        Record a successful call.
+
+        Args:
+            permit: Value returned by acquire() for this call
+        """
+        self.stats.successful_requests += 1
+        self._last_success_time = time.time()
+
+        if self.state is CircuitState.CLOSED:
+            index = self._bucket()
+            self._bucket_successes[index] += 1
+        elif self._end_trial(permit):
+            # Trial requests test whether the service has recovered
+            self._success_count += 1
+            if self._success_count >= self.config.success_threshold:
+                self._transition(CircuitState.CLOSED)
+
+    def record_failure(self, permit: Optional[int] = None) -> None:
+        """
+        Record a failed call.
+
+        Args:
+            permit: Value returned by acquire() for this call
+        """
+        self.stats.failed_requests += 1
+        self._last_failure_time = time.time()
+
+        if self.state is CircuitState.CLOSED:
+            index = self._bucket()
+            self._bucket_failures[index] += 1
+            if self._should_open():
+                self._transition(CircuitState.OPEN)
+        elif self._end_trial(permit):
+            # Any failed trial means the service has not recovered
+            self._transition(CircuitState.OPEN)
+
+    def release(self, permit: Optional[int] = None) -> None:
+        """
+        Return a permit without recording an outcome, e.g. on cancellation.
+
+        Args:
+            permit: Value returned by acquire() for this call
+        """
+        self._end_trial(permit)
 
     async def call(
         self,
@@ -108,35 +233,8 @@ class CircuitBreaker:
             CircuitBreakerError: If circuit is open
             Any exception raised by the function
         """
-        # Thread-safe state management - prevent race conditions during state transitions
-        async with self._lock:
-            # Track total request count for monitoring and statistics
-            self.stats.total_requests += 1
-
-            # State transition logic: CLOSED -> OPEN
-            # If we're in normal operation (CLOSED) but have exceeded failure threshold,
-            # transition to OPEN state to start blocking requests and give service time to recover
-            if self.state == CircuitState.CLOSED and self._should_open():
-                await self._open_circuit()
-
-            # State transition logic: OPEN -> HALF_OPEN
-            # If we're in failure mode (OPEN) but enough time has passed since last failure,
-            # transition to HALF_OPEN to test if the service has recovered
-            elif self.state == CircuitState.OPEN and self._should_attempt_reset():
-                await self._half_open_circuit()
-
-            # Request blocking logic for OPEN state
-            # When circuit is OPEN, immediately reject requests without calling the service
-            # This prevents cascading failures and gives the failing service time to recover
-            if self.state == CircuitState.OPEN:
-                self.stats.blocked_requests += 1
-                raise CircuitBreakerError(
-                    f"Circuit breaker '{self.name}' is OPEN. Service appears to be failing.",
-                    self.stats,
-                )
+        permit = self.acquire()
 
-        # Execute the actual function call outside the lock to avoid blocking other requests
-        # This allows concurrent execution while maintaining thread-safe state management
         try:
             # Timeout handling - prevent hanging requests from keeping circuit in bad state
             if self.config.timeout > 0:
@@ -160,87 +258,71 @@ class CircuitBreaker:
                     # Still use thread pool for sync functions to maintain async compatibility
                     result = await asyncio.to_thread(func, *args, **kwargs)
 
-            # Success handling - update circuit breaker state and statistics
-            # This may trigger state transitions (HALF_OPEN -> CLOSED) if enough successes occur
-            await self._on_success()
-            return result
-
         except Exception as e:
-            # Failure handling - update failure counts and potentially trigger state transitions
-            # This may cause CLOSED -> OPEN or HALF_OPEN -> OPEN transitions
-            await self._on_failure(e)
-            # Re-raise the original exception so caller can handle it appropriately
+            # Only count exceptions that indicate service problems, not client errors
+            if self._is_failure(e):
+                self.record_failure(permit)
+            else:
+                self.release(permit)
+            raise
+        except BaseException:
+            self.release(permit)
             raise
 
+        self.record_success(permit)
+        return result
+
+    def _bucket(self) -> int:
+        """Get the ring buffer slot for now, clearing it if it is from an old window."""
+        epoch = int(self._clock() / self._bucket_width)
+        index = epoch % len(self._bucket_epochs)
+        if self._bucket_epochs[index] != epoch:
+            self._bucket_epochs[index] = epoch
+            self._bucket_successes[index] = 0
+            self._bucket_failures[index] = 0
+        return index
+
+    def _window_counts(self) -> tuple[int, int]:
+        """Sum successes and failures over the buckets inside the window."""
+        oldest = int(self._clock() / self._bucket_width) - len(self._bucket_epochs) + 1
+        successes = failures = 0
+        for index, epoch in enumerate(self._bucket_epochs):
+            if epoch >= oldest:
+                successes += self._bucket_successes[index]
+                failures += self._bucket_failures[index]
+        return successes, failures
+
     def _should_open(self) -> bool:
         """Check if circuit should be opened due to failures."""
-        return self._failure_count >= self.config.failure_threshold
-
-    def _should_attempt_reset(self) -> bool:
-        """Check if circuit should attempt to reset from open to half-open."""
-        return (time.time() - self._last_failure_time) >= self.config.recovery_timeout
-
-    async def _open_circuit(self) -> None:
-        """Transition circuit to OPEN state."""
-        self.state = CircuitState.OPEN
-        self.stats.state_changes += 1
-        self._last_failure_time = time.time()
-
-    async def _half_open_circuit(self) -> None:
-        """Transition circuit to HALF_OPEN state."""
-        self.state = CircuitState.HALF_OPEN
-        self.stats.state_changes += 1
-        self._success_count = 0
-
-    async def _close_circuit(self) -> None:
-        """Transition circuit to CLOSED state."""
-        self.state = CircuitState.CLOSED
+        successes, failures = self._window_counts()
+        if failures < self.config.failure_threshold:
+            return False
+        return failures / (successes + failures) >= self.config.failure_rate_threshold
+
+    def _end_trial(self, permit: Optional[int]) -> bool:
+        """Free a trial slot; False if the permit is not a current trial."""
+        if permit is None or permit != self._generation:
+            return False
+        self._trials_in_flight -= 1
+        return True
+
+    def _transition(self, state: CircuitState) -> None:
+        """Move to a new state and reset the per-state bookkeeping."""
+        self.state = state
         self.stats.state_changes += 1
-        self._failure_count = 0
+        self._generation += 1
+        self._trials_in_flight = 0
         self._success_count = 0
+        if state is CircuitState.OPEN:
+            self._opened_at = self._clock()
+        elif state is CircuitState.CLOSED:
+            self._clear_window()
 
-    async def _on_success(self) -> None:
-        """Handle successful function call with state-specific logic."""
-        async with self._lock:
-            # Update success statistics for monitoring
-            self.stats.successful_requests += 1
-            self.stats.last_success_time = datetime.now()
-
-            # State-specific success handling
-            if self.state == CircuitState.HALF_OPEN:
-                # In HALF_OPEN state, we're testing if service has recovered
-                # Count consecutive successes and close circuit if threshold is met
-                self._success_count += 1
-                if self._success_count >= self.config.success_threshold:
-                    # Service appears to have recovered - return to normal operation
-                    await self._close_circuit()
-            elif self.state == CircuitState.CLOSED:
-                # In CLOSED state, successes help "heal" previous failures
-                # Gradually reduce failure count to prevent premature circuit opening
-                # This implements a "leaky bucket" approach where successes offset failures
-                self._failure_count = max(0, self._failure_count - 1)
-
-    async def _on_failure(self, exception: Exception) -> None:
-        """Handle failed function call with intelligent failure classification."""
-        async with self._lock:
-            # Only count exceptions that indicate service problems, not client errors
-            # This prevents circuit breaker from opening due to client-side issues
-            if self._is_failure(exception):
-                # Update failure statistics for monitoring and alerting
-                self.stats.failed_requests += 1
-                self.stats.last_failure_time = datetime.now()
-
-                # Increment failure counter for circuit breaker logic
-                self._failure_count += 1
-                # Track timestamp for recovery timeout calculation
-                self._last_failure_time = time.time()
-
-                # State-specific failure handling
-                if self.state == CircuitState.HALF_OPEN:
-                    # In HALF_OPEN state, any failure means service hasn't recovered
-                    # Immediately return to OPEN state to continue blocking requests
-                    # This prevents flapping between HALF_OPEN and OPEN states
-                    await self._open_circuit()
+    def _clear_window(self) -> None:
+        for index in range(len(self._bucket_epochs)):
+            self._bucket_epochs[index] = -1
+            self._bucket_successes[index] = 0
+            self._bucket_failures[index] = 0
 
     def _is_failure(self, exception: Exception) -> bool:
         """
@@ -276,29 +358,40 @@ class CircuitBreaker:
 
     def get_stats(self) -> CircuitBreakerStats:
         """Get current circuit breaker statistics."""
+        # Timestamps are kept as floats on the hot path and converted here
+        if self._last_success_time:
+            self.stats.last_success_time = datetime.fromtimestamp(self._last_success_time)
+        if self._last_failure_time:
+            self.stats.last_failure_time = datetime.fromtimestamp(self._last_failure_time)
         return self.stats
 
     def reset(self) -> None:
         """Manually reset the circuit breaker to CLOSED state."""
-        self.state = CircuitState.CLOSED
-        self._failure_count = 0
-        self._success_count = 0
-        self.stats.state_changes += 1
+        self._transition(CircuitState.CLOSED)
 
 
 class CircuitBreakerRegistry:
     """Registry for managing multiple circuit breakers by service/host."""
 
-    def __init__(self) -> None:
+    def __init__(self, config: Optional[CircuitBreakerConfig] = None) -> None:
+        """
+        Initialize circuit breaker registry.
+
+        Args:
+            config: Default configuration for new circuit breakers
+        """
+        self.config = config
         self._breakers: Dict[str, CircuitBreaker] = {}
-        self._lock = asyncio.Lock()
 
-    async def get_breaker(
+    def breaker_for(
         self, url: str, config: Optional[CircuitBreakerConfig] = None
     ) -> CircuitBreaker:
         """
         Get or create a circuit breaker for a URL/service.
 
+        Get-or-create does not await, so concurrent callers for one host
+        always end up sharing a single breaker.
+
         Args:
             url: URL to get circuit breaker for
             config: Optional configuration for new circuit breakers
@@ -313,10 +406,17 @@ class CircuitBreakerRegistry:
         except Exception:
             key = url
 
-        async with self._lock:
-            if key not in self._breakers:
-                self._breakers[key] = CircuitBreaker(key, config)
-            return self._breakers[key]
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(key, config or self.config)
+            self._breakers[key] = breaker
+        return breaker
+
+    async def get_breaker(
+        self, url: str, config: Optional[CircuitBreakerConfig] = None
+    ) -> CircuitBreaker:
+        """Async form of breaker_for(), kept for existing callers."""
+        return self.breaker_for(url, config)
 
     def get_all_stats(self) -> Dict[str, CircuitBreakerStats]:
         """Get statistics for all circuit breakers."""
@@ -347,7 +447,7 @@ async def with_circuit_breaker(
     Returns:
         Result of function execution
     """
-    breaker = await _global_registry.get_breaker(url, config)
+    breaker = _global_registry.breaker_for(url, config)
     return await breaker.call(func, *args, **kwargs)
 
 
@@ -3,6 +3,13 @@ Request deduplication utilities for the web_fetch library.
 
 This module provides functionality to deduplicate identical concurrent requests,
 reducing load on target servers and improving performance.
+
+Deduplication is a single-flight layer: the first caller for a key runs the
+request and every identical caller that arrives while it is in flight awaits
+the same future. A caller looks up the in-flight future and installs its own
+with no await in between, so two callers cannot both become the owner of a
+key (see :mod:`web_fetch.utils.lru_cache` for why that needs no lock), and
+requests for different keys never wait on each other.
 """
 
 from __future__ import annotations
@@ -12,7 +19,53 @@ import hashlib
 import json
 import time
 from dataclasses import dataclass, field
-from typing import Any, Awaitable, Callable, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from .lru_cache import LRUCache
+
+
+def request_fingerprint(
+    url: str,
+    method: str = "GET",
+    headers: Optional[Dict[str, str]] = None,
+    data: Optional[Any] = None,
+    params: Optional[Dict[str, str]] = None,
+) -> Hashable:
+    """
+    Build a hashable deduplication key for a request.
+
+    Plain requests without headers, params or body map to a (method, url)
+    tuple; the other components are added as sorted tuples. Only dict bodies
+    are serialized.
+
+    Args:
+        url: Request URL
+        method: HTTP method
+        headers: Request headers
+        data: Request body (str, bytes or dict)
+        params: Query parameters
+
+    Returns:
+        Tuple identifying the request
+    """
+    method = method.upper()
+    if data is None and not headers and not params:
+        return (method, url)
+
+    header_key = tuple(sorted(headers.items())) if headers else ()
+    param_key = (
+        tuple(sorted((name, str(value)) for name, value in params.items()))
+        if params
+        else ()
+    )
+    body: Any
+    if data is None or isinstance(data, (str, bytes)):
+        body = data
+    elif isinstance(data, dict):
+        body = json.dumps(data, sort_keys=True, default=str)
+    else:
+        body = repr(data)
+    return (method, url, header_key, param_key, body)
 
 
 @dataclass
@@ -38,6 +91,12 @@ class RequestKey:
         if self.params:
             self.params = dict(sorted(self.params.items()))
 
+    def fingerprint(self) -> Hashable:
+        """Get the tuple key used for deduplication."""
+        return request_fingerprint(
+            self.url, self.method, self.headers, self.data, self.params
+        )
+
     def to_hash(self) -> str:
         """Generate a hash string for this request key."""
         # Create a deterministic string representation
@@ -88,20 +147,51 @@ class RequestDeduplicator:
 
     When multiple identical requests are made concurrently, only one actual
     request is sent to the server, and all callers receive the same result.
+    With result_ttl set, a completed result is also handed to identical
+    requests that arrive within result_ttl seconds after it finished.
+    Exceptions are never shared past the callers that were already waiting.
     """
 
-    def __init__(self, max_age_seconds: float = 300.0) -> None:
+    def __init__(
+        self,
+        max_age_seconds: float = 300.0,
+        result_ttl: float = 0.0,
+        max_shared_results: int = 1024,
+    ) -> None:
         """
         Initialize the request deduplicator.
 
         Args:
             max_age_seconds: Maximum age for pending requests before cleanup
+            result_ttl: Seconds a completed result is shared with new identical
+                requests; 0 disables result sharing
+            max_shared_results: Maximum number of completed results kept for
+                sharing
         """
         self.max_age_seconds = max_age_seconds
-        self._pending: Dict[str, PendingRequest] = {}
-        self._lock = asyncio.Lock()
+        self._pending: Dict[Hashable, PendingRequest] = {}
+        self.set_result_sharing(result_ttl, max_shared_results)
         self._cleanup_task: Optional[asyncio.Task[Any]] = None
         self._initialized = False
+        self.stats = {"executed": 0, "coalesced": 0, "shared": 0}
+
+    def set_result_sharing(
+        self, result_ttl: float, max_shared_results: int = 1024
+    ) -> None:
+        """
+        Configure sharing of completed results, dropping any already kept.
+
+        Args:
+            result_ttl: Seconds a completed result is shared with new identical
+                requests; 0 disables result sharing
+            max_shared_results: Maximum number of completed results kept
+        """
+        self.result_ttl = result_ttl
+        self._recent: LRUCache[Hashable, Any] = LRUCache(
+            max_entries=max_shared_results,
+            default_ttl=result_ttl,
+            sizer=lambda value: 0,
+        )
 
     def _start_cleanup_task(self) -> None:
         """Start the background cleanup task."""
@@ -118,19 +208,19 @@ class RequestDeduplicator:
             try:
                 await asyncio.sleep(60)  # Check every minute
 
-                async with self._lock:
-                    current_time = time.time()
-                    expired_keys = [
-                        key
-                        for key, pending in self._pending.items()
-                        if current_time - pending.created_at > self.max_age_seconds
-                    ]
+                current_time = time.time()
+                expired_keys = [
+                    key
+                    for key, pending in self._pending.items()
+                    if current_time - pending.created_at > self.max_age_seconds
+                ]
 
-                    for key in expired_keys:
-                        if key in self._pending:
-                            pending = self._pending.pop(key)
-                            if not pending.future.done():
-                                pending.future.cancel()
+                for key in expired_keys:
+                    pending = self._pending.pop(key)
+                    if not pending.future.done():
+                        pending.future.cancel()
+
+                self._recent.purge_expired()
 
             except asyncio.CancelledError:
                 break
@@ -140,7 +230,7 @@ class RequestDeduplicator:
 
     async def deduplicate(
         self,
-        request_key: RequestKey,
+        request_key: RequestKey | Hashable,
         executor_func: Callable[..., Awaitable[Any]] | Callable[..., Any],
         *args: Any,
         **kwargs: Any,
@@ -153,7 +243,7 @@ class RequestDeduplicator:
         identical requests.
 
         Args:
-            request_key: Unique identifier for the request
+            request_key: RequestKey, or a key built with request_fingerprint()
             executor_func: Function to execute the actual request
             *args: Positional arguments for executor_func
             **kwargs: Keyword arguments for executor_func
@@ -166,63 +256,93 @@ class RequestDeduplicator:
             self._start_cleanup_task()
             self._initialized = True
 
-        key_hash = request_key.to_hash()
+        key = (
+            request_key.fingerprint()
+            if isinstance(request_key, RequestKey)
+            else request_key
+        )
 
-        async with self._lock:
-            # Check if identical request is already pending
-            if key_hash in self._pending:
-                pending = self._pending[key_hash]
-                pending.add_waiter()
+        result = await self._await_existing(key)
+        if result is _MISSING:
+            result = await self._run_owner(key, executor_func, *args, **kwargs)
+        return result
 
-                # Wait for the existing request to complete
-                try:
-                    return await pending.future
-                except asyncio.CancelledError:
-                    # If the original request was cancelled, we need to retry
-                    pass
+    async def _await_existing(self, key: Hashable) -> Any:
+        """
+        Get a shared result, or the result of an identical in-flight request.
 
-            # Create new pending request
-            future: asyncio.Future[Any] = asyncio.Future()
-            self._pending[key_hash] = PendingRequest(future)
+        Returns:
+            The result, or _MISSING if the caller has to run the request
+        """
+        while True:
+            if self.result_ttl > 0:
+                shared = self._recent.get(key, _MISSING)
+                if shared is not _MISSING:
+                    self.stats["shared"] += 1
+                    return shared
+
+            pending = self._pending.get(key)
+            if pending is None:
+                return _MISSING
+
+            pending.add_waiter()
+            self.stats["coalesced"] += 1
+            try:
+                # Shield so a cancelled waiter does not cancel the shared request
+                return await asyncio.shield(pending.future)
+            except asyncio.CancelledError:
+                if not pending.future.cancelled():
+                    raise
+                # The request we waited on was cancelled; run it ourselves
 
-        # Execute the request
-        try:
-            if asyncio.iscoroutinefunction(executor_func):
-                result = await executor_func(*args, **kwargs)
-            else:
-                # If executor_func is sync but returns a coroutine, await it
-                res = executor_func(*args, **kwargs)
-                if asyncio.iscoroutine(res):
-                    result = await res
-                else:
-                    result = res
-
-            # Set result for all waiters
-            async with self._lock:
-                if key_hash in self._pending:
-                    pending = self._pending.pop(key_hash)
-                    if not pending.future.done():
-                        pending.future.set_result(result)
+    async def _run_owner(
+        self,
+        key: Hashable,
+        executor_func: Callable[..., Awaitable[Any]] | Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Run the request for key and hand its outcome to the waiters."""
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        pending = PendingRequest(future)
+        self._pending[key] = pending
+        self.stats["executed"] += 1
 
-            return result
+        try:
+            result = executor_func(*args, **kwargs)
+            if asyncio.iscoroutine(result) or isinstance(result, asyncio.Future):
+                result = await result
+        except BaseException as e:
+            self._finish(key, pending)
+            if not future.done():
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                elif pending.request_count > 1:
+                    # Only set when someone waits, so it is always retrieved
+                    future.set_exception(e)
+            raise
 
-        except Exception as e:
-            # Set exception for all waiters
-            async with self._lock:
-                if key_hash in self._pending:
-                    pending = self._pending.pop(key_hash)
-                    if not pending.future.done():
-                        pending.future.set_exception(e)
+        self._finish(key, pending)
+        if self.result_ttl > 0:
+            self._recent.set(key, result)
+        if not future.done():
+            future.set_result(result)
+        return result
 
-            raise
+    def _finish(self, key: Hashable, pending: PendingRequest) -> None:
+        """Unregister a pending request unless it was already replaced."""
+        if self._pending.get(key) is pending:
+            del self._pending[key]
 
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about current deduplication state."""
         return {
+            **self.stats,
             "pending_requests": len(self._pending),
+            "shared_results": len(self._recent),
             "pending_details": [
                 {
-                    "key_hash": key[:16] + "...",  # Truncated hash for readability
+                    "key_hash": str(key)[:64],
                     "age_seconds": pending.age_seconds,
                     "request_count": pending.request_count,
                     "is_done": pending.future.done(),
@@ -233,13 +353,13 @@ class RequestDeduplicator:
 
     async def clear(self) -> None:
         """Clear all pending requests and cancel cleanup task."""
-        async with self._lock:
-            # Cancel all pending futures
-            for pending in self._pending.values():
-                if not pending.future.done():
-                    pending.future.cancel()
+        # Cancel all pending futures
+        for pending in self._pending.values():
+            if not pending.future.done():
+                pending.future.cancel()
 
-            self._pending.clear()
+        self._pending.clear()
+        self._recent.clear()
 
         # Cancel cleanup task
         if self._cleanup_task and not self._cleanup_task.done():
@@ -250,6 +370,9 @@ class RequestDeduplicator:
                 pass
 
 
+# Sentinel for shared-result lookups, since None is a valid result
+_MISSING = object()
+
 # Global deduplicator instance (lazy initialization)
 _global_deduplicator: Optional[RequestDeduplicator] = None
 
@@ -262,6 +385,20 @@ def _get_global_deduplicator() -> RequestDeduplicator:
     return _global_deduplicator
 
 
+def configure_deduplication(
+    result_ttl: float = 0.0, max_shared_results: int = 1024
+) -> None:
+    """
+    Configure result sharing for the global deduplicator.
+
+    Args:
+        result_ttl: Seconds a completed result is shared with new identical
+            requests; 0 disables result sharing
+        max_shared_results: Maximum number of completed results kept for sharing
+    """
+    _get_global_deduplicator().set_result_sharing(result_ttl, max_shared_results)
+
+
 async def deduplicate_request(
     url: str,
     method: str = "GET",
@@ -291,12 +428,10 @@ async def deduplicate_request(
     if executor_func is None:
         raise ValueError("executor_func must be provided")
 
-    request_key = RequestKey(
-        url=url, method=method, headers=headers, data=data, params=params
-    )
+    key = request_fingerprint(url, method, headers, data, params)
 
     deduplicator = _get_global_deduplicator()
-    return await deduplicator.deduplicate(request_key, executor_func, *args, **kwargs)
+    return await deduplicator.deduplicate(key, executor_func, *args, **kwargs)
 
 
 def get_deduplication_stats() -> Dict[str, Any]:
@@ -309,6 +444,8 @@ __all__ = [
     "RequestKey",
     "RequestDeduplicator",
     "PendingRequest",
+    "request_fingerprint",
+    "configure_deduplication",
     "deduplicate_request",
     "get_deduplication_stats",
 ]
@@ -0,0 +1,551 @@
+"""
+Sharded, index-backed disk cache.
+
+Entry metadata and access statistics live in a SQLite index; bodies live in
+content-addressed files under two levels of sharded subdirectories. A cache
+hit reads the body through mmap and updates only the index row, so hot
+entries are never rewritten. Identical bodies stored under different keys
+share one file, and the total size of body files is kept under a byte budget
+by evicting least recently used entries. Index queries, body mapping and
+body writes run on one worker thread per cache, so the event loop never
+waits on SQLite or the disk.
+"""
+
+import asyncio
+import hashlib
+import logging
+import mmap
+import os
+import pickle
+import secrets
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    body TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    encoding TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL,
+    last_accessed REAL NOT NULL,
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    etag TEXT,
+    last_modified TEXT,
+    content_type TEXT
+);
+CREATE INDEX IF NOT EXISTS entries_last_accessed ON entries (last_accessed);
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at);
+CREATE INDEX IF NOT EXISTS entries_body ON entries (body);
+"""
+
+_RAW = "raw"
+_PICKLE = "pickle"
+
+T = TypeVar("T")
+
+
+class _EmptyBody(bytes):
+    """Stand-in for a zero-length body, which cannot be memory-mapped."""
+
+    def __enter__(self) -> "_EmptyBody":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+@dataclass
+class DiskCacheRecord:
+    """A cache entry read from the disk cache."""
+
+    key: str
+    value: Any
+    size: int
+    created_at: float
+    expires_at: Optional[float]
+    last_accessed: float
+    hit_count: int
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_type: Optional[str] = None
+
+
+class DiskCache:
+    """
+    Persistent cache with a SQLite index and content-addressed body files.
+
+    bytes values are stored as-is; other values are pickled. get() returns a
+    copy of the body, so callers that need zero-copy reads must use
+    open_body(). The async methods run on a single worker thread, which keeps
+    index updates in order and off the event loop; the synchronous methods
+    share a lock with it.
+
+    Example:
+        ```python
+        cache = DiskCache("/var/cache/web_fetch", max_bytes=512 * 1024 * 1024)
+        await cache.set("https://example.com", b"<html>...", ttl=3600)
+        record = await cache.get("https://example.com")
+        cache.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize disk cache.
+
+        Args:
+            directory: Directory holding the index and body shards
+            max_bytes: Maximum total size of body files, unbounded if None
+            max_entries: Maximum number of index entries, unbounded if None
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+
+        self._db = sqlite3.connect(
+            self.directory / "index.sqlite3",
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+        self._lock = threading.RLock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="web_fetch-disk-cache"
+        )
+        self._bytes = self._body_bytes()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def current_bytes(self) -> int:
+        """Total size of body files in bytes."""
+        return self._bytes
+
+    async def get(self, key: str) -> Optional[DiskCacheRecord]:
+        """
+        Get an entry and record the access in the index.
+
+        Raw values are copied out of the body mapping; use open_body() to
+        read them without copying.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            DiskCacheRecord, or None if missing, expired or unreadable
+        """
+        return await self._run(self._get, key)
+
+    def _get(self, key: str) -> Optional[DiskCacheRecord]:
+        """Look up, map and decode an entry and record the hit."""
+        row = self._lookup(key)
+        if row is None:
+            self.misses += 1
+            return None
+
+        mapped = self._map_body(row[1])
+        if mapped is None:
+            # Body file vanished underneath the index
+            self._delete_rows([key])
+            self.misses += 1
+            return None
+
+        try:
+            with mapped:
+                value = bytes(mapped) if row[3] == _RAW else pickle.loads(mapped)
+        except Exception as e:
+            logger.warning(f"Dropping unreadable disk cache entry {key}: {e}")
+            self._delete_rows([key])
+            self.misses += 1
+            return None
+
+        now = time.time()
+        self._db.execute(
+            "UPDATE entries SET hit_count = hit_count + 1, last_accessed = ? "
+            "WHERE key = ?",
+            (now, key),
+        )
+        self.hits += 1
+        return DiskCacheRecord(
+            key=key,
+            value=value,
+            size=row[2],
+            created_at=row[4],
+            expires_at=row[5],
+            last_accessed=now,
+            hit_count=row[7] + 1,
+            etag=row[8],
+            last_modified=row[9],
+            content_type=row[10],
+        )
+
+    def open_body(self, key: str) -> Optional[memoryview]:
+        """
+        Map the stored bytes of an entry without copying them.
+
+        Only meaningful for entries stored from bytes values. The mapping
+        stays valid until the returned view is released, even if the entry
+        is evicted meanwhile.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Read-only memoryview over the body file, or None on a miss
+        """
+        with self._lock:
+            row = self._lookup(key)
+            if row is None or row[3] != _RAW:
+                return None
+            mapped = self._map_body(row[1])
+            if mapped is None:
+                return None
+            self._db.execute(
+                "UPDATE entries SET hit_count = hit_count + 1, last_accessed = ? "
+                "WHERE key = ?",
+                (time.time(), key),
+            )
+            return memoryview(mapped)
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        content_type: Optional[str] = None,
+        created_at: Optional[float] = None,
+    ) -> bool:
+        """
+        Store an entry.
+
+        Args:
+            key: Cache key
+            value: bytes are stored raw, anything else is pickled
+            ttl: Seconds until the entry expires, never if None
+            etag: Optional ETag to keep with the entry
+            last_modified: Optional Last-Modified value to keep with the entry
+            content_type: Optional content type to keep with the entry
+            created_at: Creation time, now if None
+
+        Returns:
+            True if stored, False if it could not be written or exceeds max_bytes
+        """
+        return await self._run(
+            self._set,
+            key,
+            value,
+            ttl,
+            etag,
+            last_modified,
+            content_type,
+            created_at,
+        )
+
+    def _set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float],
+        etag: Optional[str],
+        last_modified: Optional[str],
+        content_type: Optional[str],
+        created_at: Optional[float],
+    ) -> bool:
+        """Serialize, write and index an entry."""
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            data, encoding = bytes(value), _RAW
+        else:
+            try:
+                data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                logger.warning(f"Cannot cache value for {key}: {e}")
+                return False
+            encoding = _PICKLE
+
+        size = len(data)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return False
+
+        body = hashlib.sha256(data).hexdigest()
+        path = self._body_path(body)
+        if not path.exists():
+            try:
+                if self._write_body(path, data):
+                    self._bytes += size
+            except OSError as e:
+                logger.warning(f"Failed to write disk cache body for {key}: {e}")
+                return False
+
+        now = time.time()
+        created_at = created_at if created_at is not None else now
+        old = self._db.execute(
+            "SELECT body FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        self._db.execute(
+            "INSERT OR REPLACE INTO entries (key, body, size, encoding, created_at, "
+            "expires_at, last_accessed, hit_count, etag, last_modified, content_type) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?, ?, ?)",
+            (
+                key,
+                body,
+                size,
+                encoding,
+                created_at,
+                created_at + ttl if ttl is not None else None,
+                now,
+                etag,
+                last_modified,
+                content_type,
+            ),
+        )
+        if old is not None and old[0] != body:
+            self._release_bodies([old[0]])
+
+        self._enforce_limits()
+        return True
+
+    async def delete(self, key: str) -> bool:
+        """
+        Remove an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if the entry existed
+        """
+        return await self._run(self._delete_rows, [key]) > 0
+
+    async def clear(self) -> bool:
+        """Remove all entries and body files."""
+        return await self._run(self._clear)
+
+    def _clear(self) -> bool:
+        """Delete every index row and body file."""
+        bodies = [r[0] for r in self._db.execute("SELECT DISTINCT body FROM entries")]
+        self._db.execute("DELETE FROM entries")
+        for body in bodies:
+            self._body_path(body).unlink(missing_ok=True)
+        self._bytes = 0
+        return True
+
+    async def keys(self) -> List[str]:
+        """Get keys of unexpired entries from the index."""
+        return await self._run(self._keys)
+
+    def _keys(self) -> List[str]:
+        """Query the keys of unexpired entries."""
+        rows = self._db.execute(
+            "SELECT key FROM entries WHERE expires_at IS NULL OR expires_at > ?",
+            (time.time(),),
+        )
+        return [r[0] for r in rows]
+
+    async def size(self) -> int:
+        """Get number of unexpired entries."""
+        return await self._run(self._size)
+
+    def _size(self) -> int:
+        """Count unexpired entries."""
+        row = self._db.execute(
+            "SELECT COUNT(*) FROM entries WHERE expires_at IS NULL OR expires_at > ?",
+            (time.time(),),
+        ).fetchone()
+        return int(row[0])
+
+    async def purge(self) -> int:
+        """
+        Remove expired entries and their unreferenced bodies on the worker thread.
+
+        Returns:
+            Number of entries removed
+        """
+        return await self._run(self._purge_expired)
+
+    def purge_expired(self) -> int:
+        """
+        Remove expired entries and their unreferenced bodies.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            return self._purge_expired()
+
+    def _purge_expired(self) -> int:
+        """Delete the index rows of expired entries."""
+        rows = self._db.execute(
+            "SELECT key FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (time.time(),),
+        ).fetchall()
+        return self._delete_rows([r[0] for r in rows])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get disk cache statistics.
+
+        Returns:
+            Dictionary with entry count, body bytes and hit/miss/eviction counters
+        """
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return {
+            "size": entries,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def close(self) -> None:
+        """Finish pending operations and close the index."""
+        self._executor.shutdown(wait=True)
+        self._db.close()
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run func under the index lock on the worker thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(self._locked, func, *args)
+        )
+
+    def _locked(self, func: Callable[..., T], *args: Any) -> T:
+        """Call func while holding the index lock."""
+        with self._lock:
+            return func(*args)
+
+    def _lookup(self, key: str) -> Optional[Tuple[Any, ...]]:
+        """Get the index row for an unexpired entry, dropping it if expired."""
+        row = self._db.execute(
+            "SELECT key, body, size, encoding, created_at, expires_at, "
+            "last_accessed, hit_count, etag, last_modified, content_type "
+            "FROM entries WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        if row[5] is not None and row[5] <= time.time():
+            self._delete_rows([key])
+            return None
+        return row  # type: ignore[no-any-return]
+
+    def _body_path(self, body: str) -> Path:
+        """Sharded path of a body file."""
+        return self.directory / body[:2] / body[2:4] / body
+
+    def _map_body(self, body: str) -> Optional[Union[mmap.mmap, _EmptyBody]]:
+        """Memory-map a body file read-only."""
+        try:
+            with open(self._body_path(body), "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return _EmptyBody()
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+
+    def _write_body(self, path: Path, data: bytes) -> bool:
+        """
+        Write a body file atomically.
+
+        Returns:
+            True if the file did not exist before, so its size is new
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{secrets.token_hex(8)}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        # Writers hold the index lock, so the same body cannot be counted twice
+        created = not path.exists()
+        os.replace(tmp, path)
+        return created
+
+    def _delete_rows(self, keys: List[str]) -> int:
+        """Delete index rows and release their bodies."""
+        if not keys:
+            return 0
+        bodies = set()
+        removed = 0
+        for key in keys:
+            row = self._db.execute(
+                "SELECT body FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                continue
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            bodies.add(row[0])
+            removed += 1
+        self._release_bodies(bodies)
+        return removed
+
+    def _release_bodies(self, bodies: Iterable[str]) -> None:
+        """Remove body files no index row references any more."""
+        for body in bodies:
+            if self._db.execute(
+                "SELECT 1 FROM entries WHERE body = ? LIMIT 1", (body,)
+            ).fetchone():
+                continue
+            path = self._body_path(body)
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            self._bytes -= size
+
+    def _enforce_limits(self) -> None:
+        """Evict least recently used entries until within max_bytes/max_entries."""
+        if self.max_bytes is None and self.max_entries is None:
+            return
+        if self.max_bytes is not None and self._bytes > self.max_bytes:
+            self._purge_expired()
+
+        while True:
+            over_bytes = self.max_bytes is not None and self._bytes > self.max_bytes
+            excess = 0
+            if self.max_entries is not None:
+                count = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+                excess = count - self.max_entries
+            if not over_bytes and excess <= 0:
+                return
+
+            rows = self._db.execute(
+                "SELECT key FROM entries ORDER BY last_accessed LIMIT ?",
+                (max(excess, 1),),
+            ).fetchall()
+            if not rows:
+                return
+            self.evictions += self._delete_rows([r[0] for r in rows])
+
+    def _body_bytes(self) -> int:
+        """Total size of body files referenced by the index."""
+        total = 0
+        for (body,) in self._db.execute("SELECT DISTINCT body FROM entries"):
+            try:
+                total += self._body_path(body).stat().st_size
+            except FileNotFoundError:
+                continue
+        return total
@@ -17,6 +17,7 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 from ..exceptions import AuthenticationError, RateLimitError, ServerError, WebFetchError
+from .retry import RetryEngine, decorrelated_jitter, parse_retry_after, retry_after_from
 
 logger = logging.getLogger(__name__)
 
@@ -80,14 +81,25 @@ class ErrorInfo:
 class EnhancedErrorHandler:
     """Enhanced error handler with intelligent retry strategies."""
 
-    def __init__(self, default_retry_config: Optional[RetryConfig] = None):
+    def __init__(
+        self,
+        default_retry_config: Optional[RetryConfig] = None,
+        retry_engine: Optional[RetryEngine] = None,
+    ):
         """
         Initialize error handler.
 
         Args:
             default_retry_config: Default retry configuration
+            retry_engine: Engine whose retry budget gates next_retry_delay();
+                defaults to one drawing from the process-wide budget
         """
         self.default_retry_config = default_retry_config or RetryConfig()
+        self.retry_engine = retry_engine or RetryEngine(
+            base_delay=self.default_retry_config.base_delay,
+            max_delay=self.default_retry_config.max_delay,
+            jitter=self.default_retry_config.jitter,
+        )
 
         # Error categorization rules
         self.status_code_categories = {
@@ -257,11 +269,13 @@ class EnhancedErrorHandler:
 
         # Rate limiting exceptions
         if isinstance(exception, RateLimitError):
+            retry_after = retry_after_from(exception)
             return ErrorInfo(
                 category=ErrorCategory.RATE_LIMIT_ERROR,
                 error_message=error_message,
+                retry_after=retry_after,
                 is_retryable=True,
-                suggested_delay=60.0,
+                suggested_delay=retry_after or 60.0,
             )
 
         # Authentication exceptions
@@ -277,6 +291,7 @@ class EnhancedErrorHandler:
             return ErrorInfo(
                 category=ErrorCategory.SERVER_ERROR,
                 error_message=error_message,
+                retry_after=retry_after_from(exception),
                 is_retryable=True,
                 suggested_delay=5.0,
             )
@@ -291,14 +306,9 @@ class EnhancedErrorHandler:
     def _parse_retry_after(self, headers: Dict[str, str]) -> Optional[float]:
         """Parse Retry-After header value."""
         for header_name in self.rate_limit_headers:
-            header_value = headers.get(header_name.lower())
-            if header_value:
-                try:
-                    # Try parsing as seconds
-                    return float(header_value)
-                except ValueError:
-                    # Try parsing as HTTP date (not implemented here)
-                    pass
+            retry_after = parse_retry_after(headers.get(header_name.lower()))
+            if retry_after is not None:
+                return retry_after
 
         return None
 
@@ -356,6 +366,7 @@ class EnhancedErrorHandler:
         error_info: ErrorInfo,
         attempt: int,
         retry_config: Optional[RetryConfig] = None,
+        previous_delay: float = 0.0,
     ) -> float:
         """
         Calculate delay before next retry attempt.
@@ -364,6 +375,7 @@ class EnhancedErrorHandler:
             error_info: Information about the error
             attempt: Current attempt number (0-based)
             retry_config: Retry configuration to use
+            previous_delay: Delay used before this attempt, 0 for the first
 
         Returns:
             Delay in seconds
@@ -384,6 +396,9 @@ class EnhancedErrorHandler:
         elif config.strategy == RetryStrategy.LINEAR_BACKOFF:
             delay = base_delay * (attempt + 1)
         elif config.strategy == RetryStrategy.EXPONENTIAL_BACKOFF:
+            if config.jitter:
+                # Decorrelated jitter is already randomised
+                return decorrelated_jitter(base_delay, previous_delay, config.max_delay)
             delay = base_delay * (config.backoff_factor**attempt)
         elif config.strategy == RetryStrategy.ADAPTIVE:
             delay = self._calculate_adaptive_delay(error_info, attempt, config)
@@ -401,6 +416,43 @@ class EnhancedErrorHandler:
 
         return delay
 
+    def next_retry_delay(
+        self,
+        error_info: ErrorInfo,
+        attempt: int,
+        url: str,
+        previous_delay: float = 0.0,
+        retry_config: Optional[RetryConfig] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether to retry, drawing from the host's retry budget.
+
+        Args:
+            error_info: Information about the error
+            attempt: Current attempt number (0-based)
+            url: Request URL, whose host keys the retry budget
+            previous_delay: Delay used before this attempt, 0 for the first
+            retry_config: Retry configuration to use
+
+        Returns:
+            Delay in seconds before retrying, or None to give up
+        """
+        if not self.should_retry(error_info, attempt, retry_config):
+            return None
+        return self.retry_engine.next_delay(
+            urlparse(url).netloc or url,
+            attempt,
+            previous_delay,
+            error_info.retry_after,
+            delay=self.calculate_delay(
+                error_info, attempt, retry_config, previous_delay
+            ),
+        )
+
+    def record_attempt(self, url: str) -> None:
+        """Record an attempt against the retry budget of url's host."""
+        self.retry_engine.record_attempt(urlparse(url).netloc or url)
+
     def _calculate_adaptive_delay(
         self, error_info: ErrorInfo, attempt: int, config: RetryConfig
     ) -> float:
@@ -0,0 +1,165 @@
+"""
+Hedged requests for cutting tail latency on idempotent requests.
+
+When an attempt has not answered within the host's recent p95 (or another
+configured percentile), a second identical attempt is started. Whichever
+answers first wins and the other is cancelled. Because the first attempt is
+still holding its pooled connection, the hedge goes out on a different one,
+which is what rescues requests stuck behind a slow connection. Hedges are
+capped to a fraction of recent requests so that a slow host does not receive
+double traffic.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Optional, TypeVar
+
+from .metrics import HostLatencyTracker
+from .retry import RetryBudget
+
+T = TypeVar("T")
+
+
+@dataclass
+class HedgingConfig:
+    """Configuration for hedged requests."""
+
+    percentile: float = 95.0  # Host latency percentile that triggers a hedge
+    min_samples: int = 20  # Samples needed per host before hedging starts
+    min_delay: float = 0.01  # Never hedge sooner than this, in seconds
+    max_hedge_ratio: float = 0.05  # Hedges allowed per request in the window
+    window_seconds: float = 10.0  # Window the hedge ratio is measured over
+    latency_window: int = 200  # Recent response times kept per host
+    methods: FrozenSet[str] = field(default_factory=lambda: frozenset({"GET", "HEAD"}))
+
+
+class RequestHedger:
+    """Runs attempts with a latency-triggered hedge."""
+
+    def __init__(
+        self,
+        config: Optional[HedgingConfig] = None,
+        latencies: Optional[HostLatencyTracker] = None,
+    ):
+        """
+        Initialize request hedger.
+
+        Args:
+            config: Hedging configuration
+            latencies: Tracker supplying per-host response time percentiles
+        """
+        self.config = config or HedgingConfig()
+        self.latencies = latencies or HostLatencyTracker(
+            window=self.config.latency_window
+        )
+        self._budget = RetryBudget(
+            ratio=self.config.max_hedge_ratio,
+            min_retries_per_second=0.0,
+            window_seconds=self.config.window_seconds,
+        )
+        self._stats: Dict[str, int] = {
+            "requests": 0,
+            "hedges_issued": 0,
+            "hedges_won": 0,
+            "hedges_denied": 0,
+        }
+
+    def hedge_delay(self, host: str) -> Optional[float]:
+        """
+        Get how long to wait before hedging a request to host.
+
+        Returns:
+            Delay in seconds, or None until enough latency samples exist
+        """
+        if self.latencies.sample_count(host) < self.config.min_samples:
+            return None
+        threshold = self.latencies.percentile(host, self.config.percentile)
+        if threshold is None:
+            return None
+        return max(self.config.min_delay, threshold)
+
+    async def run(
+        self,
+        host: str,
+        attempt: Callable[[], Awaitable[T]],
+        hedge: Optional[Callable[[], Awaitable[T]]] = None,
+    ) -> T:
+        """
+        Run attempt, hedging it once if it is slower than the host threshold.
+
+        Args:
+            host: Host the request goes to
+            attempt: Callable starting one attempt of the request
+            hedge: Callable starting the hedge attempt, attempt if None
+
+        Returns:
+            Result of the first attempt to succeed
+
+        Raises:
+            Exception: The primary attempt's error if every attempt failed
+        """
+        self._stats["requests"] += 1
+        self._budget.record_request(host)
+        delay = self.hedge_delay(host)
+
+        primary_start = time.perf_counter()
+        primary = asyncio.ensure_future(self._timed(host, attempt))
+        pending = {primary}
+        try:
+            if delay is not None:
+                done, pending = await asyncio.wait(pending, timeout=delay)
+                if done:
+                    return primary.result()
+                if self._budget.try_acquire(host):
+                    self._stats["hedges_issued"] += 1
+                    hedged = asyncio.ensure_future(self._timed(host, hedge or attempt))
+                    pending = {primary, hedged}
+                    while pending:
+                        done, pending = await asyncio.wait(
+                            pending, return_when=asyncio.FIRST_COMPLETED
+                        )
+                        for task in done:
+                            if task.exception() is None:
+                                if task is hedged:
+                                    self._stats["hedges_won"] += 1
+                                    self._record_censored(host, primary, primary_start)
+                                return task.result()
+                    # Both failed; report the primary's error as if unhedged
+                    return primary.result()
+                self._stats["hedges_denied"] += 1
+            return await primary
+        finally:
+            # The loser, or everything if the caller was cancelled
+            for task in pending:
+                task.cancel()
+
+    async def _timed(self, host: str, attempt: Callable[[], Awaitable[T]]) -> T:
+        """Run one attempt and record its latency if it succeeds."""
+        start = time.perf_counter()
+        result = await attempt()
+        self.latencies.record(host, time.perf_counter() - start)
+        return result
+
+    def _record_censored(
+        self, host: str, primary: asyncio.Future[Any], start: float
+    ) -> None:
+        """
+        Record a primary that lost to its hedge as a lower-bound sample.
+
+        The primary is about to be cancelled, so _timed never records it.
+        Dropping it would leave only the fast answers in the window and pull
+        the host percentile, and with it the hedge delay, ever lower.
+        """
+        if not primary.done():
+            self.latencies.record(host, time.perf_counter() - start)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hedging statistics."""
+        stats: Dict[str, Any] = dict(self._stats)
+        issued = stats["hedges_issued"]
+        stats["hedge_rate"] = issued / stats["requests"] if stats["requests"] else 0.0
+        stats["win_rate"] = stats["hedges_won"] / issued if issued else 0.0
+        return stats
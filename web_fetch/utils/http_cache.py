@@ -0,0 +1,540 @@
+"""
+HTTP-semantics response cache (RFC 9111).
+
+HTTPCache sits on top of an EnhancedCache backend and decides freshness from
+what the server sent instead of a fixed TTL. It reads Cache-Control
+(max-age, no-cache, no-store, must-revalidate, stale-while-revalidate),
+Expires, Date and Age, falls back to the Last-Modified heuristic, and keys
+stored responses by the request headers named in Vary. Stale entries that
+carry an ETag or Last-Modified are kept so they can be revalidated with
+If-None-Match / If-Modified-Since; a 304 response then refreshes the stored
+headers and freshness without transferring the body again.
+"""
+
+import hashlib
+import time
+from dataclasses import dataclass, field, replace
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from ..models import FetchResult
+from .cache import EnhancedCache, EnhancedCacheEntry
+from .lru_cache import estimate_size
+
+# Status codes that may be cached without explicit freshness (RFC 9110 15.1)
+HEURISTICALLY_CACHEABLE = frozenset(
+    {200, 203, 204, 206, 300, 301, 308, 404, 405, 410, 414, 501}
+)
+
+# Fraction of the time since Last-Modified used as heuristic freshness
+HEURISTIC_FRACTION = 0.1
+
+# Headers from a 304 response that must not replace the stored ones
+_NOT_UPDATED_HEADERS = frozenset(
+    {
+        "content-length",
+        "content-encoding",
+        "transfer-encoding",
+        "connection",
+        "keep-alive",
+        "trailer",
+        "upgrade",
+    }
+)
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """
+    Parse a Cache-Control header into a directive map.
+
+    Args:
+        value: Header value, e.g. 'max-age=60, stale-while-revalidate=30'
+
+    Returns:
+        Lowercased directive names mapped to their unquoted argument, or None
+        for directives without one
+    """
+    directives: Dict[str, Optional[str]] = {}
+    if not value:
+        return directives
+    for part in value.split(","):
+        name, sep, argument = part.strip().partition("=")
+        name = name.strip().lower()
+        if not name:
+            continue
+        directives[name] = argument.strip().strip('"') if sep else None
+    return directives
+
+
+def _delta_seconds(directives: Mapping[str, Optional[str]], name: str) -> Optional[int]:
+    """
+    Read a delta-seconds directive argument, None if absent or malformed.
+
+    delta-seconds is a non-negative integer (RFC 9111 1.2.2), so signed or
+    decimal values such as '60.5' are malformed rather than rounded.
+    """
+    argument = directives.get(name)
+    if argument is None or not (argument.isascii() and argument.isdigit()):
+        return None
+    return int(argument)
+
+
+def _http_date(value: Optional[str]) -> Optional[float]:
+    """Parse an HTTP-date into a POSIX timestamp."""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _lower_headers(headers: Optional[Mapping[str, str]]) -> Dict[str, str]:
+    """Copy headers with lowercased names."""
+    return {name.lower(): value for name, value in (headers or {}).items()}
+
+
+class CacheState(str, Enum):
+    """Freshness of a stored response at lookup time."""
+
+    FRESH = "fresh"
+    STALE_WHILE_REVALIDATE = "stale-while-revalidate"
+    STALE = "stale"
+
+
+@dataclass
+class CachedResponse:
+    """A stored response with the timing needed to compute its age."""
+
+    result: FetchResult
+    request_time: float
+    response_time: float
+    initial_age: float
+    freshness_lifetime: float
+    stale_while_revalidate: float = 0.0
+    vary: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def etag(self) -> Optional[str]:
+        """Entity tag validator, if the response had one."""
+        return _lower_headers(self.result.headers).get("etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        """Last-Modified validator, if the response had one."""
+        return _lower_headers(self.result.headers).get("last-modified")
+
+    def current_age(self, now: float) -> float:
+        """Age of the response in seconds at time now (RFC 9111 4.2.3)."""
+        return self.initial_age + max(0.0, now - self.response_time)
+
+
+@dataclass
+class CacheLookup:
+    """Outcome of a cache lookup for a request."""
+
+    key: str
+    entry: CachedResponse
+    state: CacheState
+    age: float
+
+    def response(self) -> FetchResult:
+        """Copy of the stored result with an Age header for this lookup."""
+        headers = {
+            name: value
+            for name, value in self.entry.result.headers.items()
+            if name.lower() != "age"
+        }
+        headers["Age"] = str(int(self.age))
+        return replace(self.entry.result, headers=headers)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Validators to send when revalidating the stored response."""
+        headers: Dict[str, str] = {}
+        if self.entry.etag:
+            headers["If-None-Match"] = self.entry.etag
+        if self.entry.last_modified:
+            headers["If-Modified-Since"] = self.entry.last_modified
+        return headers
+
+
+class HTTPCache:
+    """
+    Private HTTP cache that follows server freshness and revalidates entries.
+
+    Only GET requests are looked up and stored. Responses are stored under a
+    per-URL index that records the Vary header names, and each variant lives
+    under a key derived from the request's values for those headers. Unsafe
+    requests that succeed invalidate the URL's index.
+
+    Example:
+        ```python
+        http_cache = HTTPCache(EnhancedCache(EnhancedCacheConfig()))
+        lookup = await http_cache.lookup(url, request_headers)
+        if lookup and lookup.state is CacheState.FRESH:
+            return lookup.response()
+        ```
+    """
+
+    def __init__(
+        self, cache: EnhancedCache, clock: Callable[[], float] = time.time
+    ) -> None:
+        """
+        Initialize HTTP cache.
+
+        Args:
+            cache: Enhanced cache whose backend stores the responses. Its
+                default_ttl caps heuristic freshness and is how long responses
+                with validators are kept past their freshness for revalidation.
+            clock: Wall-clock time source, in seconds since the epoch
+        """
+        self.cache = cache
+        self._clock = clock
+        self.stats = {
+            "fresh_hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "revalidations": 0,
+            "not_modified": 0,
+            "stores": 0,
+            "invalidations": 0,
+        }
+
+    def is_cacheable(self, method: str, request_headers: Mapping[str, str]) -> bool:
+        """
+        Check whether a request may be served from and stored in the cache.
+
+        Args:
+            method: HTTP method
+            request_headers: Request headers with lowercased names
+
+        Returns:
+            True for GET requests without no-store or caller-supplied validators
+        """
+        if method.upper() != "GET":
+            return False
+        if "if-none-match" in request_headers or "if-modified-since" in request_headers:
+            return False
+        directives = parse_cache_control(request_headers.get("cache-control"))
+        return "no-store" not in directives
+
+    async def lookup(
+        self, url: str, request_headers: Mapping[str, str]
+    ) -> Optional[CacheLookup]:
+        """
+        Find the stored response matching a request.
+
+        Args:
+            url: Request URL
+            request_headers: Request headers with lowercased names
+
+        Returns:
+            CacheLookup describing the stored response's freshness, or None
+        """
+        index = await self.cache.backend.get(self._index_key(url))
+        entry = None
+        key = ""
+        if index is not None:
+            key = self._variant_key(url, index.data, request_headers)
+            stored = await self.cache.backend.get(key)
+            entry = stored.data if stored is not None else None
+        if entry is None:
+            self.stats["misses"] += 1
+            self.cache.stats["misses"] += 1
+            return None
+
+        now = self._clock()
+        age = entry.current_age(now)
+        request_directives = parse_cache_control(request_headers.get("cache-control"))
+        lifetime = entry.freshness_lifetime
+        max_age = _delta_seconds(request_directives, "max-age")
+        if max_age is not None:
+            lifetime = min(lifetime, max_age)
+        force_revalidate = "no-cache" in request_directives or (
+            not request_directives and "no-cache" in request_headers.get("pragma", "")
+        )
+
+        if force_revalidate:
+            state = CacheState.STALE
+            self.stats["revalidations"] += 1
+        elif age < lifetime:
+            state = CacheState.FRESH
+            self.stats["fresh_hits"] += 1
+            self.cache.stats["hits"] += 1
+        elif age < lifetime + entry.stale_while_revalidate:
+            state = CacheState.STALE_WHILE_REVALIDATE
+            self.stats["stale_hits"] += 1
+            self.cache.stats["hits"] += 1
+        else:
+            state = CacheState.STALE
+            self.stats["revalidations"] += 1
+        return CacheLookup(key=key, entry=entry, state=state, age=age)
+
+    async def process_response(
+        self,
+        url: str,
+        method: str,
+        request_headers: Mapping[str, str],
+        result: FetchResult,
+        lookup: Optional[CacheLookup],
+        request_time: float,
+        response_time: float,
+    ) -> FetchResult:
+        """
+        Update the cache from a network response.
+
+        A 304 answering a revalidation refreshes the stored entry and returns
+        the stored result; a successful unsafe request invalidates the URL;
+        other cacheable GET responses are stored.
+
+        Args:
+            url: Request URL
+            method: HTTP method
+            request_headers: Request headers with lowercased names
+            result: Result built from the network response
+            lookup: Stale lookup that was revalidated, if any
+            request_time: Time the request was sent
+            response_time: Time the response was received
+
+        Returns:
+            Result to hand to the caller
+        """
+        if result.status_code == 304 and lookup is not None:
+            self.stats["not_modified"] += 1
+            return await self._refresh(
+                url, lookup, result.headers, request_time, response_time
+            )
+
+        if method.upper() not in ("GET", "HEAD", "OPTIONS"):
+            if result.is_success or 300 <= result.status_code < 400:
+                await self.invalidate(url)
+            return result
+
+        if self.is_cacheable(method, request_headers):
+            await self.store(url, request_headers, result, request_time, response_time)
+        return result
+
+    async def store(
+        self,
+        url: str,
+        request_headers: Mapping[str, str],
+        result: FetchResult,
+        request_time: float,
+        response_time: float,
+    ) -> bool:
+        """
+        Store a response if its status and Cache-Control allow it.
+
+        Args:
+            url: Request URL
+            request_headers: Request headers with lowercased names
+            result: Result built from the network response
+            request_time: Time the request was sent
+            response_time: Time the response was received
+
+        Returns:
+            True if the response was stored
+        """
+        if result.error is not None:
+            return False
+        headers = _lower_headers(result.headers)
+        directives = parse_cache_control(headers.get("cache-control"))
+        if "no-store" in directives:
+            return False
+        has_explicit = (
+            "max-age" in directives or "expires" in headers or "public" in directives
+        )
+        if result.status_code not in HEURISTICALLY_CACHEABLE and not has_explicit:
+            return False
+
+        vary_names = tuple(
+            sorted(
+                {
+                    name.strip().lower()
+                    for name in headers.get("vary", "").split(",")
+                    if name.strip()
+                }
+            )
+        )
+        if "*" in vary_names:
+            return False
+
+        entry = self._build_entry(
+            result, headers, directives, request_time, response_time
+        )
+        entry.vary = {name: request_headers.get(name, "") for name in vary_names}
+
+        retention = self._retention(entry)
+        if retention <= 0:
+            return False
+
+        key = self._variant_key(url, vary_names, request_headers)
+        stored = await self._write(key, entry, retention, result)
+        if stored:
+            await self._write_index(url, vary_names, retention)
+            self.stats["stores"] += 1
+        return stored
+
+    async def invalidate(self, url: str) -> None:
+        """Drop the stored responses for url."""
+        if await self.cache.backend.delete(self._index_key(url)):
+            self.stats["invalidations"] += 1
+            self.cache.stats["deletes"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get HTTP cache statistics.
+
+        Returns:
+            Lookup/revalidation counters plus the underlying cache statistics
+        """
+        stats: Dict[str, Any] = dict(self.stats)
+        stats["storage"] = self.cache.get_stats()
+        return stats
+
+    async def _refresh(
+        self,
+        url: str,
+        lookup: CacheLookup,
+        not_modified_headers: Mapping[str, str],
+        request_time: float,
+        response_time: float,
+    ) -> FetchResult:
+        """Merge a 304 response into the stored entry (RFC 9111 4.3.4)."""
+        stored = lookup.entry.result
+        updates = {
+            name.lower(): (name, value)
+            for name, value in not_modified_headers.items()
+            if name.lower() not in _NOT_UPDATED_HEADERS
+        }
+        merged = {
+            name: value
+            for name, value in stored.headers.items()
+            if name.lower() not in updates
+        }
+        merged.update(updates.values())
+
+        result = replace(stored, headers=merged)
+        headers = _lower_headers(merged)
+        directives = parse_cache_control(headers.get("cache-control"))
+        entry = self._build_entry(
+            result, headers, directives, request_time, response_time
+        )
+        entry.vary = lookup.entry.vary
+
+        retention = self._retention(entry)
+        if "no-store" in directives or retention <= 0:
+            await self.cache.backend.delete(lookup.key)
+        elif await self._write(lookup.key, entry, retention, result):
+            await self._write_index(url, tuple(sorted(entry.vary)), retention)
+        return result
+
+    def _build_entry(
+        self,
+        result: FetchResult,
+        headers: Mapping[str, str],
+        directives: Mapping[str, Optional[str]],
+        request_time: float,
+        response_time: float,
+    ) -> CachedResponse:
+        """Compute age and freshness for a response (RFC 9111 4.2)."""
+        date = _http_date(headers.get("date"))
+        apparent_age = max(0.0, response_time - date) if date is not None else 0.0
+        try:
+            age_value = max(0.0, float(headers.get("age", 0)))
+        except ValueError:
+            age_value = 0.0
+        initial_age = max(apparent_age, age_value + (response_time - request_time))
+
+        stale_while_revalidate = 0.0
+        if "no-cache" in directives:
+            lifetime = 0.0
+        elif "max-age" in directives:
+            # An invalid max-age makes the response stale (RFC 9111 4.2.1)
+            lifetime = float(_delta_seconds(directives, "max-age") or 0)
+        elif "expires" in headers:
+            expires = _http_date(headers["expires"])
+            base = date if date is not None else response_time
+            lifetime = max(0.0, expires - base) if expires is not None else 0.0
+        elif (last_modified := _http_date(headers.get("last-modified"))) is not None:
+            base = date if date is not None else response_time
+            lifetime = min(
+                max(0.0, (base - last_modified) * HEURISTIC_FRACTION),
+                self.cache.config.default_ttl,
+            )
+        else:
+            lifetime = 0.0
+
+        if "must-revalidate" not in directives and "no-cache" not in directives:
+            stale_while_revalidate = float(
+                _delta_seconds(directives, "stale-while-revalidate") or 0
+            )
+
+        return CachedResponse(
+            result=result,
+            request_time=request_time,
+            response_time=response_time,
+            initial_age=initial_age,
+            freshness_lifetime=lifetime,
+            stale_while_revalidate=stale_while_revalidate,
+        )
+
+    def _retention(self, entry: CachedResponse) -> float:
+        """
+        How long to keep an entry in the backend.
+
+        Entries with a validator outlive their freshness by default_ttl so a
+        stale entry can still be revalidated with a conditional request.
+        """
+        retention = entry.freshness_lifetime + entry.stale_while_revalidate
+        if entry.etag or entry.last_modified:
+            retention += self.cache.config.default_ttl
+        return retention
+
+    async def _write_index(
+        self, url: str, vary_names: Tuple[str, ...], retention: float
+    ) -> None:
+        """Write the per-URL index that records the Vary header names."""
+        await self.cache.backend.set(
+            EnhancedCacheEntry(
+                key=self._index_key(url),
+                data=vary_names,
+                timestamp=time.time(),
+                ttl=max(retention, self.cache.config.default_ttl),
+            )
+        )
+
+    async def _write(
+        self, key: str, entry: CachedResponse, retention: float, result: FetchResult
+    ) -> bool:
+        """Write a variant entry to the backend."""
+        success = await self.cache.backend.set(
+            EnhancedCacheEntry(
+                key=key,
+                data=entry,
+                timestamp=time.time(),
+                ttl=retention,
+                etag=entry.etag,
+                last_modified=entry.last_modified,
+                size=estimate_size(result.content),
+            )
+        )
+        if success:
+            self.cache.stats["sets"] += 1
+        return success
+
+    @staticmethod
+    def _index_key(url: str) -> str:
+        return hashlib.sha256(f"http-index|{url}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _variant_key(
+        url: str, vary_names: Tuple[str, ...], request_headers: Mapping[str, str]
+    ) -> str:
+        parts = [f"http-variant|{url}"]
+        for name in vary_names:
+            # Normalize whitespace so equivalent header values share a variant
+            value = " ".join(request_headers.get(name, "").split())
+            parts.append(f"{name}:{value}")
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
@@ -0,0 +1,310 @@
+"""
+O(1) LRU cache engine with TTL expiry and a memory budget.
+
+This module provides the in-memory storage engine shared by SimpleCache, the
+EnhancedCache memory backend and the advanced cache memory backend. Entries
+live in an OrderedDict kept in recency order, so lookups, inserts and LRU
+evictions are O(1). Expiry deadlines sit in a min-heap that is drained as
+time passes, so expired entries are dropped without scanning the table.
+
+All operations are synchronous. A coroutine on an event loop is only
+suspended at an await, so a call that contains none runs to completion before
+any other coroutine resumes; callers therefore do not need an asyncio.Lock
+around these operations. Deduplication and the circuit breaker rely on the
+same guarantee for their own bookkeeping. None of this makes the cache safe
+to share between threads.
+"""
+
+import heapq
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the memory footprint of a cached value in bytes.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Length for bytes-like and string values, length of str() otherwise
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value)
+    if value is None:
+        return 0
+    return len(str(value))
+
+
+class _Slot:
+    """Stored value with its size and expiry deadline."""
+
+    __slots__ = ("value", "size", "expires_at")
+
+    def __init__(self, value: Any, size: int, expires_at: Optional[float]) -> None:
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Least-recently-used cache bounded by entry count and total bytes.
+
+    Entries may carry a TTL; expired entries are never returned and are
+    removed either when looked up or when their deadline reaches the top of
+    the expiry heap. When a limit would be exceeded, the least recently used
+    entries are evicted one at a time until the new entry fits.
+
+    Example:
+        ```python
+        cache = LRUCache(max_entries=1000, max_bytes=50 * 1024 * 1024)
+        cache.set("key", b"value", ttl=60)
+        value = cache.get("key")
+        ```
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        default_ttl: Optional[float] = None,
+        sizer: Callable[[Any], int] = estimate_size,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize LRU cache.
+
+        Args:
+            max_entries: Maximum number of entries, unbounded if None
+            max_bytes: Maximum total size of entries in bytes, unbounded if None
+            default_ttl: TTL in seconds for entries set without one; None never expires
+            sizer: Callable returning the size of a value in bytes
+            clock: Time source for TTLs, in seconds
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._sizer = sizer
+        self._clock = clock
+
+        self._data: "OrderedDict[K, _Slot]" = OrderedDict()
+        self._expiry: List[Tuple[float, int, K]] = []
+        self._counter = 0
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def current_bytes(self) -> int:
+        """Total size of stored entries in bytes."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        slot = self._data.get(cast(K, key))
+        return slot is not None and not self._is_expired(slot)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(list(self._data))
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """
+        Get a value and mark it as most recently used.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value, or default if missing or expired
+        """
+        slot = self._data.get(key)
+        if slot is None:
+            self.misses += 1
+            return default
+        if self._is_expired(slot):
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return slot.value  # type: ignore[no-any-return]
+
+    def peek(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Get a value without updating recency or hit counters."""
+        slot = self._data.get(key)
+        if slot is None or self._is_expired(slot):
+            return default
+        return slot.value  # type: ignore[no-any-return]
+
+    def set(
+        self,
+        key: K,
+        value: V,
+        ttl: Optional[float] = None,
+        size: Optional[int] = None,
+    ) -> bool:
+        """
+        Store a value as the most recently used entry.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds until the entry expires; default_ttl if None
+            size: Size of value in bytes; measured with the sizer if None
+
+        Returns:
+            False if the value alone exceeds max_bytes and was not stored
+        """
+        if size is None:
+            size = self._sizer(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            self.delete(key)
+            return False
+
+        if ttl is None:
+            ttl = self.default_ttl
+        now = self._clock() if ttl is not None or self._expiry else 0.0
+        expires_at = now + ttl if ttl is not None else None
+
+        old = self._data.pop(key, None)
+        if old is not None:
+            self._bytes -= old.size
+
+        self._data[key] = _Slot(value, size, expires_at)
+        self._bytes += size
+        if expires_at is not None:
+            self._counter += 1
+            heapq.heappush(self._expiry, (expires_at, self._counter, key))
+            if len(self._expiry) > 2 * len(self._data) + 64:
+                self._rebuild_expiry()
+
+        if self._expiry and self._expiry[0][0] <= now:
+            self.purge_expired()
+        if (self.max_entries is not None and len(self._data) > self.max_entries) or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            self._evict()
+        return True
+
+    def delete(self, key: K) -> bool:
+        """
+        Remove an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if the entry existed
+        """
+        if key not in self._data:
+            return False
+        self._remove(key)
+        return True
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+        self._expiry.clear()
+        self._bytes = 0
+
+    def keys(self) -> List[K]:
+        """Get keys of unexpired entries, least recently used first."""
+        self.purge_expired()
+        return list(self._data)
+
+    def purge_expired(self) -> int:
+        """
+        Drop entries whose deadline has passed.
+
+        Returns:
+            Number of entries removed
+        """
+        now = self._clock()
+        removed = 0
+        heap = self._expiry
+        while heap and heap[0][0] <= now:
+            expires_at, _, key = heapq.heappop(heap)
+            slot = self._data.get(key)
+            # Stale heap items belong to entries that were replaced or deleted
+            if slot is not None and slot.expires_at == expires_at:
+                self._remove(key)
+                removed += 1
+
+        self.expirations += removed
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, byte usage and hit/miss/eviction counters
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _is_expired(self, slot: _Slot) -> bool:
+        return slot.expires_at is not None and self._clock() >= slot.expires_at
+
+    def _remove(self, key: K) -> None:
+        slot = self._data.pop(key)
+        self._bytes -= slot.size
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until both limits are met."""
+        data = self._data
+        while data and (
+            (self.max_entries is not None and len(data) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, slot = data.popitem(last=False)
+            self._bytes -= slot.size
+            self.evictions += 1
+
+    def _rebuild_expiry(self) -> None:
+        """Drop stale heap items once they outnumber live entries."""
+        self._expiry = [
+            item
+            for item in self._expiry
+            if (slot := self._data.get(item[2])) is not None
+            and slot.expires_at == item[0]
+        ]
+        heapq.heapify(self._expiry)
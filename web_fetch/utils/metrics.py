@@ -13,6 +13,8 @@ from datetime import datetime, timedelta
 from typing import Any, Deque, Dict, List, Optional
 from urllib.parse import urlparse
 
+from .lru_cache import LRUCache
+
 
 @dataclass
 class RequestMetrics:
@@ -332,6 +334,77 @@ class MetricsCollector:
         self._start_time = datetime.now()
 
 
+class HostLatencyTracker:
+    """
+    Rolling per-host response times with cached percentiles.
+
+    Keeps the last ``window`` samples for each host and re-sorts them only
+    every ``refresh_every`` new samples, so percentile() is cheap enough to
+    call before every request.
+    """
+
+    def __init__(
+        self, window: int = 200, refresh_every: int = 20, max_hosts: int = 1024
+    ):
+        """
+        Initialize latency tracker.
+
+        Args:
+            window: Samples kept per host
+            refresh_every: New samples between percentile recomputations
+            max_hosts: Hosts tracked before the least recently used is dropped
+        """
+        self.window = window
+        self.refresh_every = max(1, refresh_every)
+        self._hosts: LRUCache[str, _HostLatencies] = LRUCache(max_entries=max_hosts)
+
+    def record(self, host: str, response_time: float) -> None:
+        """Record a response time in seconds for host."""
+        latencies = self._hosts.get(host)
+        if latencies is None:
+            latencies = _HostLatencies(self.window)
+            self._hosts.set(host, latencies)
+        latencies.samples.append(response_time)
+        latencies.pending += 1
+
+    def sample_count(self, host: str) -> int:
+        """Get the number of samples held for host."""
+        latencies = self._hosts.peek(host)
+        return len(latencies.samples) if latencies else 0
+
+    def percentile(self, host: str, percentile: float) -> Optional[float]:
+        """
+        Get a response time percentile for host.
+
+        Args:
+            host: Host to look up
+            percentile: Percentile between 0 and 100
+
+        Returns:
+            Response time in seconds, or None if host has no samples
+        """
+        latencies = self._hosts.get(host)
+        if latencies is None or not latencies.samples:
+            return None
+        if latencies.pending >= self.refresh_every or not latencies.sorted_samples:
+            latencies.sorted_samples = sorted(latencies.samples)
+            latencies.pending = 0
+        ordered = latencies.sorted_samples
+        index = min(int((percentile / 100) * len(ordered)), len(ordered) - 1)
+        return ordered[index]
+
+
+class _HostLatencies:
+    """Samples and cached sort order for one host."""
+
+    __slots__ = ("samples", "sorted_samples", "pending")
+
+    def __init__(self, window: int) -> None:
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.sorted_samples: List[float] = []
+        self.pending = 0
+
+
 # Global metrics collector instance
 _global_collector = MetricsCollector()
 
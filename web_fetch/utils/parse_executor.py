@@ -0,0 +1,154 @@
+"""
+Off-loop content parsing for the web_fetch library.
+
+This module moves CPU-bound parsing work (BeautifulSoup tree building, text
+extraction, link/image scans) off the asyncio event loop so that a single large
+page cannot stall every other in-flight socket. Work can run inline, on a thread
+pool, or on a process pool. Workers always receive the raw response bytes and
+return plain picklable data, so the same entry points work for every mode.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from ..models.base import ParseExecutorMode
+from ..parsers.html_document import ParsedHTMLDocument
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def parse_html_bytes(content_bytes: bytes) -> Dict[str, Any]:
+    """
+    Parse raw HTML bytes into the structured dict returned by WebFetcher.
+
+    This is a module-level function so it can be pickled and shipped to
+    process pool workers.
+
+    Args:
+        content_bytes: Raw response body
+
+    Returns:
+        Dictionary with title, text, links and images keys
+    """
+    return ParsedHTMLDocument.from_bytes(content_bytes).to_dict()
+
+
+def parse_html_document(content_bytes: bytes) -> ParsedHTMLDocument:
+    """
+    Parse raw HTML bytes into a document whose derived values are computed.
+
+    The document keeps its tree for later consumers, so it cannot be pickled;
+    only use this where :meth:`ParseExecutor.parses_locally` is true.
+
+    Args:
+        content_bytes: Raw response body
+
+    Returns:
+        ParsedHTMLDocument with title, text, links and images cached
+    """
+    document = ParsedHTMLDocument.from_bytes(content_bytes)
+    document.to_dict()
+    return document
+
+
+class ParseExecutor:
+    """
+    Dispatches parse functions inline, to a thread pool, or to a process pool.
+
+    The underlying pool is created lazily on first use and released by
+    :meth:`shutdown`. Payloads smaller than ``offload_threshold`` bytes are
+    always parsed inline because the dispatch cost outweighs the parse cost.
+    """
+
+    def __init__(
+        self,
+        mode: ParseExecutorMode = ParseExecutorMode.INLINE,
+        max_workers: Optional[int] = None,
+        offload_threshold: int = 0,
+    ) -> None:
+        """
+        Initialize parse executor.
+
+        Args:
+            mode: Where parse work runs
+            max_workers: Pool size, defaults to the CPU count (capped at 8)
+            offload_threshold: Minimum payload size in bytes to offload
+        """
+        self.mode = ParseExecutorMode(mode)
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.offload_threshold = offload_threshold
+        self._executor: Optional[Executor] = None
+
+        # Statistics
+        self.inline_count = 0
+        self.offloaded_count = 0
+
+    def _get_executor(self) -> Executor:
+        """Create the worker pool on first use."""
+        if self._executor is None:
+            if self.mode == ParseExecutorMode.PROCESS:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="web_fetch-parse",
+                )
+        return self._executor
+
+    def parses_locally(self, size: int) -> bool:
+        """
+        Check whether a payload of size bytes is parsed in this process.
+
+        Results of local parses are handed back as is, so they may hold
+        objects that cannot be pickled.
+        """
+        return self.mode != ParseExecutorMode.PROCESS or size < self.offload_threshold
+
+    async def run(self, func: Callable[[bytes], T], content_bytes: bytes) -> T:
+        """
+        Run a parse function against raw bytes according to the configured mode.
+
+        Args:
+            func: Module-level (picklable) function taking the raw bytes
+            content_bytes: Raw response body
+
+        Returns:
+            Whatever ``func`` returns
+        """
+        if (
+            self.mode == ParseExecutorMode.INLINE
+            or len(content_bytes) < self.offload_threshold
+        ):
+            self.inline_count += 1
+            return func(content_bytes)
+
+        self.offloaded_count += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), partial(func, content_bytes)
+        )
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Release the worker pool, if one was created."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get executor statistics."""
+        return {
+            "mode": self.mode.value,
+            "max_workers": self.max_workers,
+            "offload_threshold": self.offload_threshold,
+            "inline_count": self.inline_count,
+            "offloaded_count": self.offloaded_count,
+            "pool_active": self._executor is not None,
+        }
@@ -0,0 +1,138 @@
+"""
+Streaming access to HTTP response bodies.
+
+ResponseStream hands out the body as memoryview chunks exactly as they come
+off the connection, so consumers such as hashers, file writers and
+incremental parsers can process large responses without the body ever being
+joined into one bytes object. The size limit is enforced on the running
+total, so an oversized response is abandoned after at most one chunk past
+the limit instead of after it has been fully buffered.
+"""
+
+from __future__ import annotations
+
+import inspect
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from aiohttp import ClientResponse
+
+from ..exceptions import ContentError, WebFetchError
+from ..parsers.csv_stream import CSVBatch, iter_csv_batches
+from ..parsers.json_stream import iter_json_items
+
+
+class ResponseStream:
+    """Async iterator over a response body as memoryview chunks."""
+
+    def __init__(
+        self,
+        response: ClientResponse,
+        url: str,
+        max_size: int,
+        chunk_size: Optional[int] = None,
+        retry_count: int = 0,
+    ):
+        """
+        Initialize response stream.
+
+        Args:
+            response: Open aiohttp response whose body has not been read
+            url: Requested URL
+            max_size: Largest body in bytes before the stream is aborted
+            chunk_size: Fixed chunk size; None yields chunks as received,
+                which avoids re-slicing the connection buffer
+            retry_count: Attempts that failed before this response
+        """
+        self.url = url
+        self.status_code = response.status
+        self.headers: Dict[str, str] = dict(response.headers)
+        self.max_size = max_size
+        self.chunk_size = chunk_size
+        self.retry_count = retry_count
+        self.bytes_read = 0
+        self._response = response
+        self._consumed = False
+
+    @property
+    def content_length(self) -> Optional[int]:
+        """Declared body size, if the server sent Content-Length."""
+        return self._response.content_length
+
+    def __aiter__(self) -> AsyncIterator[memoryview]:
+        if self._consumed:
+            raise WebFetchError(f"Response body for {self.url} already consumed")
+        self._consumed = True
+        return self._chunks()
+
+    async def _chunks(self) -> AsyncIterator[memoryview]:
+        reader = self._response.content
+        source = (
+            reader.iter_chunked(self.chunk_size) if self.chunk_size else reader.iter_any()
+        )
+        async for chunk in source:
+            self.bytes_read += len(chunk)
+            if self.bytes_read > self.max_size:
+                # Drop the connection rather than draining the rest of the body
+                self._response.close()
+                raise ContentError(
+                    f"Response size exceeds maximum {self.max_size}",
+                    url=self.url,
+                    content_length=self.bytes_read,
+                )
+            yield memoryview(chunk)
+
+    async def pipe(self, *consumers: Callable[[memoryview], Any]) -> int:
+        """
+        Feed every chunk to each consumer in turn.
+
+        Consumers may be plain callables such as ``hashlib.sha256().update``
+        or coroutine functions such as an aiofiles ``write``.
+
+        Args:
+            *consumers: Callables receiving each chunk
+
+        Returns:
+            Number of body bytes read
+        """
+        async for chunk in self:
+            for consumer in consumers:
+                outcome = consumer(chunk)
+                if inspect.isawaitable(outcome):
+                    await outcome
+        return self.bytes_read
+
+    def iter_json(self, prefix: str = "item", backend: str = "auto") -> AsyncIterator[Any]:
+        """
+        Parse the body incrementally and yield the JSON values at prefix.
+
+        Args:
+            prefix: Path of the values to yield, see parsers.json_stream
+            backend: Item decoder, ``"auto"``, ``"orjson"`` or ``"json"``
+
+        Returns:
+            Async iterator of decoded items
+        """
+        return iter_json_items(self, prefix, backend)
+
+    def iter_csv(
+        self,
+        batch_size: int = 10_000,
+        encoding: Optional[str] = None,
+        has_header: Optional[bool] = None,
+    ) -> AsyncIterator[CSVBatch]:
+        """
+        Parse the body incrementally into typed column batches.
+
+        Args:
+            batch_size: Rows per batch
+            encoding: Text encoding; detected from the first chunk when None
+            has_header: Whether the first row is a header; detected when None
+
+        Returns:
+            Async iterator of CSVBatch objects
+        """
+        return iter_csv_batches(self, batch_size, encoding, has_header)
+
+    async def read(self) -> bytes:
+        """Read the remaining body into a single bytes object."""
+        return b"".join([chunk async for chunk in self])
@@ -0,0 +1,310 @@
+"""
+Shared retry engine with decorrelated-jitter backoff and retry budgets.
+
+Every subsystem that retries (WebFetcher, GraphQL, FTP and authentication)
+computes its backoff here and draws retries from a common RetryBudget. The
+budget caps retries to a fraction of recent requests, per host and across the
+process, so a struggling server sees a bounded amount of extra load instead of
+every caller multiplying its traffic by max_retries.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from .lru_cache import LRUCache
+
+GLOBAL_KEY = "*"
+
+
+def parse_retry_after(
+    value: Optional[str], now: Optional[float] = None
+) -> Optional[float]:
+    """
+    Parse a Retry-After header value into seconds.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP-date
+        now: Wall-clock time to measure an HTTP-date against
+
+    Returns:
+        Seconds to wait (never negative), or None if the value is unusable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+    return max(0.0, retry_at - (time.time() if now is None else now))
+
+
+def decorrelated_jitter(base: float, previous: float, cap: float) -> float:
+    """
+    Draw a backoff delay with decorrelated jitter.
+
+    Args:
+        base: Smallest delay
+        previous: Delay used before the failed attempt, 0 for the first
+        cap: Largest delay
+
+    Returns:
+        Delay in seconds between base and three times previous, at most cap
+    """
+    if base <= 0:
+        return 0.0
+    return min(cap, random.uniform(base, max(base, previous * 3)))
+
+
+def retry_after_from(error: BaseException) -> Optional[float]:
+    """
+    Get the server-requested retry delay carried by an exception.
+
+    Looks for a ``retry_after`` attribute first and falls back to a
+    Retry-After entry in the exception's ``headers``.
+
+    Args:
+        error: Exception raised by a failed attempt
+
+    Returns:
+        Seconds to wait, or None if the server did not say
+    """
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except (TypeError, ValueError):
+            pass
+    headers: Optional[Mapping[str, Any]] = getattr(error, "headers", None)
+    if headers:
+        for name, value in headers.items():
+            if str(name).lower() == "retry-after":
+                return parse_retry_after(str(value))
+    return None
+
+
+class _BudgetWindow:
+    """Ring buffer of request and retry counts over a sliding window."""
+
+    __slots__ = ("_width", "_epochs", "_requests", "_retries")
+
+    def __init__(self, window_seconds: float, buckets: int) -> None:
+        buckets = max(1, buckets)
+        self._width = window_seconds / buckets
+        self._epochs = [-1] * buckets
+        self._requests = [0] * buckets
+        self._retries = [0] * buckets
+
+    def _bucket(self, now: float) -> int:
+        """Get the slot for now, clearing it if it is from an old window."""
+        epoch = int(now / self._width)
+        index = epoch % len(self._epochs)
+        if self._epochs[index] != epoch:
+            self._epochs[index] = epoch
+            self._requests[index] = 0
+            self._retries[index] = 0
+        return index
+
+    def add_request(self, now: float) -> None:
+        self._requests[self._bucket(now)] += 1
+
+    def add_retry(self, now: float) -> None:
+        self._retries[self._bucket(now)] += 1
+
+    def counts(self, now: float) -> tuple[int, int]:
+        """Sum requests and retries over the buckets inside the window."""
+        oldest = int(now / self._width) - len(self._epochs) + 1
+        requests = retries = 0
+        for index, epoch in enumerate(self._epochs):
+            if epoch >= oldest:
+                requests += self._requests[index]
+                retries += self._retries[index]
+        return requests, retries
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of recent requests, per key and globally.
+
+    Every attempt deposits a request; a retry is allowed only while the
+    retries in the window stay within ``ratio`` of the requests plus a small
+    reserve of ``min_retries_per_second`` so that low-traffic callers can
+    still retry. A retry must fit both its own key's budget and the global
+    one. Keys are hosts (netlocs), so each destination gets its own share;
+    the least recently used are dropped once ``max_keys`` is reached.
+
+    The reserve is a flat allowance on top of the ratio: with the defaults a
+    key may retry up to 10 times per 10 second window even with no traffic,
+    after which only 10% of its requests may be retried. Raise it for
+    clients that make few requests but must ride out brief outages, or pass
+    a budget with a different reserve to RetryEngine.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        min_retries_per_second: float = 1.0,
+        window_seconds: float = 10.0,
+        window_buckets: int = 10,
+        max_keys: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize retry budget.
+
+        Args:
+            ratio: Retries allowed per request in the window
+            min_retries_per_second: Reserve allowed regardless of traffic,
+                multiplied by window_seconds to give retries per window
+            window_seconds: Length of the sliding window
+            window_buckets: Ring buffer slots the window is split into
+            max_keys: Per-key windows kept before the oldest are dropped
+            clock: Monotonic time source
+        """
+        self.ratio = ratio
+        self.reserve = min_retries_per_second * window_seconds
+        self.window_seconds = window_seconds
+        self.window_buckets = window_buckets
+        self._clock = clock
+        self._global = _BudgetWindow(window_seconds, window_buckets)
+        self._windows: LRUCache[str, _BudgetWindow] = LRUCache(max_entries=max_keys)
+        self._allowed = 0
+        self._denied = 0
+
+    def _window(self, key: str) -> _BudgetWindow:
+        window = self._windows.get(key)
+        if window is None:
+            window = _BudgetWindow(self.window_seconds, self.window_buckets)
+            self._windows.set(key, window)
+        return window
+
+    def _has_room(self, window: _BudgetWindow, now: float) -> bool:
+        requests, retries = window.counts(now)
+        return retries + 1 <= requests * self.ratio + self.reserve
+
+    def record_request(self, key: str = GLOBAL_KEY) -> None:
+        """Record an attempt (first try or retry) against key."""
+        now = self._clock()
+        self._global.add_request(now)
+        if key != GLOBAL_KEY:
+            self._window(key).add_request(now)
+
+    def try_acquire(self, key: str = GLOBAL_KEY) -> bool:
+        """
+        Withdraw one retry from the budget.
+
+        Args:
+            key: Budget key, usually the host being retried
+
+        Returns:
+            True if the retry may go ahead, False if the budget is spent
+        """
+        now = self._clock()
+        window = self._window(key) if key != GLOBAL_KEY else None
+        if not self._has_room(self._global, now) or (
+            window is not None and not self._has_room(window, now)
+        ):
+            self._denied += 1
+            return False
+        self._global.add_retry(now)
+        if window is not None:
+            window.add_retry(now)
+        self._allowed += 1
+        return True
+
+    def get_stats(self, key: Optional[str] = None) -> Dict[str, Any]:
+        """Get budget statistics, for one key or globally."""
+        now = self._clock()
+        window = self._global if key is None else self._windows.peek(key)
+        requests, retries = window.counts(now) if window else (0, 0)
+        return {
+            "requests": requests,
+            "retries": retries,
+            "retries_allowed": self._allowed,
+            "retries_denied": self._denied,
+            "tracked_keys": len(self._windows),
+        }
+
+
+# Process-wide budget shared by every RetryEngine that is not given its own
+retry_budget = RetryBudget()
+
+
+@dataclass
+class RetryEngine:
+    """
+    Computes retry delays and gates retries through a RetryBudget.
+
+    Backoff uses decorrelated jitter: each delay is drawn uniformly between
+    ``base_delay`` and three times the previous delay, capped at
+    ``max_delay``. This spreads out clients that failed together better than
+    exponential backoff with proportional jitter. A server-supplied
+    Retry-After is treated as a floor; if it exceeds ``max_retry_after`` the
+    retry is abandoned rather than parking the caller for that long.
+    """
+
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+    max_retry_after: float = 300.0
+    jitter: bool = True
+    budget: RetryBudget = field(default_factory=lambda: retry_budget)
+
+    def backoff(self, attempt: int, previous_delay: float = 0.0) -> float:
+        """
+        Get the backoff before the retry following attempt.
+
+        Args:
+            attempt: Failed attempt number (0-based)
+            previous_delay: Delay used before that attempt, 0 for the first
+
+        Returns:
+            Delay in seconds
+        """
+        if not self.jitter:
+            return float(min(self.max_delay, self.base_delay * (2**attempt)))
+        return decorrelated_jitter(self.base_delay, previous_delay, self.max_delay)
+
+    def next_delay(
+        self,
+        key: str,
+        attempt: int,
+        previous_delay: float = 0.0,
+        retry_after: Optional[float] = None,
+        delay: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether to retry and how long to wait first.
+
+        Args:
+            key: Budget key, usually the host being retried
+            attempt: Failed attempt number (0-based)
+            previous_delay: Delay used before that attempt, 0 for the first
+            retry_after: Server-requested delay in seconds, if any
+            delay: Backoff computed by the caller's own strategy; defaults
+                to decorrelated jitter
+
+        Returns:
+            Delay in seconds, or None if the retry should not happen
+        """
+        if retry_after is not None and retry_after > self.max_retry_after:
+            return None
+        if not self.budget.try_acquire(key):
+            return None
+        if delay is None:
+            delay = self.backoff(attempt, previous_delay)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def record_attempt(self, key: str) -> None:
+        """Record an attempt against the budget for key."""
+        self.budget.record_request(key)
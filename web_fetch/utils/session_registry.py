@@ -0,0 +1,218 @@
+"""
+Process-wide registry of shared aiohttp sessions.
+
+Short-lived fetchers (convenience functions, resource components, batch
+processors) would otherwise build a new ClientSession and TCP connector on
+every call, discarding keep-alive connections, the DNS cache and TLS sessions.
+The registry hands out one session per event loop and connection-relevant
+configuration key, counts references to it, and closes it once it has been
+idle for a while or when its event loop shuts down.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Optional, Set
+
+from aiohttp import ClientSession
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _SharedSession:
+    """A registered session and its reference count."""
+
+    key: Hashable
+    session: ClientSession
+    refs: int = 0
+    idle_handle: Optional[asyncio.TimerHandle] = None
+
+
+@dataclass
+class _LoopSessions:
+    """Sessions registered on one event loop."""
+
+    sessions: Dict[Hashable, _SharedSession] = field(default_factory=dict)
+    by_id: Dict[int, _SharedSession] = field(default_factory=dict)
+    keeper: Optional[asyncio.Task[None]] = None
+    closing: Set[asyncio.Task[None]] = field(default_factory=set)
+
+
+class SessionRegistry:
+    """
+    Reference-counted, event-loop-aware registry of shared ClientSessions.
+
+    Sessions are bound to the loop they were created on, so each loop gets its
+    own set. A session is closed when it has had no references for
+    idle_timeout seconds, when close_all() is called, or when its loop shuts
+    down: a small keeper task per loop is cancelled by asyncio.run() on exit
+    and closes whatever is left.
+
+    Example:
+        ```python
+        session = await registry.acquire(key, build_session)
+        try:
+            async with session.get(url) as response:
+                ...
+        finally:
+            await registry.release(session)
+        ```
+    """
+
+    def __init__(self, idle_timeout: float = 60.0) -> None:
+        """
+        Initialize registry.
+
+        Args:
+            idle_timeout: Seconds an unreferenced session is kept open
+        """
+        self.idle_timeout = idle_timeout
+        self._loops: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopSessions
+        ] = weakref.WeakKeyDictionary()
+        self._created = 0
+        self._reused = 0
+
+    def _loop_sessions(self) -> _LoopSessions:
+        """Get the session table for the running loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        state = self._loops.get(loop)
+        if state is None:
+            state = self._loops[loop] = _LoopSessions()
+        if state.keeper is None or state.keeper.done():
+            state.keeper = loop.create_task(self._keep(loop, state))
+        return state
+
+    async def acquire(
+        self, key: Hashable, factory: Callable[[], ClientSession]
+    ) -> ClientSession:
+        """
+        Get the shared session for key, creating it with factory if needed.
+
+        Args:
+            key: Hashable description of the connection-relevant settings
+            factory: Callable that builds a new ClientSession
+
+        Returns:
+            Shared ClientSession; pass it to release() when done
+        """
+        state = self._loop_sessions()
+        shared = state.sessions.get(key)
+
+        if shared is None or shared.session.closed:
+            shared = _SharedSession(key=key, session=factory())
+            state.sessions[key] = shared
+            state.by_id[id(shared.session)] = shared
+            self._created += 1
+        else:
+            self._reused += 1
+
+        if shared.idle_handle is not None:
+            shared.idle_handle.cancel()
+            shared.idle_handle = None
+
+        shared.refs += 1
+        return shared.session
+
+    async def release(self, session: ClientSession) -> None:
+        """
+        Drop a reference to a session obtained from acquire().
+
+        Args:
+            session: Session returned by acquire()
+        """
+        loop = asyncio.get_running_loop()
+        state = self._loops.get(loop)
+        shared = state.by_id.get(id(session)) if state else None
+        if state is None or shared is None or shared.session is not session:
+            # Not ours (or already closed): close it like an owned session
+            await session.close()
+            return
+
+        shared.refs = max(0, shared.refs - 1)
+        if shared.refs == 0:
+            shared.idle_handle = loop.call_later(
+                self.idle_timeout, self._expire, state, shared
+            )
+
+    def _expire(self, state: _LoopSessions, shared: _SharedSession) -> None:
+        """Close a session that stayed idle for idle_timeout."""
+        shared.idle_handle = None
+        if shared.refs == 0 and self._forget(state, shared):
+            task = asyncio.get_running_loop().create_task(shared.session.close())
+            state.closing.add(task)
+            task.add_done_callback(state.closing.discard)
+
+    def _forget(self, state: _LoopSessions, shared: _SharedSession) -> bool:
+        """Remove shared from the table. Returns False if it was not registered."""
+        if state.sessions.get(shared.key) is not shared:
+            return False
+        del state.sessions[shared.key]
+        state.by_id.pop(id(shared.session), None)
+        if shared.idle_handle is not None:
+            shared.idle_handle.cancel()
+            shared.idle_handle = None
+        return True
+
+    async def _keep(
+        self, loop: asyncio.AbstractEventLoop, state: _LoopSessions
+    ) -> None:
+        """Close the loop's sessions and drop its table when the loop shuts down."""
+        try:
+            await asyncio.Future()
+        finally:
+            await self._close_sessions(state)
+            # The keeper references the loop, so the weak key cannot drop on its own
+            if self._loops.get(loop) is state:
+                del self._loops[loop]
+
+    async def _close_sessions(self, state: _LoopSessions) -> None:
+        """Close and forget every session in state."""
+        for shared in list(state.sessions.values()):
+            self._forget(state, shared)
+            try:
+                await shared.session.close()
+            except Exception as e:
+                logger.debug(f"Error closing shared session: {e}")
+
+    async def close_all(self) -> None:
+        """Close every shared session on the running loop."""
+        state = self._loops.get(asyncio.get_running_loop())
+        if state is None:
+            return
+        await self._close_sessions(state)
+        if state.keeper is not None:
+            state.keeper.cancel()
+            state.keeper = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get registry statistics for the running loop.
+
+        Returns:
+            Dictionary with open session count and creation/reuse counters
+        """
+        try:
+            state = self._loops.get(asyncio.get_running_loop())
+        except RuntimeError:
+            state = None
+        sessions = list(state.sessions.values()) if state else []
+        return {
+            "open_sessions": len(sessions),
+            "referenced_sessions": sum(1 for s in sessions if s.refs > 0),
+            "sessions_created": self._created,
+            "sessions_reused": self._reused,
+        }
+
+
+# Global registry used by WebFetcher(shared_session=True)
+shared_sessions = SessionRegistry()
+
+
+async def close_shared_sessions() -> None:
+    """Close all shared sessions on the running event loop."""
+    await shared_sessions.close_all()
@@ -11,7 +11,7 @@ import json
 import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, AsyncIterable, Callable, Dict, List, Optional, Union
 from urllib.parse import urljoin, urlparse
 
 try:
@@ -28,6 +28,9 @@ try:
 except ImportError:
     HAS_JSONPATH = False
 
+from ..parsers.html_document import ParsedHTMLDocument
+from .response_stream import ResponseStream
+
 
 @dataclass
 class TransformationResult:
@@ -80,19 +83,27 @@ class Transformer(ABC):
 class JSONPathExtractor(Transformer):
     """Extract data from JSON using JSONPath expressions."""
 
-    def __init__(self, expressions: Dict[str, str], strict: bool = False):
+    def __init__(
+        self,
+        expressions: Dict[str, str],
+        strict: bool = False,
+        stream_prefix: str = "item",
+    ):
         """
         Initialize JSONPath extractor.
 
         Args:
             expressions: Dict mapping field names to JSONPath expressions
             strict: If True, fail if any expression doesn't match
+            stream_prefix: Values to parse out of a ResponseStream, which are
+                then handled like any other stream of items
         """
         if not HAS_JSONPATH:
             raise ImportError("jsonpath-ng is required for JSONPathExtractor")
 
         self.expressions = expressions
         self.strict = strict
+        self.stream_prefix = stream_prefix
         self._compiled_expressions = {
             name: jsonpath_ng.parse(expr) for name, expr in expressions.items()
         }
@@ -100,7 +111,19 @@ class JSONPathExtractor(Transformer):
     async def transform(
         self, data: Any, context: Dict[str, Any]
     ) -> TransformationResult:
-        """Extract data using JSONPath expressions."""
+        """
+        Extract data using JSONPath expressions.
+
+        data may also be a ResponseStream or an async iterable of parsed items
+        (e.g. from WebFetcher.fetch_json_items). Expressions are then evaluated
+        against each item as it arrives and every field collects a list of
+        per-item values, so the document is never held in memory as a whole.
+        """
+        if isinstance(data, ResponseStream):
+            data = data.iter_json(self.stream_prefix)
+        if isinstance(data, AsyncIterable):
+            return await self._transform_items(data)
+
         result = TransformationResult({})
 
         try:
@@ -131,6 +154,39 @@ class JSONPathExtractor(Transformer):
 
         return result
 
+    async def _transform_items(self, items: AsyncIterable[Any]) -> TransformationResult:
+        """Evaluate every expression against each item of a stream."""
+        result = TransformationResult(
+            {field_name: [] for field_name in self._compiled_expressions}
+        )
+        matched = dict.fromkeys(self._compiled_expressions, False)
+        count = 0
+
+        try:
+            async for item in items:
+                count += 1
+                for field_name, compiled_expr in self._compiled_expressions.items():
+                    values = [match.value for match in compiled_expr.find(item)]
+                    if values:
+                        matched[field_name] = True
+                        result.data[field_name].append(
+                            values[0] if len(values) == 1 else values
+                        )
+                    else:
+                        result.data[field_name].append(None)
+        except Exception as e:
+            result.add_error(f"JSONPath extraction failed: {e}")
+
+        if self.strict:
+            for field_name, found in matched.items():
+                if not found:
+                    result.add_error(
+                        f"JSONPath expression '{self.expressions[field_name]}' found no matches"
+                    )
+        result.add_metadata("extracted_fields", len(result.data))
+        result.add_metadata("items_processed", count)
+        return result
+
     @property
     def name(self) -> str:
         return "jsonpath_extractor"
@@ -173,11 +229,7 @@ class HTMLExtractor(Transformer):
         result = TransformationResult({})
 
         try:
-            # Parse HTML
-            if isinstance(data, bytes):
-                data = data.decode("utf-8", errors="ignore")
-
-            soup = BeautifulSoup(data, "html.parser")
+            soup = self._get_soup(data, context)
 
             # Use base_url from context if not provided
             base_url = self.base_url or context.get("url")
@@ -219,6 +271,24 @@ class HTMLExtractor(Transformer):
 
         return result
 
+    def _get_soup(self, data: Any, context: Dict[str, Any]) -> BeautifulSoup:
+        """Return the parsed tree for data, reusing a shared document if possible."""
+        if isinstance(data, ParsedHTMLDocument):
+            return data.soup
+
+        if isinstance(data, dict):
+            # Structured result from ContentType.HTML parsing. It does not
+            # carry the markup; WebFetcher passes the response's document
+            shared = context.get("html_document")
+            if "raw_html" in data:
+                data = data["raw_html"]
+            elif isinstance(shared, ParsedHTMLDocument):
+                return shared.soup
+        if isinstance(data, bytes):
+            data = data.decode("utf-8", errors="ignore")
+
+        return BeautifulSoup(data, "html.parser")
+
     def _resolve_urls(self, values: List[str], base_url: str) -> List[str]:
         """Resolve relative URLs in extracted content."""
         resolved = []
@@ -10,16 +10,26 @@ from .manager import WebSocketManager
 from .exceptions import WebSocketError
 from .core_models import (
     WebSocketConfig,
+    FastWebSocketMessage,
     WebSocketConnectionState,
     WebSocketMessage,
     WebSocketMessageType,
     WebSocketResult,
     create_message,
 )
+from .codecs import (
+    JSONCodec,
+    MessageCodec,
+    MsgpackCodec,
+    RawCodec,
+    get_codec,
+    register_codec,
+)
 from .optimization import (
     get_message_pool_statistics,
     get_global_profiler,
     AdaptiveQueue,
+    FanInQueue,
     WebSocketProfiler,
 )
 
@@ -29,6 +39,7 @@ __all__ = [
     "WebSocketConfig",
     # Models
     "WebSocketMessage",
+    "FastWebSocketMessage",
     "WebSocketMessageType",
     "WebSocketConnectionState",
     "WebSocketResult",
@@ -40,5 +51,13 @@ __all__ = [
     "get_message_pool_statistics",
     "get_global_profiler",
     "AdaptiveQueue",
+    "FanInQueue",
     "WebSocketProfiler",
+    # Codecs
+    "MessageCodec",
+    "JSONCodec",
+    "MsgpackCodec",
+    "RawCodec",
+    "get_codec",
+    "register_codec",
 ]
@@ -11,29 +11,34 @@ import asyncio
 import gc
 import logging
 import psutil
+import socket
 import sys
 import time
 import weakref
-from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Union
 
 import aiohttp
 from aiohttp import WSMsgType
 
 from .exceptions import WebSocketError
 from .core_models import (
+    FastWebSocketMessage,
     WebSocketConfig,
     WebSocketConnectionState,
     WebSocketMessage,
     WebSocketMessageType,
     WebSocketResult,
     create_message,
+    payload_size,
 )
 from .optimization import (
     get_message_pool_statistics,
     AdaptiveQueue,
+    FastMessagePool,
     get_global_profiler,
 )
 from .callbacks import WeakCallbackManager
+from .codecs import MessageCodec, get_codec
 
 try:
     from ..monitoring.metrics import MetricsCollector
@@ -44,6 +49,72 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Linux only; elsewhere batches are written without corking
+HAS_TCP_CORK = hasattr(socket, "TCP_CORK")
+
+
+def _set_cork(sock: Any, enabled: bool) -> bool:
+    """Set TCP_CORK on sock, returning whether it could be set."""
+    if sock is None or not HAS_TCP_CORK:
+        return False
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, int(enabled))
+        return True
+    except OSError:
+        return False
+
+
+class _CountingTransport:
+    """Transport proxy that counts the bytes written through it."""
+
+    def __init__(self, transport: Any, counter: _WireCounter):
+        self._transport = transport
+        self._counter = counter
+
+    def write(self, data: Any) -> None:
+        self._counter.sent += len(data)
+        self._transport.write(data)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._transport, name)
+
+
+class _WireCounter:
+    """
+    Frame bytes sent and received on the wire, after compression.
+
+    aiohttp does not report compressed frame sizes, so the counter sits
+    between its WebSocket writer and the transport, and in front of the
+    connection protocol's data_received.
+    """
+
+    def __init__(self) -> None:
+        self.sent = 0
+        self.received = 0
+
+    def attach(self, websocket: aiohttp.ClientWebSocketResponse) -> bool:
+        """Start counting on websocket, returning whether it could be attached."""
+        writer = getattr(websocket, "_writer", None)
+        connection = getattr(websocket, "_conn", None)
+        protocol = getattr(connection, "protocol", None)
+        if writer is None or protocol is None or not hasattr(writer, "transport"):
+            # These are aiohttp internals; wire sizes are unavailable if they move
+            logger.warning(
+                "Cannot count WebSocket wire bytes: unsupported aiohttp %s",
+                aiohttp.__version__,
+            )
+            return False
+
+        writer.transport = _CountingTransport(writer.transport, self)
+        data_received = protocol.data_received
+
+        def counting_data_received(data: bytes) -> None:
+            self.received += len(data)
+            data_received(data)
+
+        protocol.data_received = counting_data_received
+        return True
+
 
 class WebSocketClient:
     """
@@ -186,6 +257,26 @@ class WebSocketClient:
         self._profiler = get_global_profiler()
         self._enable_profiling = True
 
+        # Set by WebSocketManager to deliver into a shared fan-in queue; a
+        # sink returning False means the message goes to the client's queue
+        self._message_sink: Optional[Callable[[Any], Awaitable[bool]]] = None
+
+        # Fast receive path: pooled messages and metrics aggregated between flushes
+        self._fast_pool: Optional[FastMessagePool] = None
+        if config.fast_receive:
+            self._fast_pool = FastMessagePool(config.max_queue_size * 2)
+        self._pending_received = 0
+        self._pending_received_bytes = 0
+        self._received_tags = {k: str(v) for k, v in self._metrics_tags.items()}
+        self._received_tags.update(event_type="message_received", success="True")
+
+        # Codec for send_object/receive_object, and on-the-wire byte counts
+        # for compression ratios
+        self._codec: MessageCodec = get_codec(config.codec)
+        self._wire = _WireCounter()
+        self._wire_attached = False
+        self._negotiated_window_bits = 0
+
         # Message batching for high-throughput scenarios
         self._batch_size = getattr(config, 'batch_size', 10)
         self._batch_timeout = getattr(config, 'batch_timeout', 0.01)  # 10ms
@@ -245,6 +336,9 @@ class WebSocketClient:
             "send_queue_size": self._send_queue.qsize(),
             "message_pool": get_message_pool_statistics(),
         }
+        if self._fast_pool is not None:
+            stats["fast_message_pool"] = self._fast_pool.statistics
+        stats["compression"] = self.compression_statistics
 
         # Add adaptive queue statistics if available
         if hasattr(self._message_queue, 'statistics'):
@@ -271,6 +365,29 @@ class WebSocketClient:
 
         return stats
 
+    @property
+    def compression_statistics(self) -> Dict[str, Any]:
+        """
+        Get permessage-deflate statistics for this connection.
+
+        Ratios are payload bytes over frame bytes on the wire, so frame
+        headers, pings and close frames are included and an uncompressed
+        connection reports slightly below 1.0. They are None until bytes
+        have been counted in that direction.
+        """
+        wire = self._wire
+        counted = self._wire_attached
+        return {
+            "negotiated": self._negotiated_window_bits > 0,
+            "window_bits": self._negotiated_window_bits or None,
+            "wire_bytes_sent": wire.sent if counted else None,
+            "wire_bytes_received": wire.received if counted else None,
+            "send_ratio": self._bytes_sent / wire.sent if counted and wire.sent else None,
+            "receive_ratio": (
+                self._bytes_received / wire.received if counted and wire.received else None
+            ),
+        }
+
     def add_event_handler(self, event_type: str, handler: Callable[..., Any]) -> None:
         """
         Add an event handler using weak references.
@@ -628,14 +745,18 @@ class WebSocketClient:
                 self._session_reused = True
                 logger.debug("Reusing existing aiohttp session")
 
-            # Connect to WebSocket
-            # Set compression to 15 (default) if enabled, None if disabled
-            compression = 15 if self.config.enable_compression else None
+            # Connect to WebSocket, offering permessage-deflate with the
+            # configured server window size when compression is enabled
+            compression = (
+                self.config.compression_window_bits
+                if self.config.enable_compression
+                else 0
+            )
             self._websocket = await self._session.ws_connect(
                 str(self.config.url),
                 protocols=self.config.subprotocols,
                 headers=self.config.headers,
-                compress=compression or 0,
+                compress=compression,
                 max_msg_size=self.config.max_message_size,
                 timeout=aiohttp.ClientWSTimeout(ws_close=self.config.close_timeout),
                 heartbeat=(
@@ -646,6 +767,9 @@ class WebSocketClient:
             self._connection_state = WebSocketConnectionState.CONNECTED
             self._connect_time = time.time() - start_time
             self._reconnect_attempts = 0
+            compress = getattr(self._websocket, "compress", 0)
+            self._negotiated_window_bits = compress if isinstance(compress, int) else 0
+            self._wire_attached = self._wire.attach(self._websocket)
 
             # Record connection metrics and profiling
             self._record_metrics("connection", success=True, duration=self._connect_time)
@@ -720,6 +844,7 @@ class WebSocketClient:
 
             # Stop background tasks
             await self._stop_tasks()
+            self._record_compression_metrics()
 
             # Close WebSocket connection
             if self._websocket and not self._websocket.closed:
@@ -797,6 +922,45 @@ class WebSocketClient:
         message = create_message(WebSocketMessageType.BINARY, data)
         await self._send_queue.put(message)
 
+    async def send_object(self, obj: Any) -> None:
+        """
+        Encode an object with the configured codec and send it.
+
+        Args:
+            obj: Object to send
+
+        Raises:
+            WebSocketError: If not connected
+        """
+        if not self.is_connected:
+            raise WebSocketError("WebSocket is not connected")
+
+        payload = self._codec.encode(obj)
+        message_type = (
+            WebSocketMessageType.BINARY
+            if self._codec.is_binary(payload)
+            else WebSocketMessageType.TEXT
+        )
+        await self._send_queue.put(create_message(message_type, payload))
+
+    async def queue_message(self, message: WebSocketMessage) -> None:
+        """
+        Queue an already built message for the send loop.
+
+        The same message may be queued on several clients, so a payload is
+        only converted and measured once when broadcasting.
+
+        Args:
+            message: Message to send
+
+        Raises:
+            WebSocketError: If not connected
+        """
+        if not self.is_connected:
+            raise WebSocketError("WebSocket is not connected")
+
+        await self._send_queue.put(message)
+
     async def send_message(self, message: WebSocketMessage) -> WebSocketResult:
         """
         Send a WebSocket message.
@@ -820,14 +984,7 @@ class WebSocketClient:
         try:
             # Send the message directly to the websocket
             if self._websocket:
-                serialized = message.serialize()
-                if message.type == WebSocketMessageType.BINARY:
-                    if isinstance(serialized, bytes):
-                        await self._websocket.send_bytes(serialized)
-                    else:
-                        await self._websocket.send_bytes(str(serialized).encode())
-                else:
-                    await self._websocket.send_str(str(serialized))
+                await self._send_frame(self._websocket, message)
 
                 self._messages_sent += 1
                 self._bytes_sent += message.size
@@ -873,13 +1030,90 @@ class WebSocketClient:
                 message = await asyncio.wait_for(
                     self._message_queue.get(), timeout=timeout
                 )
-                return message if isinstance(message, WebSocketMessage) else None
             else:
                 message = await self._message_queue.get()
-                return message if isinstance(message, WebSocketMessage) else None
+            if isinstance(message, (WebSocketMessage, FastWebSocketMessage)):
+                return message  # type: ignore[return-value]
+            return None
         except asyncio.TimeoutError:
             return None
 
+    async def receive_object(self, timeout: Optional[float] = None) -> Any:
+        """
+        Receive a message and decode it with the configured codec.
+
+        The codec reads the received str or bytes directly, and messages from
+        the fast receive path are released once decoded.
+
+        Args:
+            timeout: Timeout in seconds (None for no timeout)
+
+        Returns:
+            Decoded object, or None if timeout
+
+        Raises:
+            WebSocketError: If the payload cannot be decoded
+        """
+        message = await self.receive_message(timeout)
+        if message is None:
+            return None
+        return self.decode_message(message)
+
+    def decode_message(self, message: Union[WebSocketMessage, FastWebSocketMessage]) -> Any:
+        """
+        Decode a received message with the configured codec.
+
+        Args:
+            message: Received message; released afterwards if it is pooled
+
+        Returns:
+            Decoded object
+
+        Raises:
+            WebSocketError: If the payload cannot be decoded
+        """
+        try:
+            if message.data is None:
+                raise ValueError(f"{message.type.value} message has no data")
+            return self._codec.decode(message.data)
+        except Exception as e:
+            raise WebSocketError(
+                f"Failed to decode message with {self._codec.name} codec: {e}"
+            ) from e
+        finally:
+            if isinstance(message, FastWebSocketMessage):
+                message.release()
+
+    def set_message_sink(
+        self, sink: Optional[Callable[[Any], Awaitable[bool]]]
+    ) -> None:
+        """
+        Deliver received messages to sink instead of the client's queue.
+
+        Used by WebSocketManager to multiplex connections. Messages for
+        which sink returns False are queued on the client as usual.
+
+        Args:
+            sink: Coroutine function taking a message, or None to restore
+                the client's own queue
+        """
+        self._message_sink = sink
+
+    def take_queued_messages(self) -> List[Any]:
+        """Remove and return the messages waiting in the client's queue."""
+        messages = []
+        while not self._message_queue.empty():
+            messages.append(self._message_queue.get_nowait())
+        return messages
+
+    def restore_queued_messages(self, messages: List[Any]) -> None:
+        """Put messages back on the client's queue, dropping any that do not fit."""
+        for message in messages:
+            try:
+                self._message_queue.put_nowait(message)
+            except asyncio.QueueFull:
+                logger.warning("Message queue is full, dropping message")
+
     async def receive_messages(self) -> AsyncIterator[WebSocketMessage]:
         """
         Async iterator for receiving messages.
@@ -963,6 +1197,9 @@ class WebSocketClient:
         """Background task for receiving messages."""
         if not self._websocket:
             return
+        if self._fast_pool is not None:
+            await self._fast_receive_loop()
+            return
 
         try:
             async for msg in self._websocket:
@@ -988,14 +1225,7 @@ class WebSocketClient:
 
                 elif msg.type == WSMsgType.PONG:
                     message = create_message(WebSocketMessageType.PONG, msg.data)
-                    # Update pong timing for health monitoring
-                    self._last_pong_time = time.time()
-                    self._ping_failures = max(0, self._ping_failures - 1)  # Reduce failure count on successful pong
-
-                    # Record ping latency metrics
-                    if self._last_ping_time:
-                        latency = self._last_pong_time - self._last_ping_time
-                        self._record_metrics("ping", success=True, duration=latency)
+                    self._on_pong()
 
                 elif msg.type == WSMsgType.CLOSE:
                     logger.info("WebSocket connection closed by server")
@@ -1009,7 +1239,7 @@ class WebSocketClient:
 
                 # Add message to queue
                 try:
-                    await self._message_queue.put(message)
+                    await self._deliver(message)
 
                     # Call message handlers (both weak and direct)
                     self._callback_manager.call_callbacks('message', message)
@@ -1030,10 +1260,146 @@ class WebSocketClient:
             if self.config.auto_reconnect:
                 await self._schedule_reconnect()
 
+    async def _fast_receive_loop(self) -> None:
+        """
+        Receive loop used when config.fast_receive is set.
+
+        Messages come from the client's FastMessagePool with their size taken
+        from the frame, per-message metric calls are replaced by counters
+        flushed every metrics_flush_interval, and no periodic GC is run.
+        """
+        websocket = self._websocket
+        pool = self._fast_pool
+        assert websocket is not None and pool is not None
+        flush_interval = self.config.metrics_flush_interval
+        next_flush = time.monotonic() + flush_interval
+
+        try:
+            async for msg in websocket:
+                if not await self._dispatch_fast_frame(websocket, pool, msg):
+                    break
+
+                now = time.monotonic()
+                if now >= next_flush:
+                    self._flush_receive_metrics()
+                    next_flush = now + flush_interval
+
+        except Exception as e:
+            logger.error(f"Error in receive loop: {e}")
+            if self.config.auto_reconnect:
+                await self._schedule_reconnect()
+        finally:
+            self._flush_receive_metrics()
+
+    async def _dispatch_fast_frame(
+        self,
+        websocket: aiohttp.ClientWebSocketResponse,
+        pool: FastMessagePool,
+        msg: aiohttp.WSMessage,
+    ) -> bool:
+        """
+        Deliver one received frame as a pooled message.
+
+        Returns:
+            False once the connection is closed or failed
+        """
+        if msg.type == WSMsgType.TEXT:
+            size = payload_size(msg.data)
+            message = pool.acquire(WebSocketMessageType.TEXT, msg.data, size)
+        elif msg.type == WSMsgType.BINARY:
+            size = len(msg.data)
+            message = pool.acquire(WebSocketMessageType.BINARY, msg.data, size)
+        elif msg.type == WSMsgType.PONG:
+            self._on_pong()
+            await self._deliver(pool.acquire(WebSocketMessageType.PONG, msg.data))
+            return True
+        elif msg.type == WSMsgType.CLOSE:
+            logger.info("WebSocket connection closed by server")
+            return False
+        elif msg.type == WSMsgType.ERROR:
+            logger.error(f"WebSocket error: {websocket.exception()}")
+            return False
+        else:
+            return True
+
+        self._messages_received += 1
+        self._bytes_received += size
+        self._pending_received += 1
+        self._pending_received_bytes += size
+        await self._deliver(message)
+
+        self._callback_manager.call_callbacks('message', message)
+        if self.on_message:
+            try:
+                self.on_message(message)  # type: ignore[arg-type]
+            except Exception as e:
+                logger.warning(f"Error in direct message handler: {e}")
+        return True
+
+    async def _deliver(
+        self, message: Union[WebSocketMessage, FastWebSocketMessage]
+    ) -> None:
+        """Hand a received message to the sink, or queue it if the sink declines."""
+        sink = self._message_sink
+        if sink is None or not await sink(message):
+            await self._message_queue.put(message)
+
+    def _flush_receive_metrics(self) -> None:
+        """Report messages received since the last flush as aggregate counters."""
+        count = self._pending_received
+        if not count:
+            return
+        size = self._pending_received_bytes
+        self._pending_received = 0
+        self._pending_received_bytes = 0
+
+        if self._enable_profiling:
+            self._profiler.record_throughput(count, size)
+        if not self._metrics_collector:
+            return
+        try:
+            self._metrics_collector.record_counter(
+                "websocket.messages.received", float(count), self._received_tags
+            )
+            self._metrics_collector.record_counter(
+                "websocket.bytes.received", float(size), self._received_tags
+            )
+        except Exception as e:
+            logger.debug(f"Failed to record metrics: {e}")
+
+    def _record_compression_metrics(self) -> None:
+        """Report the connection's compression ratios as gauges."""
+        if not self._metrics_collector or not self._wire_attached:
+            return
+        stats = self.compression_statistics
+        try:
+            for direction in ("send", "receive"):
+                ratio = stats[f"{direction}_ratio"]
+                if ratio is not None:
+                    self._metrics_collector.record_gauge(
+                        f"websocket.compression.{direction}_ratio", ratio, self._received_tags
+                    )
+        except Exception as e:
+            logger.debug(f"Failed to record metrics: {e}")
+
+    def _on_pong(self) -> None:
+        """Update health monitoring after a pong."""
+        # Update pong timing for health monitoring
+        self._last_pong_time = time.time()
+        self._ping_failures = max(0, self._ping_failures - 1)  # Reduce failure count on successful pong
+
+        # Record ping latency metrics
+        if self._last_ping_time:
+            latency = self._last_pong_time - self._last_ping_time
+            self._record_metrics("ping", success=True, duration=latency)
+
     async def _send_loop(self) -> None:
         """Background task for sending messages."""
         if not self._websocket:
             return
+        if self._enable_batching:
+            await self._batched_send_loop()
+            return
 
         try:
             while self.is_connected:
@@ -1042,14 +1408,7 @@ class WebSocketClient:
                         self._send_queue.get(), timeout=1.0
                     )
 
-                    if message.type == WebSocketMessageType.TEXT:
-                        if isinstance(message.data, str):
-                            await self._websocket.send_str(message.data)
-                    elif message.type == WebSocketMessageType.BINARY:
-                        if isinstance(message.data, bytes):
-                            await self._websocket.send_bytes(message.data)
-                        else:
-                            await self._websocket.send_bytes(str(message.data).encode())
+                    await self._send_frame(self._websocket, message)
 
                     self._messages_sent += 1
                     self._bytes_sent += message.size
@@ -1063,6 +1422,86 @@ class WebSocketClient:
         except Exception as e:
             logger.error(f"Error in send loop: {e}")
 
+    @staticmethod
+    async def _send_frame(
+        websocket: aiohttp.ClientWebSocketResponse, message: WebSocketMessage
+    ) -> None:
+        """
+        Write one message as a frame.
+
+        Text payloads that are already UTF-8 bytes, such as orjson output
+        from send_object, go out as a text frame without a decode and
+        re-encode.
+        """
+        data = message.data
+        if message.type == WebSocketMessageType.BINARY:
+            payload = data if isinstance(data, bytes) else message.serialize()
+            await websocket.send_bytes(
+                payload if isinstance(payload, bytes) else str(payload).encode()
+            )
+        elif message.type == WebSocketMessageType.TEXT and isinstance(data, bytes):
+            # send_frame was added in aiohttp 3.11
+            send_frame = getattr(websocket, "send_frame", None)
+            if send_frame is not None:
+                await send_frame(data, WSMsgType.TEXT)
+            else:
+                await websocket.send_str(data.decode())
+        else:
+            await websocket.send_str(str(message.serialize()))
+
+    async def _batched_send_loop(self) -> None:
+        """
+        Send loop used when config.enable_batching is set.
+
+        Wakes once for whatever is queued, lingers up to batch_timeout for
+        more if the batch is not full, then writes the frames back to back.
+        """
+        websocket = self._websocket
+        assert websocket is not None
+        queue = self._send_queue
+
+        try:
+            while self.is_connected:
+                batch = [await queue.get()]
+                self._drain_send_queue(batch)
+                if len(batch) < self._batch_size and self._batch_timeout > 0:
+                    await asyncio.sleep(self._batch_timeout)
+                    self._drain_send_queue(batch)
+                await self._write_batch(websocket, batch)
+
+        except Exception as e:
+            logger.error(f"Error in send loop: {e}")
+
+    def _drain_send_queue(self, batch: List[WebSocketMessage]) -> None:
+        """Move queued messages into batch without waiting, up to batch_size."""
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._send_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                return
+
+    async def _write_batch(
+        self, websocket: aiohttp.ClientWebSocketResponse, batch: List[WebSocketMessage]
+    ) -> None:
+        """
+        Write a batch of messages as consecutive frames.
+
+        The socket is corked for the batch where TCP_CORK is available, so the
+        kernel sends the frames in as few segments as possible on uncork.
+        aiohttp only drains the transport once its buffer passes the high
+        water mark, so the writes themselves rarely yield.
+        """
+        sock = websocket.get_extra_info("socket") if len(batch) > 1 else None
+        corked = _set_cork(sock, True)
+        try:
+            for message in batch:
+                await self._send_frame(websocket, message)
+                self._messages_sent += 1
+                self._bytes_sent += message.size
+        finally:
+            if corked:
+                _set_cork(sock, False)
+
     async def _ping_loop(self) -> None:
         """Background task for sending ping messages with health monitoring."""
         try:
@@ -0,0 +1,167 @@
+"""
+Message codecs for WebSocket payloads.
+
+A codec turns Python objects into frame payloads and back. Decoding reads
+the received str or bytes as is: orjson and msgpack both parse bytes and
+memoryviews without an intermediate copy, and JSON text frames are parsed
+from the str aiohttp already produced, so no payload is re-encoded or
+joined before decoding. JSON encoded by orjson is sent as UTF-8 bytes in a
+text frame rather than being decoded to str and encoded again.
+"""
+
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Union, cast
+
+from ..parsers.json_stream import HAS_ORJSON, get_json_loads
+
+try:
+    import msgpack
+
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+if HAS_ORJSON:
+    import orjson
+
+Payload = Union[str, bytes, bytearray, memoryview]
+
+
+class MessageCodec(ABC):
+    """Converts objects to WebSocket payloads and back."""
+
+    #: Name used in WebSocketConfig.codec
+    name: str = ""
+    #: Whether encoded payloads are sent as binary frames
+    binary: bool = False
+
+    @abstractmethod
+    def encode(self, obj: Any) -> Union[str, bytes]:
+        """Encode an object as a frame payload."""
+
+    @abstractmethod
+    def decode(self, data: Payload) -> Any:
+        """Decode a received payload."""
+
+    def is_binary(self, payload: Union[str, bytes]) -> bool:
+        """Whether an encoded payload is sent as a binary frame."""
+        return self.binary
+
+
+class JSONCodec(MessageCodec):
+    """JSON in text frames, using orjson when installed."""
+
+    name = "json"
+
+    def __init__(self, backend: str = "auto"):
+        """
+        Initialize JSON codec.
+
+        Args:
+            backend: ``"orjson"``, ``"json"``, or ``"auto"`` for orjson when installed
+        """
+        self._loads = get_json_loads(backend)
+        self._orjson = self._loads is not json.loads
+
+    def encode(self, obj: Any) -> Union[str, bytes]:
+        if self._orjson:
+            return orjson.dumps(obj)
+        return json.dumps(obj, separators=(",", ":"))
+
+    def decode(self, data: Payload) -> Any:
+        if isinstance(data, (str, bytes)) or self._orjson:
+            # orjson also parses bytearray and memoryview in place
+            return self._loads(cast(Union[str, bytes], data))
+        # json.loads only accepts str and bytes
+        return self._loads(bytes(data))
+
+
+class MsgpackCodec(MessageCodec):
+    """MessagePack in binary frames."""
+
+    name = "msgpack"
+    binary = True
+
+    def __init__(self) -> None:
+        """
+        Initialize msgpack codec.
+
+        Raises:
+            ImportError: If msgpack is not installed
+        """
+        if not HAS_MSGPACK:
+            raise ImportError("msgpack is required for the msgpack WebSocket codec")
+
+    def encode(self, obj: Any) -> bytes:
+        packed: bytes = msgpack.packb(obj, use_bin_type=True)
+        return packed
+
+    def decode(self, data: Payload) -> Any:
+        return msgpack.unpackb(data, raw=False)
+
+
+class RawCodec(MessageCodec):
+    """Payloads passed through unchanged; bytes go in binary frames."""
+
+    name = "raw"
+
+    def encode(self, obj: Any) -> Union[str, bytes]:
+        if isinstance(obj, (str, bytes)):
+            return obj
+        if isinstance(obj, (bytearray, memoryview)):
+            return bytes(obj)
+        raise TypeError(f"Raw codec cannot send {type(obj).__name__}")
+
+    def decode(self, data: Payload) -> Any:
+        return data
+
+    def is_binary(self, payload: Union[str, bytes]) -> bool:
+        return isinstance(payload, bytes)
+
+
+_codecs: Dict[str, MessageCodec] = {}
+
+
+def register_codec(codec: MessageCodec) -> None:
+    """
+    Make a codec available by name to WebSocketConfig.codec.
+
+    Args:
+        codec: Codec instance; replaces any codec with the same name
+    """
+    _codecs[codec.name] = codec
+
+
+def get_codec(name: str) -> MessageCodec:
+    """
+    Get a registered codec.
+
+    Args:
+        name: Codec name
+
+    Returns:
+        The codec instance
+
+    Raises:
+        ValueError: If no codec has that name
+    """
+    try:
+        return _codecs[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown WebSocket codec: {name} (available: {', '.join(available_codecs())})"
+        ) from None
+
+
+def available_codecs() -> List[str]:
+    """Names of the registered codecs."""
+    return sorted(_codecs)
+
+
+register_codec(JSONCodec())
+register_codec(RawCodec())
+if HAS_MSGPACK:
+    register_codec(MsgpackCodec())
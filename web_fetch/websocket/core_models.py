@@ -40,6 +40,16 @@ class WebSocketConnectionState(str, Enum):
     ERROR = "error"
 
 
+def payload_size(data: Union[str, bytes, None]) -> int:
+    """Size in bytes of a message payload as sent on the wire."""
+    if isinstance(data, str):
+        # len() is the UTF-8 size for ASCII text, which avoids an encode
+        return len(data) if data.isascii() else len(data.encode("utf-8"))
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return len(data)
+    return 0
+
+
 @dataclass
 class WebSocketMessage:
     """WebSocket message data with object pooling support."""
@@ -57,13 +67,7 @@ class WebSocketMessage:
 
     def _calculate_size(self) -> None:
         """Calculate and set the message size."""
-        if self.data is not None:
-            if isinstance(self.data, str):
-                self.size = len(self.data.encode("utf-8"))
-            elif isinstance(self.data, bytes):
-                self.size = len(self.data)
-        else:
-            self.size = 0
+        self.size = payload_size(self.data)
 
     def _reset(self, msg_type: WebSocketMessageType, data: Union[str, bytes, None] = None) -> None:
         """Reset message for reuse from pool."""
@@ -110,6 +114,59 @@ class WebSocketMessage:
             return str(self.data) if self.data is not None else ""
 
 
+class FastWebSocketMessage:
+    """
+    Slotted message produced by the fast receive path.
+
+    The id and size are only computed when first read, and the instance is
+    returned to its pool by an explicit release() rather than a finalizer.
+    A released message must not be used again.
+    """
+
+    __slots__ = ("type", "data", "timestamp", "_id", "_size", "_pool")
+
+    def __init__(
+        self,
+        type: WebSocketMessageType,
+        data: Union[str, bytes, None] = None,
+        timestamp: float = 0.0,
+        size: int = -1,
+        pool: Optional[Any] = None,
+    ):
+        self.type = type
+        self.data = data
+        self.timestamp = timestamp
+        self._id: Optional[str] = None
+        self._size = size
+        self._pool = pool
+
+    @property
+    def id(self) -> str:
+        """Unique message id, generated on first access."""
+        if self._id is None:
+            self._id = str(uuid.uuid4())
+        return self._id
+
+    @property
+    def size(self) -> int:
+        """Payload size in bytes, computed on first access if not known."""
+        if self._size < 0:
+            self._size = payload_size(self.data)
+        return self._size
+
+    def release(self) -> None:
+        """Return the message to the pool it came from."""
+        if self._pool is not None:
+            self._pool.release(self)
+
+    def serialize(self) -> Union[str, bytes]:
+        """Serialize the message for transmission."""
+        return WebSocketMessage.serialize(self)  # type: ignore[arg-type]
+
+    def __repr__(self) -> str:
+        return f"FastWebSocketMessage(type={self.type!r}, size={self.size})"
+
+
 @dataclass
 class WebSocketResult:
     """Result of WebSocket operation."""
@@ -201,6 +258,16 @@ class WebSocketConfig(BaseModel):
     enable_compression: bool = Field(
         default=True, description="Enable per-message deflate compression"
     )
+    compression_window_bits: int = Field(
+        default=15, ge=9, le=15,
+        description="LZ77 window size in bits requested for the server's deflate "
+        "stream; smaller windows use less memory per connection and compress less"
+    )
+
+    # Codec used by send_object/receive_object
+    codec: str = Field(
+        default="json", description="Name of a registered codec: json, msgpack, raw"
+    )
 
     # Adaptive optimization settings
     enable_adaptive_queues: bool = Field(
@@ -219,6 +286,16 @@ class WebSocketConfig(BaseModel):
         default=0.3, ge=0.1, le=0.8, description="Usage threshold below which queues shrink"
     )
 
+    # Fast receive path
+    fast_receive: bool = Field(
+        default=False,
+        description="Receive into pooled slotted messages with lazy ids and "
+        "aggregated metrics; consumers should release() each message",
+    )
+    metrics_flush_interval: float = Field(
+        default=1.0, ge=0.01, description="Seconds between aggregated receive metric flushes"
+    )
+
     # Message batching settings
     enable_batching: bool = Field(
         default=False, description="Enable message batching for high-throughput scenarios"
@@ -227,7 +304,8 @@ class WebSocketConfig(BaseModel):
         default=10, ge=1, le=100, description="Maximum number of messages to batch"
     )
     batch_timeout: float = Field(
-        default=0.01, ge=0.001, le=1.0, description="Maximum time to wait for batch completion in seconds"
+        default=0.01, ge=0.0, le=1.0,
+        description="Maximum time to wait for batch completion in seconds; 0 sends what is queued at once"
     )
 
     @field_validator('url')
@@ -8,12 +8,22 @@ with connection pooling and lifecycle management.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import time
 from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, cast
 
 from .client import WebSocketClient
-from .core_models import WebSocketConfig, WebSocketConnectionState, WebSocketResult, WebSocketMessage
+from .core_models import (
+    WebSocketConfig,
+    WebSocketConnectionState,
+    WebSocketMessage,
+    WebSocketMessageType,
+    WebSocketResult,
+    create_message,
+)
+from .exceptions import WebSocketError
+from .optimization import FanInQueue
 
 logger = logging.getLogger(__name__)
 
@@ -52,7 +62,8 @@ class WebSocketManager:
     """
 
     def __init__(self, max_connections: int = 100, cleanup_interval: float = 60.0,
-                 health_check_interval: float = 30.0):
+                 health_check_interval: float = 30.0,
+                 receive_buffer_per_connection: int = 100):
         """
         Initialize WebSocket manager.
 
@@ -60,10 +71,16 @@ class WebSocketManager:
             max_connections: Maximum number of concurrent connections
             cleanup_interval: Interval in seconds for proactive cleanup
             health_check_interval: Interval in seconds for health checks
+            receive_buffer_per_connection: Messages a connection may have
+                waiting in receive_all_messages before its receive loop pauses
         """
         self.max_connections = max_connections
         self.cleanup_interval = cleanup_interval
         self.health_check_interval = health_check_interval
+        self.receive_buffer_per_connection = receive_buffer_per_connection
+
+        # Shared queue fed by every client while receive_all_messages runs
+        self._fan_in: Optional[FanInQueue] = None
 
         self._connections: Dict[str, WebSocketClient] = {}
         self._connection_tasks: Dict[str, asyncio.Task[Any]] = {}
@@ -120,6 +137,7 @@ class WebSocketManager:
                     "cleanup_attempts": 0
                 }
                 self._total_connections_created += 1
+                self._attach_to_fan_in(connection_id, client)
                 logger.info(f"Added WebSocket connection: {connection_id}")
 
                 # Start monitoring tasks if this is the first connection
@@ -151,6 +169,7 @@ class WebSocketManager:
 
         try:
             client = self._connections[connection_id]
+            client.set_message_sink(None)
             result = await client.disconnect()
 
             # Remove from tracking
@@ -234,6 +253,8 @@ class WebSocketManager:
         """
         Broadcast text message to all connections.
 
+        The message is built once and shared by every connection's send queue.
+
         Args:
             text: Text message to broadcast
             exclude: List of connection IDs to exclude
@@ -241,14 +262,7 @@ class WebSocketManager:
         Returns:
             Dictionary mapping connection IDs to success status
         """
-        exclude = exclude or []
-        results = {}
-
-        for connection_id in self._connections:
-            if connection_id not in exclude:
-                results[connection_id] = await self.send_text(connection_id, text)
-
-        return results
+        return await self._broadcast(create_message(WebSocketMessageType.TEXT, text), exclude)
 
     async def broadcast_binary(
         self, data: bytes, exclude: Optional[List[str]] = None
@@ -263,12 +277,24 @@ class WebSocketManager:
         Returns:
             Dictionary mapping connection IDs to success status
         """
-        exclude = exclude or []
+        return await self._broadcast(create_message(WebSocketMessageType.BINARY, data), exclude)
+
+    async def _broadcast(
+        self, message: WebSocketMessage, exclude: Optional[List[str]]
+    ) -> Dict[str, bool]:
+        """Queue one prepared message on every connection not in exclude."""
+        excluded = set(exclude or ())
         results = {}
 
-        for connection_id in self._connections:
-            if connection_id not in exclude:
-                results[connection_id] = await self.send_binary(connection_id, data)
+        for connection_id, client in list(self._connections.items()):
+            if connection_id in excluded:
+                continue
+            try:
+                await client.queue_message(message)
+                results[connection_id] = True
+            except Exception as e:
+                logger.error(f"Error broadcasting to '{connection_id}': {e}")
+                results[connection_id] = False
 
         return results
 
@@ -276,75 +302,62 @@ class WebSocketManager:
         """
         Async iterator for receiving messages from all connections.
 
+        Every client's receive loop pushes straight into one shared
+        FanInQueue, so each message costs O(1) however many connections
+        there are. A connection with receive_buffer_per_connection messages
+        waiting is paused without holding up the others. Connections added
+        while iterating are included, and messages not yet yielded when
+        iteration stops go back to their connection's own queue.
+
         Yields:
             Tuple of (connection_id, WebSocketMessage)
+
+        Raises:
+            WebSocketError: If another receive_all_messages is running
         """
-        # Create tasks for receiving from each connection
-        receive_tasks = {}
+        if self._fan_in is not None:
+            raise WebSocketError("receive_all_messages is already running")
 
+        fan_in = self._fan_in = FanInQueue(self.receive_buffer_per_connection)
         for connection_id, client in self._connections.items():
-            if client.is_connected:
-                task = asyncio.create_task(client.receive_message(timeout=1.0))
-                receive_tasks[connection_id] = task
+            self._attach_to_fan_in(connection_id, client)
 
-        while receive_tasks:
-            try:
-                # Wait for any message
-                done, pending = await asyncio.wait(
-                    receive_tasks.values(),
-                    return_when=asyncio.FIRST_COMPLETED,
-                    timeout=1.0,
-                )
-
-                # Process completed tasks
-                for task in done:
-                    # Find which connection this task belongs to
-                    found_connection_id: Optional[str] = None
-                    for cid, t in receive_tasks.items():
-                        if t == task:
-                            found_connection_id = cid
-                            break
-
-                    if found_connection_id:
-                        try:
-                            message = await task
-                            if message:
-                                yield found_connection_id, message
-                        except Exception as e:
-                            logger.error(f"Error receiving from '{found_connection_id}': {e}")
-
-                        # Remove completed task and create new one if connection still active
-                        del receive_tasks[found_connection_id]
-
-                        maybe_client = self._connections.get(found_connection_id)
-                        if maybe_client is not None and maybe_client.is_connected:
-                            # Type guard: client is definitely not None here
-                            client = maybe_client  # Type narrowed by None check
-                            new_task = asyncio.create_task(
-                                client.receive_message(timeout=1.0)
-                            )
-                            receive_tasks[found_connection_id] = new_task
-
-                # Clean up disconnected connections
-                to_remove = []
-                for connection_id, client in self._connections.items():
-                    if not client.is_connected and connection_id in receive_tasks:
-                        receive_tasks[connection_id].cancel()
-                        to_remove.append(connection_id)
-
-                for connection_id in to_remove:
-                    del receive_tasks[connection_id]
-
-            except asyncio.TimeoutError:
-                continue
-            except Exception as e:
-                logger.error(f"Error in receive_all_messages: {e}")
-                break
+        try:
+            while True:
+                try:
+                    yield fan_in.get_nowait()
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
 
-        # Cancel remaining tasks
-        for task in receive_tasks.values():
-            if not task.done():
-                task.cancel()
+                # Only reached when idle, so the scan is not per message
+                if not any(client.is_connected for client in self._connections.values()):
+                    break
+                try:
+                    yield await asyncio.wait_for(fan_in.get(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    continue
+        finally:
+            self._fan_in = None
+            for client in self._connections.values():
+                client.set_message_sink(None)
+            leftovers: Dict[str, List[Any]] = {}
+            for connection_id, message in fan_in.close():
+                leftovers.setdefault(connection_id, []).append(message)
+            for connection_id, messages in leftovers.items():
+                maybe_client = self._connections.get(connection_id)
+                if maybe_client is not None:
+                    maybe_client.restore_queued_messages(messages)
+
+    def _attach_to_fan_in(self, connection_id: str, client: WebSocketClient) -> None:
+        """Route a client's messages into the active fan-in queue, if any."""
+        fan_in = self._fan_in
+        if fan_in is None:
+            return
+        # Keep order: messages already queued on the client come first
+        for message in client.take_queued_messages():
+            fan_in.put_nowait(connection_id, message)
+        client.set_message_sink(functools.partial(fan_in.put, connection_id))
 
     async def disconnect_all(self) -> Dict[str, WebSocketResult]:
         """
@@ -569,6 +582,7 @@ class WebSocketManager:
         # Create new client
         client = WebSocketClient(config)
         self._connections[client_id] = client
+        self._attach_to_fan_in(client_id, client)
 
         logger.info(f"Added WebSocket client: {client_id}")
         return client_id
@@ -588,6 +602,7 @@ class WebSocketManager:
 
         # Get the client and disconnect it
         client = self._connections[client_id]
+        client.set_message_sink(None)
         try:
             await client.disconnect()
         except Exception as e:
@@ -13,12 +13,14 @@ from .optimization import (
     get_message_pool_statistics,
     get_global_profiler,
     AdaptiveQueue,
+    FanInQueue,
     WebSocketProfiler,
 )
 from .core_models import (
     WebSocketMessageType,
     WebSocketConnectionState,
     WebSocketMessage,
+    FastWebSocketMessage,
     WebSocketResult,
     WebSocketConfig,
     create_message,
@@ -30,11 +32,13 @@ __all__ = [
     "WebSocketMessageType",
     "WebSocketConnectionState",
     "WebSocketMessage",
+    "FastWebSocketMessage",
     "WebSocketResult",
     "WebSocketConfig",
     "create_message",
     "get_message_pool_statistics",
     "get_global_profiler",
     "AdaptiveQueue",
+    "FanInQueue",
     "WebSocketProfiler",
 ]
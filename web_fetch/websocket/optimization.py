@@ -17,7 +17,7 @@ from threading import Lock
 from typing import Any, Dict, List, Optional, Union, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from .core_models import WebSocketMessage, WebSocketMessageType
+    from .core_models import FastWebSocketMessage, WebSocketMessage, WebSocketMessageType
 
 import logging
 
@@ -102,6 +102,84 @@ class WebSocketMessagePool:
 _global_message_pool = WebSocketMessagePool()
 
 
+class FastMessagePool:
+    """
+    Pool of FastWebSocketMessage instances with explicit release.
+
+    Each client owns its pool and uses it only from its event loop, so no
+    lock is taken. Messages that are never released are simply collected.
+    """
+
+    def __init__(self, max_pool_size: int = 1000):
+        """
+        Initialize the pool.
+
+        Args:
+            max_pool_size: Maximum number of released messages to keep
+        """
+        self.max_pool_size = max_pool_size
+        self._pool: List[FastWebSocketMessage] = []
+        self._created_count = 0
+        self._reused_count = 0
+
+    def acquire(
+        self, msg_type: WebSocketMessageType, data: Union[str, bytes, None], size: int = -1
+    ) -> FastWebSocketMessage:
+        """
+        Get a message from the pool or create one.
+
+        Args:
+            msg_type: Type of the WebSocket message
+            data: Message data
+            size: Payload size if already known, -1 to compute on access
+
+        Returns:
+            FastWebSocketMessage owned by this pool until released
+        """
+        if self._pool:
+            message = self._pool.pop()
+            message.type = msg_type
+            message.data = data
+            message.timestamp = time.time()
+            message._size = size
+            message._pool = self
+            self._reused_count += 1
+            return message
+
+        from .core_models import FastWebSocketMessage
+        self._created_count += 1
+        return FastWebSocketMessage(msg_type, data, time.time(), size, self)
+
+    def release(self, message: FastWebSocketMessage) -> None:
+        """
+        Take a message back for reuse.
+
+        Args:
+            message: Message acquired from this pool; releasing twice is a no-op
+        """
+        if message._pool is not self:
+            return
+        message._pool = None
+        message.data = None
+        message._id = None
+        if len(self._pool) < self.max_pool_size:
+            self._pool.append(message)
+
+    @property
+    def statistics(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        total_requests = self._created_count + self._reused_count
+        reuse_rate = (self._reused_count / total_requests * 100) if total_requests > 0 else 0
+        return {
+            "pool_size": len(self._pool),
+            "max_pool_size": self.max_pool_size,
+            "created_count": self._created_count,
+            "reused_count": self._reused_count,
+            "reuse_rate_percent": round(reuse_rate, 2),
+            "total_requests": total_requests
+        }
+
+
 class AdaptiveQueue:
     """
     Adaptive queue that adjusts its size based on usage patterns.
@@ -265,6 +343,118 @@ class AdaptiveQueue:
         }
 
 
+class FanInQueue:
+    """
+    One queue fed by many producers, each with its own credit limit.
+
+    Items are (producer_id, item) pairs. A producer may have at most
+    ``per_producer_limit`` items waiting; past that its put() waits until
+    the consumer takes one of them, so a busy producer is slowed down
+    without holding up the others. The queue as a whole is bounded by the
+    sum of the credits. Every operation is O(1).
+    """
+
+    def __init__(self, per_producer_limit: int = 100):
+        """
+        Initialize fan-in queue.
+
+        Args:
+            per_producer_limit: Items a producer may have queued at once
+        """
+        self.per_producer_limit = per_producer_limit
+        self._queue: asyncio.Queue[Tuple[str, Any]] = asyncio.Queue()
+        self._in_flight: Dict[str, int] = {}
+        self._waiters: Dict[str, asyncio.Future[None]] = {}
+        self._closed = False
+        self._blocked_count = 0
+
+    @property
+    def closed(self) -> bool:
+        """Whether close() has been called."""
+        return self._closed
+
+    async def put(self, producer_id: str, item: Any) -> bool:
+        """
+        Queue an item, waiting while the producer is over its limit.
+
+        Args:
+            producer_id: Producer the item comes from
+            item: Item to queue
+
+        Returns:
+            False if the queue was closed and the item was not queued
+        """
+        while (
+            not self._closed
+            and self._in_flight.get(producer_id, 0) >= self.per_producer_limit
+        ):
+            self._blocked_count += 1
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters[producer_id] = waiter
+            await waiter
+        if self._closed:
+            return False
+        self.put_nowait(producer_id, item)
+        return True
+
+    def put_nowait(self, producer_id: str, item: Any) -> None:
+        """Queue an item without checking the producer's limit."""
+        self._in_flight[producer_id] = self._in_flight.get(producer_id, 0) + 1
+        self._queue.put_nowait((producer_id, item))
+
+    def get_nowait(self) -> Tuple[str, Any]:
+        """Take the next item, raising asyncio.QueueEmpty if there is none."""
+        return self._taken(self._queue.get_nowait())
+
+    async def get(self) -> Tuple[str, Any]:
+        """Take the next item, waiting for one."""
+        return self._taken(await self._queue.get())
+
+    def _taken(self, entry: Tuple[str, Any]) -> Tuple[str, Any]:
+        producer_id = entry[0]
+        self._in_flight[producer_id] -= 1
+        waiter = self._waiters.pop(producer_id, None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+        return entry
+
+    def qsize(self) -> int:
+        """Return the number of queued items."""
+        return self._queue.qsize()
+
+    def empty(self) -> bool:
+        """Return True if the queue is empty."""
+        return self._queue.empty()
+
+    def close(self) -> List[Tuple[str, Any]]:
+        """
+        Stop accepting items and wake every waiting producer.
+
+        Returns:
+            Items that were still queued, oldest first
+        """
+        self._closed = True
+        for waiter in self._waiters.values():
+            if not waiter.done():
+                waiter.set_result(None)
+        self._waiters.clear()
+        remaining = []
+        while not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+        self._in_flight.clear()
+        return remaining
+
+    @property
+    def statistics(self) -> Dict[str, Any]:
+        """Get queue statistics."""
+        return {
+            "current_size": self.qsize(),
+            "per_producer_limit": self.per_producer_limit,
+            "producers": len(self._in_flight),
+            "blocked_count": self._blocked_count,
+        }
+
+
 class WebSocketProfiler:
     """
     Performance profiler for WebSocket operations.